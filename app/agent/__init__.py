@@ -5,6 +5,7 @@ Agent 모듈
 
 from .agent import CalendarManagerAgent, UserIntent
 from .factory import AgentFactory
+from .pool import AgentPool
 from .prompt import PromptManager
 
-__all__ = ['CalendarManagerAgent', 'UserIntent', 'AgentFactory', 'PromptManager'] 
\ No newline at end of file
+__all__ = ['CalendarManagerAgent', 'UserIntent', 'AgentFactory', 'AgentPool', 'PromptManager'] 
\ No newline at end of file
@@ -3,30 +3,47 @@
 """
 
 import asyncio
-from typing import Literal
+import time
+from typing import Callable, List, Literal, Optional
 from pydantic import BaseModel, Field
 
-from autogen_agentchat.conditions import MaxMessageTermination
+from autogen_agentchat.base import TaskResult
+from autogen_agentchat.conditions import MaxMessageTermination, TextMessageTermination
 from autogen_agentchat.teams import RoundRobinGroupChat
 from autogen_agentchat.messages import StructuredMessage
+from autogen_core.models import ChatCompletionClient
 from autogen_ext.models.openai import OpenAIChatCompletionClient
 
 try:
     # 전역 설치된 경우
-    from app.calendar_tools import CalendarTools
-    from app.config import OPENAI_API_KEY
+    from app.calendar_tools import CalendarTools, AsyncCalendarTools
+    from app.config import (
+        OPENAI_API_KEY, DEFAULT_CALENDAR_NAME, AGENT_MODE, INTENT_RULE_THRESHOLD, INTENT_CACHE_ENABLED,
+        INTENT_CACHE_SIZE, AGENT_POOL_SIZE, MEMORY_SUMMARIZER
+    )
+    from app.intent import RuleIntentClassifier, IntentCache, parse_examples
     from app.session import SessionManager
-    from app.memory import MemoryManager
+    from app.memory import MemoryManager, ModelSummarizer
     from app.agent.prompt import PromptManager
     from app.agent.factory import AgentFactory
+    from app.agent.pool import AgentPool
 except ImportError:
     # 로컬 실행인 경우
-    from calendar_tools import CalendarTools
-    from config import OPENAI_API_KEY
+    from calendar_tools import CalendarTools, AsyncCalendarTools
+    from config import (
+        OPENAI_API_KEY, DEFAULT_CALENDAR_NAME, AGENT_MODE, INTENT_RULE_THRESHOLD, INTENT_CACHE_ENABLED,
+        INTENT_CACHE_SIZE, AGENT_POOL_SIZE, MEMORY_SUMMARIZER
+    )
+    from intent import RuleIntentClassifier, IntentCache, parse_examples
     from session import SessionManager
-    from memory import MemoryManager
+    from memory import MemoryManager, ModelSummarizer
     from .prompt import PromptManager
     from .factory import AgentFactory
+    from .pool import AgentPool
+
+
+# pipeline: 의도 분류 → 캘린더/일반 대화 에이전트, router: 도구를 가진 에이전트 하나가 바로 처리
+AGENT_MODES = ("pipeline", "router")
 
 
 class UserIntent(BaseModel):
@@ -42,49 +59,101 @@ class UserIntent(BaseModel):
 class CalendarManagerAgent:
     """AutoGen AgentChat 기반 캘린더 관리 에이전트 (리팩토링됨)"""
     
-    def __init__(self, calendar_name: str = "캘린더"):
-        # 핵심 컴포넌트들
-        self.calendar_tools = CalendarTools(calendar_name)
-        self.model_client = OpenAIChatCompletionClient(
+    def __init__(self, calendar_name: Optional[str] = None, calendars: Optional[List[str]] = None,
+                 mode: Optional[str] = None, model_client: Optional[ChatCompletionClient] = None,
+                 stream: bool = False):
+        self.mode = mode or AGENT_MODE
+        # 응답 에이전트가 모델 토큰을 스트리밍 이벤트로 내보낼지 여부
+        self.stream = stream
+        if self.mode not in AGENT_MODES:
+            raise ValueError(f"알 수 없는 에이전트 모드입니다: {self.mode} (가능한 값: {', '.join(AGENT_MODES)})")
+        
+        # 핵심 컴포넌트들 (일정은 calendar_name, 없으면 calendars의 첫 번째 캘린더에 추가)
+        calendar_name = calendar_name or (calendars[0] if calendars else DEFAULT_CALENDAR_NAME)
+        self.calendar_tools = CalendarTools(calendar_name, calendars=calendars)
+        self.async_calendar_tools = AsyncCalendarTools(self.calendar_tools)
+        self.model_client = model_client or OpenAIChatCompletionClient(
             model="gpt-4o-mini",
             api_key=OPENAI_API_KEY,
             temperature=0.1
         )
         self.prompt_manager = PromptManager()
+        # 뻔한 입력은 LLM 없이 분류 (분류 프롬프트의 예시로 n-gram을 채움)
+        intent_prompt = self.prompt_manager.get_intent_classifier_prompt()
+        self.intent_rules = RuleIntentClassifier(parse_examples(intent_prompt), threshold=INTENT_RULE_THRESHOLD)
+        # 애매한 입력의 LLM 분류 결과는 프로세스 간에 공유되는 캐시에 보관
+        self.intent_cache = IntentCache(intent_prompt, max_entries=INTENT_CACHE_SIZE) if INTENT_CACHE_ENABLED else None
         
         # 관리자들
         self.session_manager = SessionManager()
-        self.memory_manager = MemoryManager(self.session_manager.storage)
+        # 세션 메모리는 에이전트별 토큰 예산만큼만 컨텍스트에 넣고, 오래된 줄은 백그라운드에서 요약
+        summarizer = ModelSummarizer(self.model_client) if MEMORY_SUMMARIZER == "model" else None
+        self.memory_manager = MemoryManager(self.session_manager.storage, summarizer=summarizer)
         
         # 에이전트 팩토리
         self.agent_factory = AgentFactory(
             self.model_client, 
             self.calendar_tools, 
-            self.prompt_manager
+            self.prompt_manager,
+            self.async_calendar_tools,
+            stream=stream
         )
+        # 세션·역할별 팀을 턴마다 다시 만들지 않고 재사용
+        self.agent_pool = AgentPool(self._build_team, max_entries=AGENT_POOL_SIZE)
+    
+    def _build_team(self, role: str, memory=None) -> RoundRobinGroupChat:
+        """역할(intent, calendar, general, router)의 에이전트와 종료 조건으로 새 팀을 만듭니다."""
+        if role == "intent":
+            # 구조화된 분류 결과 메시지 타입을 팀에 등록해야 함
+            return RoundRobinGroupChat([self.agent_factory.create_intent_classifier(memory)],
+                                       termination_condition=MaxMessageTermination(max_messages=2),
+                                       custom_message_types=[StructuredMessage[UserIntent]])
+        if role == "calendar":
+            return RoundRobinGroupChat([self.agent_factory.create_calendar_agent(memory)],
+                                       termination_condition=MaxMessageTermination(max_messages=5))
+        if role == "general":
+            return RoundRobinGroupChat([self.agent_factory.create_general_agent(memory)],
+                                       termination_condition=MaxMessageTermination(max_messages=2))
+        if role == "router":
+            # 텍스트 답변이 나오면 바로 종료 (도구 호출 결과 요약 뒤 또는 일반 대화 답변)
+            termination = TextMessageTermination("router_agent") | MaxMessageTermination(max_messages=5)
+            return RoundRobinGroupChat([self.agent_factory.create_router_agent(memory)],
+                                       termination_condition=termination)
+        raise ValueError(f"알 수 없는 에이전트 역할입니다: {role}")
     
     async def classify_intent(self, user_input: str, session_id: str = None) -> UserIntent:
-        """사용자 의도를 분류합니다."""
+        """사용자 의도를 분류합니다.
+        
+        규칙 분류의 신뢰도가 기준 이상이면 그 결과를 쓰고, 다음으로 의도 캐시를 찾은 뒤,
+        둘 다 없으면 LLM 분류 에이전트를 실행합니다. LLM이 분류에 성공한 결과만 캐시에 넣습니다.
+        """
+        decision = self.intent_rules.classify(user_input)
+        if decision.intent_type:
+            return UserIntent(intent_type=decision.intent_type, reasoning=decision.reasoning)
+        
+        if self.intent_cache:
+            cached = self.intent_cache.get(user_input)
+            if cached:
+                intent_type, reasoning = cached
+                return UserIntent(intent_type=intent_type, reasoning=reasoning)
+        
+        began = time.perf_counter()
         try:
             # 메모리 가져오기
             memory = None
             if session_id:
-                memory = self.memory_manager.get_or_create_memory(session_id)
-            
-            # 의도 분류 에이전트 생성
-            intent_classifier = self.agent_factory.create_intent_classifier(memory)
+                memory = self.memory_manager.get_agent_memory(session_id, "intent")
             
-            # 종료 조건 설정
-            termination = MaxMessageTermination(max_messages=2)
-            
-            # 팀 생성 및 실행
-            team = RoundRobinGroupChat([intent_classifier], termination_condition=termination)
-            result = await team.run(task=user_input)
+            # 세션의 의도 분류 팀 재사용 (없으면 생성)
+            async with self.agent_pool.lease(session_id, "intent", memory) as team:
+                result = await team.run(task=user_input)
             
             # 결과 처리
             if result and result.messages:
                 for message in reversed(result.messages):
                     if isinstance(message, StructuredMessage) and isinstance(message.content, UserIntent):
+                        if self.intent_cache:
+                            self.intent_cache.put(user_input, message.content.intent_type, message.content.reasoning)
                         return message.content
             
             # 분류 실패 시 기본값
@@ -99,9 +168,37 @@ class CalendarManagerAgent:
                 intent_type="general",
                 reasoning=f"오류 발생으로 일반 대화로 처리: {str(e)}"
             )
+        finally:
+            self.intent_rules.record_llm(time.perf_counter() - began)
+    
+    def intent_stats(self) -> dict:
+        """의도 분류 빠른 경로의 적중률과 절약한 시간 (캐시를 쓰면 캐시 적중/실패 횟수 포함)"""
+        stats = self.intent_rules.stats.as_dict()
+        if self.intent_cache:
+            stats["cache"] = self.intent_cache.stats()
+        return stats
+    
+    async def _run_team(self, team: RoundRobinGroupChat, user_input: str,
+                        on_event: Optional[Callable[[object], None]] = None) -> TaskResult:
+        """팀을 실행합니다. on_event가 있으면 run_stream으로 토큰·도구 이벤트를 도착하는 대로 넘깁니다."""
+        if on_event is None:
+            return await team.run(task=user_input)
+        
+        result = None
+        async for item in team.run_stream(task=user_input):
+            if isinstance(item, TaskResult):
+                result = item
+            else:
+                on_event(item)
+        return result
     
-    async def process_user_input(self, user_input: str, session_id: str = None) -> str:
-        """사용자 입력을 처리하고 결과를 반환합니다."""
+    async def process_user_input(self, user_input: str, session_id: str = None,
+                                 on_event: Optional[Callable[[object], None]] = None) -> str:
+        """사용자 입력을 처리하고 결과를 반환합니다.
+        
+        on_event를 주면 응답 에이전트의 실행 이벤트(토큰 조각, 도구 호출 요청/결과, 메시지)를
+        도착하는 대로 넘깁니다. (CLI의 StreamPrinter 참고)
+        """
         try:
             # 세션 ID가 없으면 새로 생성
             if not session_id:
@@ -118,14 +215,18 @@ class CalendarManagerAgent:
             # 사용자 입력을 메모리에 추가
             await self.memory_manager.add_to_memory(session_id, user_input, "user")
             
-            # 1. 의도 분류
-            intent = await self.classify_intent(user_input, session_id)
-            
-            # 2. 의도에 따른 처리
-            if intent.intent_type == "calendar":
-                response = await self._handle_calendar_request(user_input, session_id)
+            if self.mode == "router":
+                # 의도 분류 없이 라우터 에이전트가 한 번에 처리
+                response = await self._handle_routed_request(user_input, session_id, on_event)
             else:
-                response = await self._handle_general_conversation(user_input, session_id)
+                # 1. 의도 분류
+                intent = await self.classify_intent(user_input, session_id)
+                
+                # 2. 의도에 따른 처리
+                if intent.intent_type == "calendar":
+                    response = await self._handle_calendar_request(user_input, session_id, on_event)
+                else:
+                    response = await self._handle_general_conversation(user_input, session_id, on_event)
             
             # 에이전트 응답을 메모리에 추가
             await self.memory_manager.add_to_memory(session_id, response, "assistant")
@@ -136,6 +237,9 @@ class CalendarManagerAgent:
             memory_contents = self.memory_manager.get_memory_contents(session_id)
             self.session_manager.storage.save_session(session_info, memory_contents)
             
+            # 길어진 메모리는 응답을 돌려준 뒤 백그라운드에서 요약
+            self.memory_manager.compact_in_background(session_id)
+            
             return response
             
         except Exception as e:
@@ -144,17 +248,14 @@ class CalendarManagerAgent:
                 await self.memory_manager.add_to_memory(session_id, error_msg, "system")
             return error_msg
     
-    async def _handle_calendar_request(self, user_input: str, session_id: str) -> str:
+    async def _handle_calendar_request(self, user_input: str, session_id: str,
+                                       on_event: Optional[Callable[[object], None]] = None) -> str:
         """캘린더 관련 요청을 처리합니다."""
         try:
-            # 메모리가 있는 캘린더 에이전트 생성
-            memory = self.memory_manager.get_or_create_memory(session_id)
-            calendar_agent = self.agent_factory.create_calendar_agent(memory)
-            
-            termination = MaxMessageTermination(max_messages=5)
-            team = RoundRobinGroupChat([calendar_agent], termination_condition=termination)
-            
-            result = await team.run(task=user_input)
+            # 메모리가 있는 캘린더 에이전트 팀 재사용
+            memory = self.memory_manager.get_agent_memory(session_id, "calendar")
+            async with self.agent_pool.lease(session_id, "calendar", memory) as team:
+                result = await self._run_team(team, user_input, on_event)
             
             if result and result.messages:
                 for message in reversed(result.messages):
@@ -166,17 +267,36 @@ class CalendarManagerAgent:
         except Exception as e:
             return f"캘린더 작업 중 오류가 발생했습니다: {str(e)}"
     
-    async def _handle_general_conversation(self, user_input: str, session_id: str) -> str:
-        """일반 대화를 처리합니다."""
+    async def _handle_routed_request(self, user_input: str, session_id: str,
+                                     on_event: Optional[Callable[[object], None]] = None) -> str:
+        """라우터 모드: 도구를 가진 에이전트 하나가 캘린더 요청과 일반 대화를 함께 처리합니다.
+        
+        일반 대화는 도구 없이 바로 답하므로 모델 호출 한 번으로 끝나고, 캘린더 요청은 도구 호출 뒤
+        텍스트 답변이 나오는 즉시 종료합니다.
+        """
         try:
-            # 메모리가 있는 일반 대화 에이전트 생성
-            memory = self.memory_manager.get_or_create_memory(session_id)
-            general_agent = self.agent_factory.create_general_agent(memory)
+            memory = self.memory_manager.get_agent_memory(session_id, "router")
+            async with self.agent_pool.lease(session_id, "router", memory) as team:
+                result = await self._run_team(team, user_input, on_event)
             
-            termination = MaxMessageTermination(max_messages=2)
-            team = RoundRobinGroupChat([general_agent], termination_condition=termination)
+            if result and result.messages:
+                for message in reversed(result.messages):
+                    if hasattr(message, 'content') and message.content and message.source == 'router_agent':
+                        return message.content.strip()
             
-            result = await team.run(task=user_input)
+            return "요청을 처리했지만 결과를 가져올 수 없습니다."
+            
+        except Exception as e:
+            return f"요청 처리 중 오류가 발생했습니다: {str(e)}"
+    
+    async def _handle_general_conversation(self, user_input: str, session_id: str,
+                                           on_event: Optional[Callable[[object], None]] = None) -> str:
+        """일반 대화를 처리합니다."""
+        try:
+            # 메모리가 있는 일반 대화 에이전트 팀 재사용
+            memory = self.memory_manager.get_agent_memory(session_id, "general")
+            async with self.agent_pool.lease(session_id, "general", memory) as team:
+                result = await self._run_team(team, user_input, on_event)
             
             if result and result.messages:
                 for message in reversed(result.messages):
@@ -190,5 +310,11 @@ class CalendarManagerAgent:
     
     async def close(self):
         """리소스를 정리합니다."""
+        await self.async_calendar_tools.close()
+        self.calendar_tools.close()
+        if self.intent_cache:
+            self.intent_cache.close()
+        await self.agent_pool.close()
+        await self.memory_manager.close()
         if hasattr(self.model_client, 'close'):
             await self.model_client.close() 
\ No newline at end of file
@@ -3,19 +3,22 @@
 """
 
 import json
-from typing import List
+from typing import Any, Dict, List, Optional
 
 from autogen_agentchat.agents import AssistantAgent
+from autogen_core.tools import FunctionTool
 from autogen_ext.models.openai import OpenAIChatCompletionClient
-from autogen_core.memory import ListMemory
+from autogen_core.memory import Memory
 
 try:
     # 전역 설치된 경우
-    from app.calendar_tools import CalendarTools
+    from app.calendar_tools import CalendarTools, AsyncCalendarTools
+    from app.events import json_default
     from app.agent.prompt import PromptManager
 except ImportError:
     # 로컬 실행인 경우
-    from calendar_tools import CalendarTools
+    from calendar_tools import CalendarTools, AsyncCalendarTools
+    from events import json_default
     from .prompt import PromptManager
 
 
@@ -23,12 +26,18 @@ class AgentFactory:
     """에이전트 생성 팩토리"""
     
     def __init__(self, model_client: OpenAIChatCompletionClient, 
-                 calendar_tools: CalendarTools, prompt_manager: PromptManager):
+                 calendar_tools: CalendarTools, prompt_manager: PromptManager,
+                 async_calendar_tools: AsyncCalendarTools = None, stream: bool = False):
         self.model_client = model_client
         self.calendar_tools = calendar_tools
         self.prompt_manager = prompt_manager
+        # 도구 함수는 비동기 버전을 사용해 AppleScript 실행 중에도 이벤트 루프가 멈추지 않게 함
+        self.async_calendar_tools = async_calendar_tools or AsyncCalendarTools(calendar_tools)
+        self._tools: Optional[List[FunctionTool]] = None
+        # 답변을 쓰는 에이전트(캘린더·일반 대화·라우터)는 모델 토큰을 스트리밍 이벤트로 내보냄
+        self.stream = stream
     
-    def create_intent_classifier(self, memory: ListMemory = None) -> AssistantAgent:
+    def create_intent_classifier(self, memory: Memory = None) -> AssistantAgent:
         """의도 분류 에이전트를 생성합니다."""
         from .agent import UserIntent  # 순환 import 방지
         
@@ -44,13 +53,14 @@ class AgentFactory:
         
         return AssistantAgent(**config)
     
-    def create_calendar_agent(self, memory: ListMemory = None) -> AssistantAgent:
+    def create_calendar_agent(self, memory: Memory = None) -> AssistantAgent:
         """캘린더 전문 에이전트를 생성합니다."""
         config = {
             "name": "calendar_agent",
             "model_client": self.model_client,
             "tools": self._get_calendar_tools(),
-            "system_message": self.prompt_manager.get_calendar_agent_prompt()
+            "system_message": self.prompt_manager.get_calendar_agent_prompt(),
+            "model_client_stream": self.stream
         }
         
         if memory:
@@ -58,12 +68,13 @@ class AgentFactory:
         
         return AssistantAgent(**config)
     
-    def create_general_agent(self, memory: ListMemory = None) -> AssistantAgent:
+    def create_general_agent(self, memory: Memory = None) -> AssistantAgent:
         """일반 대화 에이전트를 생성합니다."""
         config = {
             "name": "general_agent",
             "model_client": self.model_client,
-            "system_message": self.prompt_manager.get_general_agent_prompt()
+            "system_message": self.prompt_manager.get_general_agent_prompt(),
+            "model_client_stream": self.stream
         }
         
         if memory:
@@ -71,28 +82,90 @@ class AgentFactory:
         
         return AssistantAgent(**config)
     
-    def _get_calendar_tools(self) -> List:
-        """캘린더 관련 도구 함수들을 반환합니다."""
-        
-        def create_event(date_str: str, title: str, time_str: str = None, duration_minutes: int = 60) -> str:
-            """캘린더에 새 일정을 생성합니다."""
-            result = self.calendar_tools.create_event(date_str, title, time_str, duration_minutes)
-            return json.dumps(result, ensure_ascii=False)
-        
-        def get_events(date_str: str = None, keywords: str = None, months_range: int = 1) -> str:
-            """캘린더에서 일정을 조회합니다."""
-            result = self.calendar_tools.get_events(date_str, keywords, months_range)
-            return json.dumps(result, ensure_ascii=False)
-        
-        def update_event(original_title: str, new_date_str: str = None, 
-                        new_time_str: str = None, new_title: str = None) -> str:
-            """기존 일정을 수정합니다."""
-            result = self.calendar_tools.update_event(original_title, new_date_str, new_time_str, new_title)
-            return json.dumps(result, ensure_ascii=False)
-        
-        def delete_event(title: str, date_str: str = None) -> str:
-            """일정을 삭제합니다."""
-            result = self.calendar_tools.delete_event(title, date_str)
-            return json.dumps(result, ensure_ascii=False)
-        
-        return [create_event, get_events, update_event, delete_event] 
\ No newline at end of file
+    def create_router_agent(self, memory: Memory = None) -> AssistantAgent:
+        """의도 분류 없이 캘린더 요청과 일반 대화를 함께 처리하는 라우터 에이전트를 생성합니다."""
+        config = {
+            "name": "router_agent",
+            "model_client": self.model_client,
+            "tools": self._get_calendar_tools(),
+            "system_message": self.prompt_manager.get_router_agent_prompt(),
+            "model_client_stream": self.stream
+        }
+        
+        if memory:
+            config["memory"] = [memory]
+        
+        return AssistantAgent(**config)
+    
+    @staticmethod
+    def _to_json(result: dict) -> str:
+        """CalendarTools 결과(Event 포함)를 도구 응답 JSON으로 직렬화합니다."""
+        return json.dumps(result, ensure_ascii=False, default=json_default)
+    
+    def _get_calendar_tools(self) -> List[FunctionTool]:
+        """캘린더 도구 목록 (스키마 생성 비용이 크므로 처음 한 번만 만들고 모든 에이전트가 공유)"""
+        if self._tools is None:
+            self._tools = [FunctionTool(func, description=func.__doc__ or "") for func in self._build_calendar_tools()]
+        return self._tools
+    
+    def _build_calendar_tools(self) -> List:
+        """캘린더 관련 도구 함수들을 반환합니다. (비동기 함수라 런타임이 도구 호출을 겹쳐 실행할 수 있음)"""
+        tools = self.async_calendar_tools
+        
+        async def create_event(date_str: str, title: str, time_str: str = None, duration_minutes: int = None, 
+                               location: str = None, notes: str = None, recurrence: str = None) -> str:
+            """캘린더에 새 일정을 생성합니다. 반복 일정은 recurrence("매주", "평일", "격주 화요일", "매주 월수금 10회", "매월 12월까지")를 주면 한 번에 생성됩니다."""
+            result = await tools.create_event(date_str, title, time_str, duration_minutes, location, notes, recurrence)
+            return self._to_json(result)
+        
+        async def get_events(date_str: str = None, keywords: str = None, months_range: int = 1, 
+                             start: str = None, end: str = None, calendar: str = None) -> str:
+            """캘린더에서 일정을 조회합니다. 기간 조회는 start/end에 "이번 주", "다음 달", "6월 둘째 주" 같은 표현을 넣으세요. (start만 주면 그 기간 전체, calendar를 주면 해당 캘린더만)"""
+            result = await tools.get_events(date_str, keywords, months_range, start, end,
+                                            [calendar] if calendar else None)
+            return self._to_json(result)
+        
+        async def search_events(query: str, start: str = None, end: str = None, limit: int = 20) -> str:
+            """일정 제목·장소·메모에서 키워드를 검색해 관련도 순으로 반환합니다. (start/end로 기간 제한 가능)"""
+            result = await tools.search_events(query, start, end, limit)
+            return self._to_json(result)
+        
+        async def find_free_slots(range_str: str, duration_minutes: int = 60, working_hours: str = None) -> str:
+            """range_str("목요일 오후", "내일", "이번 주") 안에서 duration_minutes 이상 비어 있는 시간을 찾습니다. (working_hours 예: "09:00-18:00")"""
+            result = await tools.find_free_slots(range_str, duration_minutes, working_hours)
+            return self._to_json(result)
+        
+        async def check_conflicts(start: str, end: str = None) -> str:
+            """start~end 구간("내일 오후 3시", "금요일 오후 2시부터 4시")과 겹치는 일정이 있는지 확인합니다."""
+            result = await tools.check_conflicts(start, end)
+            return self._to_json(result)
+        
+        async def update_event(original_title: str, new_date_str: str = None, new_time_str: str = None, 
+                               new_title: str = None, original_date_str: str = None, uid: str = None) -> str:
+            """기존 일정을 수정합니다. 조회 결과의 uid를 주면 그 일정을 정확히 수정합니다. (같은 제목이 여럿이면 original_date_str로 구분)"""
+            result = await tools.update_event(original_title, new_date_str, new_time_str, new_title, 
+                                              original_date_str, uid)
+            return self._to_json(result)
+        
+        async def delete_event(title: str, date_str: str = None, uid: str = None) -> str:
+            """일정을 삭제합니다. 조회 결과의 uid를 주면 그 일정을 정확히 삭제합니다."""
+            result = await tools.delete_event(title, date_str, uid)
+            return self._to_json(result)
+        
+        async def create_events(events: List[Dict[str, Any]]) -> str:
+            """여러 일정을 한 번에 생성합니다. 각 항목: {"date_str", "title", "time_str"(선택), "duration_minutes"(선택), "recurrence"(선택)}"""
+            result = await tools.create_events(events)
+            return self._to_json(result)
+        
+        async def update_events(updates: List[Dict[str, Any]]) -> str:
+            """여러 일정을 한 번에 수정합니다. 각 항목: {"original_title", "new_date_str"(선택), "new_time_str"(선택), "new_title"(선택), "original_date_str"(선택), "uid"(선택)}"""
+            result = await tools.update_events(updates)
+            return self._to_json(result)
+        
+        async def delete_events(deletions: List[Dict[str, Any]]) -> str:
+            """여러 일정을 한 번에 삭제합니다. 각 항목: {"title", "date_str"(선택), "uid"(선택)}"""
+            result = await tools.delete_events(deletions)
+            return self._to_json(result)
+        
+        return [create_event, get_events, search_events, find_free_slots, check_conflicts, 
+                update_event, delete_event, create_events, update_events, delete_events] 
\ No newline at end of file
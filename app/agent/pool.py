@@ -0,0 +1,162 @@
+"""
+세션별 에이전트 팀 풀
+
+요청마다 AssistantAgent와 RoundRobinGroupChat을 새로 만들지 않고 (세션, 역할)마다 한 번 만든 팀을
+재사용합니다. 턴이 끝나면 team.reset()으로 대화 상태와 종료 조건을 초기화해 다음 턴이 이전 턴의
+메시지를 보지 않게 하고, 풀이 가득 차면 가장 오래 쓰지 않은 팀부터 버립니다(LRU).
+초기화는 내장 런타임을 한 번 돌리는 작업이라 응답을 돌려준 뒤 백그라운드에서 실행합니다.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Dict, Optional, Set, Tuple
+
+from autogen_agentchat.base import Team
+from autogen_core.memory import Memory
+
+
+# (역할, 세션 메모리) → 새 팀
+TeamBuilder = Callable[[str, Optional[Memory]], Team]
+
+
+@dataclass
+class PoolStats:
+    """팀 생성/재사용 횟수와 턴 준비에 쓴 시간"""
+    created: int = 0
+    reused: int = 0
+    evicted: int = 0
+    build_seconds: float = 0.0
+    wait_seconds: float = 0.0  # 끝나지 않은 초기화를 기다린 시간
+    reset_seconds: float = 0.0  # 백그라운드 초기화 시간 (응답 시간에는 포함되지 않음)
+    
+    @property
+    def setup_seconds(self) -> float:
+        """요청 처리 경로에서 턴 준비에 쓴 시간 (생성 + 초기화 대기)"""
+        return self.build_seconds + self.wait_seconds
+    
+    def as_dict(self) -> Dict[str, float]:
+        turns = self.created + self.reused
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "evicted": self.evicted,
+            "setup_ms": round(self.setup_seconds * 1000, 3),
+            "setup_average_ms": round(self.setup_seconds / turns * 1000, 3) if turns else 0.0,
+            "reset_ms": round(self.reset_seconds * 1000, 3),
+        }
+
+
+@dataclass
+class _PoolEntry:
+    team: Team
+    memory: Optional[Memory]
+    busy: bool = False
+    resetting: Optional["asyncio.Future"] = None
+
+
+class AgentPool:
+    """(세션 ID, 역할)별로 팀을 재사용하는 LRU 풀
+    
+    lease()로 빌린 팀은 돌려줄 때 백그라운드 초기화를 시작하고, 다음에 빌릴 때 초기화가 끝나지
+    않았으면 기다립니다. 같은 팀이 이미 실행 중이면(같은 세션의 동시 요청) 풀에 넣지 않는 임시 팀을
+    만들어 주고, 세션 메모리 객체가 바뀐 팀은 새로 만듭니다. 종료 전에 close()로 초기화를 마무리하세요.
+    max_entries가 0이면 매번 새 팀을 만듭니다. (재사용 전 동작)
+    """
+    
+    def __init__(self, build: TeamBuilder, max_entries: int = 32):
+        self._build = build
+        self.max_entries = max_entries
+        self.stats = PoolStats()
+        self._entries: "OrderedDict[Tuple[Optional[str], str], _PoolEntry]" = OrderedDict()
+        self._pending: Set["asyncio.Future"] = set()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def _create(self, role: str, memory: Optional[Memory]) -> Team:
+        began = time.perf_counter()
+        team = self._build(role, memory)
+        self.stats.build_seconds += time.perf_counter() - began
+        self.stats.created += 1
+        return team
+    
+    def _checkout(self, key: Tuple[Optional[str], str], memory: Optional[Memory]) -> Optional[_PoolEntry]:
+        """재사용할 항목을 꺼내거나 새로 만들어 넣습니다. (풀에 넣을 수 없으면 None)"""
+        entry = self._entries.get(key)
+        if entry is not None and entry.memory is not memory:
+            # 세션 메모리 객체가 바뀐 팀은 버림 (실행 중이면 빌려 간 쪽이 끝까지 사용)
+            del self._entries[key]
+            entry = None
+        if entry is not None:
+            if entry.busy and entry.resetting is None:
+                return None
+            self._entries.move_to_end(key)
+            self.stats.reused += 1
+            return entry
+        if self.max_entries <= 0:
+            return None
+        
+        entry = _PoolEntry(self._create(key[1], memory), memory)
+        self._entries[key] = entry
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evicted += 1
+        return entry
+    
+    @asynccontextmanager
+    async def lease(self, session_id: Optional[str], role: str,
+                    memory: Optional[Memory] = None) -> AsyncIterator[Team]:
+        """세션·역할의 팀을 빌려 줍니다. (블록을 나오면 백그라운드에서 초기화해 풀에 돌려놓음)"""
+        key = (session_id, role)
+        entry = self._checkout(key, memory)
+        if entry is None:
+            yield self._create(role, memory)
+            return
+        
+        if entry.resetting is not None:
+            began = time.perf_counter()
+            await entry.resetting
+            self.stats.wait_seconds += time.perf_counter() - began
+            if entry.busy or self._entries.get(key) is not entry:
+                # 기다리는 사이 다른 요청이 가져갔거나 초기화에 실패함
+                yield self._create(role, memory)
+                return
+        
+        entry.busy = True
+        try:
+            yield entry.team
+        finally:
+            entry.resetting = asyncio.ensure_future(self._reset(key, entry))
+            self._pending.add(entry.resetting)
+            entry.resetting.add_done_callback(self._pending.discard)
+    
+    async def _reset(self, key: Tuple[Optional[str], str], entry: _PoolEntry):
+        began = time.perf_counter()
+        try:
+            await entry.team.reset()
+        except Exception:
+            # 초기화할 수 없는 팀은 다시 쓰지 않음
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+        finally:
+            entry.busy = False
+            entry.resetting = None
+            self.stats.reset_seconds += time.perf_counter() - began
+    
+    def discard(self, session_id: Optional[str]):
+        """세션의 팀을 모두 버립니다."""
+        for key in [key for key in self._entries if key[0] == session_id]:
+            del self._entries[key]
+    
+    def clear(self):
+        """모든 팀을 버립니다."""
+        self._entries.clear()
+    
+    async def close(self):
+        """진행 중인 초기화를 마치고 모든 팀을 버립니다."""
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        self.clear()
@@ -38,19 +38,33 @@ class PromptManager:
 
         사용 가능한 함수:
         - create_event: 새 일정 생성
-        - get_events: 일정 조회/검색
+        - get_events: 날짜/기간별 일정 조회
+        - search_events: 키워드로 일정 검색 (제목·장소·메모, 관련도 순)
+        - find_free_slots: 기간 안의 빈 시간 찾기 ("목요일 오후에 언제 비어?")
+        - check_conflicts: 특정 시간에 겹치는 일정이 있는지 확인
         - update_event: 기존 일정 수정
         - delete_event: 일정 삭제
+        - create_events / update_events / delete_events: 여러 일정을 한 번에 생성/수정/삭제
+          (2개 이상의 일정을 다룰 때는 단건 함수를 반복 호출하지 말고 일괄 함수를 한 번 호출하세요)
 
         요청 패턴 분석:
         1. 일정 생성: "날짜 시간 - 제목" 형태 또는 "날짜에 제목 일정" 형태
         예: "5월 17일 일정등록해줘 저녁식사", "7월 5일 오후 2시 - 회의", "내일 오후 3시 팀 미팅"
+        반복 일정("매주 월요일 10시 스탠드업")은 일정을 여러 개 만들지 말고 create_event의 recurrence에
+        반복 표현("매주 월요일")을 넣어 한 번만 생성하세요.
         2. 일정 조회: "찾아줘", "보여줘", "확인", "조회", "언제" 등의 키워드
         예: "회의 일정 찾아줘", "내일 일정 보여줘"
+        날짜 없이 주제로 찾는 경우("회의 관련 일정 찾아줘", "강남에서 한 약속")에는 search_events를 사용하세요.
+        기간을 묻는 경우("이번 주 일정", "다음 달 회의", "6월 둘째 주")에는 get_events의 start(필요하면 end)에
+        기간 표현을 그대로 넣어 필요한 구간만 조회하세요. (예: start="이번 주", start="6월 10일", end="6월 20일")
         3. 일정 수정: "변경", "수정", "바꿔", "옮겨" 등의 키워드
         예: "회의 시간 변경해줘"
         4. 일정 삭제: "삭제", "지워", "취소" 등의 키워드
         예: "회의 일정 삭제해줘"
+        앞서 조회한 일정을 수정/삭제할 때는 결과의 uid를 함께 넘겨 정확한 일정을 지정하세요.
+        5. 빈 시간/겹침 확인: "언제 비어", "시간 돼", "겹치는" 등의 키워드
+        예: "목요일 오후에 1시간 빈 시간 찾아줘" → find_free_slots(range_str="목요일 오후", duration_minutes=60)
+        일정 목록을 받아 직접 계산하지 말고 find_free_slots/check_conflicts를 사용하세요.
 
         작업 결과를 한국어로 명확하게 설명해주세요.
         """
@@ -71,4 +85,12 @@ class PromptManager:
         - 인사 → 따뜻한 인사와 함께 기능 소개
         - 감사 → 겸손한 응답과 추가 도움 제안
         - 테스트 → 테스트 확인과 기능 안내
-        """ 
\ No newline at end of file
+        """
+    
+    @staticmethod
+    def get_router_agent_prompt() -> str:
+        """라우터 에이전트용 프롬프트 (의도 분류·캘린더 작업·일반 대화를 한 에이전트가 처리)"""
+        return PromptManager.get_calendar_agent_prompt() + """
+        캘린더와 관련 없는 인사, 감사, 테스트, 잡담에는 함수를 호출하지 말고 친근하고 간결하게 바로 답하세요.
+        (인사 → 따뜻한 인사와 함께 캘린더 관리 기능 소개, 감사 → 추가 도움 제안, 테스트 → 정상 동작 확인)
+        """
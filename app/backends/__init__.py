@@ -0,0 +1,37 @@
+"""
+AppleScript 실행 백엔드 모듈
+"""
+
+import shlex
+from typing import Optional
+
+from .base import AppleScriptError, ScriptBackend, CallableBackend
+from .osascript import OsascriptBackend, ScriptCompiler
+from .templates import Script, ScriptCall, ScriptTemplate, register_template, get_template
+from .worker import PersistentWorkerBackend, WorkerCrashed, WorkerTimeout, default_worker_command
+from .aio import AsyncScriptBackend, AsyncOsascriptBackend, AsyncWorkerBackend, create_async_backend
+from .memory import MemoryCalendar, MemoryEvent, MemoryCalendarBackend, AsyncMemoryCalendarBackend, shared_calendar
+
+
+def create_backend(kind: str = "worker", command: Optional[str] = None, 
+                   max_workers: int = 2, timeout: Optional[float] = 30.0) -> ScriptBackend:
+    """설정 값에 맞는 백엔드를 생성합니다.
+    
+    command를 지정하면 상주 실행기 대신 해당 명령(예: 대체 인터프리터)을 띄웁니다.
+    """
+    if kind == "osascript":
+        return OsascriptBackend()
+    if kind == "memory":
+        return MemoryCalendarBackend(shared_calendar())
+    worker_command = shlex.split(command) if command else default_worker_command()
+    return PersistentWorkerBackend(worker_command, max_workers=max_workers, timeout=timeout)
+
+
+__all__ = [
+    'AppleScriptError', 'ScriptBackend', 'CallableBackend', 'OsascriptBackend',
+    'PersistentWorkerBackend', 'WorkerCrashed', 'WorkerTimeout', 'default_worker_command',
+    'create_backend', 'AsyncScriptBackend', 'AsyncOsascriptBackend', 'AsyncWorkerBackend',
+    'create_async_backend', 'Script', 'ScriptCall', 'ScriptTemplate', 'ScriptCompiler',
+    'register_template', 'get_template', 'MemoryCalendar', 'MemoryEvent', 'MemoryCalendarBackend',
+    'AsyncMemoryCalendarBackend', 'shared_calendar'
+]
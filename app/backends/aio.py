@@ -0,0 +1,223 @@
+"""
+asyncio 기반 AppleScript 백엔드
+
+이벤트 루프를 막지 않도록 asyncio.create_subprocess_exec로 실행기를 띄우며,
+세마포어로 동시 실행 수를 제한하고 호출마다 시간 제한을 둡니다.
+작업이 취소되거나 시간이 초과되면 실행 중인 자식 프로세스를 종료합니다.
+"""
+
+import asyncio
+import shlex
+from abc import ABC, abstractmethod
+from typing import List, Optional, Sequence
+
+from .base import AppleScriptError
+from .osascript import ScriptCompiler
+from .templates import Script, ScriptCall
+from .worker import WorkerCrashed, WorkerTimeout, default_worker_command, encode_request
+
+
+class AsyncScriptBackend(ABC):
+    """AppleScript 비동기 실행 백엔드 인터페이스"""
+    
+    def __init__(self, max_concurrency: int = 2, timeout: Optional[float] = 30.0):
+        self.max_concurrency = max(1, max_concurrency)
+        self.timeout = timeout
+        self._semaphore: Optional[asyncio.Semaphore] = None
+    
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """동시 실행 수 제한 (실행 중인 이벤트 루프에서 처음 사용할 때 생성)"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+    
+    @abstractmethod
+    async def run(self, script: Script, timeout: Optional[float] = None) -> str:
+        """스크립트(소스 문자열 또는 템플릿 실행 요청)를 실행하고 결과 문자열을 반환합니다."""
+    
+    async def close(self):
+        """백엔드가 가진 자원을 정리합니다."""
+
+
+async def _kill(process: asyncio.subprocess.Process):
+    """자식 프로세스를 종료하고 회수합니다."""
+    if process.returncode is None:
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+    await process.wait()
+
+
+class AsyncOsascriptBackend(AsyncScriptBackend):
+    """호출마다 osascript 프로세스를 띄우는 비동기 백엔드
+    
+    템플릿 실행 요청은 컴파일해 둔 .scpt 파일과 argv로 실행합니다. (컴파일은 템플릿당 한 번)
+    """
+    
+    def __init__(self, command: Sequence[str] = ("osascript", "-e"),
+                 max_concurrency: int = 2, timeout: Optional[float] = 30.0, 
+                 compiler: Optional[ScriptCompiler] = None):
+        super().__init__(max_concurrency, timeout)
+        self.command = list(command)
+        self.compiler = compiler or ScriptCompiler()
+    
+    async def _arguments(self, script: Script) -> List[str]:
+        if isinstance(script, ScriptCall):
+            # osacompile은 처음 한 번만 실행되지만 이벤트 루프를 막지 않도록 스레드에서 실행
+            path = await asyncio.get_running_loop().run_in_executor(None, self.compiler.path, script.template)
+            return [self.command[0], str(path), *script.args]
+        return [*self.command, script]
+    
+    async def run(self, script: Script, timeout: Optional[float] = None) -> str:
+        timeout = timeout if timeout is not None else self.timeout
+        arguments = await self._arguments(script)
+        async with self.semaphore:
+            process = await asyncio.create_subprocess_exec(
+                *arguments,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+            except asyncio.TimeoutError:
+                raise WorkerTimeout(f"AppleScript 실행 시간 초과 ({timeout}초)")
+            finally:
+                # 시간 초과·취소로 빠져나온 경우 osascript를 남기지 않음
+                if process.returncode is None:
+                    await asyncio.shield(_kill(process))
+            
+            if process.returncode != 0:
+                raise AppleScriptError(f"AppleScript 실행 오류: {stderr.decode('utf-8', 'replace')}")
+            return stdout.decode("utf-8", "replace").strip("\r\n")
+
+
+class _AsyncWorkerProcess:
+    """worker_main 프레임 프로토콜로 통신하는 비동기 실행기 프로세스 하나"""
+    
+    def __init__(self, process: asyncio.subprocess.Process):
+        self.process = process
+    
+    @classmethod
+    async def spawn(cls, command: Sequence[str]) -> "_AsyncWorkerProcess":
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        return cls(process)
+    
+    @property
+    def alive(self) -> bool:
+        return self.process.returncode is None
+    
+    async def execute(self, script: Script) -> str:
+        """스크립트 하나를 보내고 응답 전체를 반환합니다."""
+        try:
+            self.process.stdin.write(encode_request(script))
+            await self.process.stdin.drain()
+            
+            header = await self.process.stdout.readline()
+            if not header:
+                raise EOFError
+            status, length = header.decode("ascii").split()
+            payload = await self.process.stdout.readexactly(int(length))
+        except (OSError, EOFError, ValueError, asyncio.IncompleteReadError):
+            raise WorkerCrashed("AppleScript 실행기가 비정상 종료되었습니다.")
+        
+        text = payload.decode("utf-8", "replace")
+        if status != "ok":
+            raise AppleScriptError(f"AppleScript 실행 오류: {text}")
+        return text.strip("\r\n")
+    
+    async def kill(self):
+        await _kill(self.process)
+    
+    async def close(self):
+        """입력을 닫아 정상 종료를 요청합니다."""
+        try:
+            self.process.stdin.close()
+            await asyncio.wait_for(self.process.wait(), 2)
+        except Exception:
+            await self.kill()
+
+
+class AsyncWorkerBackend(AsyncScriptBackend):
+    """상주 실행기 프로세스 풀을 asyncio 파이프로 사용하는 비동기 백엔드
+    
+    PersistentWorkerBackend와 같은 실행기(worker_main)를 사용합니다. 실행기가 죽으면
+    새로 띄워 한 번 재시도하고, 시간 초과되거나 취소된 호출의 실행기는 응답이
+    뒤섞이지 않도록 종료 후 교체합니다.
+    """
+    
+    def __init__(self, command: Optional[Sequence[str]] = None,
+                 max_concurrency: int = 2, timeout: Optional[float] = 30.0):
+        super().__init__(max_concurrency, timeout)
+        self.command = list(command) if command else default_worker_command()
+        self.restart_count = 0
+        self._idle: List[_AsyncWorkerProcess] = []
+        self._workers: List[_AsyncWorkerProcess] = []
+    
+    async def _acquire_worker(self) -> _AsyncWorkerProcess:
+        """유휴 실행기를 꺼내거나 새로 띄웁니다."""
+        while self._idle:
+            worker = self._idle.pop()
+            if worker.alive:
+                return worker
+            await self._discard(worker)
+        worker = await _AsyncWorkerProcess.spawn(self.command)
+        self._workers.append(worker)
+        return worker
+    
+    async def _discard(self, worker: _AsyncWorkerProcess):
+        if worker in self._workers:
+            self._workers.remove(worker)
+        await worker.kill()
+    
+    async def run(self, script: Script, timeout: Optional[float] = None) -> str:
+        timeout = timeout if timeout is not None else self.timeout
+        async with self.semaphore:
+            for attempt in range(2):
+                worker = await self._acquire_worker()
+                healthy = False
+                try:
+                    result = await asyncio.wait_for(worker.execute(script), timeout)
+                    healthy = True
+                    return result
+                except asyncio.TimeoutError:
+                    self.restart_count += 1
+                    raise WorkerTimeout(f"AppleScript 실행 시간 초과 ({timeout}초)")
+                except WorkerCrashed:
+                    self.restart_count += 1
+                    if attempt == 0:
+                        continue
+                    raise
+                except AppleScriptError:
+                    healthy = True
+                    raise
+                finally:
+                    if healthy:
+                        self._idle.append(worker)
+                    else:
+                        # 취소된 경우에도 응답이 남은 실행기를 재사용하지 않음
+                        await asyncio.shield(self._discard(worker))
+    
+    async def close(self):
+        """모든 실행기를 종료합니다."""
+        workers, self._workers, self._idle = self._workers, [], []
+        for worker in workers:
+            await worker.close()
+
+
+def create_async_backend(kind: str = "worker", command: Optional[str] = None,
+                         max_concurrency: int = 2, timeout: Optional[float] = 30.0) -> AsyncScriptBackend:
+    """설정 값에 맞는 비동기 백엔드를 생성합니다. (create_backend와 같은 설정을 사용)"""
+    if kind == "osascript":
+        return AsyncOsascriptBackend(max_concurrency=max_concurrency, timeout=timeout)
+    if kind == "memory":
+        from .memory import AsyncMemoryCalendarBackend, shared_calendar
+        return AsyncMemoryCalendarBackend(shared_calendar(), max_concurrency=max_concurrency, timeout=timeout)
+    worker_command = shlex.split(command) if command else None
+    return AsyncWorkerBackend(worker_command, max_concurrency=max_concurrency, timeout=timeout)
@@ -0,0 +1,57 @@
+"""
+AppleScript 실행 백엔드 인터페이스
+"""
+
+from abc import ABC, abstractmethod
+from typing import Callable, Iterator
+
+from .templates import Script, script_source
+
+
+class AppleScriptError(Exception):
+    """AppleScript 실행 실패"""
+
+
+class ScriptBackend(ABC):
+    """AppleScript를 실행하는 백엔드 인터페이스
+
+    CalendarTools는 이 인터페이스만 사용하므로 macOS가 아닌 환경에서도
+    대체 백엔드를 주입해 스크립트 생성/결과 파싱 경로를 실행할 수 있습니다.
+    
+    script는 소스 문자열이거나 템플릿 실행 요청(ScriptCall)입니다. 템플릿을 미리 컴파일할 수
+    없는 백엔드는 script_source()로 인라인 스크립트를 만들어 실행합니다.
+    """
+    
+    @abstractmethod
+    def run(self, script: Script) -> str:
+        """스크립트를 실행하고 표준 출력(앞뒤 줄바꿈 제거)을 반환합니다.
+        
+        str.strip()은 RS/US 구분자도 공백으로 보고 지우므로, 마지막 레코드의 빈 필드가
+        사라지지 않게 줄바꿈만 제거합니다.
+        """
+    
+    def stream(self, script: Script) -> Iterator[str]:
+        """스크립트를 실행하고 표준 출력을 조각 단위로 내보냅니다.
+        
+        기본 구현은 run() 결과를 한 번에 내보내며, 가능한 백엔드는 읽는 대로 내보냅니다.
+        """
+        yield self.run(script)
+    
+    def close(self):
+        """백엔드가 점유한 자원을 정리합니다."""
+
+
+class CallableBackend(ScriptBackend):
+    """함수 하나를 백엔드로 감싸는 어댑터 (테스트/대체 구현용)
+    
+    템플릿 실행 요청은 인라인 스크립트로 바꿔 함수에 넘깁니다.
+    """
+    
+    def __init__(self, func: Callable[[str], str]):
+        self.func = func
+        self.call_count = 0
+    
+    def run(self, script: Script) -> str:
+        """감싼 함수로 스크립트를 실행합니다."""
+        self.call_count += 1
+        return (self.func(script_source(script)) or "").strip("\r\n")
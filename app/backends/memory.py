@@ -0,0 +1,391 @@
+"""
+메모리 안의 가짜 Calendar 백엔드
+
+Calendar 앱 대신 메모리에 둔 캘린더로 템플릿 실행 요청(ScriptCall)을 템플릿 ID와 인자에 따라
+해석합니다. 도구가 기대는 Calendar 동작(캘린더 여러 개, 날짜 구간 whose 조회, 대소문자를 구분하지
+않는 제목 비교, 첫 번째 일치 항목 삭제, stamp date 기준 변경분)을 그대로 흉내 내므로 macOS가 아닌
+환경에서도 CalendarTools 전체 경로를 실행할 수 있습니다. 합성 일정을 대량으로 채울 수 있어
+도구 계층 성능 측정에도 사용합니다.
+"""
+
+import bisect
+import itertools
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta, tzinfo
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import pytz
+
+from .aio import AsyncScriptBackend
+from .base import AppleScriptError, ScriptBackend
+from .templates import Script, ScriptCall
+
+try:
+    # 전역 설치된 경우
+    from app.events.wire import FIELD_SEPARATOR, RECORD_SEPARATOR
+    from app.query import RULE_MARKER, STATS_MARKER
+    from app.scripts import CREATE_FIELDS, UPDATE_FIELDS, DELETE_FIELDS
+except ImportError:
+    # 로컬 실행인 경우
+    from events.wire import FIELD_SEPARATOR, RECORD_SEPARATOR
+    from query import RULE_MARKER, STATS_MARKER
+    from scripts import CREATE_FIELDS, UPDATE_FIELDS, DELETE_FIELDS
+
+
+STAMP_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+# 합성 일정 제목 (제목 검색이 의미 있도록 자주 쓰는 단어로 구성)
+SYNTHETIC_TITLES = [
+    "팀 회의", "주간 회의", "1:1 면담", "코드 리뷰", "점심 약속", "운동", "병원 예약",
+    "프로젝트 리뷰", "고객 미팅", "스프린트 계획", "저녁 약속", "스터디", "출장", "Design Review"
+]
+SYNTHETIC_RULES = ["FREQ=DAILY;INTERVAL=1", "FREQ=WEEKLY;INTERVAL=1", "FREQ=WEEKLY;INTERVAL=2", "FREQ=MONTHLY;INTERVAL=1"]
+
+
+@dataclass
+class MemoryEvent:
+    """Calendar 일정 한 건 (시각은 캘린더 시간대의 벽시계 시각)"""
+    uid: str
+    summary: str
+    start: datetime
+    end: datetime
+    location: str = ""
+    description: str = ""
+    recurrence: str = ""
+    stamp: Optional[datetime] = None
+
+
+class _MemoryCalendarData:
+    """캘린더 하나의 일정 목록 (시작 시각 순으로 정렬해 구간 조회를 이분 탐색)"""
+    
+    def __init__(self):
+        self.events: List[MemoryEvent] = []
+        self._keys: List[Tuple[datetime, int]] = []
+        self._order = itertools.count()
+    
+    def add(self, event: MemoryEvent):
+        key = (event.start, next(self._order))
+        position = bisect.bisect(self._keys, key)
+        self._keys.insert(position, key)
+        self.events.insert(position, event)
+    
+    def remove(self, event: MemoryEvent):
+        position = bisect.bisect_left(self._keys, (event.start,))
+        while self.events[position] is not event:
+            position += 1
+        del self._keys[position]
+        del self.events[position]
+    
+    def between(self, start: datetime, end: datetime) -> List[MemoryEvent]:
+        """start ≤ 시작 ≤ end인 일정"""
+        low = bisect.bisect_left(self._keys, (start,))
+        high = bisect.bisect_right(self._keys, (end, float("inf")))
+        return self.events[low:high]
+
+
+def _casefold(value: str) -> str:
+    # AppleScript 문자열 비교(is, contains)는 기본적으로 대소문자를 구분하지 않음
+    return value.casefold()
+
+
+def _parse(value: str) -> datetime:
+    return datetime.strptime(value, STAMP_FORMAT)
+
+
+def _stamp(value: datetime) -> str:
+    return value.strftime(STAMP_FORMAT)
+
+
+class MemoryCalendar:
+    """메모리 안의 Calendar 앱 (캘린더 이름 → 일정)
+    
+    execute()가 scripts 모듈의 템플릿을 ID별로 해석합니다. 변경분 조회용 stamp date는 clock이
+    돌려주는 시각(기본: tz 기준 현재 벽시계 시각)을 Calendar처럼 초 단위로 기록합니다.
+    """
+    
+    def __init__(self, calendars: Iterable[str] = ("캘린더",), tz: Optional[tzinfo] = None,
+                 clock: Optional[Callable[[], datetime]] = None):
+        self.timezone = tz or pytz.timezone('Asia/Seoul')
+        self.clock = clock or (lambda: datetime.now(self.timezone).replace(tzinfo=None))
+        self.calendars: Dict[str, _MemoryCalendarData] = {}
+        self._by_uid: Dict[str, Tuple[str, MemoryEvent]] = {}
+        self._uids = itertools.count(1)
+        for name in calendars:
+            self.add_calendar(name)
+        
+        self._handlers = {
+            "calendar/list": self._list,
+            "calendar/rules": self._rules,
+            "calendar/changes": self._changes,
+            "calendar/live-uids": self._live_uids,
+            "calendar/create": self._create,
+            "calendar/update": self._update,
+            "calendar/delete": self._delete,
+        }
+    
+    def add_calendar(self, name: str):
+        """빈 캘린더를 추가합니다. (이미 있으면 그대로 둠)"""
+        self.calendars.setdefault(name, _MemoryCalendarData())
+    
+    def add_event(self, calendar: str, summary: str, start: datetime, end: datetime,
+                  location: str = "", description: str = "", recurrence: str = "",
+                  uid: Optional[str] = None) -> MemoryEvent:
+        """일정을 추가합니다. 시각은 naive(벽시계 시각) 또는 aware(캘린더 시간대로 변환)입니다."""
+        if calendar not in self.calendars:
+            raise AppleScriptError(f'캘린더를 찾을 수 없습니다: "{calendar}"')
+        event = MemoryEvent(uid or f"MEM-{next(self._uids):08d}", summary, self._wall(start), self._wall(end),
+                            location, description, recurrence, self._now())
+        self.calendars[calendar].add(event)
+        self._by_uid[event.uid] = (calendar, event)
+        return event
+    
+    def seed(self, count: int, calendars: Optional[Sequence[str]] = None, start: Optional[datetime] = None,
+             days: int = 365, recurring_ratio: float = 0.0, seed: int = 42) -> List[MemoryEvent]:
+        """합성 일정 count개를 캘린더들에 고르게 흩어 넣습니다.
+        
+        start(기본: 오늘 0시)부터 days일 동안 근무 시간 위주로 15분~3시간 일정을 만들고,
+        recurring_ratio 비율만큼은 반복 규칙을 붙입니다. 같은 seed는 같은 데이터를 만듭니다.
+        """
+        names = list(calendars or self.calendars)
+        for name in names:
+            self.add_calendar(name)
+        rng = random.Random(seed)
+        base = self._wall(start) if start else self.clock().replace(hour=0, minute=0, second=0, microsecond=0)
+        
+        events = []
+        for i in range(count):
+            begin = base + timedelta(days=rng.randrange(days), hours=rng.randrange(8, 20),
+                                     minutes=rng.choice((0, 15, 30, 45)))
+            end = begin + timedelta(minutes=rng.choice((15, 30, 60, 90, 180)))
+            rule = rng.choice(SYNTHETIC_RULES) if rng.random() < recurring_ratio else ""
+            events.append(self.add_event(names[i % len(names)], f"{rng.choice(SYNTHETIC_TITLES)} {i}",
+                                         begin, end, recurrence=rule))
+        return events
+    
+    def events(self, calendar: Optional[str] = None) -> List[MemoryEvent]:
+        """캘린더(기본: 전체)의 일정 목록"""
+        names = [calendar] if calendar else list(self.calendars)
+        return [event for name in names if name in self.calendars for event in self.calendars[name].events]
+    
+    def __len__(self) -> int:
+        return sum(len(data.events) for data in self.calendars.values())
+    
+    def execute(self, call: ScriptCall) -> str:
+        """템플릿 실행 요청을 해석해 스크립트 출력과 같은 문자열을 반환합니다."""
+        template_id = call.template_id
+        if template_id.startswith("calendar/query/"):
+            records = self._query(call.args, with_rules=template_id.endswith("/rules"))
+        else:
+            handler = self._handlers.get(template_id)
+            if handler is None:
+                raise AppleScriptError(f"지원하지 않는 템플릿입니다: {template_id}")
+            records = handler(call.args)
+        return RECORD_SEPARATOR.join(records)
+    
+    # 내부 도구
+    
+    def _wall(self, value: datetime) -> datetime:
+        if value.tzinfo is None:
+            return value
+        return value.astimezone(self.timezone).replace(tzinfo=None)
+    
+    def _now(self) -> datetime:
+        return self.clock().replace(microsecond=0)
+    
+    def _existing(self, names: str) -> Iterator[Tuple[str, _MemoryCalendarData]]:
+        """US로 이은 캘린더 이름 중 있는 캘린더 (없는 캘린더는 스크립트의 try처럼 건너뜀)"""
+        for name in names.split(FIELD_SEPARATOR) if names else []:
+            data = self.calendars.get(name)
+            if data is not None:
+                yield name, data
+    
+    @staticmethod
+    def _record(name: str, event: MemoryEvent, rule: bool = False) -> str:
+        fields = [name, event.uid, event.summary, _stamp(event.start), _stamp(event.end),
+                  event.location, event.description]
+        if rule:
+            fields.append(event.recurrence)
+        return FIELD_SEPARATOR.join(fields)
+    
+    def _find(self, default_calendar: str, args: Sequence[str]) -> Tuple[str, List[MemoryEvent]]:
+        """FIND_TARGET과 같은 규칙으로 (캘린더, 일치 일정)을 찾습니다."""
+        uid, title, day_start, day_end, calendars = args[:5]
+        if uid:
+            found = self._by_uid.get(uid)
+            if found and found[0] in calendars.split(FIELD_SEPARATOR):
+                return found[0], [found[1]]
+            return default_calendar, []
+        
+        data = self.calendars.get(default_calendar)
+        if data is None:
+            return default_calendar, []
+        candidates = data.between(_parse(day_start), _parse(day_end)) if day_start else data.events
+        wanted = _casefold(title)
+        return default_calendar, [event for event in candidates if _casefold(event.summary) == wanted]
+    
+    def _move(self, name: str, event: MemoryEvent, start: datetime, end: datetime):
+        data = self.calendars[name]
+        data.remove(event)
+        event.start, event.end = start, end
+        data.add(event)
+    
+    # 템플릿별 해석
+    
+    def _list(self, args: Sequence[str]) -> List[str]:
+        return list(self.calendars)
+    
+    def _query(self, args: Sequence[str], with_rules: bool = False) -> List[str]:
+        start, end = _parse(args[1]), _parse(args[2])
+        terms = [_casefold(term) for term in args[3:]]
+        records, scanned = [], 0
+        for name, data in self._existing(args[0]):
+            in_range = data.between(start, end)
+            scanned += len(in_range)
+            for event in in_range:
+                summary = _casefold(event.summary)
+                if all(term in summary for term in terms):
+                    records.append(self._record(name, event))
+            if with_rules:
+                records.extend(f"{RULE_MARKER}{FIELD_SEPARATOR}{self._record(name, event, rule=True)}"
+                               for event in data.events if event.recurrence)
+        records.append(f"{STATS_MARKER}{FIELD_SEPARATOR}{scanned}")
+        return records
+    
+    def _rules(self, args: Sequence[str]) -> List[str]:
+        return [self._record(name, event, rule=True)
+                for name, data in self._existing(args[0]) for event in data.events if event.recurrence]
+    
+    def _changes(self, args: Sequence[str]) -> List[str]:
+        since = _parse(args[1])
+        return [self._record(name, event, rule=True)
+                for name, data in self._existing(args[0]) for event in data.events if event.stamp >= since]
+    
+    def _live_uids(self, args: Sequence[str]) -> List[str]:
+        start, end = _parse(args[1]), _parse(args[2])
+        uids = []
+        for _, data in self._existing(args[0]):
+            uids.extend(event.uid for event in data.between(start, end))
+            uids.extend(event.uid for event in data.events if event.recurrence)
+        return uids
+    
+    def _create(self, args: Sequence[str]) -> List[str]:
+        calendar = args[0]
+        if calendar not in self.calendars:
+            # 스크립트의 tell calendar가 try 밖에 있으므로 전체 실행이 실패함
+            raise AppleScriptError(f'AppleScript 실행 오류: 캘린더를 찾을 수 없습니다: "{calendar}"')
+        results = []
+        for base in range(1, len(args), CREATE_FIELDS):
+            title, start, end, location, notes, rule = args[base:base + CREATE_FIELDS]
+            try:
+                event = self.add_event(calendar, title, _parse(start), _parse(end), location, notes, rule)
+            except ValueError as e:
+                results.append(f"error{FIELD_SEPARATOR}{e}")
+                continue
+            results.append(f"ok{FIELD_SEPARATOR}{event.uid}")
+        return results
+    
+    def _update(self, args: Sequence[str]) -> List[str]:
+        default_calendar, results = args[0], []
+        for base in range(1, len(args), UPDATE_FIELDS):
+            item = args[base:base + UPDATE_FIELDS]
+            new_title, new_start, new_time, duration = item[5:9]
+            try:
+                name, matches = self._find(default_calendar, item)
+                if not matches:
+                    results.append("missing")
+                    continue
+                event = matches[0]
+                if new_title:
+                    event.summary = new_title
+                if new_start or new_time:
+                    if new_start:
+                        start = _parse(new_start)
+                    else:
+                        # 시간만 바꾸면 기존 일정의 날짜에 새 시각을 적용
+                        start = event.start.replace(hour=int(new_time[:2]), minute=int(new_time[3:5]), second=0)
+                    length = timedelta(seconds=int(duration)) if duration else event.end - event.start
+                    self._move(name, event, start, start + length)
+                event.stamp = self._now()
+                results.append(FIELD_SEPARATOR.join(["ok", event.uid, name, event.summary,
+                                                     _stamp(event.start), _stamp(event.end)]))
+            except ValueError as e:
+                results.append(f"error{FIELD_SEPARATOR}{e}")
+        return results
+    
+    def _delete(self, args: Sequence[str]) -> List[str]:
+        default_calendar, results = args[0], []
+        for base in range(1, len(args), DELETE_FIELDS):
+            try:
+                name, matches = self._find(default_calendar, args[base:base + DELETE_FIELDS])
+            except ValueError as e:
+                results.append(f"error{FIELD_SEPARATOR}{e}")
+                continue
+            if not matches:
+                results.append("missing")
+                continue
+            self.calendars[name].remove(matches[0])
+            del self._by_uid[matches[0].uid]
+            results.append(f"ok{FIELD_SEPARATOR}{matches[0].uid}")
+        return results
+
+
+_shared_calendar: Optional[MemoryCalendar] = None
+
+
+def shared_calendar() -> MemoryCalendar:
+    """설정으로 만든 메모리 백엔드(create_backend / create_async_backend)가 함께 쓰는 캘린더
+    
+    MAC_AGENT_APPLESCRIPT_BACKEND=memory일 때 동기 도구와 비동기 도구가 같은 일정을 보게 합니다.
+    """
+    global _shared_calendar
+    if _shared_calendar is None:
+        _shared_calendar = MemoryCalendar()
+    return _shared_calendar
+
+
+class MemoryCalendarBackend(ScriptBackend):
+    """MemoryCalendar로 템플릿 실행 요청을 처리하는 백엔드 (오프라인 테스트/벤치마크용)
+    
+    소스 문자열 스크립트는 해석할 수 없으므로 AppleScriptError입니다.
+    calls에는 템플릿 ID별 실행 횟수를 셉니다.
+    """
+    
+    def __init__(self, calendar: Optional[MemoryCalendar] = None):
+        # 빈 MemoryCalendar도 len()이 0이라 거짓이므로 None과만 비교
+        self.calendar = calendar if calendar is not None else MemoryCalendar()
+        self.calls: Dict[str, int] = {}
+    
+    def _execute(self, script: Script) -> str:
+        if not isinstance(script, ScriptCall):
+            raise AppleScriptError("메모리 백엔드는 템플릿 실행 요청만 실행할 수 있습니다.")
+        self.calls[script.template_id] = self.calls.get(script.template_id, 0) + 1
+        return self.calendar.execute(script)
+    
+    def run(self, script: Script) -> str:
+        return self._execute(script).strip("\r\n")
+    
+    def stream(self, script: Script) -> Iterator[str]:
+        # 상주 실행기의 스트리밍 출력처럼 앞뒤 공백을 자르지 않음 (마지막 레코드의 빈 필드 보존)
+        yield self._execute(script)
+
+
+class AsyncMemoryCalendarBackend(AsyncScriptBackend):
+    """MemoryCalendarBackend의 비동기 버전 (같은 MemoryCalendar를 공유할 수 있음)"""
+    
+    def __init__(self, calendar: Optional[MemoryCalendar] = None,
+                 max_concurrency: int = 2, timeout: Optional[float] = 30.0):
+        super().__init__(max_concurrency, timeout)
+        self.backend = MemoryCalendarBackend(calendar)
+    
+    @property
+    def calendar(self) -> MemoryCalendar:
+        return self.backend.calendar
+    
+    @property
+    def calls(self) -> Dict[str, int]:
+        return self.backend.calls
+    
+    async def run(self, script: Script, timeout: Optional[float] = None) -> str:
+        async with self.semaphore:
+            return self.backend.run(script)
@@ -0,0 +1,118 @@
+"""
+osascript 프로세스 기반 백엔드
+"""
+
+import os
+import subprocess
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from .base import AppleScriptError, ScriptBackend
+from .templates import Script, ScriptCall, ScriptTemplate
+
+
+class ScriptCompiler:
+    """템플릿을 osacompile로 컴파일한 .scpt 파일을 템플릿 ID별로 보관합니다.
+    
+    파일 이름에 소스 해시를 넣으므로 템플릿이 바뀌면 새로 컴파일하고, 다른 프로세스가
+    이미 컴파일해 둔 파일은 그대로 재사용합니다.
+    """
+    
+    def __init__(self, cache_dir: Optional[Path] = None, executable: str = "osacompile"):
+        self.cache_dir = Path(cache_dir) if cache_dir else Path.home() / ".mac_agent" / "scripts"
+        self.executable = executable
+        self.compile_count = 0
+        self._paths: Dict[str, Path] = {}
+        self._lock = threading.Lock()
+    
+    def path(self, template: ScriptTemplate) -> Path:
+        """템플릿의 컴파일된 스크립트 경로 (없으면 컴파일)"""
+        key = f"{template.template_id}-{template.digest}"
+        path = self._paths.get(key)
+        if path is not None:
+            return path
+        with self._lock:
+            path = self.cache_dir / f"{key.replace('/', '_')}.scpt"
+            if not path.exists():
+                self._compile(template, path)
+            self._paths[key] = path
+        return path
+    
+    def _compile(self, template: ScriptTemplate, path: Path):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, source_path = tempfile.mkstemp(suffix=".applescript", dir=self.cache_dir)
+        output_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(template.source)
+            result = subprocess.run(
+                [self.executable, "-o", output_path, source_path],
+                capture_output=True,
+                text=True
+            )
+            if result.returncode != 0:
+                raise AppleScriptError(f"AppleScript 컴파일 오류 ({template.template_id}): {result.stderr}")
+            # 동시에 컴파일한 다른 프로세스와 겹쳐도 완성된 파일만 보이도록 교체
+            os.replace(output_path, path)
+            self.compile_count += 1
+        finally:
+            for leftover in (source_path, output_path):
+                if os.path.exists(leftover):
+                    os.unlink(leftover)
+
+
+class OsascriptBackend(ScriptBackend):
+    """호출마다 osascript 프로세스를 실행하는 기본 백엔드
+    
+    템플릿 실행 요청은 컴파일해 둔 .scpt 파일과 argv로 실행하므로 매번 소스를 컴파일하지 않습니다.
+    """
+    
+    CHUNK_SIZE = 64 * 1024
+    
+    def __init__(self, executable: str = "osascript", compiler: Optional[ScriptCompiler] = None):
+        self.executable = executable
+        self.compiler = compiler or ScriptCompiler()
+    
+    def command(self, script: Script) -> List[str]:
+        """스크립트를 실행할 osascript 명령"""
+        if isinstance(script, ScriptCall):
+            return [self.executable, str(self.compiler.path(script.template)), *script.args]
+        return [self.executable, "-e", script]
+    
+    def run(self, script: Script) -> str:
+        """AppleScript를 실행하고 결과를 반환합니다."""
+        try:
+            result = subprocess.run(
+                self.command(script),
+                capture_output=True,
+                text=True,
+                check=True
+            )
+            return result.stdout.strip("\r\n")
+        except subprocess.CalledProcessError as e:
+            raise AppleScriptError(f"AppleScript 실행 오류: {e.stderr}")
+    
+    def stream(self, script: Script) -> Iterator[str]:
+        """osascript 출력을 읽는 대로 내보냅니다."""
+        process = subprocess.Popen(
+            self.command(script),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8"
+        )
+        try:
+            while True:
+                chunk = process.stdout.read(self.CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+            stderr = process.stderr.read()
+            if process.wait() != 0:
+                raise AppleScriptError(f"AppleScript 실행 오류: {stderr}")
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
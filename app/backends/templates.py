@@ -0,0 +1,87 @@
+"""
+미리 컴파일해 재사용하는 AppleScript 템플릿
+
+템플릿은 제목·날짜 같은 값을 소스에 끼워 넣지 않고 `on run argv`로 받으므로 호출마다 소스가
+같습니다. 백엔드는 템플릿 ID별로 한 번만 컴파일(osacompile / NSAppleScript)해 두고 인자만
+바꿔 실행하며, 인자는 스크립트 소스로 해석되지 않으므로 따옴표나 역슬래시가 든 제목도 그대로
+전달됩니다. argv를 넘길 수 없는 백엔드(CallableBackend 등)는 인자를 문자열 리터럴로 바꾼
+인라인 스크립트를 실행합니다.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from typing import Dict, Sequence, Tuple, Union
+
+
+def quote_applescript(value: str) -> str:
+    """AppleScript 문자열 리터럴로 변환합니다."""
+    escaped = value.replace('\\', '\\\\').replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+@dataclass(frozen=True)
+class ScriptTemplate:
+    """`on run argv` 본문과 run 핸들러 밖에 둘 보조 핸들러로 이루어진 스크립트 템플릿"""
+    template_id: str
+    body: str
+    handlers: str = ""
+    
+    @property
+    def source(self) -> str:
+        """컴파일할 스크립트 소스"""
+        return f"{self.handlers}\non run argv\n{self.body}\nend run\n"
+    
+    @property
+    def digest(self) -> str:
+        """소스가 바뀌면 달라지는 짧은 해시 (컴파일 결과 캐시 키)"""
+        return hashlib.sha1(self.source.encode("utf-8")).hexdigest()[:12]
+    
+    def inline(self, args: Sequence[str]) -> str:
+        """argv를 문자열 리터럴 목록으로 대입한 단일 스크립트 (컴파일 캐시를 쓸 수 없는 백엔드용)"""
+        literal = ", ".join(quote_applescript(arg) for arg in args)
+        return f"{self.handlers}\nset argv to {{{literal}}}\n{self.body}\n"
+    
+    def call(self, *args: str) -> "ScriptCall":
+        """인자를 붙인 실행 요청"""
+        return ScriptCall(self, tuple(args))
+
+
+@dataclass(frozen=True)
+class ScriptCall:
+    """템플릿과 argv로 이루어진 스크립트 실행 요청"""
+    template: ScriptTemplate
+    args: Tuple[str, ...] = ()
+    
+    @property
+    def template_id(self) -> str:
+        return self.template.template_id
+    
+    def inline(self) -> str:
+        return self.template.inline(self.args)
+
+
+# 백엔드가 실행하는 스크립트 (소스 문자열 또는 템플릿 실행 요청)
+Script = Union[str, ScriptCall]
+
+
+def script_source(script: Script) -> str:
+    """템플릿 실행 요청이면 인라인 스크립트로, 아니면 그대로 반환합니다."""
+    return script.inline() if isinstance(script, ScriptCall) else script
+
+
+_TEMPLATES: Dict[str, ScriptTemplate] = {}
+
+
+def register_template(template_id: str, body: str, handlers: str = "") -> ScriptTemplate:
+    """템플릿을 등록하고 반환합니다. 같은 ID에 다른 소스를 등록하면 ValueError입니다."""
+    template = ScriptTemplate(template_id, body, handlers)
+    registered = _TEMPLATES.setdefault(template_id, template)
+    if registered.source != template.source:
+        raise ValueError(f"이미 다른 소스로 등록된 템플릿입니다: {template_id}")
+    return registered
+
+
+def get_template(template_id: str) -> ScriptTemplate:
+    """등록된 템플릿을 반환합니다. (없으면 KeyError)"""
+    return _TEMPLATES[template_id]
+
@@ -0,0 +1,228 @@
+"""
+상주 프로세스 기반 AppleScript 백엔드
+"""
+
+import codecs
+import json
+import queue
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence
+
+from .base import AppleScriptError, ScriptBackend
+from .templates import Script, ScriptCall
+
+
+WORKER_SCRIPT = Path(__file__).parent / "worker_main.py"
+CHUNK_SIZE = 64 * 1024
+
+
+def default_worker_command(engine: str = "applescript") -> List[str]:
+    """기본 상주 실행기 명령을 반환합니다."""
+    return [sys.executable, str(WORKER_SCRIPT), "--engine", engine]
+
+
+def encode_request(script: Script) -> bytes:
+    """실행기에 보낼 요청 프레임 (템플릿 실행 요청은 ID·소스·argv를 JSON으로 보냄)"""
+    if isinstance(script, ScriptCall):
+        data = json.dumps({
+            "id": script.template_id,
+            "source": script.template.source,
+            "args": list(script.args)
+        }, ensure_ascii=False).encode("utf-8")
+        return f"call {len(data)}\n".encode("ascii") + data
+    data = script.encode("utf-8")
+    return f"{len(data)}\n".encode("ascii") + data
+
+
+class WorkerCrashed(AppleScriptError):
+    """실행기 프로세스가 응답 도중 종료됨"""
+
+
+class WorkerTimeout(AppleScriptError):
+    """실행 시간 초과"""
+
+
+class _WorkerProcess:
+    """프레임 프로토콜로 통신하는 실행기 프로세스 하나"""
+    
+    def __init__(self, command: Sequence[str]):
+        self.process = subprocess.Popen(
+            list(command),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+        self.timed_out = False
+    
+    @property
+    def alive(self) -> bool:
+        return self.process.poll() is None
+    
+    def execute(self, script: Script, timeout: Optional[float]) -> str:
+        """스크립트 하나를 보내고 응답 전체를 반환합니다."""
+        return "".join(self.execute_stream(script, timeout)).strip("\r\n")
+    
+    def execute_stream(self, script: Script, timeout: Optional[float]) -> Iterator[str]:
+        """스크립트 하나를 보내고 응답 프레임을 읽는 대로 내보냅니다."""
+        request = encode_request(script)
+        timer = None
+        if timeout:
+            timer = threading.Timer(timeout, self._expire)
+            timer.start()
+        try:
+            self.process.stdin.write(request)
+            self.process.stdin.flush()
+            
+            header = self.process.stdout.readline()
+            if not header:
+                raise EOFError
+            status, length = header.decode("ascii").split()
+            remaining = int(length)
+            
+            if status != "ok":
+                message = self.process.stdout.read(remaining).decode("utf-8", "replace")
+                raise AppleScriptError(f"AppleScript 실행 오류: {message}")
+            
+            decoder = codecs.getincrementaldecoder("utf-8")()
+            while remaining:
+                chunk = self.process.stdout.read(min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    raise EOFError
+                remaining -= len(chunk)
+                text = decoder.decode(chunk)
+                if text:
+                    yield text
+            tail = decoder.decode(b"", final=True)
+            if tail:
+                yield tail
+        except (OSError, EOFError, ValueError):
+            self.kill()
+            if self.timed_out:
+                raise WorkerTimeout(f"AppleScript 실행 시간 초과 ({timeout}초)")
+            raise WorkerCrashed("AppleScript 실행기가 비정상 종료되었습니다.")
+        finally:
+            if timer:
+                timer.cancel()
+    
+    def _expire(self):
+        self.timed_out = True
+        self.kill()
+    
+    def kill(self):
+        if self.alive:
+            self.process.kill()
+        try:
+            self.process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            pass
+    
+    def close(self):
+        """입력을 닫아 정상 종료를 요청합니다."""
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout=2)
+        except Exception:
+            self.kill()
+
+
+class PersistentWorkerBackend(ScriptBackend):
+    """상주 실행기 프로세스 풀에 스크립트를 전달하는 백엔드
+    
+    실행기는 처음 필요할 때 띄워 재사용하며, 최대 max_workers개의 호출을 동시에 처리합니다.
+    템플릿 실행 요청은 실행기가 템플릿 ID별로 컴파일해 둔 스크립트를 argv만 바꿔 실행합니다.
+    실행기가 죽으면 새로 띄워 한 번 재시도하고, 시간 초과된 실행기는 종료 후 교체합니다.
+    """
+    
+    def __init__(self, command: Optional[Sequence[str]] = None, max_workers: int = 2, 
+                 timeout: Optional[float] = 30.0):
+        self.command = list(command) if command else default_worker_command()
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self.restart_count = 0
+        
+        self._slots = threading.BoundedSemaphore(self.max_workers)
+        self._idle: "queue.SimpleQueue[_WorkerProcess]" = queue.SimpleQueue()
+        self._workers: List[_WorkerProcess] = []
+        self._lock = threading.Lock()
+    
+    def _acquire_worker(self) -> _WorkerProcess:
+        """유휴 실행기를 꺼내거나 새로 띄웁니다."""
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if worker.alive:
+                return worker
+            self._discard(worker)
+        
+        worker = _WorkerProcess(self.command)
+        with self._lock:
+            self._workers.append(worker)
+        return worker
+    
+    def _discard(self, worker: _WorkerProcess):
+        worker.kill()
+        with self._lock:
+            if worker in self._workers:
+                self._workers.remove(worker)
+    
+    def run(self, script: Script, timeout: Optional[float] = None) -> str:
+        """스크립트를 실행기에 전달하고 결과를 반환합니다."""
+        timeout = timeout if timeout is not None else self.timeout
+        with self._slots:
+            for attempt in range(2):
+                worker = self._acquire_worker()
+                try:
+                    result = worker.execute(script, timeout)
+                except WorkerCrashed:
+                    self._discard(worker)
+                    self.restart_count += 1
+                    if attempt == 0:
+                        continue
+                    raise
+                except WorkerTimeout:
+                    self._discard(worker)
+                    self.restart_count += 1
+                    raise
+                except AppleScriptError:
+                    self._idle.put(worker)
+                    raise
+                self._idle.put(worker)
+                return result
+    
+    def stream(self, script: Script, timeout: Optional[float] = None) -> Iterator[str]:
+        """스크립트 결과를 실행기에서 읽는 대로 내보냅니다.
+        
+        일부 출력이 이미 전달되었을 수 있으므로 실행기가 죽어도 재시도하지 않으며,
+        끝까지 읽지 않고 중단하면 남은 출력을 버리기 위해 해당 실행기를 교체합니다.
+        """
+        timeout = timeout if timeout is not None else self.timeout
+        with self._slots:
+            worker = self._acquire_worker()
+            healthy = False
+            try:
+                yield from worker.execute_stream(script, timeout)
+                healthy = True
+            except (WorkerCrashed, WorkerTimeout):
+                self.restart_count += 1
+                raise
+            except AppleScriptError:
+                healthy = True
+                raise
+            finally:
+                if healthy:
+                    self._idle.put(worker)
+                else:
+                    self._discard(worker)
+    
+    def close(self):
+        """모든 실행기를 종료합니다."""
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.close()
+        self._idle = queue.SimpleQueue()
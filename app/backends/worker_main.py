@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+AppleScript 상주 실행기 (PersistentWorkerBackend가 띄우는 자식 프로세스)
+
+표준 입력으로 길이 접두 프레임을 받아 스크립트를 실행하고, 같은 형식으로 결과를 돌려줍니다.
+
+    요청: b"<길이>\\n" + UTF-8 스크립트
+          b"call <길이>\\n" + JSON {"id": 템플릿 ID, "source": 소스, "args": [인자, ...]}
+    응답: b"ok <길이>\\n" + 결과  또는  b"err <길이>\\n" + 오류 메시지
+
+템플릿 실행 요청은 ID별로 한 번만 컴파일해 두고 argv만 바꿔 실행합니다.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+
+def _read_frame(stream):
+    """프레임 하나를 (종류, 내용)으로 읽습니다. 입력이 닫히면 None을 반환합니다."""
+    header = stream.readline()
+    if not header:
+        return None
+    parts = header.split()
+    if len(parts) == 2 and parts[0] == b"call":
+        return "call", stream.read(int(parts[1]))
+    return "script", stream.read(int(parts[0]))
+
+
+def _write_frame(stream, status: str, payload: str):
+    """상태와 결과를 프레임으로 씁니다."""
+    data = payload.encode("utf-8")
+    stream.write(f"{status} {len(data)}\n".encode("ascii"))
+    stream.write(data)
+    stream.flush()
+
+
+def _fourcc(code: str) -> int:
+    return int.from_bytes(code.encode("ascii"), "big")
+
+
+class OsascriptEngine:
+    """pyobjc가 없을 때 사용하는 osascript 실행 엔진 (템플릿은 osacompile로 컴파일해 둔 파일을 실행)"""
+    
+    def __init__(self, cache_dir: Path = Path.home() / ".mac_agent" / "scripts"):
+        self.cache_dir = cache_dir
+        self._compiled = {}
+    
+    def _run(self, command) -> str:
+        result = subprocess.run(command, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip())
+        return result.stdout.strip("\r\n")
+    
+    def execute(self, script: str) -> str:
+        return self._run(["osascript", "-e", script])
+    
+    def execute_call(self, template_id: str, source: str, args) -> str:
+        key = (template_id, source)
+        path = self._compiled.get(key)
+        if path is None:
+            digest = hashlib.sha1(source.encode("utf-8")).hexdigest()[:12]
+            path = self.cache_dir / f"{template_id.replace('/', '_')}-{digest}.scpt"
+            if not path.exists():
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                fd, source_path = tempfile.mkstemp(suffix=".applescript", dir=self.cache_dir)
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(source)
+                try:
+                    output_path = f"{path}.{os.getpid()}.tmp"
+                    self._run(["osacompile", "-o", output_path, source_path])
+                    os.replace(output_path, path)
+                finally:
+                    os.unlink(source_path)
+            self._compiled[key] = path
+        return self._run(["osascript", str(path), *args])
+
+
+class NSAppleScriptEngine:
+    """프로세스 안에서 NSAppleScript로 실행하는 엔진 (프로세스 생성 없음)"""
+    
+    def __init__(self):
+        from Foundation import NSAppleEventDescriptor, NSAppleScript
+        self._ns_apple_script = NSAppleScript
+        self._descriptor = NSAppleEventDescriptor
+        self._compiled = {}
+    
+    @staticmethod
+    def _result(descriptor, error) -> str:
+        if error is not None:
+            raise RuntimeError(str(error.get("NSAppleScriptErrorMessage", error)))
+        if descriptor is None or descriptor.stringValue() is None:
+            return ""
+        return descriptor.stringValue().strip("\r\n")
+    
+    def execute(self, script: str) -> str:
+        apple_script = self._ns_apple_script.alloc().initWithSource_(script)
+        return self._result(*apple_script.executeAndReturnError_(None))
+    
+    def execute_call(self, template_id: str, source: str, args) -> str:
+        compiled = self._compiled.get(template_id)
+        if compiled is None or compiled[0] != source:
+            apple_script = self._ns_apple_script.alloc().initWithSource_(source)
+            ok, error = apple_script.compileAndReturnError_(None)
+            if not ok:
+                raise RuntimeError(str(error.get("NSAppleScriptErrorMessage", error)))
+            compiled = self._compiled[template_id] = (source, apple_script)
+        
+        # run 핸들러에 argv 목록을 넘기는 'aevt'/'oapp' 이벤트
+        argv = self._descriptor.listDescriptor()
+        for index, arg in enumerate(args, 1):
+            argv.insertDescriptor_atIndex_(self._descriptor.descriptorWithString_(arg), index)
+        event = self._descriptor.appleEventWithEventClass_eventID_targetDescriptor_returnID_transactionID_(
+            _fourcc("aevt"), _fourcc("oapp"), self._descriptor.currentProcessDescriptor(), -1, 0
+        )
+        event.setParamDescriptor_forKeyword_(argv, _fourcc("----"))
+        return self._result(*compiled[1].executeAppleEvent_error_(event, None))
+
+
+class EchoEngine:
+    """스크립트를 그대로 돌려주는 대체 엔진 (macOS 외 환경의 테스트/벤치마크용)"""
+    
+    def execute(self, script: str) -> str:
+        return script.strip()
+    
+    def execute_call(self, template_id: str, source: str, args) -> str:
+        """argv를 US로 이은 레코드 하나 (인자가 손상 없이 전달되는지 확인용)"""
+        return "\x1f".join(args)
+
+
+def create_engine(name: str):
+    """이름에 해당하는 실행 엔진을 생성합니다."""
+    if name == "echo":
+        return EchoEngine()
+    if name == "osascript":
+        return OsascriptEngine()
+    try:
+        return NSAppleScriptEngine()
+    except ImportError:
+        return OsascriptEngine()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AppleScript 상주 실행기")
+    parser.add_argument("--engine", choices=["applescript", "osascript", "echo"], default="applescript")
+    args = parser.parse_args()
+    
+    engine = create_engine(args.engine)
+    stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+    
+    while True:
+        frame = _read_frame(stdin)
+        if frame is None:
+            break
+        kind, payload = frame
+        try:
+            if kind == "call":
+                request = json.loads(payload.decode("utf-8"))
+                result = engine.execute_call(request["id"], request["source"], request["args"])
+            else:
+                result = engine.execute(payload.decode("utf-8"))
+            _write_frame(stdout, "ok", result)
+        except Exception as e:
+            _write_frame(stdout, "err", str(e))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,266 +1,650 @@
-import subprocess
-import json
-from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
-from dateutil import parser
+import time
+from datetime import date, datetime, timedelta
+from typing import Optional, List, Dict, Any, Callable, Generator, Iterable, Iterator, Tuple
 import pytz
 from config import (
     DEFAULT_CALENDAR_NAME, 
     DEFAULT_EVENT_DURATION, 
     DEFAULT_EVENT_START_TIME,
-    APPLESCRIPT_DATE_FORMAT
+    WORKING_HOURS,
+    SEARCH_CALENDAR_NAMES,
+    APPLESCRIPT_BACKEND,
+    APPLESCRIPT_WORKER_COMMAND,
+    APPLESCRIPT_MAX_WORKERS,
+    APPLESCRIPT_TIMEOUT,
+    APPLESCRIPT_MAX_CONCURRENCY,
+    EVENT_CACHE_ENABLED,
+    EVENT_CACHE_TTL,
+    CALENDAR_CATALOG_TTL,
+    SYNC_PAST_DAYS,
+    SYNC_FUTURE_DAYS
 )
 
+try:
+    # 전역 설치된 경우
+    from app.backends import ScriptBackend, AsyncScriptBackend, create_backend, create_async_backend
+    from app.store import EventStore, CalendarCatalog
+    from app.events import Event, field_text, iter_records, localize, parse_events, records_to_events
+    from app.backends.templates import Script
+    from app.events.wire import FIELD_SEPARATOR
+    from app.scripts import (
+        script_date, list_calendars_call, query_call, rules_call, changes_call, live_uids_call,
+        create_call, update_call, delete_call
+    )
+    from app.temporal import TemporalRange, resolve as resolve_temporal, split_day_part
+    from app.query import QueryStats, plan_query, split_stats
+    from app.recurrence import RecurringEvent, expand, parse_recurrence, records_to_rules
+    from app.schedule import IntervalIndex, merge_busy, working_windows, free_slots, parse_working_hours
+except ImportError:
+    # 로컬 실행인 경우
+    from backends import ScriptBackend, AsyncScriptBackend, create_backend, create_async_backend
+    from store import EventStore, CalendarCatalog
+    from events import Event, field_text, iter_records, localize, parse_events, records_to_events
+    from backends.templates import Script
+    from events.wire import FIELD_SEPARATOR
+    from scripts import (
+        script_date, list_calendars_call, query_call, rules_call, changes_call, live_uids_call,
+        create_call, update_call, delete_call
+    )
+    from temporal import TemporalRange, resolve as resolve_temporal, split_day_part
+    from query import QueryStats, plan_query, split_stats
+    from recurrence import RecurringEvent, expand, parse_recurrence, records_to_rules
+    from schedule import IntervalIndex, merge_busy, working_windows, free_slots, parse_working_hours
+
+
+# 스크립트(템플릿 실행 요청)를 내보내고 실행 결과 레코드를 돌려받는 단계 생성기
+# (_drive / AsyncCalendarTools._drive로 실행)
+Steps = Generator[Script, Iterable[List[str]], Any]
+
+# 겹침 검사 때 구간 앞으로 더 가져오는 기간
+# 일정은 시작 날짜 기준으로 가져오므로 전날 시작해 넘어오는 일정까지 보려면 필요
+# (이보다 먼저 시작한 여러 날 일정은 보이지 않음)
+OVERLAP_LOOKBACK = timedelta(days=1)
+
 
 class CalendarTools:
     """macOS 캘린더와 상호작용하는 도구 클래스"""
     
-    def __init__(self, calendar_name: str = DEFAULT_CALENDAR_NAME):
+    def __init__(self, calendar_name: str = DEFAULT_CALENDAR_NAME, 
+                 backend: Optional[ScriptBackend] = None, 
+                 store: Optional[EventStore] = None, 
+                 calendars: Optional[List[str]] = None, 
+                 catalog: Optional[CalendarCatalog] = None):
         self.calendar_name = calendar_name
+        # 조회 대상으로 고른 캘린더 (None이면 Calendar 앱에 있는 캘린더 전체)
+        self.calendars = list(dict.fromkeys(calendars)) if calendars else None
         self.timezone = pytz.timezone('Asia/Seoul')
+        self.backend = backend or create_backend(
+            APPLESCRIPT_BACKEND,
+            command=APPLESCRIPT_WORKER_COMMAND,
+            max_workers=APPLESCRIPT_MAX_WORKERS,
+            timeout=APPLESCRIPT_TIMEOUT
+        )
+        if store is None and EVENT_CACHE_ENABLED:
+            store = EventStore(ttl_seconds=EVENT_CACHE_TTL, tz=self.timezone)
+        self.store = store
+        if catalog is None and EVENT_CACHE_ENABLED:
+            catalog = CalendarCatalog(ttl_seconds=CALENDAR_CATALOG_TTL)
+        self.catalog = catalog
+        self._available: Optional[List[str]] = None
     
-    def _run_applescript(self, script: str) -> str:
-        """AppleScript를 실행하고 결과를 반환합니다."""
-        try:
-            result = subprocess.run(
-                ["osascript", "-e", script],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            return result.stdout.strip()
-        except subprocess.CalledProcessError as e:
-            raise Exception(f"AppleScript 실행 오류: {e.stderr}")
+    def close(self):
+        """AppleScript 백엔드와 로컬 캐시를 정리합니다."""
+        self.backend.close()
+        if self.store:
+            self.store.close()
+    
+    def _localize(self, dt: datetime) -> datetime:
+        """naive 로컬 시각을 캘린더 시간대의 aware datetime으로 변환합니다."""
+        return localize(dt, self.timezone)
+    
+    @staticmethod
+    def _dedup(events: Iterable[Event]) -> List[Event]:
+        """여러 캘린더에서 중복 조회된 일정을 제거하고 시작 시각 순으로 정렬합니다."""
+        unique: Dict[tuple, Event] = {}
+        for event in events:
+            unique.setdefault(event.dedup_key, event)
+        return sorted(unique.values(), key=lambda event: event.sort_key)
+    
+    def _split_rules(self, records: Iterable[List[str]], 
+                     stats: Optional[QueryStats] = None) -> Tuple[List[Event], List[RecurringEvent]]:
+        """query_call(with_rules=True) 결과를 일정과 반복 일정 규칙으로 나눕니다."""
+        rule_records: List[List[str]] = []
+        events = list(split_stats(records, self.timezone, stats or QueryStats(), rule_records))
+        return events, list(records_to_rules(rule_records, self.timezone))
+    
+    def _now(self) -> datetime:
+        """캘린더 시간대 기준 현재 시각 (naive)"""
+        return datetime.now(self.timezone).replace(tzinfo=None)
+    
+    def _today(self) -> date:
+        """캘린더 시간대 기준 오늘 날짜"""
+        return self._now().date()
+    
+    def _resolve_expression(self, date_str: str, time_str: Optional[str] = None) -> TemporalRange:
+        """날짜/시간 표현을 지금 기준 구간으로 해석합니다. ("30분 후"는 현재 시각에서 계산)"""
+        expression = f"{date_str} {time_str}" if time_str else date_str
+        return resolve_temporal(expression, self._now())
     
     def _parse_korean_date(self, date_str: str) -> datetime:
-        """한국어 날짜 표현을 파싱합니다."""
-        import re
+        """한국어 날짜 표현을 파싱합니다. (시간이 없으면 기본 시작 시각)"""
+        span = self._resolve_expression(date_str)
+        if span.has_time:
+            return span.start
+        hour, minute = map(int, DEFAULT_EVENT_START_TIME.split(':'))
+        return span.start.replace(hour=hour, minute=minute)
+    
+    def _resolve_start(self, date_str: str, time_str: Optional[str] = None) -> datetime:
+        """날짜/시간 표현을 캘린더 시간대의 시작 시각으로 변환합니다."""
+        full_date_str = f"{date_str} {time_str}" if time_str else date_str
+        return self._localize(self._parse_korean_date(full_date_str))
+    
+    def _drive(self, steps: Steps) -> Any:
+        """단계 생성기를 동기 백엔드로 실행합니다.
+        
+        생성기가 내보낸 스크립트마다 결과 레코드를 읽는 대로 넘겨주며, 생성기의 반환값을 돌려줍니다.
+        스크립트 구성과 결과 해석은 생성기에 있으므로 비동기 구현(AsyncCalendarTools)과 공유됩니다.
+        """
+        try:
+            script = next(steps)
+            while True:
+                script = steps.send(iter_records(self.backend.stream(script)))
+        except StopIteration as stop:
+            return stop.value
+    
+    def discover_calendars(self, refresh: bool = False) -> List[str]:
+        """Calendar 앱에 있는 캘린더 이름 목록 (refresh이면 캐시를 무시하고 다시 가져옴)"""
+        return self._drive(self._available_calendars_steps(refresh))
+    
+    def _available_calendars_steps(self, refresh: bool = False) -> Steps:
+        """있는 캘린더 목록을 메모리 → 디스크 목록 캐시 → 스크립트 순으로 찾습니다.
+        
+        목록을 가져오지 못하면 기존 기본 목록(SEARCH_CALENDAR_NAMES)을 쓰되 기억하지 않습니다.
+        """
+        if self._available is not None and not refresh:
+            return self._available
+        available = self.catalog.load() if self.catalog and not refresh else None
+        if available is None:
+            try:
+                records = yield list_calendars_call()
+                available = list(dict.fromkeys(fields[0] for fields in records if fields and fields[0]))
+            except Exception:
+                available = []
+            if not available:
+                return list(SEARCH_CALENDAR_NAMES)
+            if self.catalog:
+                self.catalog.save(available)
+        self._available = available
+        return available
+    
+    def _search_calendars_steps(self, requested: Optional[List[str]] = None) -> Steps:
+        """조회할 캘린더 (요청한 캘린더, 없으면 고른 캘린더, 없으면 전체) 중 실제로 있는 것만 반환합니다."""
+        available = yield from self._available_calendars_steps()
+        wanted = requested or self.calendars
+        if not wanted:
+            return list(available)
+        existing = set(available)
+        return [name for name in dict.fromkeys(wanted) if name in existing]
+    
+    @staticmethod
+    def _align_records(records: List[List[str]], count: int) -> List[List[str]]:
+        """결과 레코드 수를 항목 수에 맞춥니다. (결과가 없는 항목은 오류로 처리)"""
+        return records[:count] + [["error", "결과 없음"]] * (count - len(records))
+    
+    @staticmethod
+    def _batch_summary(results: List[Dict[str, Any]], action: str) -> Dict[str, Any]:
+        """항목별 결과를 일괄 작업 결과로 요약합니다."""
+        succeeded = sum(1 for result in results if result["success"])
+        return {
+            "success": succeeded == len(results),
+            "message": f"{len(results)}개 중 {succeeded}개 일정을 {action}했습니다.",
+            "results": results
+        }
+    
+    def create_event(self, date_str: str, title: str, time_str: Optional[str] = None, 
+                    duration_minutes: Optional[int] = None, location: Optional[str] = None, 
+                    notes: Optional[str] = None, recurrence: Optional[str] = None) -> Dict[str, Any]:
+        """캘린더에 새 일정을 생성합니다.
+        
+        recurrence("매주", "평일", "격주 화요일", "매주 월수금 10회", "매월 12월까지")를 주면
+        반복 일정 하나로 생성합니다.
+        """
+        return self.create_events([{
+            "date_str": date_str,
+            "title": title,
+            "time_str": time_str,
+            "duration_minutes": duration_minutes,
+            "location": location,
+            "notes": notes,
+            "recurrence": recurrence
+        }])["results"][0]
+    
+    def create_events(self, events: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """여러 일정을 한 번의 스크립트 실행으로 생성합니다.
+        
+        각 항목은 create_event와 같은 키(date_str, title, time_str, duration_minutes, location, notes,
+        recurrence)를 가지며,
+        결과의 results에 입력 순서대로 항목별 결과가 담깁니다.
+        """
+        return self._drive(self._create_events_steps(events))
+    
+    def _create_events_steps(self, events: List[Dict[str, Any]]) -> Steps:
+        results: List[Optional[Dict[str, Any]]] = [None] * len(events)
+        drafts = []  # (입력 위치, UID 없는 Event, RRULE 또는 None)
+        
+        for index, item in enumerate(events):
+            title = field_text(item.get("title"))
+            try:
+                start_dt = self._resolve_start(item["date_str"], item.get("time_str"))
+                duration = item.get("duration_minutes")
+                if not duration:
+                    # "오후 2시부터 4시까지", "3시 1시간 반"처럼 표현에 길이가 있으면 그대로 사용
+                    span = self._resolve_expression(item["date_str"], item.get("time_str"))
+                    duration = span.duration.total_seconds() / 60 if span.duration else DEFAULT_EVENT_DURATION
+                end_dt = start_dt + timedelta(minutes=int(duration))
+                rule = parse_recurrence(item["recurrence"], start_dt.date()) if item.get("recurrence") else None
+                drafts.append((index, Event("", self.calendar_name, title, start_dt, end_dt, 
+                                            field_text(item.get("location")), field_text(item.get("notes"))), rule))
+            except Exception as e:
+                results[index] = {
+                    "success": False,
+                    "message": f"일정 생성 실패: {str(e)}",
+                    "error": str(e)
+                }
         
-        # 현재 연도 기준
-        current_year = datetime.now().year
+        created = yield from self._create_drafts_steps([draft for _, draft, _ in drafts], 
+                                                       rules=[rule for _, _, rule in drafts])
+        for (index, _, _), result in zip(drafts, created):
+            results[index] = result
         
-        # 월, 일 추출
-        month_match = re.search(r'(\d+)월', date_str)
-        day_match = re.search(r'(\d+)일', date_str)
+        return self._batch_summary(results, "추가")
+    
+    def _create_drafts(self, drafts: List[Event], check_conflicts: bool = True) -> List[Dict[str, Any]]:
+        """UID 없는 일정 초안들을 한 번의 스크립트 실행으로 생성하고 항목별 결과를 반환합니다."""
+        return self._drive(self._create_drafts_steps(drafts, check_conflicts))
+    
+    def _create_drafts_steps(self, drafts: List[Event], check_conflicts: bool = True, 
+                             rules: Optional[List[Optional[str]]] = None) -> Steps:
+        if not drafts:
+            return []
+        rules = rules or [None] * len(drafts)
+        
+        # 겹치는 일정 확인 (로컬 캐시 기준)
+        conflicts = [[] for _ in drafts]
+        if check_conflicts:
+            try:
+                conflicts = yield from self._find_conflicts_many_steps(drafts)
+            except Exception:
+                pass
+        
+        try:
+            records = list((yield create_call(self.calendar_name, drafts, rules)))
+        except Exception as e:
+            records = [["error", str(e)]] * len(drafts)
         
-        if month_match and day_match:
-            month = int(month_match.group(1))
-            day = int(day_match.group(1))
+        results = []
+        for draft, rule, record, overlaps in zip(drafts, rules, self._align_records(records, len(drafts)), conflicts):
+            if record[0] != "ok":
+                error = record[1] if len(record) > 1 else record[0]
+                results.append({
+                    "success": False,
+                    "message": f"일정 생성 실패: {error}",
+                    "error": error
+                })
+                continue
             
-            # 시간 정보가 있는지 확인
-            time_match = re.search(r'(\d{1,2}):(\d{2})', date_str)
-            if time_match:
-                hour = int(time_match.group(1))
-                minute = int(time_match.group(2))
-            else:
-                # 오후/오전 시간 처리
-                afternoon_match = re.search(r'오후\s*(\d{1,2})시', date_str)
-                morning_match = re.search(r'오전\s*(\d{1,2})시', date_str)
-                hour_match = re.search(r'(\d{1,2})시', date_str)
-                
-                if afternoon_match:
-                    hour = int(afternoon_match.group(1))
-                    if hour != 12:  # 오후 12시는 12시 그대로
-                        hour += 12
-                    minute = 0
-                elif morning_match:
-                    hour = int(morning_match.group(1))
-                    if hour == 12:  # 오전 12시는 0시
-                        hour = 0
-                    minute = 0
-                elif hour_match:
-                    hour = int(hour_match.group(1))
-                    minute = 0
+            event = Event(record[1], draft.calendar, draft.title, draft.start, draft.end, draft.location, draft.notes)
+            if self.store:
+                if rule:
+                    # 반복 일정은 회차를 만들지 않고 규칙 한 행으로 보관
+                    self.store.add_rule(RecurringEvent(event, rule))
                 else:
-                    # 기본 시간 설정
-                    hour, minute = map(int, DEFAULT_EVENT_START_TIME.split(':'))
+                    self.store.add_event(event)
             
-            return datetime(current_year, month, day, hour, minute)
+            message = f"'{event.title}' 일정을 {event.start.strftime('%Y년 %m월 %d일 %H:%M')}에 추가했습니다."
+            if rule:
+                message += f" (반복: {rule})"
+            if overlaps:
+                message += f" (겹치는 일정 {len(overlaps)}개가 있습니다.)"
+            result = {
+                "success": True,
+                "message": message,
+                "event": event,
+                "conflicts": overlaps
+            }
+            if rule:
+                result["recurrence"] = rule
+            results.append(result)
+        return results
+    
+    def iter_calendar_events(self, calendar_names: List[str], search_start: datetime, 
+                             search_end: datetime) -> Iterator[Event]:
+        """여러 캘린더의 일정을 한 번의 스크립트 실행으로 조회해 읽는 대로 내보냅니다.
+        
+        존재하지 않는 캘린더는 스크립트 안에서 건너뛰므로 캘린더 수와 관계없이
+        osascript 실행은 한 번입니다. 각 행에는 조회된 캘린더 이름이 붙습니다.
+        """
+        if not calendar_names:
+            return iter(())
+        script = query_call(plan_query(calendar_names, search_start, search_end))
+        return parse_events(self.backend.stream(script), self.timezone)
+    
+    def sync_changes(self, reconcile: bool = False, past_days: int = SYNC_PAST_DAYS, 
+                     future_days: int = SYNC_FUTURE_DAYS) -> Dict[str, Any]:
+        """마지막 동기화 이후 수정된 일정만 가져와 로컬 캐시에 반영합니다.
+        
+        Args:
+            reconcile: 구간의 UID 목록과 비교해 캘린더에서 삭제된 일정도 캐시에서 지울지
+            past_days, future_days: 오늘 기준으로 캐시에 미러링할 구간
+        """
+        return self._drive(self._sync_changes_steps(reconcile, past_days, future_days))
+    
+    def _sync_changes_steps(self, reconcile: bool = False, past_days: int = SYNC_PAST_DAYS, 
+                            future_days: int = SYNC_FUTURE_DAYS) -> Steps:
+        if not self.store:
+            return {"success": False, "message": "로컬 캐시가 꺼져 있어 동기화할 수 없습니다."}
         
-        # 일반적인 날짜 파싱 시도 (연도 보정)
         try:
-            parsed_date = parser.parse(date_str)
-            # 연도가 현재 연도와 다르면 현재 연도로 변경
-            if parsed_date.year != current_year:
-                parsed_date = parsed_date.replace(year=current_year)
-            return parsed_date
-        except:
-            raise ValueError(f"날짜 파싱 실패: {date_str}")
-    
-    def _format_applescript_date(self, dt: datetime) -> str:
-        """AppleScript에서 사용할 날짜 형식으로 변환합니다."""
-        # 영어 요일 매핑 (macOS AppleScript는 영어 요일명을 사용)
-        weekdays = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        weekday = weekdays[dt.weekday()]
-        
-        # AppleScript가 인식할 수 있는 형식으로 변경
-        return f"{weekday}, {dt.month}/{dt.day}/{dt.year} {dt.hour:02d}:{dt.minute:02d}:00"
+            # 다음 동기화의 기준 시각은 조회 전에 잡아, 조회 중에 바뀐 일정도 다음 번에 다시 가져옴
+            stamp = datetime.now(self.timezone)
+            today = stamp.replace(hour=0, minute=0, second=0, microsecond=0)
+            search_start = today - timedelta(days=past_days)
+            search_end = (today + timedelta(days=future_days)).replace(hour=23, minute=59, second=59)
+            first, last = search_start.date(), search_end.date()
+            
+            calendar_names = yield from self._search_calendars_steps()
+            stamps = self.store.sync_stamps(calendar_names)
+            tracked = [name for name in calendar_names if name in stamps]
+            changed = removed = 0
+            if tracked:
+                changes = yield changes_call(tracked, min(stamps[name] for name in tracked))
+                records = [fields for fields in changes if len(fields) == 8 and fields[1]]
+                events = records_to_events((fields[:7] for fields in records if not fields[7].strip()), self.timezone)
+                rules = records_to_rules(records, self.timezone)
+                changed = self.store.apply_changes(tracked, list(events), list(rules), first, last)
+                if reconcile:
+                    uid_records = yield live_uids_call(tracked, search_start, search_end)
+                    live_uids = [fields[0] for fields in uid_records if fields and fields[0]]
+                    # 빈 목록은 캘린더를 읽지 못한 경우일 수 있으므로 캐시를 비우지 않음
+                    if live_uids:
+                        removed = self.store.prune(tracked, first, last, live_uids)
+            
+            # 처음 동기화하는 캘린더와 구간에 새로 들어온 날짜는 구간 조회로 채움
+            fetched = len(self.store.missing_ranges(calendar_names, search_start, search_end))
+            yield from self._sync_window_steps(calendar_names, search_start, search_end)
+            self.store.set_sync_stamp(calendar_names, stamp)
+            
+            return {
+                "success": True,
+                "message": f"동기화 완료: 변경 {changed}건, 삭제 {removed}건",
+                "calendars": calendar_names,
+                "changed": changed,
+                "removed": removed,
+                "fetched_ranges": fetched,
+                "stamp": stamp.isoformat()
+            }
+        except Exception as e:
+            return {
+                "success": False,
+                "message": f"동기화 실패: {str(e)}",
+                "error": str(e)
+            }
     
-    def create_event(self, date_str: str, title: str, time_str: Optional[str] = None, 
-                    duration_minutes: int = DEFAULT_EVENT_DURATION) -> Dict[str, Any]:
-        """캘린더에 새 일정을 생성합니다."""
+    def query_calendars(self, calendar_names: List[str], search_start: datetime, 
+                        search_end: datetime) -> List[Event]:
+        """여러 캘린더의 일정을 한 번의 스크립트 실행으로 조회합니다. (중복 제거, 시작 시각 순)"""
+        return self._dedup(self.iter_calendar_events(calendar_names, search_start, search_end))
+    
+    def _sync_window(self, calendar_names: List[str], search_start: datetime, search_end: datetime):
+        """캐시에 없거나 오래된 날짜 구간만 캘린더에서 다시 가져옵니다."""
+        self._drive(self._sync_window_steps(calendar_names, search_start, search_end))
+    
+    def _sync_window_steps(self, calendar_names: List[str], search_start: datetime, 
+                           search_end: datetime) -> Steps:
+        if not calendar_names:
+            return
+        stale = self.store.stale_rule_calendars(calendar_names)
+        ranges = self.store.missing_ranges(calendar_names, search_start, search_end)
+        if stale and not ranges:
+            records = yield rules_call(stale)
+            self.store.replace_rules(stale, records_to_rules(records, self.timezone))
+        for first, last in ranges:
+            range_start = self._localize(datetime.combine(first, datetime.min.time()))
+            range_end = self._localize(datetime.combine(last, datetime.max.time()).replace(microsecond=0))
+            # 규칙을 다시 가져와야 하면 첫 구간 조회에 함께 실어 스크립트 실행을 따로 하지 않음
+            records = yield query_call(plan_query(calendar_names, range_start, range_end), with_rules=bool(stale))
+            events, rules = self._split_rules(records)
+            if stale:
+                self.store.replace_rules(calendar_names, rules)
+                stale = []
+            self.store.replace_range(calendar_names, first, last, events)
+    
+    def find_conflicts(self, start_dt: datetime, end_dt: datetime) -> List[Event]:
+        """[start_dt, end_dt)와 겹치는 일정을 로컬 캐시에서 찾습니다."""
+        return self._find_conflicts_many([Event("", "", "", start_dt, end_dt)])[0]
+    
+    def _find_conflicts_many(self, drafts: List[Event]) -> List[List[Event]]:
+        """여러 일정 초안 각각과 겹치는 일정을 찾습니다. (캐시 동기화는 전체 구간에 한 번)"""
+        return self._drive(self._find_conflicts_many_steps(drafts))
+    
+    def _find_conflicts_many_steps(self, drafts: List[Event]) -> Steps:
+        if not self.store or not drafts:
+            return [[] for _ in drafts]
+        calendar_names = yield from self._search_calendars_steps()
+        span_start, span_end = min(d.start for d in drafts), max(d.end for d in drafts)
+        day_start = span_start.replace(hour=0, minute=0, second=0, microsecond=0) - OVERLAP_LOOKBACK
+        day_end = span_end.replace(hour=23, minute=59, second=59, microsecond=0)
+        yield from self._sync_window_steps(calendar_names, day_start, day_end)
+        # 전체 구간을 한 번 읽어 구간 색인을 만들고 초안마다 색인에서 겹침을 찾음
+        index = IntervalIndex(self._dedup(self.store.find_overlaps(span_start, span_end, calendar_names)))
+        return [index.overlapping(d.start, d.end) for d in drafts]
+    
+    def _busy_events_steps(self, start: datetime, end: datetime) -> Steps:
+        """[start, end)와 겹치는 일정 (캐시가 있으면 동기화 후 캐시에서, 없으면 캘린더에서 바로)"""
+        calendar_names = yield from self._search_calendars_steps()
+        if not calendar_names:
+            return []
+        day_start = start.replace(hour=0, minute=0, second=0, microsecond=0) - OVERLAP_LOOKBACK
+        day_end = end.replace(hour=23, minute=59, second=59, microsecond=0)
+        if self.store:
+            yield from self._sync_window_steps(calendar_names, day_start, day_end)
+            events = self.store.find_overlaps(start, end, calendar_names)
+        else:
+            records = yield query_call(plan_query(calendar_names, day_start, day_end), with_rules=True)
+            day_events, rules = self._split_rules(records)
+            events = [event for event in day_events if event.overlaps(start, end)]
+            for rule in rules:
+                events.extend(rule.overlapping(start, end, self.timezone))
+        return self._dedup(events)
+    
+    def _resolve_slot(self, start: str, end: Optional[str] = None) -> Tuple[datetime, datetime]:
+        """시작/종료 표현을 [시작, 종료) 시각으로 변환합니다.
+        
+        종료가 없으면 표현의 길이("오후 3시부터 5시", "오후 2시 1시간 반"), 시각만 있으면 기본 길이,
+        날짜만 있으면 그날 전체입니다.
+        """
+        first = self._resolve_expression(start)
+        if end:
+            last = self._resolve_expression(end)
+            end_naive = last.start if last.has_time else last.end
+        elif first.duration:
+            end_naive = first.end
+        elif first.has_time:
+            end_naive = first.start + timedelta(minutes=DEFAULT_EVENT_DURATION)
+        else:
+            end_naive = first.end
+        if end_naive <= first.start:
+            raise ValueError(f"종료({end})가 시작({start})보다 앞섭니다.")
+        return self._localize(first.start), self._localize(end_naive)
+    
+    def check_conflicts(self, start: str, end: Optional[str] = None) -> Dict[str, Any]:
+        """start~end 표현 구간("내일 오후 3시", "금요일 오후 2시부터 4시")과 겹치는 일정을 확인합니다."""
+        return self._drive(self._check_conflicts_steps(start, end))
+    
+    def _check_conflicts_steps(self, start: str, end: Optional[str] = None) -> Steps:
+        try:
+            start_dt, end_dt = self._resolve_slot(start, end)
+            conflicts = yield from self._busy_events_steps(start_dt, end_dt)
+            period = f"{start_dt.strftime('%m월 %d일 %H:%M')} ~ {end_dt.strftime('%m월 %d일 %H:%M')}"
+            return {
+                "success": True,
+                "message": (f"{period}에 겹치는 일정이 {len(conflicts)}개 있습니다." if conflicts 
+                            else f"{period}에 겹치는 일정이 없습니다."),
+                "start": start_dt,
+                "end": end_dt,
+                "conflicts": conflicts
+            }
+        except Exception as e:
+            return {
+                "success": False,
+                "message": f"일정 겹침 확인 실패: {str(e)}",
+                "error": str(e)
+            }
+    
+    def find_free_slots(self, range_str: str, duration_minutes: int = 60, 
+                        working_hours: Optional[str] = None) -> Dict[str, Any]:
+        """range_str 구간에서 duration_minutes 이상 비어 있는 시간을 찾습니다.
+        
+        range_str에는 "목요일 오후", "내일", "이번 주", "금요일 오후 1시부터 6시" 같은 표현을 쓰며,
+        "오후"/"저녁"처럼 하루 중 때를 주면 그 시간대에서, 아니면 하루마다 working_hours
+        ("09:00-18:00", 기본값은 config.WORKING_HOURS) 안에서 찾습니다. 지난 시간은 제외합니다.
+        """
+        return self._drive(self._find_free_slots_steps(range_str, duration_minutes, working_hours))
+    
+    def _find_free_slots_steps(self, range_str: str, duration_minutes: int = 60, 
+                               working_hours: Optional[str] = None) -> Steps:
         try:
-            # 날짜 파싱
-            if time_str:
-                full_date_str = f"{date_str} {time_str}"
+            day_part, rest = split_day_part(range_str)
+            span = self._resolve_expression(rest or "오늘")
+            if span.has_time:
+                # 시각으로 지정한 구간은 근무 시간과 관계없이 그대로 사용
+                hours = None
+                span_end = span.end if span.end > span.start else span.start.replace(hour=23, minute=59, second=59)
             else:
-                full_date_str = date_str
+                hours = day_part or parse_working_hours(working_hours or WORKING_HOURS)
+                span_end = span.end
+            window_start, window_end = self._localize(span.start), self._localize(span_end)
             
-            start_dt = self._parse_korean_date(full_date_str)
-            end_dt = start_dt + timedelta(minutes=duration_minutes)
+            # 지난 시간은 제외 (다음 30분 단위부터)
+            now = datetime.now(self.timezone).replace(second=0, microsecond=0)
+            now += timedelta(minutes=-now.minute % 30)
+            window_start = max(window_start, now)
             
-            # AppleScript에서 날짜를 직접 생성하는 방식 사용
-            script = f'''
-            tell application "Calendar"
-                tell calendar "{self.calendar_name}"
-                    set startDate to (current date)
-                    set year of startDate to {start_dt.year}
-                    set month of startDate to {start_dt.month}
-                    set day of startDate to {start_dt.day}
-                    set hours of startDate to {start_dt.hour}
-                    set minutes of startDate to {start_dt.minute}
-                    set seconds of startDate to 0
-                    
-                    set endDate to (current date)
-                    set year of endDate to {end_dt.year}
-                    set month of endDate to {end_dt.month}
-                    set day of endDate to {end_dt.day}
-                    set hours of endDate to {end_dt.hour}
-                    set minutes of endDate to {end_dt.minute}
-                    set seconds of endDate to 0
-                    
-                    make new event at end with properties {{summary:"{title}", start date:startDate, end date:endDate}}
-                end tell
-            end tell
-            '''
+            if window_start >= window_end:
+                return {
+                    "success": True,
+                    "message": "이미 지난 구간이라 찾을 빈 시간이 없습니다.",
+                    "slots": []
+                }
             
-            self._run_applescript(script)
+            events = yield from self._busy_events_steps(window_start, window_end)
+            began = time.perf_counter()
+            busy = merge_busy(events, window_start, window_end)
+            windows = working_windows(window_start, window_end, hours, self.timezone)
+            slots = free_slots(busy, windows, timedelta(minutes=duration_minutes))
+            elapsed_ms = (time.perf_counter() - began) * 1000
             
+            scope = f"{window_start.strftime('%Y년 %m월 %d일 %H:%M')} ~ {window_end.strftime('%Y년 %m월 %d일 %H:%M')}"
+            if hours is not None:
+                scope += f", 매일 {hours[0].strftime('%H:%M')}-{hours[1].strftime('%H:%M')}"
             return {
                 "success": True,
-                "message": f"'{title}' 일정을 {start_dt.strftime('%Y년 %m월 %d일 %H:%M')}에 추가했습니다.",
-                "event": {
-                    "title": title,
-                    "start_time": start_dt.isoformat(),
-                    "end_time": end_dt.isoformat()
-                }
+                "message": f"{duration_minutes}분 이상 비어 있는 시간 {len(slots)}개를 찾았습니다. (검색 범위: {scope})",
+                "slots": [
+                    {"start": slot_start, "end": slot_end, 
+                     "minutes": int((slot_end - slot_start).total_seconds() // 60)}
+                    for slot_start, slot_end in slots
+                ],
+                "busy_events": len(events),
+                "elapsed_ms": round(elapsed_ms, 3)
             }
-            
         except Exception as e:
             return {
                 "success": False,
-                "message": f"일정 생성 실패: {str(e)}",
+                "message": f"빈 시간 찾기 실패: {str(e)}",
                 "error": str(e)
             }
     
     def get_events(self, date_str: Optional[str] = None, keywords: Optional[str] = None, 
-                   months_range: int = 1) -> Dict[str, Any]:
-        """캘린더에서 일정을 조회합니다."""
+                   months_range: int = 1, start: Optional[str] = None, 
+                   end: Optional[str] = None, calendars: Optional[List[str]] = None) -> Dict[str, Any]:
+        """캘린더에서 일정을 조회합니다.
+        
+        start/end에 "이번 주", "다음 달", "6월 둘째 주", "6월 10일" 같은 표현을 주면 그 구간만 조회합니다.
+        start만 주면 그 기간 전체, end만 주면 오늘부터 end까지입니다. calendars를 주면 해당 캘린더만 조회합니다.
+        결과의 query에는 검사한 행 수(scanned)와 반환된 행 수(returned)가 담깁니다.
+        """
+        return self._drive(self._get_events_steps(date_str, keywords, months_range, start, end, calendars))
+    
+    def _resolve_window(self, start: Optional[str], end: Optional[str]) -> Tuple[datetime, datetime]:
+        """start/end 표현을 조회 구간(캘린더 시간대)으로 변환합니다."""
+        if start:
+            first = self._resolve_expression(start)
+            last = self._resolve_expression(end) if end else first
+        else:
+            last = self._resolve_expression(end)
+            first = TemporalRange(datetime.combine(self._today(), datetime.min.time()), last.end)
+        if last.end < first.start:
+            raise ValueError(f"조회 종료({end})가 시작({start})보다 앞섭니다.")
+        return self._localize(first.start), self._localize(last.end)
+    
+    def _get_events_steps(self, date_str: Optional[str] = None, keywords: Optional[str] = None, 
+                          months_range: int = 1, start: Optional[str] = None, 
+                          end: Optional[str] = None, calendars: Optional[List[str]] = None) -> Steps:
         try:
-            # 모든 캘린더에서 검색하도록 수정
-            calendar_names = ["캘린더", "Home", "홈", "Work", "집", "직장"]
-            all_events = []
+            # 지정하지 않으면 고른(없으면 모든) 캘린더에서 검색하며, 없는 캘린더는 조회하지 않음
+            calendar_names = yield from self._search_calendars_steps(calendars)
+            if not calendar_names:
+                available = yield from self._available_calendars_steps()
+                return {
+                    "success": False,
+                    "message": f"조회할 캘린더가 없습니다. (요청: {', '.join(calendars or self.calendars or [])}, "
+                               f"사용 가능: {', '.join(available)})"
+                }
             
             # 기본 날짜 범위 설정 (현재 날짜 기준 전후 months_range 개월)
-            today = datetime.now()
-            if date_str:
+            today = datetime.now(self.timezone).replace(microsecond=0)
+            if start or end:
+                # 기간 표현이 지정된 경우 해당 구간만 조회
+                search_start, search_end = self._resolve_window(start, end)
+            elif date_str:
                 # 특정 날짜가 지정된 경우
                 target_date = self._parse_korean_date(date_str)
-                start_of_day = target_date.replace(hour=0, minute=0, second=0)
-                end_of_day = target_date.replace(hour=23, minute=59, second=59)
-                search_start = start_of_day
-                search_end = end_of_day
+                search_start = self._localize(target_date.replace(hour=0, minute=0, second=0, microsecond=0))
+                search_end = self._localize(target_date.replace(hour=23, minute=59, second=59, microsecond=0))
             else:
                 # 날짜가 지정되지 않은 경우 기본 범위 설정
                 # 현재 날짜 기준 1개월 전부터 1개월 후까지
                 search_start = today.replace(day=1) - timedelta(days=30 * months_range)
                 search_end = today + timedelta(days=30 * months_range)
             
-            for calendar_name in calendar_names:
-                try:
-                    # 날짜 범위를 적용한 검색
-                    script = f'''
-                    tell application "Calendar"
-                        try
-                            tell calendar "{calendar_name}"
-                                set startDate to (current date)
-                                set year of startDate to {search_start.year}
-                                set month of startDate to {search_start.month}
-                                set day of startDate to {search_start.day}
-                                set hours of startDate to {search_start.hour}
-                                set minutes of startDate to {search_start.minute}
-                                set seconds of startDate to {search_start.second}
-                                
-                                set endDate to (current date)
-                                set year of endDate to {search_end.year}
-                                set month of endDate to {search_end.month}
-                                set day of endDate to {search_end.day}
-                                set hours of endDate to {search_end.hour}
-                                set minutes of endDate to {search_end.minute}
-                                set seconds of endDate to {search_end.second}
-                                
-                                set eventList to every event whose start date ≥ startDate and start date ≤ endDate
-                                set eventInfo to {{}}
-                                repeat with anEvent in eventList
-                                    set eventTitle to (summary of anEvent)
-                                    set eventStart to (start date of anEvent) as string
-                                    set eventEnd to (end date of anEvent) as string
-                                    set end of eventInfo to eventTitle & "|||" & eventStart & "|||" & eventEnd
-                                end repeat
-                                return eventInfo as string
-                            end tell
-                        on error
-                            return ""
-                        end try
-                    end tell
-                    '''
-                    
-                    result = self._run_applescript(script)
-                    
-                    # 결과 파싱
-                    if result and result.strip():
-                        event_strings = result.split(', ')
-                        for event_str in event_strings:
-                            if '|||' in event_str:
-                                parts = event_str.split('|||')
-                                if len(parts) >= 3:
-                                    all_events.append({
-                                        "title": parts[0].strip(),
-                                        "start_time": parts[1].strip(),
-                                        "end_time": parts[2].strip(),
-                                        "calendar": calendar_name
-                                    })
-                            elif event_str.strip():
-                                # 구분자가 없는 경우 제목만 있는 것으로 처리
-                                all_events.append({
-                                    "title": event_str.strip(),
-                                    "start_time": "시간 정보 없음",
-                                    "end_time": "시간 정보 없음",
-                                    "calendar": calendar_name
-                                })
-                except Exception:
-                    # 캘린더가 없거나 접근할 수 없는 경우 무시
-                    continue
-            
-            # 키워드 필터링
-            if keywords:
-                all_events = [e for e in all_events if keywords.lower() in e["title"].lower()]
-            
-            # 날짜순 정렬 (시간 정보가 있는 경우)
-            def sort_key(event):
-                try:
-                    if "시간 정보 없음" not in event["start_time"]:
-                        # 한국어 날짜 문자열을 파싱하여 정렬
-                        return event["start_time"]
-                    return "9999-12-31"  # 시간 정보가 없는 경우 마지막에 정렬
-                except:
-                    return "9999-12-31"
-            
-            all_events.sort(key=sort_key)
+            plan = plan_query(calendar_names, search_start, search_end, keywords)
+            if self.store:
+                # 로컬 캐시를 동기화한 뒤 캐시에서 조회 (정렬/키워드 필터 포함)
+                # 캐시는 구간 전체를 미러링해야 하므로 제목 조건은 스크립트가 아닌 SQLite에서 적용
+                yield from self._sync_window_steps(list(plan.calendars), search_start, search_end)
+                events = self.store.query(search_start, search_end, keywords, plan.calendars)
+                stats = QueryStats(
+                    scanned=self.store.count(search_start, search_end, plan.calendars),
+                    returned=len(events),
+                    source="cache"
+                )
+                all_events = self._dedup(events)
+            else:
+                # 캘린더 선택, 날짜 구간, 제목 조건을 스크립트로 내려보내 일치하는 행만 받음
+                stats = QueryStats(pushed_down=plan.describe())
+                # 반복 일정 규칙도 같은 스크립트로 받아 구간 안의 회차만 전개해 합침 (첫 회차는 중복 제거)
+                records = yield query_call(plan, with_rules=True)
+                events, rules = self._split_rules(records, stats)
+                events.extend(e for e in expand(rules, search_start, search_end, self.timezone) if plan.matches(e))
+                all_events = [
+                    e for e in self._dedup(events)
+                    if search_start <= e.start <= search_end
+                ]
             
             # 검색 범위 정보 추가
             range_info = ""
-            if not date_str:
+            if start or end or not date_str:
                 range_info = f" (검색 범위: {search_start.strftime('%Y년 %m월 %d일')} ~ {search_end.strftime('%Y년 %m월 %d일')})"
             
             return {
@@ -270,9 +654,10 @@ class CalendarTools:
                 "search_range": {
                     "start": search_start.isoformat(),
                     "end": search_end.isoformat()
-                }
+                },
+                "query": stats.to_dict()
             }
-            
+        
         except Exception as e:
             return {
                 "success": False,
@@ -280,145 +665,488 @@ class CalendarTools:
                 "error": str(e)
             }
     
-    def update_event(self, original_title: str, new_date_str: Optional[str] = None, 
-                    new_time_str: Optional[str] = None, new_title: Optional[str] = None) -> Dict[str, Any]:
-        """기존 일정을 수정합니다."""
+    def search_events(self, query: str, start: Optional[str] = None, end: Optional[str] = None, 
+                      limit: int = 20) -> Dict[str, Any]:
+        """로컬 캐시의 n-gram 색인으로 제목·장소·메모를 검색해 점수 순으로 반환합니다.
+        
+        start/end("올해", "지난 달" 등)를 주면 그 구간을 먼저 동기화하고 구간 안에서만 찾으며,
+        주지 않으면 지금까지 캐시된 전체 기록에서 찾습니다.
+        """
+        return self._drive(self._search_events_steps(query, start, end, limit))
+    
+    def _search_events_steps(self, query: str, start: Optional[str] = None, end: Optional[str] = None, 
+                             limit: int = 20) -> Steps:
+        if not self.store:
+            return {
+                "success": False,
+                "message": "일정 검색에는 로컬 캐시가 필요합니다. (MAC_AGENT_EVENT_CACHE=1)"
+            }
         try:
-            # 먼저 기존 일정 찾기
-            script = f'''
-            tell application "Calendar"
-                tell calendar "{self.calendar_name}"
-                    set targetEvent to first event whose summary is "{original_title}"
-                    if targetEvent exists then
-                        return "found"
-                    else
-                        return "not found"
-                    end if
-                end tell
-            end tell
-            '''
+            search_start = search_end = None
+            calendar_names = None
+            if start or end:
+                search_start, search_end = self._resolve_window(start, end)
+                calendar_names = yield from self._search_calendars_steps()
+                yield from self._sync_window_steps(calendar_names, search_start, search_end)
             
-            result = self._run_applescript(script)
-            if result != "found":
-                return {
-                    "success": False,
-                    "message": f"'{original_title}' 일정을 찾을 수 없습니다."
-                }
-            
-            # 수정 스크립트 생성
-            update_commands = []
-            
-            if new_title:
-                update_commands.append(f'set summary of targetEvent to "{new_title}"')
-            
-            if new_date_str or new_time_str:
-                if new_date_str and new_time_str:
-                    full_date_str = f"{new_date_str} {new_time_str}"
-                elif new_date_str:
-                    full_date_str = new_date_str
-                else:
-                    # 시간만 변경하는 경우는 복잡하므로 현재는 지원하지 않음
-                    return {
-                        "success": False,
-                        "message": "시간만 변경하는 기능은 아직 지원되지 않습니다."
-                    }
-                
-                new_start_dt = self._parse_korean_date(full_date_str)
-                # 기존 일정의 지속시간을 유지한다고 가정 (1시간)
-                new_end_dt = new_start_dt + timedelta(minutes=DEFAULT_EVENT_DURATION)
-                
-                start_date_str = self._format_applescript_date(new_start_dt)
-                end_date_str = self._format_applescript_date(new_end_dt)
-                
-                update_commands.append(f'set start date of targetEvent to date "{start_date_str}"')
-                update_commands.append(f'set end date of targetEvent to date "{end_date_str}"')
-            
-            if not update_commands:
-                return {
-                    "success": False,
-                    "message": "수정할 내용이 없습니다."
-                }
+            began = time.perf_counter()
+            ranked = self.store.search(query, search_start, search_end, calendar_names, limit)
+            elapsed_ms = (time.perf_counter() - began) * 1000
             
-            script = f'''
-            tell application "Calendar"
-                tell calendar "{self.calendar_name}"
-                    set targetEvent to first event whose summary is "{original_title}"
-                    {chr(10).join(update_commands)}
-                end tell
-            end tell
-            '''
-            
-            self._run_applescript(script)
+            # 여러 캘린더에 중복된 일정은 점수가 높은 쪽만 남김 (순위 유지)
+            seen, events, scores = set(), [], []
+            for event, score in ranked:
+                if event.dedup_key in seen:
+                    continue
+                seen.add(event.dedup_key)
+                events.append(event)
+                scores.append(round(score, 3))
             
             return {
                 "success": True,
-                "message": f"'{original_title}' 일정이 수정되었습니다."
+                "message": f"'{query}' 검색 결과 {len(events)}개의 일정을 찾았습니다.",
+                "events": events,
+                "scores": scores,
+                "elapsed_ms": round(elapsed_ms, 2)
             }
-            
         except Exception as e:
             return {
                 "success": False,
-                "message": f"일정 수정 실패: {str(e)}",
+                "message": f"일정 검색 실패: {str(e)}",
                 "error": str(e)
             }
     
-    def delete_event(self, title: str, date_str: Optional[str] = None) -> Dict[str, Any]:
-        """일정을 삭제합니다."""
-        try:
-            if date_str:
-                # 특정 날짜의 일정 삭제
-                target_date = self._parse_korean_date(date_str)
-                start_of_day = target_date.replace(hour=0, minute=0, second=0)
-                end_of_day = target_date.replace(hour=23, minute=59, second=59)
-                
-                start_date_str = self._format_applescript_date(start_of_day)
-                end_date_str = self._format_applescript_date(end_of_day)
-                
-                script = f'''
-                tell application "Calendar"
-                    tell calendar "{self.calendar_name}"
-                        set targetEvents to every event whose summary is "{title}" and start date ≥ date "{start_date_str}" and start date ≤ date "{end_date_str}"
-                        if (count of targetEvents) > 0 then
-                            delete first item of targetEvents
-                            return "deleted"
-                        else
-                            return "not found"
-                        end if
-                    end tell
-                end tell
-                '''
+    def iter_events_range(self, start: datetime, end: datetime, 
+                          chunk_days: int = 31) -> Iterator[Event]:
+        """구간의 일정을 chunk_days 단위로 나눠 조회하며 시작 시각 순으로 내보냅니다.
+        
+        한 번에 한 조각만 메모리에 두므로 긴 기간을 내보낼 때도 사용량이 일정합니다.
+        """
+        calendar_names = self._drive(self._search_calendars_steps())
+        chunk_start = start
+        while chunk_start <= end:
+            chunk_end = min(chunk_start + timedelta(days=chunk_days) - timedelta(seconds=1), end)
+            if self.store:
+                self._sync_window(calendar_names, chunk_start, chunk_end)
+                events = self.store.query(chunk_start, chunk_end, calendars=calendar_names)
             else:
-                # 제목으로만 일정 삭제 (첫 번째 일치하는 일정)
-                script = f'''
-                tell application "Calendar"
-                    tell calendar "{self.calendar_name}"
-                        set targetEvent to first event whose summary is "{title}"
-                        if targetEvent exists then
-                            delete targetEvent
-                            return "deleted"
-                        else
-                            return "not found"
-                        end if
-                    end tell
-                end tell
-                '''
-            
-            result = self._run_applescript(script)
-            
-            if result == "deleted":
-                return {
-                    "success": True,
-                    "message": f"'{title}' 일정이 삭제되었습니다."
-                }
+                events = self.iter_calendar_events(calendar_names, chunk_start, chunk_end)
+            yield from self._dedup(e for e in events if chunk_start <= e.start <= chunk_end)
+            chunk_start = chunk_end + timedelta(seconds=1)
+    
+    def import_events(self, events: Iterable[Event], batch_size: int = 50, 
+                      progress: Optional[Callable[[Dict[str, int]], None]] = None) -> Dict[str, Any]:
+        """일정 스트림을 batch_size 단위로 기본 캘린더에 추가합니다.
+        
+        배치마다 해당 기간의 기존 일정(제목과 시작 시각 기준)과 이미 가져온 일정을 제외하고
+        한 번의 스크립트로 생성하므로, 메모리에는 배치 하나와 중복 확인용 키만 유지됩니다.
+        progress가 있으면 배치마다 누적 통계(processed, created, skipped, failed)를 전달합니다.
+        """
+        stats = {"processed": 0, "created": 0, "skipped": 0, "failed": 0}
+        seen = set()
+        errors: List[str] = []
+        
+        batch: List[Event] = []
+        for event in events:
+            batch.append(event)
+            if len(batch) >= batch_size:
+                self._import_batch(batch, seen, stats, errors)
+                batch = []
+                if progress:
+                    progress(dict(stats))
+        if batch:
+            self._import_batch(batch, seen, stats, errors)
+            if progress:
+                progress(dict(stats))
+        
+        return {
+            "success": stats["failed"] == 0,
+            "message": (f"{stats['processed']}개 중 {stats['created']}개를 추가했습니다. "
+                        f"(중복 {stats['skipped']}개, 실패 {stats['failed']}개)"),
+            "stats": stats,
+            "errors": errors[:20]
+        }
+    
+    def _import_batch(self, batch: List[Event], seen: set, stats: Dict[str, int], errors: List[str]):
+        """가져오기 배치 하나를 중복 제거 후 생성합니다."""
+        window_start = min(e.start for e in batch)
+        window_end = max(e.start for e in batch)
+        existing = {(e.title, e.start) for e in self.iter_events_range(window_start, window_end, chunk_days=366)}
+        
+        drafts = []
+        for event in batch:
+            title = field_text(event.title)
+            key = (title, event.start)
+            if key in existing or key in seen:
+                stats["skipped"] += 1
+                continue
+            seen.add(key)
+            drafts.append(Event("", self.calendar_name, title, event.start, event.end,
+                                field_text(event.location), field_text(event.notes)))
+        
+        for result in self._create_drafts(drafts, check_conflicts=False):
+            if result["success"]:
+                stats["created"] += 1
             else:
-                return {
+                stats["failed"] += 1
+                errors.append(result["message"])
+        stats["processed"] += len(batch)
+    
+    def _day_window(self, date_str: str) -> Tuple[datetime, datetime]:
+        """날짜 표현이 가리키는 하루 전체 구간 (캘린더 시간대)"""
+        target_date = self._parse_korean_date(date_str)
+        return (self._localize(target_date.replace(hour=0, minute=0, second=0, microsecond=0)),
+                self._localize(target_date.replace(hour=23, minute=59, second=59, microsecond=0)))
+    
+    def _find_target_steps(self, title: str, window: Optional[Tuple[datetime, datetime]] = None) -> Steps:
+        """제목(과 날짜)이 일치하는 수정/삭제 대상을 로컬 캐시의 (제목, 날짜) 색인에서 고릅니다.
+        
+        반환값은 (대상 일정 또는 None, 같은 조건의 후보 수)입니다. 날짜가 있으면 그 날을 먼저
+        동기화하고, 없으면 지금까지 캐시된 범위에서 찾습니다. 같은 제목이 여럿이면 끝나지 않은
+        가장 가까운 일정을, 모두 지났으면 가장 최근 일정을 고릅니다.
+        """
+        if not self.store or not title:
+            return None, 0
+        calendar_names = yield from self._search_calendars_steps()
+        if window is not None:
+            try:
+                yield from self._sync_window_steps(calendar_names, *window)
+            except Exception:
+                pass
+        start, end = window or (None, None)
+        candidates = self.store.find_by_title(title, start, end, calendar_names)
+        if not candidates:
+            return None, 0
+        now = datetime.now(self.timezone)
+        upcoming = [event for event in candidates if event.end >= now]
+        return (upcoming[0] if upcoming else candidates[-1]), len(candidates)
+    
+    def _target_args(self, uid: Optional[str], title: str, 
+                     window: Optional[Tuple[datetime, datetime]], calendars: List[str]) -> Tuple[str, ...]:
+        """대상 일정을 찾는 항목 인자 (uid, title, dayStart, dayEnd, calendars)
+        
+        UID가 있으면 calendars(기본 캘린더 먼저)에서 uid로, 없으면 기본 캘린더에서 제목(과 날짜)으로 찾습니다.
+        """
+        if uid:
+            if len(calendars) != 1:
+                calendars = list(dict.fromkeys([self.calendar_name, *calendars]))
+            return (uid, title, "", "", FIELD_SEPARATOR.join(calendars))
+        day_start, day_end = (script_date(window[0]), script_date(window[1])) if window else ("", "")
+        return ("", title, day_start, day_end, "")
+    
+    def _target_calendars_steps(self, target: Optional[Event]) -> Steps:
+        """UID로 찾을 캘린더 (캐시에서 캘린더를 알면 그 캘린더만, 모르면 있는 캘린더 전체)"""
+        if target is not None:
+            return [target.calendar]
+        available = yield from self._available_calendars_steps()
+        return available
+    
+    @staticmethod
+    def _target_note(target: Optional[Event], candidates: int) -> str:
+        """같은 제목의 일정이 여럿일 때 어떤 일정을 골랐는지 알려주는 문구"""
+        if target is None or candidates < 2:
+            return ""
+        return f" (같은 제목의 일정 {candidates}개 중 {target.start.strftime('%m월 %d일 %H:%M')} 일정)"
+    
+    def update_event(self, original_title: str, new_date_str: Optional[str] = None, 
+                    new_time_str: Optional[str] = None, new_title: Optional[str] = None, 
+                    original_date_str: Optional[str] = None, uid: Optional[str] = None) -> Dict[str, Any]:
+        """기존 일정을 수정합니다."""
+        return self.update_events([{
+            "original_title": original_title,
+            "new_date_str": new_date_str,
+            "new_time_str": new_time_str,
+            "new_title": new_title,
+            "original_date_str": original_date_str,
+            "uid": uid
+        }])["results"][0]
+    
+    def update_events(self, updates: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """여러 일정을 한 번의 스크립트 실행으로 수정합니다.
+        
+        각 항목은 update_event와 같은 키(original_title, new_date_str, new_time_str, new_title,
+        original_date_str, uid)를 가집니다. 대상은 uid, 없으면 로컬 캐시의 (제목, 날짜) 색인으로
+        정해 UID로 수정하며, 캐시에 없을 때만 스크립트가 제목으로 찾습니다. 날짜나 시간을 옮겨도
+        새 시간 표현에 길이("오후 2시부터 4시까지")가 없으면 기존 일정의 길이를 유지합니다.
+        """
+        return self._drive(self._update_events_steps(updates))
+    
+    def _update_events_steps(self, updates: List[Dict[str, Any]]) -> Steps:
+        results: List[Optional[Dict[str, Any]]] = [None] * len(updates)
+        planned = []  # (입력 위치, 원래 제목, 새 제목, 대상 일정, 후보 수, 항목 인자)
+        
+        for index, item in enumerate(updates):
+            original_title = field_text(item.get("original_title"))
+            new_date_str, new_time_str = item.get("new_date_str"), item.get("new_time_str")
+            new_title = field_text(item.get("new_title"))
+            try:
+                new_start = new_time = duration = ""
+                if new_date_str or new_time_str:
+                    if new_date_str:
+                        span = self._resolve_expression(new_date_str, new_time_str)
+                        new_start = script_date(self._resolve_start(new_date_str, new_time_str))
+                    else:
+                        # 시간만 바꾸면 기존 일정의 날짜에 새 시각을 적용
+                        span = self._resolve_expression(new_time_str)
+                        if not span.has_time:
+                            raise ValueError(f"시간 파싱 실패: {new_time_str}")
+                        new_time = span.start.strftime("%H:%M")
+                    # 표현에 길이가 없으면 기존 일정의 길이를 유지
+                    duration = str(int(span.duration.total_seconds())) if span.duration else ""
+                
+                if not (new_title or new_start or new_time):
+                    results[index] = {
+                        "success": False,
+                        "message": "수정할 내용이 없습니다."
+                    }
+                    continue
+                
+                uid, window = item.get("uid"), None
+                if item.get("original_date_str"):
+                    window = self._day_window(item["original_date_str"])
+                target, candidates = None, 0
+                if not uid:
+                    target, candidates = yield from self._find_target_steps(original_title, window)
+                    uid = target.uid if target else None
+                elif self.store:
+                    target = self.store.get_by_uid(uid)
+                
+                target_calendars = (yield from self._target_calendars_steps(target)) if uid else []
+                args = self._target_args(uid, original_title, window, target_calendars)
+                planned.append((index, original_title or (target.title if target else ""), new_title, 
+                                target, candidates, args + (new_title, new_start, new_time, duration)))
+            except Exception as e:
+                results[index] = {
                     "success": False,
-                    "message": f"'{title}' 일정을 찾을 수 없습니다."
+                    "message": f"일정 수정 실패: {str(e)}",
+                    "error": str(e)
                 }
+        
+        if planned:
+            try:
+                records = list((yield update_call(self.calendar_name, [args for *_, args in planned])))
+            except Exception as e:
+                records = [["error", str(e)]] * len(planned)
+            
+            for plan, record in zip(planned, self._align_records(records, len(planned))):
+                index, original_title, new_title, target, candidates, _ = plan
+                if record[0] == "ok" and len(record) >= 6:
+                    start_dt = self._localize(datetime.fromisoformat(record[4]))
+                    end_dt = self._localize(datetime.fromisoformat(record[5]))
+                    event = Event(record[1], record[2], record[3], start_dt, end_dt,
+                                  target.location if target else "", target.notes if target else "")
+                    if self.store:
+                        self.store.update_by_uid(event.uid, new_title, start_dt, end_dt)
+                    results[index] = {
+                        "success": True,
+                        "message": f"'{original_title}' 일정이 수정되었습니다.{self._target_note(target, candidates)}",
+                        "event": event
+                    }
+                elif record[0] == "missing":
+                    results[index] = {
+                        "success": False,
+                        "message": f"'{original_title}' 일정을 찾을 수 없습니다."
+                    }
+                else:
+                    error = record[1] if len(record) > 1 else record[0]
+                    results[index] = {
+                        "success": False,
+                        "message": f"일정 수정 실패: {error}",
+                        "error": error
+                    }
+        
+        return self._batch_summary(results, "수정")
+    
+    def delete_event(self, title: str, date_str: Optional[str] = None, uid: Optional[str] = None) -> Dict[str, Any]:
+        """일정을 삭제합니다."""
+        return self.delete_events([{"title": title, "date_str": date_str, "uid": uid}])["results"][0]
+    
+    def delete_events(self, deletions: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """여러 일정을 한 번의 스크립트 실행으로 삭제합니다.
+        
+        각 항목은 delete_event와 같은 키(title, date_str, uid)를 가집니다. 대상은 uid, 없으면
+        로컬 캐시의 (제목, 날짜) 색인으로 정해 UID로 삭제하며, 캐시에 없을 때만 스크립트가
+        date_str 날짜(없으면 전체)에서 제목이 일치하는 첫 번째 일정을 찾습니다.
+        """
+        return self._drive(self._delete_events_steps(deletions))
+    
+    def _delete_events_steps(self, deletions: List[Dict[str, Any]]) -> Steps:
+        results: List[Optional[Dict[str, Any]]] = [None] * len(deletions)
+        planned = []  # (입력 위치, 제목, 대상 일정, 후보 수, 항목 인자)
+        
+        for index, item in enumerate(deletions):
+            title = field_text(item.get("title"))
+            try:
+                uid, window = item.get("uid"), None
+                if item.get("date_str"):
+                    # 특정 날짜의 일정 삭제
+                    window = self._day_window(item["date_str"])
+                target, candidates = None, 0
+                if not uid:
+                    target, candidates = yield from self._find_target_steps(title, window)
+                    uid = target.uid if target else None
+                elif self.store:
+                    target = self.store.get_by_uid(uid)
                 
-        except Exception as e:
-            return {
-                "success": False,
-                "message": f"일정 삭제 실패: {str(e)}",
-                "error": str(e)
-            } 
\ No newline at end of file
+                target_calendars = (yield from self._target_calendars_steps(target)) if uid else []
+                planned.append((index, title or (target.title if target else ""), target, candidates, 
+                                self._target_args(uid, title, window, target_calendars)))
+            except Exception as e:
+                results[index] = {
+                    "success": False,
+                    "message": f"일정 삭제 실패: {str(e)}",
+                    "error": str(e)
+                }
+        
+        if planned:
+            try:
+                records = list((yield delete_call(self.calendar_name, [args for *_, args in planned])))
+            except Exception as e:
+                records = [["error", str(e)]] * len(planned)
+            
+            for plan, record in zip(planned, self._align_records(records, len(planned))):
+                index, title, target, candidates, _ = plan
+                if record[0] == "ok":
+                    if self.store and len(record) > 1:
+                        self.store.delete_by_uid(record[1])
+                    results[index] = {
+                        "success": True,
+                        "message": f"'{title}' 일정이 삭제되었습니다.{self._target_note(target, candidates)}"
+                    }
+                elif record[0] == "missing":
+                    results[index] = {
+                        "success": False,
+                        "message": f"'{title}' 일정을 찾을 수 없습니다."
+                    }
+                else:
+                    error = record[1] if len(record) > 1 else record[0]
+                    results[index] = {
+                        "success": False,
+                        "message": f"일정 삭제 실패: {error}",
+                        "error": error
+                    }
+        
+        return self._batch_summary(results, "삭제")
+
+class AsyncCalendarTools:
+    """이벤트 루프를 막지 않는 CalendarTools 비동기 버전
+    
+    스크립트 구성, 결과 해석, 로컬 캐시는 CalendarTools의 단계 생성기를 그대로 사용하고
+    스크립트 실행만 AsyncScriptBackend(asyncio.create_subprocess_exec)로 처리합니다.
+    동시 실행 수와 시간 제한은 백엔드가 관리하며, 호출한 작업이 취소되면 실행 중인
+    스크립트 프로세스도 종료됩니다.
+    """
+    
+    def __init__(self, tools: CalendarTools, backend: Optional[AsyncScriptBackend] = None):
+        self.tools = tools
+        self.backend = backend or create_async_backend(
+            APPLESCRIPT_BACKEND,
+            command=APPLESCRIPT_WORKER_COMMAND,
+            max_concurrency=APPLESCRIPT_MAX_CONCURRENCY,
+            timeout=APPLESCRIPT_TIMEOUT
+        )
+    
+    async def close(self):
+        """비동기 백엔드를 정리합니다. (CalendarTools는 소유자가 정리)"""
+        await self.backend.close()
+    
+    async def _drive(self, steps: Steps) -> Any:
+        """단계 생성기를 비동기 백엔드로 실행합니다.
+        
+        실행 오류는 생성기 안으로 전달해 동기 버전과 같은 방식으로 처리되게 하고,
+        취소(CancelledError)는 그대로 호출자에게 전파합니다.
+        """
+        try:
+            script = next(steps)
+            while True:
+                try:
+                    output = await self.backend.run(script)
+                except Exception as e:
+                    script = steps.throw(e)
+                else:
+                    script = steps.send(iter_records([output]))
+        except StopIteration as stop:
+            return stop.value
+        finally:
+            steps.close()
+    
+    async def create_event(self, date_str: str, title: str, time_str: Optional[str] = None, 
+                           duration_minutes: Optional[int] = None, location: Optional[str] = None, 
+                           notes: Optional[str] = None, recurrence: Optional[str] = None) -> Dict[str, Any]:
+        """캘린더에 새 일정을 생성합니다."""
+        result = await self.create_events([{
+            "date_str": date_str,
+            "title": title,
+            "time_str": time_str,
+            "duration_minutes": duration_minutes,
+            "location": location,
+            "notes": notes,
+            "recurrence": recurrence
+        }])
+        return result["results"][0]
+    
+    async def create_events(self, events: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """여러 일정을 한 번의 스크립트 실행으로 생성합니다."""
+        return await self._drive(self.tools._create_events_steps(events))
+    
+    async def get_events(self, date_str: Optional[str] = None, keywords: Optional[str] = None, 
+                         months_range: int = 1, start: Optional[str] = None, 
+                         end: Optional[str] = None, calendars: Optional[List[str]] = None) -> Dict[str, Any]:
+        """캘린더에서 일정을 조회합니다. (인자는 CalendarTools.get_events 참고)"""
+        return await self._drive(
+            self.tools._get_events_steps(date_str, keywords, months_range, start, end, calendars)
+        )
+    
+    async def search_events(self, query: str, start: Optional[str] = None, end: Optional[str] = None, 
+                            limit: int = 20) -> Dict[str, Any]:
+        """로컬 캐시의 n-gram 색인으로 일정을 검색합니다. (인자는 CalendarTools.search_events 참고)"""
+        return await self._drive(self.tools._search_events_steps(query, start, end, limit))
+    
+    async def sync_changes(self, reconcile: bool = False, past_days: int = SYNC_PAST_DAYS, 
+                           future_days: int = SYNC_FUTURE_DAYS) -> Dict[str, Any]:
+        """마지막 동기화 이후 수정된 일정만 가져와 로컬 캐시에 반영합니다."""
+        return await self._drive(self.tools._sync_changes_steps(reconcile, past_days, future_days))
+    
+    async def find_conflicts(self, start_dt: datetime, end_dt: datetime) -> List[Event]:
+        """[start_dt, end_dt)와 겹치는 일정을 로컬 캐시에서 찾습니다."""
+        conflicts = await self._drive(
+            self.tools._find_conflicts_many_steps([Event("", "", "", start_dt, end_dt)])
+        )
+        return conflicts[0]
+    
+    async def check_conflicts(self, start: str, end: Optional[str] = None) -> Dict[str, Any]:
+        """start~end 표현 구간과 겹치는 일정을 확인합니다."""
+        return await self._drive(self.tools._check_conflicts_steps(start, end))
+    
+    async def find_free_slots(self, range_str: str, duration_minutes: int = 60, 
+                              working_hours: Optional[str] = None) -> Dict[str, Any]:
+        """구간 안의 빈 시간을 찾습니다. (인자는 CalendarTools.find_free_slots 참고)"""
+        return await self._drive(self.tools._find_free_slots_steps(range_str, duration_minutes, working_hours))
+    
+    async def update_event(self, original_title: str, new_date_str: Optional[str] = None, 
+                           new_time_str: Optional[str] = None, new_title: Optional[str] = None, 
+                           original_date_str: Optional[str] = None, uid: Optional[str] = None) -> Dict[str, Any]:
+        """기존 일정을 수정합니다."""
+        result = await self.update_events([{
+            "original_title": original_title,
+            "new_date_str": new_date_str,
+            "new_time_str": new_time_str,
+            "new_title": new_title,
+            "original_date_str": original_date_str,
+            "uid": uid
+        }])
+        return result["results"][0]
+    
+    async def update_events(self, updates: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """여러 일정을 한 번의 스크립트 실행으로 수정합니다."""
+        return await self._drive(self.tools._update_events_steps(updates))
+    
+    async def delete_event(self, title: str, date_str: Optional[str] = None, 
+                           uid: Optional[str] = None) -> Dict[str, Any]:
+        """일정을 삭제합니다."""
+        result = await self.delete_events([{"title": title, "date_str": date_str, "uid": uid}])
+        return result["results"][0]
+    
+    async def delete_events(self, deletions: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """여러 일정을 한 번의 스크립트 실행으로 삭제합니다."""
+        return await self._drive(self.tools._delete_events_steps(deletions))
@@ -4,5 +4,6 @@ CLI 모듈
 
 from .parser import create_parser
 from .commands import CLICommands
+from .stream import StreamPrinter, should_stream
 
-__all__ = ['create_parser', 'CLICommands'] 
\ No newline at end of file
+__all__ = ['create_parser', 'CLICommands', 'StreamPrinter', 'should_stream'] 
\ No newline at end of file
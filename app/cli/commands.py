@@ -4,22 +4,41 @@ CLI 명령어 처리 모듈
 
 import asyncio
 import sys
+from datetime import datetime, timedelta
 
 try:
     # 전역 설치된 경우
     from app.agent import CalendarManagerAgent
     from app.session import SessionManager
+    from app.calendar_tools import CalendarTools, AsyncCalendarTools
+    from app.config import DEFAULT_CALENDAR_NAME
+    from app.sync import SyncEngine
+    from app.events.ics import iter_ics_events, iter_ics_lines
+    from app.cli.stream import StreamPrinter
 except ImportError:
     # 로컬 실행인 경우
     from agent import CalendarManagerAgent
     from session import SessionManager
+    from calendar_tools import CalendarTools, AsyncCalendarTools
+    from config import DEFAULT_CALENDAR_NAME
+    from sync import SyncEngine
+    from events.ics import iter_ics_events, iter_ics_lines
+    from .stream import StreamPrinter
 
 
 class CLICommands:
     """CLI 명령어 처리기"""
     
+    async def _respond(self, agent, user_input: str, session_id: str, verbose: bool = False) -> str:
+        """입력을 처리하고 응답을 출력합니다. (스트리밍 에이전트면 토큰과 도구 진행 상황을 바로 출력)"""
+        printer = StreamPrinter()
+        response = await agent.process_user_input(user_input, session_id,
+                                                  on_event=printer if agent.stream else None)
+        printer.finish(response, verbose)
+        return response
+    
     async def single_command_mode(self, agent, args):
-        """단일 명령 모드를 처리합니다."""
+        """단일 명령 모드를 처리하고 응답을 출력합니다."""
         # 세션 ID가 없으면 전략에 따라 세션 선택
         session_id = args.session_id
         if not session_id:
@@ -27,7 +46,7 @@ class CLICommands:
                 args.session_strategy, args.user_id
             )
         
-        return await agent.process_user_input(args.command, session_id)
+        return await self._respond(agent, args.command, session_id, args.verbose)
     
     async def interactive_mode(self, agent, args):
         """대화형 모드를 실행합니다."""
@@ -41,6 +60,7 @@ class CLICommands:
         print("  - 'history': 대화 내역 보기")
         print("  - 'session': 세션 정보 보기")
         print("  - 'clear': 새 세션 시작")
+        print("  - 'stats': 의도 분류 통계 보기")
         print("  - 'help': 도움말 보기")
         print("-" * 50)
         
@@ -62,7 +82,7 @@ class CLICommands:
                     print("\n💡 사용 가능한 명령어:")
                     print("  - 캘린더 관련: '내일 회의 일정 추가해줘', '오늘 일정 보여줘'")
                     print("  - 일반 대화: '안녕하세요', '날씨 어때?'")
-                    print("  - 시스템 명령어: quit, history, session, clear, help")
+                    print("  - 시스템 명령어: quit, history, session, clear, stats, help")
                     continue
                 elif user_input.lower() == 'history':
                     history = await agent.memory_manager.get_conversation_history(session_id)
@@ -84,15 +104,29 @@ class CLICommands:
                     else:
                         print("🔍 세션 정보를 찾을 수 없습니다.")
                     continue
+                elif user_input.lower() == 'stats':
+                    stats = agent.intent_stats()
+                    print("\n📊 의도 분류 통계:")
+                    print(f"  규칙 분류 적중: {stats['hits']}/{stats['total']} ({stats['hit_rate']:.0%})")
+                    print(f"  LLM 분류 평균: {stats['llm_average_ms']}ms ({stats['llm_calls']}회)")
+                    print(f"  절약한 시간(추정): {stats['saved_ms']}ms")
+                    if 'cache' in stats:
+                        cache = stats['cache']
+                        print(f"  의도 캐시: 이번 실행 적중 {cache['hits']}회, 실패 {cache['misses']}회 | "
+                              f"누적 적중률 {cache['total_hit_rate']:.0%} | 항목 {cache['entries']}/{cache['max_entries']}")
+                    pool = agent.agent_pool.stats.as_dict()
+                    print(f"  에이전트 팀: 생성 {pool['created']}회, 재사용 {pool['reused']}회 | "
+                          f"턴 준비 평균 {pool['setup_average_ms']}ms")
+                    continue
                 elif user_input.lower() == 'clear':
-                    # 새 세션 시작
+                    # 새 세션 시작 (이전 세션의 에이전트 팀은 버림)
+                    agent.agent_pool.discard(session_id)
                     session_id = agent.session_manager.create_session()
                     print("🆕 새 세션을 시작했습니다.")
                     continue
                 
                 try:
-                    response = await agent.process_user_input(user_input, session_id)
-                    print(f"🤖 {response}")
+                    await self._respond(agent, user_input, session_id, args.verbose)
                 except KeyboardInterrupt:
                     print("\n👋 처리 중 종료 요청을 받았습니다.")
                     break
@@ -138,4 +172,92 @@ class CLICommands:
             else:
                 print(f"❌ 세션 {args.session_id[:8]}...을 찾을 수 없습니다.")
         else:
-            print("❌ 잘못된 세션 관리 명령입니다.") 
\ No newline at end of file
+            print("❌ 잘못된 세션 관리 명령입니다.") 
+    
+    async def handle_watch_command(self, args):
+        """변경분 동기화 루프를 Ctrl+C까지 실행합니다."""
+        calendars = args.calendar
+        tools = CalendarTools(calendars[0] if calendars else DEFAULT_CALENDAR_NAME, calendars=calendars)
+        if tools.store is None:
+            print("❌ 로컬 캐시가 꺼져 있어 동기화할 수 없습니다. (MAC_AGENT_EVENT_CACHE=0)")
+            tools.close()
+            return
+        async_tools = AsyncCalendarTools(tools)
+        
+        def report(result):
+            now = datetime.now().strftime('%H:%M:%S')
+            if result["success"]:
+                print(f"🔄 [{now}] 변경 {result['changed']} | 삭제 {result['removed']} | "
+                      f"구간 조회 {result['fetched_ranges']}", file=sys.stderr, flush=True)
+            else:
+                print(f"❌ [{now}] {result['message']}", file=sys.stderr, flush=True)
+        
+        engine = SyncEngine(async_tools, interval=args.watch_interval)
+        print(f"👀 {engine.interval:g}초마다 캘린더 변경분을 동기화합니다. (Ctrl+C로 종료)", file=sys.stderr)
+        try:
+            await engine.run(on_sync=report)
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            print("\n👋 동기화를 종료합니다.", file=sys.stderr)
+        finally:
+            await async_tools.close()
+            tools.close()
+    
+    async def handle_ics_command(self, args, calendar_tools=None):
+        """ICS 가져오기/내보내기 명령을 처리합니다."""
+        calendars = args.calendar
+        tools = calendar_tools or CalendarTools(calendars[0] if calendars else DEFAULT_CALENDAR_NAME, 
+                                                calendars=calendars)
+        try:
+            if args.import_ics:
+                self._import_ics(tools, args)
+            if args.export_ics:
+                self._export_ics(tools, args)
+        finally:
+            if calendar_tools is None:
+                tools.close()
+    
+    def _import_ics(self, tools, args):
+        """ICS 파일을 배치 단위로 스트리밍하며 캘린더에 추가합니다."""
+        def report(stats):
+            print(f"\r📥 처리 {stats['processed']}개 | 추가 {stats['created']} | "
+                  f"중복 {stats['skipped']} | 실패 {stats['failed']}", end="", file=sys.stderr, flush=True)
+        
+        with open(args.import_ics, 'r', encoding='utf-8') as f:
+            events = iter_ics_events(f, tools.timezone, tools.calendar_name)
+            result = tools.import_events(events, batch_size=max(1, args.batch_size), progress=report)
+        
+        print(file=sys.stderr)
+        print(f"{'✅' if result['success'] else '⚠️'} {result['message']}")
+        for error in result["errors"]:
+            print(f"  - {error}")
+    
+    def _export_ics(self, tools, args):
+        """기간 내 일정을 조회하는 대로 ICS 파일에 씁니다."""
+        try:
+            # "2025-01-01"뿐 아니라 "다음 달 첫날" 같은 표현도 받음
+            start = tools._resolve_expression(args.range_from or "오늘").start
+            end = tools._resolve_expression(args.range_to).end if args.range_to else start + timedelta(days=30)
+        except ValueError as e:
+            print(f"❌ 내보낼 기간을 해석할 수 없습니다: {e}")
+            return
+        start = tools._localize(start.replace(hour=0, minute=0, second=0))
+        end = tools._localize(end.replace(hour=23, minute=59, second=59))
+        if end < start:
+            print(f"❌ 종료일({end.strftime('%Y-%m-%d')})이 시작일({start.strftime('%Y-%m-%d')})보다 앞섭니다.")
+            return
+        
+        count = 0
+        def counted(events):
+            nonlocal count
+            for event in events:
+                count += 1
+                if count % 100 == 0:
+                    print(f"\r📤 {count}개 내보내는 중...", end="", file=sys.stderr, flush=True)
+                yield event
+        
+        with open(args.export_ics, 'w', encoding='utf-8', newline='') as f:
+            f.writelines(iter_ics_lines(counted(tools.iter_events_range(start, end))))
+        
+        print(file=sys.stderr)
+        print(f"✅ {count}개 일정을 {args.export_ics}에 저장했습니다. "
+              f"({start.strftime('%Y-%m-%d')} ~ {end.strftime('%Y-%m-%d')})")
\ No newline at end of file
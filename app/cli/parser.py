@@ -3,6 +3,22 @@ CLI 파서 설정
 """
 
 import argparse
+from typing import List
+
+try:
+    # 전역 설치된 경우
+    from app.config import AGENT_MODE, STREAM_OUTPUT, SYNC_INTERVAL
+except ImportError:
+    # 로컬 실행인 경우
+    from config import AGENT_MODE, STREAM_OUTPUT, SYNC_INTERVAL
+
+
+def calendar_list(value: str) -> List[str]:
+    """쉼표로 구분한 캘린더 이름 목록 ("Work,Home" → ["Work", "Home"])"""
+    names = [name.strip() for name in value.split(',') if name.strip()]
+    if not names:
+        raise argparse.ArgumentTypeError("캘린더 이름이 비어 있습니다.")
+    return list(dict.fromkeys(names))
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -33,6 +49,19 @@ def create_parser() -> argparse.ArgumentParser:
     
   대화형 모드:
     python main.py --interactive
+    
+  라우터 모드 (의도 분류 없이 에이전트 하나가 한 번에 처리):
+    python main.py -c "내일 일정 보여줘" --mode router
+    
+  캘린더 선택 (첫 번째 캘린더에 일정을 추가하고, 나열한 캘린더만 조회):
+    python main.py -c "이번 주 일정 보여줘" --calendar Work,Home
+    
+  ICS 가져오기/내보내기:
+    python main.py --import-ics events.ics --batch-size 50
+    python main.py --export-ics backup.ics --from 2025-01-01 --to 2025-12-31
+    
+  변경분 동기화 (다른 터미널이나 백그라운드에서 실행하면 조회가 로컬 캐시에서 처리됨):
+    python main.py --watch --watch-interval 30 &
         """
     )
     
@@ -43,8 +72,23 @@ def create_parser() -> argparse.ArgumentParser:
     
     parser.add_argument(
         '--calendar',
-        default="캘린더",
-        help='사용할 캘린더 이름 (기본값: 캘린더)'
+        type=calendar_list,
+        help='사용할 캘린더 이름, 쉼표로 여러 개 지정 (첫 번째에 일정 추가, 기본값: 모든 캘린더 조회 · "캘린더"에 추가)'
+    )
+    
+    parser.add_argument(
+        '--mode',
+        choices=['pipeline', 'router'],
+        default=AGENT_MODE,
+        help=f'요청 처리 방식: pipeline(의도 분류 후 전문 에이전트), router(에이전트 하나가 바로 처리) (기본값: {AGENT_MODE})'
+    )
+    
+    parser.add_argument(
+        '--no-stream',
+        dest='stream',
+        action='store_false',
+        default=STREAM_OUTPUT,
+        help='응답을 토큰 단위로 바로 출력하지 않고 완성된 뒤 한 번에 출력 (터미널이 아니면 항상 한 번에 출력)'
     )
     
     parser.add_argument(
@@ -76,6 +120,53 @@ def create_parser() -> argparse.ArgumentParser:
         help='대화형 모드 실행'
     )
     
+    parser.add_argument(
+        '--import-ics',
+        metavar='FILE',
+        help='.ics 파일의 일정을 캘린더로 가져오기'
+    )
+    
+    parser.add_argument(
+        '--export-ics',
+        metavar='FILE',
+        help='기간 내 일정을 .ics 파일로 내보내기 (--from, --to와 함께 사용)'
+    )
+    
+    parser.add_argument(
+        '--from',
+        dest='range_from',
+        metavar='YYYY-MM-DD',
+        help='내보낼 기간의 시작일 (YYYY-MM-DD 또는 "다음 달 첫날" 같은 표현, 기본값: 오늘)'
+    )
+    
+    parser.add_argument(
+        '--to',
+        dest='range_to',
+        metavar='YYYY-MM-DD',
+        help='내보낼 기간의 종료일 (YYYY-MM-DD 또는 "다음 달" 같은 표현, 기본값: 시작일로부터 30일 후)'
+    )
+    
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=50,
+        help='가져오기 시 한 번에 생성할 일정 수 (기본값: 50)'
+    )
+    
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='수정된 일정만 주기적으로 가져와 로컬 캐시를 최신으로 유지 (Ctrl+C로 종료)'
+    )
+    
+    parser.add_argument(
+        '--watch-interval',
+        type=float,
+        default=SYNC_INTERVAL,
+        metavar='SECONDS',
+        help=f'--watch 동기화 간격 (초, 기본값: {SYNC_INTERVAL:g})'
+    )
+    
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
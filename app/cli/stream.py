@@ -0,0 +1,86 @@
+"""
+응답 스트리밍 출력
+
+team.run_stream()이 내보내는 모델 토큰과 도구 호출 이벤트를 도착하는 대로 터미널에 씁니다.
+응답 전체를 기다리지 않으므로 첫 글자가 보이기까지의 시간(TTFB)이 모델 첫 토큰 시간으로 줄어듭니다.
+"""
+
+import sys
+import time
+from typing import Optional, TextIO
+
+from autogen_agentchat.messages import (
+    BaseChatMessage, ModelClientStreamingChunkEvent, ToolCallExecutionEvent, ToolCallRequestEvent
+)
+
+
+def should_stream(requested: bool = True, out: Optional[TextIO] = None) -> bool:
+    """스트리밍 출력 여부 (요청했고 출력이 터미널일 때만, 파이프·파일이면 완성된 응답만 출력)"""
+    out = out or sys.stdout
+    return requested and hasattr(out, "isatty") and out.isatty()
+
+
+class StreamPrinter:
+    """팀 실행 이벤트를 받아 토큰과 도구 진행 상황을 바로 출력하는 콜백
+    
+    CalendarManagerAgent.process_user_input(on_event=printer)로 넘기고, 끝나면 finish(response)를
+    부릅니다. 스트리밍된 마지막 메시지와 최종 응답이 다르면(오류 메시지 등) 최종 응답을 이어서 씁니다.
+    """
+    
+    def __init__(self, out: Optional[TextIO] = None, prefix: str = "🤖 "):
+        self.out = out or sys.stdout
+        self.prefix = prefix
+        self.began = time.perf_counter()
+        self.first_byte: Optional[float] = None
+        self._line_open = False
+        self._text = ""
+    
+    @property
+    def streamed(self) -> bool:
+        return self.first_byte is not None
+    
+    @property
+    def time_to_first_byte(self) -> Optional[float]:
+        """첫 출력까지 걸린 시간 (초, 출력 전이면 None)"""
+        return self.first_byte - self.began if self.first_byte is not None else None
+    
+    def _write(self, text: str):
+        if self.first_byte is None:
+            self.first_byte = time.perf_counter()
+        self.out.write(text)
+        self.out.flush()
+    
+    def _end_line(self):
+        if self._line_open:
+            self._write("\n")
+            self._line_open = False
+    
+    def __call__(self, event):
+        if isinstance(event, ModelClientStreamingChunkEvent):
+            if not event.content:
+                return
+            if not self._line_open:
+                self._write(self.prefix)
+                self._line_open = True
+                self._text = ""
+            self._write(event.content)
+            self._text += event.content
+        elif isinstance(event, ToolCallRequestEvent):
+            self._end_line()
+            names = ", ".join(call.name for call in event.content)
+            self._write(f"🔧 {names} 실행 중...\n")
+        elif isinstance(event, ToolCallExecutionEvent):
+            failed = [result.name for result in event.content if result.is_error]
+            self._write(f"⚠️ {', '.join(failed)} 실패\n" if failed else "✅ 완료\n")
+        elif isinstance(event, BaseChatMessage) and event.source != "user":
+            # 토큰으로 받은 메시지가 완성됨
+            self._end_line()
+    
+    def finish(self, response: str, verbose: bool = False):
+        """응답 출력을 마무리합니다. (스트리밍하지 않았으면 응답 전체를 출력)"""
+        self._end_line()
+        if not self.streamed or response.strip() != self._text.strip():
+            self._write(f"{self.prefix}{response}\n")
+        if verbose:
+            elapsed = (time.perf_counter() - self.began) * 1000
+            print(f"⏱️ 첫 출력 {self.time_to_first_byte * 1000:.0f} ms / 전체 {elapsed:.0f} ms")
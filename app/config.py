@@ -29,8 +29,54 @@ if not OPENAI_API_KEY or OPENAI_API_KEY == 'your_openai_api_key_here':
 
 
 DEFAULT_CALENDAR_NAME = "캘린더"  
+SEARCH_CALENDAR_NAMES = ["캘린더", "Home", "홈", "Work", "집", "직장"]  
 DEFAULT_EVENT_DURATION = 60  
 DEFAULT_EVENT_START_TIME = "09:00"  
+WORKING_HOURS = os.getenv('MAC_AGENT_WORKING_HOURS', '09:00-18:00')  # 빈 시간 찾기 기본 범위
+
+
+# AppleScript 실행 백엔드 (worker: 상주 실행기, osascript: 호출마다 프로세스 실행, memory: 메모리 안의 가짜 Calendar)
+APPLESCRIPT_BACKEND = os.getenv('MAC_AGENT_APPLESCRIPT_BACKEND', 'worker')
+APPLESCRIPT_WORKER_COMMAND = os.getenv('MAC_AGENT_APPLESCRIPT_WORKER')  # 대체 실행기 명령 (선택)
+APPLESCRIPT_MAX_WORKERS = int(os.getenv('MAC_AGENT_APPLESCRIPT_MAX_WORKERS', '2'))
+APPLESCRIPT_TIMEOUT = float(os.getenv('MAC_AGENT_APPLESCRIPT_TIMEOUT', '30'))
+APPLESCRIPT_MAX_CONCURRENCY = int(os.getenv('MAC_AGENT_APPLESCRIPT_MAX_CONCURRENCY', '4'))  # 비동기 도구 동시 실행 수
+
+# 로컬 일정 캐시 (~/.mac_agent/events.db)
+EVENT_CACHE_ENABLED = os.getenv('MAC_AGENT_EVENT_CACHE', '1') != '0'
+EVENT_CACHE_TTL = float(os.getenv('MAC_AGENT_EVENT_CACHE_TTL', '300'))  # 초
+
+# 캘린더 목록 캐시 (~/.mac_agent/calendars.json)
+CALENDAR_CATALOG_TTL = float(os.getenv('MAC_AGENT_CALENDAR_CATALOG_TTL', '86400'))  # 초
+
+# 변경분 동기화 (mac_agent --watch)
+SYNC_INTERVAL = float(os.getenv('MAC_AGENT_SYNC_INTERVAL', '60'))  # 초
+SYNC_PAST_DAYS = int(os.getenv('MAC_AGENT_SYNC_PAST_DAYS', '30'))  # 오늘 기준 미러링할 과거 일수
+SYNC_FUTURE_DAYS = int(os.getenv('MAC_AGENT_SYNC_FUTURE_DAYS', '180'))  # 오늘 기준 미러링할 미래 일수
+SYNC_RECONCILE_EVERY = int(os.getenv('MAC_AGENT_SYNC_RECONCILE_EVERY', '10'))  # 삭제 확인 주기 (동기화 횟수)
+
+# 요청 처리 방식 (pipeline: 의도 분류 후 전문 에이전트 실행, router: 도구를 가진 에이전트 하나가 한 번에 처리)
+AGENT_MODE = os.getenv('MAC_AGENT_MODE', 'pipeline')
+STREAM_OUTPUT = os.getenv('MAC_AGENT_STREAM', '1') != '0'  # 터미널이면 응답을 토큰 단위로 바로 출력
+AGENT_POOL_SIZE = int(os.getenv('MAC_AGENT_AGENT_POOL_SIZE', '32'))  # 재사용할 (세션, 역할)별 팀 수, 0이면 매번 생성
+
+# 의도 분류 빠른 경로 (규칙 분류 신뢰도가 기준 이상이면 LLM 분류를 건너뜀, 1 이상이면 항상 LLM)
+INTENT_RULE_THRESHOLD = float(os.getenv('MAC_AGENT_INTENT_RULE_THRESHOLD', '0.95'))
+
+# 의도 분류 결과 캐시 (~/.mac_agent/intents.db, 분류 프롬프트가 바뀌면 무효)
+INTENT_CACHE_ENABLED = os.getenv('MAC_AGENT_INTENT_CACHE', '1') != '0'
+INTENT_CACHE_SIZE = int(os.getenv('MAC_AGENT_INTENT_CACHE_SIZE', '2000'))  # 최대 항목 수 (LRU)
+
+# 대화 메모리 (최근 줄은 원문, 오래된 줄은 턴이 끝난 뒤 백그라운드에서 요약으로 접음)
+MEMORY_RECENT_TOKENS = int(os.getenv('MAC_AGENT_MEMORY_RECENT_TOKENS', '1500'))  # 원문으로 남길 최근 줄 토큰 수
+MEMORY_SUMMARY_TOKENS = int(os.getenv('MAC_AGENT_MEMORY_SUMMARY_TOKENS', '400'))  # 요약 최대 토큰 수
+MEMORY_SUMMARIZER = os.getenv('MAC_AGENT_MEMORY_SUMMARIZER', 'extractive')  # extractive: 줄 앞부분만 남김, model: 모델로 요약
+# 에이전트별로 컨텍스트에 넣을 메모리 토큰 예산 ("역할=토큰,..."으로 일부만 바꿀 수 있음)
+MEMORY_BUDGETS = {'intent': 300, 'calendar': 2000, 'general': 1000, 'router': 2000}
+MEMORY_BUDGETS.update({
+    role.strip(): int(tokens)
+    for role, tokens in (item.split('=') for item in os.getenv('MAC_AGENT_MEMORY_BUDGETS', '').split(',') if '=' in item)
+})
 
 
 DATE_FORMAT = "%Y-%m-%d"
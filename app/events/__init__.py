@@ -0,0 +1,12 @@
+"""
+일정 데이터 모듈
+"""
+
+from .models import Event, json_default, localize, to_local_naive
+from .wire import RECORD_SEPARATOR, FIELD_SEPARATOR, field_text, iter_records, parse_events, records_to_events
+
+__all__ = [
+    'Event', 'json_default', 'localize', 'to_local_naive',
+    'RECORD_SEPARATOR', 'FIELD_SEPARATOR', 'field_text', 'iter_records', 'parse_events',
+    'records_to_events'
+]
@@ -0,0 +1,197 @@
+"""
+iCalendar(.ics) 스트리밍 읽기/쓰기
+
+파일 전체를 메모리에 올리지 않도록 읽기는 줄 단위 이터러블을, 쓰기는 줄 단위 제너레이터를 사용합니다.
+반복 규칙(RRULE)과 알림(VALARM) 등 일정 한 건을 표현하는 데 필요 없는 속성은 무시합니다.
+"""
+
+import re
+import uuid
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .models import Event, localize
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # Python 3.8
+    ZoneInfo = None
+
+
+_DURATION_PATTERN = re.compile(
+    r"^(?P<sign>[+-])?P(?:(?P<weeks>\d+)W)?(?:(?P<days>\d+)D)?"
+    r"(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?(?:(?P<seconds>\d+)S)?)?$"
+)
+_ESCAPES = {"\\\\": "\\", "\\;": ";", "\\,": ",", "\\n": "\n", "\\N": "\n"}
+_ESCAPE_PATTERN = re.compile(r"\\[\\;,nN]")
+
+
+def _unfold(lines: Iterable[str]) -> Iterator[str]:
+    """접힌 줄(공백/탭으로 시작하는 연속 줄)을 이어 붙입니다."""
+    current = None
+    for raw in lines:
+        line = raw.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and current is not None:
+            current += line[1:]
+            continue
+        if current is not None:
+            yield current
+        current = line
+    if current:
+        yield current
+
+
+def _split_property(line: str) -> Tuple[str, Dict[str, str], str]:
+    """'NAME;PARAM=V:VALUE'를 (이름, 파라미터, 값)으로 나눕니다."""
+    in_quotes = False
+    for position, char in enumerate(line):
+        if char == '"':
+            in_quotes = not in_quotes
+        elif char == ":" and not in_quotes:
+            head, value = line[:position], line[position + 1:]
+            break
+    else:
+        return line.upper(), {}, ""
+    
+    name, *params = head.split(";")
+    parsed = {}
+    for param in params:
+        key, _, param_value = param.partition("=")
+        parsed[key.upper()] = param_value.strip('"')
+    return name.upper(), parsed, value
+
+
+def _unescape(value: str) -> str:
+    return _ESCAPE_PATTERN.sub(lambda m: _ESCAPES[m.group(0)], value)
+
+
+def _escape(value: str) -> str:
+    return (value.replace("\\", "\\\\").replace(";", "\\;")
+            .replace(",", "\\,").replace("\r\n", "\n").replace("\n", "\\n"))
+
+
+def _resolve_tz(tzid: Optional[str], default_tz: tzinfo) -> tzinfo:
+    if tzid and ZoneInfo is not None:
+        try:
+            return ZoneInfo(tzid)
+        except Exception:
+            pass
+    return default_tz
+
+
+def _parse_datetime(value: str, params: Dict[str, str], default_tz: tzinfo) -> Tuple[datetime, bool]:
+    """DTSTART/DTEND 값을 (aware datetime, 종일 여부)로 변환합니다."""
+    if params.get("VALUE") == "DATE" or len(value) == 8:
+        day = datetime.strptime(value, "%Y%m%d")
+        return localize(day, default_tz), True
+    if value.endswith("Z"):
+        parsed = datetime.strptime(value[:-1], "%Y%m%dT%H%M%S").replace(tzinfo=timezone.utc)
+        return parsed.astimezone(default_tz), False
+    parsed = datetime.strptime(value, "%Y%m%dT%H%M%S")
+    return localize(localize(parsed, _resolve_tz(params.get("TZID"), default_tz)), default_tz), False
+
+
+def _parse_duration(value: str) -> Optional[timedelta]:
+    match = _DURATION_PATTERN.match(value.strip())
+    if not match:
+        return None
+    parts = {key: int(val) for key, val in match.groupdict().items() if val and key != "sign"}
+    delta = timedelta(**parts)
+    return -delta if match.group("sign") == "-" else delta
+
+
+def iter_ics_events(lines: Iterable[str], tz: tzinfo, calendar: str = "") -> Iterator[Event]:
+    """줄 단위 입력에서 VEVENT를 하나씩 Event로 변환해 내보냅니다.
+    
+    시간대 정보가 없는(floating) 시각은 tz 기준으로 해석하며, 종료 시각이 없으면
+    DURATION을, 그것도 없으면 종일 일정은 하루·일반 일정은 1시간을 사용합니다.
+    시작 시각이나 제목을 해석할 수 없는 일정은 건너뜁니다.
+    """
+    stack: List[str] = []
+    props: Dict[str, Tuple[Dict[str, str], str]] = {}
+    
+    for line in _unfold(lines):
+        if not line:
+            continue
+        name, params, value = _split_property(line)
+        if name == "BEGIN":
+            stack.append(value.upper())
+            if stack == ["VCALENDAR", "VEVENT"] or stack == ["VEVENT"]:
+                props = {}
+            continue
+        if name == "END":
+            component = stack.pop() if stack else ""
+            if component == "VEVENT" and "VEVENT" not in stack:
+                event = _build_event(props, tz, calendar)
+                if event is not None:
+                    yield event
+            continue
+        # VEVENT 바로 아래 속성만 사용 (VALARM 등 하위 컴포넌트 제외)
+        if stack and stack[-1] == "VEVENT" and name not in props:
+            props[name] = (params, value)
+
+
+def _build_event(props: Dict[str, Tuple[Dict[str, str], str]], tz: tzinfo, calendar: str) -> Optional[Event]:
+    if "DTSTART" not in props:
+        return None
+    try:
+        start, all_day = _parse_datetime(props["DTSTART"][1], props["DTSTART"][0], tz)
+        if "DTEND" in props:
+            end, _ = _parse_datetime(props["DTEND"][1], props["DTEND"][0], tz)
+        elif "DURATION" in props and _parse_duration(props["DURATION"][1]) is not None:
+            end = start + _parse_duration(props["DURATION"][1])
+        else:
+            end = start + (timedelta(days=1) if all_day else timedelta(hours=1))
+    except ValueError:
+        return None
+    
+    title = _unescape(props.get("SUMMARY", ({}, ""))[1]).strip()
+    uid = props.get("UID", ({}, ""))[1].strip()
+    location = _unescape(props.get("LOCATION", ({}, ""))[1]).strip()
+    notes = _unescape(props.get("DESCRIPTION", ({}, ""))[1]).strip()
+    return Event(uid, calendar, title, start, end, location, notes)
+
+
+def _fold(line: str) -> str:
+    """75옥텟을 넘는 줄을 UTF-8 문자 경계에서 접습니다."""
+    if len(line.encode("utf-8")) <= 75:
+        return line + "\r\n"
+    parts, current, size = [], "", 0
+    for char in line:
+        char_size = len(char.encode("utf-8"))
+        if size + char_size > (75 if not parts else 74):
+            parts.append(current)
+            current, size = "", 0
+        current += char
+        size += char_size
+    parts.append(current)
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _format_utc(dt: datetime) -> str:
+    return dt.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def iter_ics_lines(events: Iterable[Event], prodid: str = "-//mac_agent//Calendar Export//KO") -> Iterator[str]:
+    """일정을 하나씩 받아 iCalendar 줄(CRLF 포함)을 내보냅니다."""
+    stamp = _format_utc(datetime.now(timezone.utc))
+    yield "BEGIN:VCALENDAR\r\n"
+    yield "VERSION:2.0\r\n"
+    yield _fold(f"PRODID:{prodid}")
+    yield "CALSCALE:GREGORIAN\r\n"
+    for event in events:
+        uid = event.uid or f"{uuid.uuid5(uuid.NAMESPACE_URL, f'{event.title}|{event.start.isoformat()}')}@mac_agent"
+        yield "BEGIN:VEVENT\r\n"
+        yield _fold(f"UID:{uid}")
+        yield f"DTSTAMP:{stamp}\r\n"
+        yield f"DTSTART:{_format_utc(event.start)}\r\n"
+        yield f"DTEND:{_format_utc(event.end)}\r\n"
+        yield _fold(f"SUMMARY:{_escape(event.title)}")
+        if event.location:
+            yield _fold(f"LOCATION:{_escape(event.location)}")
+        if event.notes:
+            yield _fold(f"DESCRIPTION:{_escape(event.notes)}")
+        if event.calendar:
+            yield _fold(f"CATEGORIES:{_escape(event.calendar)}")
+        yield "END:VEVENT\r\n"
+    yield "END:VCALENDAR\r\n"
@@ -0,0 +1,98 @@
+"""
+일정 데이터 모델
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, tzinfo
+from functools import lru_cache
+from typing import Any, Dict, Tuple
+
+
+@lru_cache(maxsize=8192)
+def _pytz_offset(tz: tzinfo, year: int, month: int, day: int, hour: int) -> tzinfo:
+    # pytz의 localize는 호출당 수 µs가 들어 대량 파싱 시 병목이 되므로
+    # 시(hour) 단위로 고정 오프셋 tzinfo를 캐시합니다. (서머타임 전환은 정시에 일어남)
+    return tz.localize(datetime(year, month, day, hour)).tzinfo
+
+
+def localize(dt: datetime, tz: tzinfo) -> datetime:
+    """naive datetime을 tz 기준 시각으로 해석합니다. (pytz/zoneinfo 모두 지원)"""
+    if dt.tzinfo is not None:
+        return dt.astimezone(tz)
+    if hasattr(tz, "localize"):
+        return dt.replace(tzinfo=_pytz_offset(tz, dt.year, dt.month, dt.day, dt.hour))
+    return dt.replace(tzinfo=tz)
+
+
+def to_local_naive(dt: datetime, tz: tzinfo) -> datetime:
+    """tz 기준 로컬 시각의 naive datetime으로 변환합니다. (저장/AppleScript 전달용)"""
+    if dt.tzinfo is None:
+        return dt
+    return dt.astimezone(tz).replace(tzinfo=None)
+
+
+@dataclass(frozen=True, init=False)
+class Event:
+    """캘린더 일정 (불변, __slots__ 사용)
+    
+    start/end는 timezone-aware datetime이며, uid는 Calendar.app의 일정 UID입니다.
+    아직 UID를 모르는 일정(예: 생성 직후 백엔드가 UID를 돌려주지 않은 경우)은 빈 문자열입니다.
+    location/notes는 가져온 경우에만 채워지며 기본값은 빈 문자열입니다.
+    """
+    __slots__ = ("uid", "calendar", "title", "start", "end", "location", "notes")
+    
+    uid: str
+    calendar: str
+    title: str
+    start: datetime
+    end: datetime
+    location: str
+    notes: str
+    
+    def __init__(self, uid: str, calendar: str, title: str, start: datetime, end: datetime, 
+                 location: str = "", notes: str = ""):
+        # __slots__와 기본값을 함께 쓰기 위해 생성자를 직접 정의 (frozen이므로 object.__setattr__ 사용)
+        for name, value in zip(self.__slots__, (uid, calendar, title, start, end, location, notes)):
+            object.__setattr__(self, name, value)
+    
+    @property
+    def sort_key(self) -> Tuple[datetime, datetime, str]:
+        return (self.start, self.end, self.title)
+    
+    @property
+    def dedup_key(self) -> Tuple:
+        """같은 일정을 식별하는 키 (UID 우선, 없으면 제목과 시간)
+        
+        반복 일정의 회차들은 UID가 같으므로 시작 시각을 함께 씁니다.
+        """
+        if self.uid:
+            return ("uid", self.uid, self.start)
+        return ("fields", self.title, self.start, self.end)
+    
+    def overlaps(self, start: datetime, end: datetime) -> bool:
+        """[start, end)와 시간이 겹치는지 확인합니다."""
+        return self.start < end and self.end > start
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """도구 응답(JSON)용 딕셔너리로 변환합니다."""
+        data = {
+            "uid": self.uid,
+            "title": self.title,
+            "start_time": self.start.isoformat(),
+            "end_time": self.end.isoformat(),
+            "calendar": self.calendar
+        }
+        if self.location:
+            data["location"] = self.location
+        if self.notes:
+            data["notes"] = self.notes
+        return data
+
+
+def json_default(obj: Any) -> Any:
+    """json.dumps의 default 인자로 사용하는 변환 함수"""
+    if isinstance(obj, Event):
+        return obj.to_dict()
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"JSON으로 변환할 수 없는 타입: {type(obj).__name__}")
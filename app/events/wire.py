@@ -0,0 +1,76 @@
+"""
+AppleScript 조회 결과 전송 형식과 스트리밍 파서
+
+레코드는 RS(0x1E), 필드는 US(0x1F)로 구분하므로 쉼표·줄바꿈이 포함된 제목도 그대로
+전달됩니다. 두 제어 문자는 제목에 쓰일 일이 없으므로 스크립트에 넘길 텍스트에서는
+field_text()로 공백으로 바꿔 출력 레코드가 깨지지 않게 합니다.
+"""
+
+from datetime import datetime, tzinfo
+from typing import Iterable, Iterator, List, Optional
+
+from .models import Event, localize
+
+RECORD_SEPARATOR = "\x1e"
+FIELD_SEPARATOR = "\x1f"
+
+# AppleScript 쪽에서 구분자를 만드는 구문
+APPLESCRIPT_SEPARATORS = """
+set RS to character id 30
+set US to character id 31
+"""
+
+# 필드 값 안의 구분자를 공백으로 바꾸는 변환표
+_SEPARATOR_TABLE = str.maketrans({RECORD_SEPARATOR: " ", FIELD_SEPARATOR: " "})
+
+
+def field_text(value: Optional[str]) -> str:
+    """스크립트에 넘길 텍스트(제목, 장소, 메모)에서 RS/US를 공백으로 바꿉니다. (None은 빈 문자열)"""
+    return (value or "").translate(_SEPARATOR_TABLE)
+
+
+def iter_records(chunks: Iterable[str]) -> Iterator[List[str]]:
+    """출력 조각을 읽는 대로 완성된 레코드를 필드 목록으로 내보냅니다."""
+    pending = ""
+    for chunk in chunks:
+        if not chunk:
+            continue
+        pending += chunk
+        if RECORD_SEPARATOR not in chunk:
+            continue
+        *complete, pending = pending.split(RECORD_SEPARATOR)
+        for record in complete:
+            if record:
+                yield record.split(FIELD_SEPARATOR)
+    
+    # osascript가 붙이는 마지막 줄바꿈 제거
+    pending = pending.rstrip("\r\n")
+    if pending:
+        yield pending.split(FIELD_SEPARATOR)
+
+
+def parse_events(chunks: Iterable[str], tz: tzinfo) -> Iterator[Event]:
+    """출력 조각을 읽는 대로 Event로 변환합니다. (records_to_events 참고)"""
+    return records_to_events(iter_records(chunks), tz)
+
+
+def records_to_events(records: Iterable[List[str]], tz: tzinfo) -> Iterator[Event]:
+    """calendar, uid, title, start, end[, location, notes] 필드의 레코드를 Event로 변환합니다.
+    
+    시각 필드는 tz 기준 로컬 시각으로 해석합니다. 필드 수가 맞지 않거나
+    시간 형식이 잘못된 레코드는 건너뜁니다.
+    """
+    fromisoformat = datetime.fromisoformat
+    for fields in records:
+        count = len(fields)
+        if count != 5 and count != 7:
+            continue
+        try:
+            start = localize(fromisoformat(fields[3]), tz)
+            end = localize(fromisoformat(fields[4]), tz)
+        except ValueError:
+            continue
+        if count == 7:
+            yield Event(fields[1], fields[0], fields[2], start, end, fields[5], fields[6])
+        else:
+            yield Event(fields[1], fields[0], fields[2], start, end)
@@ -0,0 +1,8 @@
+"""
+의도 분류 모듈
+"""
+
+from .rules import RuleIntentClassifier, RuleDecision, IntentStats, parse_examples
+from .cache import IntentCache, normalize_input
+
+__all__ = ['RuleIntentClassifier', 'RuleDecision', 'IntentStats', 'parse_examples', 'IntentCache', 'normalize_input']
@@ -0,0 +1,185 @@
+"""
+SQLite 기반 의도 분류 결과 캐시
+
+같은 말투("오늘 일정 보여줘", "고마워")가 반복될 때 LLM 분류를 다시 하지 않도록, 정규화한 입력 →
+(의도, 이유)를 ~/.mac_agent/intents.db에 보관합니다. 명령마다 새로 뜨는 CLI 프로세스들이 같은
+파일을 공유하며, 항목 수가 max_entries를 넘으면 가장 오래 쓰지 않은 항목부터 지웁니다(LRU).
+분류 프롬프트가 바뀌면 이전 프롬프트로 분류한 항목은 무효가 되도록 프롬프트 해시를 키에 넣습니다.
+"""
+
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS intents (
+    prompt TEXT NOT NULL,
+    input TEXT NOT NULL,
+    intent TEXT NOT NULL,
+    reasoning TEXT NOT NULL DEFAULT '',
+    used_at REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (prompt, input)
+);
+CREATE INDEX IF NOT EXISTS idx_intents_used ON intents (used_at);
+
+-- 프로세스를 넘어 누적되는 적중/실패 횟수 (캐시 크기 결정용)
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+DROP_SCHEMA = """
+DROP TABLE IF EXISTS intents;
+DROP TABLE IF EXISTS counters;
+"""
+
+_SPACES = re.compile(r"\s+")
+_TRAILING = re.compile(r"[\s.?!~…]+$")
+
+
+def normalize_input(text: str) -> str:
+    """캐시 키로 쓸 입력 (NFKC, 소문자, 공백 하나로, 끝의 문장 부호 제거)"""
+    text = unicodedata.normalize("NFKC", text).lower()
+    return _TRAILING.sub("", _SPACES.sub(" ", text).strip())
+
+
+def prompt_digest(prompt: str) -> str:
+    """분류 프롬프트의 해시 (프롬프트가 바뀌면 캐시 항목이 달라짐)"""
+    return hashlib.sha1(prompt.encode("utf-8")).hexdigest()[:16]
+
+
+class IntentCache:
+    """프로세스 간에 공유되는 LRU 의도 분류 캐시
+    
+    get/put은 현재 프롬프트 해시의 항목만 다루며, 처음 열 때 다른 프롬프트의 항목을 지웁니다.
+    hits/misses는 이 프로세스의 횟수이고, totals()는 모든 프로세스에서 누적된 횟수입니다.
+    min_length보다 짧은 입력("응", "네")은 앞 대화에 따라 의도가 달라지므로 저장하지 않습니다.
+    """
+    
+    def __init__(self, prompt: str, db_path: Optional[Path] = None, max_entries: int = 2000,
+                 min_length: int = 2):
+        if db_path is None:
+            db_path = Path.home() / ".mac_agent" / "intents.db"
+        
+        self.db_path = Path(db_path)
+        if str(db_path) != ":memory:":
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.prompt = prompt_digest(prompt)
+        self.max_entries = max(1, max_entries)
+        self.min_length = min_length
+        self.hits = 0
+        self.misses = 0
+        
+        self._lock = threading.Lock()
+        # 다른 프로세스가 쓰는 중이면 잠시 기다림
+        self._conn = sqlite3.connect(str(db_path), timeout=5, check_same_thread=False)
+        self._init_schema()
+    
+    def _init_schema(self):
+        with self._lock, self._conn:
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != SCHEMA_VERSION:
+                self._conn.executescript(DROP_SCHEMA)
+            self._conn.executescript(SCHEMA)
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            self._conn.execute("DELETE FROM intents WHERE prompt != ?", (self.prompt,))
+    
+    def close(self):
+        """DB 연결을 닫습니다."""
+        with self._lock:
+            self._conn.close()
+    
+    def _count(self, name: str):
+        self._conn.execute(
+            "INSERT INTO counters (name, value) VALUES (?, 1) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + 1",
+            (name,)
+        )
+    
+    def get(self, text: str) -> Optional[Tuple[str, str]]:
+        """캐시된 (의도, 이유) (없으면 None)"""
+        key = normalize_input(text)
+        if len(key) < self.min_length:
+            return None
+        try:
+            with self._lock, self._conn:
+                row = self._conn.execute(
+                    "SELECT intent, reasoning FROM intents WHERE prompt = ? AND input = ?",
+                    (self.prompt, key)
+                ).fetchone()
+                if row is None:
+                    self.misses += 1
+                    self._count("misses")
+                    return None
+                self._conn.execute(
+                    "UPDATE intents SET used_at = ?, hits = hits + 1 WHERE prompt = ? AND input = ?",
+                    (time.time(), self.prompt, key)
+                )
+                self.hits += 1
+                self._count("hits")
+                return row[0], row[1]
+        except sqlite3.Error as e:
+            print(f"의도 캐시 조회 중 오류: {str(e)}")
+            return None
+    
+    def put(self, text: str, intent: str, reasoning: str = ""):
+        """분류 결과를 저장하고, 항목 수가 넘치면 가장 오래 쓰지 않은 항목을 지웁니다."""
+        key = normalize_input(text)
+        if len(key) < self.min_length:
+            return
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO intents (prompt, input, intent, reasoning, used_at, hits) "
+                    "VALUES (?, ?, ?, ?, ?, 0)",
+                    (self.prompt, key, intent, reasoning, time.time())
+                )
+                self._conn.execute(
+                    "DELETE FROM intents WHERE rowid IN ("
+                    "SELECT rowid FROM intents ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,)
+                )
+        except sqlite3.Error as e:
+            print(f"의도 캐시 저장 중 오류: {str(e)}")
+    
+    def clear(self):
+        """모든 항목과 누적 횟수를 지웁니다."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM intents")
+            self._conn.execute("DELETE FROM counters")
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM intents").fetchone()[0]
+    
+    def totals(self) -> Dict[str, int]:
+        """모든 프로세스에서 누적된 적중/실패 횟수"""
+        with self._lock:
+            rows = self._conn.execute("SELECT name, value FROM counters").fetchall()
+        counts = {"hits": 0, "misses": 0}
+        counts.update(dict(rows))
+        return counts
+    
+    def stats(self) -> Dict[str, float]:
+        """캐시 크기 결정용 통계 (이 프로세스 / 누적 적중률, 항목 수)"""
+        totals = self.totals()
+        lookups = totals["hits"] + totals["misses"]
+        return {
+            "entries": len(self),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "total_hits": totals["hits"],
+            "total_misses": totals["misses"],
+            "total_hit_rate": round(totals["hits"] / lookups, 3) if lookups else 0.0,
+        }
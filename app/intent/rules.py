@@ -0,0 +1,231 @@
+"""
+규칙 기반 의도 분류 (LLM 분류 앞단의 빠른 경로)
+
+키워드 사전, 날짜/시간 표현 해석 결과, 분류 프롬프트 예시 문장의 문자 2-gram으로 calendar와
+general 점수를 매기고, 두 점수 차를 로지스틱 함수로 바꾼 신뢰도가 기준 이상일 때만 결정합니다.
+"내일 일정 보여줘", "고마워"처럼 뻔한 입력은 마이크로초 단위로 끝나고, 애매한 입력은 None을
+돌려 LLM 분류로 넘깁니다.
+"""
+
+import math
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    # 전역 설치된 경우
+    from app.search import ngrams, tokenize
+    from app.temporal import resolve as resolve_temporal
+except ImportError:
+    # 로컬 실행인 경우
+    from search import ngrams, tokenize
+    from temporal import resolve as resolve_temporal
+
+
+INTENTS = ("calendar", "general")
+
+# 부분 문자열로 찾는 단서와 가중치 ("삭제해줘"는 "삭제"로 일치)
+CALENDAR_KEYWORDS = {
+    "일정": 3.0, "캘린더": 3.0, "달력": 3.0, "스케줄": 3.0, "스케쥴": 3.0,
+    "약속": 2.0, "회의": 2.0, "미팅": 2.0, "예약": 2.0, "모임": 1.5, "면담": 1.5, "행사": 1.5,
+    "빈 시간": 2.5, "반복": 1.0, "매주": 1.5, "매일": 1.0, "매달": 1.5,
+    "출장": 1.5, "회식": 1.5, "병원": 1.0,
+}
+# 일정에 하는 동작 (키워드와 따로 세는 단서)
+CALENDAR_ACTIONS = {
+    "등록": 1.5, "추가": 1.0, "삭제": 1.5, "지워": 1.5, "취소": 1.0, "변경": 1.0, "수정": 1.0,
+    "옮겨": 1.5, "미뤄": 1.5, "앞당겨": 1.5, "바꿔": 0.5, "비어": 1.0, "겹치": 1.5, "시간 돼": 1.5,
+    "뭐 있": 1.0, "잡아": 1.5, "넣어": 1.5, "보여": 1.0,
+}
+GENERAL_KEYWORDS = {
+    "안녕": 3.0, "반가": 3.0, "고마": 3.0, "고맙": 3.0, "감사": 3.0, "땡큐": 3.0, "테스트": 3.0,
+    "hello": 3.0, "thank": 3.0, "수고": 3.0, "잘 자": 3.0, "심심": 3.0, "농담": 3.0, "누구": 3.0,
+    "이름이": 2.0, "뭐 할 수": 2.0, "기능": 1.0, "도움말": 2.0, "날씨": 2.0, "기분": 1.5,
+    "ㅋㅋ": 1.5, "ㅎㅎ": 1.5,
+}
+
+# 날짜/시간 표현이 해석되면 더하는 calendar 점수 (시각까지 있으면 더 강함)
+DATE_WEIGHT = 2.0
+TIME_WEIGHT = 2.5
+DATE_CLUE = "날짜 표현"
+TIME_CLUE = "시각 표현"
+
+# calendar로 결정하는 데 필요한 단서 종류(키워드, 동작, 날짜/시각 표현) 수
+# "캘린더가 뭐야?", "일정 관리 앱 추천해줘"처럼 키워드 하나뿐인 입력은 LLM이 분류
+MIN_CALENDAR_CLUES = 2
+
+# 사용법을 묻는 표현 ("일정 추가하는 법 알려줘", "일정 삭제 기능 있어?")
+# 이런 질문의 동작 단어는 요청이 아니므로 동작 단서로 세지 않음
+USAGE_QUESTION_MARKERS = ("는 법", "방법", "사용법", "기능", "어떻게 해", "어떻게 하")
+
+# 예시 문장의 2-gram 하나당 가중치 (한쪽 의도의 예시에만 나온 gram만 사용)
+EXAMPLE_GRAM_WEIGHT = 0.5
+
+_EXAMPLE = re.compile(r'"([^"]+)"\s*→\s*(calendar|general)')
+
+
+def parse_examples(prompt: str) -> List[Tuple[str, str]]:
+    """분류 프롬프트의 `"문장" → 의도` 예시를 (문장, 의도) 목록으로 꺼냅니다."""
+    return [(text.strip(), intent) for text, intent in _EXAMPLE.findall(prompt)]
+
+
+@dataclass(frozen=True)
+class RuleDecision:
+    """규칙 분류 결과 (intent_type이 None이면 신뢰도가 기준 미만이라 결정하지 않음)"""
+    intent_type: Optional[str]
+    confidence: float
+    evidence: Tuple[str, ...] = ()
+    
+    @property
+    def reasoning(self) -> str:
+        clues = ", ".join(self.evidence) if self.evidence else "단서 없음"
+        return f"규칙 분류 (신뢰도 {self.confidence:.2f}: {clues})"
+
+
+@dataclass
+class IntentStats:
+    """빠른 경로 적중률과 절약한 시간 집계"""
+    hits: int = 0
+    fallbacks: int = 0
+    rule_seconds: float = 0.0
+    llm_seconds: float = 0.0
+    llm_calls: int = 0
+    by_intent: Dict[str, int] = field(default_factory=dict)
+    
+    @property
+    def total(self) -> int:
+        return self.hits + self.fallbacks
+    
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.total if self.total else 0.0
+    
+    @property
+    def llm_average(self) -> float:
+        """LLM 분류 한 번의 평균 시간 (초, 측정 전이면 0)"""
+        return self.llm_seconds / self.llm_calls if self.llm_calls else 0.0
+    
+    @property
+    def saved_seconds(self) -> float:
+        """빠른 경로로 건너뛴 LLM 분류 시간 추정치 (적중 수 × LLM 평균 - 규칙 분류 시간)"""
+        return max(0.0, self.hits * self.llm_average - self.rule_seconds)
+    
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "total": self.total,
+            "hits": self.hits,
+            "fallbacks": self.fallbacks,
+            "llm_calls": self.llm_calls,
+            "hit_rate": round(self.hit_rate, 3),
+            "rule_ms": round(self.rule_seconds * 1000, 3),
+            "llm_average_ms": round(self.llm_average * 1000, 1),
+            "saved_ms": round(self.saved_seconds * 1000, 1),
+            "by_intent": dict(self.by_intent),
+        }
+
+
+class RuleIntentClassifier:
+    """키워드·날짜 표현·예시 n-gram 점수로 뻔한 입력만 분류하는 빠른 분류기
+    
+    decide()는 항상 RuleDecision을 돌려주며, 신뢰도가 threshold 미만이면 intent_type이 None입니다.
+    threshold를 1 이상으로 두면 모든 입력을 LLM으로 넘깁니다.
+    """
+    
+    def __init__(self, examples: Iterable[Tuple[str, str]] = (), threshold: float = 0.95):
+        self.threshold = threshold
+        self.stats = IntentStats()
+        self._example_grams = self._build_example_grams(examples)
+    
+    @staticmethod
+    def _build_example_grams(examples: Iterable[Tuple[str, str]]) -> Dict[str, str]:
+        """예시 문장의 2-gram 중 한쪽 의도에만 나온 gram → 의도"""
+        seen: Dict[str, set] = {}
+        for text, intent in examples:
+            if intent not in INTENTS:
+                continue
+            for token in tokenize(text):
+                for gram in ngrams(token):
+                    seen.setdefault(gram, set()).add(intent)
+        return {gram: next(iter(intents)) for gram, intents in seen.items() if len(intents) == 1}
+    
+    def score(self, text: str) -> Tuple[Dict[str, float], List[str]]:
+        """의도별 점수와 근거 단서 목록"""
+        scores = {intent: 0.0 for intent in INTENTS}
+        evidence: List[str] = []
+        lowered = text.lower()
+        
+        for intent, keywords in (("calendar", CALENDAR_KEYWORDS), ("calendar", CALENDAR_ACTIONS),
+                                 ("general", GENERAL_KEYWORDS)):
+            for keyword, weight in keywords.items():
+                if keyword in lowered:
+                    scores[intent] += weight
+                    evidence.append(keyword)
+        evidence.extend(marker for marker in USAGE_QUESTION_MARKERS
+                        if marker in lowered and marker not in evidence)
+        
+        try:
+            expression = resolve_temporal(text)
+        except ValueError:
+            pass
+        else:
+            scores["calendar"] += TIME_WEIGHT if expression.has_time else DATE_WEIGHT
+            evidence.append(TIME_CLUE if expression.has_time else DATE_CLUE)
+        
+        for token in tokenize(text):
+            for gram in ngrams(token):
+                intent = self._example_grams.get(gram)
+                if intent:
+                    scores[intent] += EXAMPLE_GRAM_WEIGHT
+        return scores, evidence
+    
+    @staticmethod
+    def calendar_clues(evidence: Iterable[str]) -> int:
+        """근거 단서 중 calendar 단서의 종류 수 (키워드, 동작, 날짜/시각 표현)
+        
+        사용법 질문이면 동작 단서는 세지 않습니다.
+        """
+        evidence = list(evidence)
+        usage_question = any(clue in USAGE_QUESTION_MARKERS for clue in evidence)
+        kinds = set()
+        for clue in evidence:
+            if clue in CALENDAR_KEYWORDS:
+                kinds.add("keyword")
+            elif clue in CALENDAR_ACTIONS and not usage_question:
+                kinds.add("action")
+            elif clue in (DATE_CLUE, TIME_CLUE):
+                kinds.add("date")
+        return len(kinds)
+    
+    def decide(self, text: str) -> RuleDecision:
+        """입력을 분류합니다. (집계에는 반영하지 않음)
+        
+        calendar는 서로 다른 종류의 단서가 MIN_CALENDAR_CLUES개 이상일 때만 결정합니다.
+        """
+        scores, evidence = self.score(text)
+        margin = scores["calendar"] - scores["general"]
+        probability = 1.0 / (1.0 + math.exp(-margin))
+        intent = "calendar" if margin > 0 else "general"
+        confidence = max(probability, 1.0 - probability)
+        if margin == 0 or confidence < self.threshold:
+            return RuleDecision(None, confidence, tuple(evidence))
+        if intent == "calendar" and self.calendar_clues(evidence) < MIN_CALENDAR_CLUES:
+            return RuleDecision(None, confidence, tuple(evidence))
+        return RuleDecision(intent, confidence, tuple(evidence))
+    
+    def classify(self, text: str) -> RuleDecision:
+        """입력을 분류하고 적중/위임을 집계합니다."""
+        began = time.perf_counter()
+        decision = self.decide(text)
+        self.stats.rule_seconds += time.perf_counter() - began
+        if decision.intent_type:
+            self.stats.hits += 1
+            self.stats.by_intent[decision.intent_type] = self.stats.by_intent.get(decision.intent_type, 0) + 1
+        else:
+            self.stats.fallbacks += 1
+        return decision
+    
+    def record_llm(self, seconds: float):
+        """LLM 분류에 걸린 시간을 기록합니다. (절약 시간 추정용)"""
+        self.stats.llm_calls += 1
+        self.stats.llm_seconds += seconds
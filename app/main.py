@@ -16,11 +16,11 @@ if str(current_dir) not in sys.path:
 
 try:
     # 전역 설치된 경우 (패키지 import)
-    from app.cli import create_parser, CLICommands
+    from app.cli import create_parser, CLICommands, should_stream
     from app.agent import CalendarManagerAgent
 except ImportError:
     # 로컬 실행인 경우 (상대 import)
-    from cli import create_parser, CLICommands
+    from cli import create_parser, CLICommands, should_stream
     from agent import CalendarManagerAgent
 
 
@@ -83,17 +83,26 @@ async def main():
         await cli_commands.handle_session_command(args)
         return
     
-    # 에이전트 생성
-    agent = CalendarManagerAgent()
+    # ICS 가져오기/내보내기 명령어 처리
+    if args.import_ics or args.export_ics:
+        await cli_commands.handle_ics_command(args)
+        return
+    
+    # 변경분 동기화 루프
+    if args.watch:
+        await cli_commands.handle_watch_command(args)
+        return
+    
+    # 에이전트 생성 (--calendar로 고른 캘린더만 조회, --mode로 처리 방식 선택, 터미널이면 스트리밍)
+    agent = CalendarManagerAgent(calendars=args.calendar, mode=args.mode, stream=should_stream(args.stream))
     
     try:
         if args.interactive:
             # 대화형 모드
             await cli_commands.interactive_mode(agent, args)
         elif args.command:
-            # 단일 명령 모드
-            response = await cli_commands.single_command_mode(agent, args)
-            print(f"🤖 {response}")
+            # 단일 명령 모드 (응답은 single_command_mode가 출력)
+            await cli_commands.single_command_mode(agent, args)
         else:
             # 도움말 출력
             parser.print_help()
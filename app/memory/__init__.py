@@ -3,5 +3,7 @@
 """
 
 from .manager import MemoryManager
+from .budget import ConversationMemory, MemoryView, ModelSummarizer, estimate_tokens, extractive_summary
 
-__all__ = ['MemoryManager'] 
\ No newline at end of file
+__all__ = ['MemoryManager', 'ConversationMemory', 'MemoryView', 'ModelSummarizer', 'estimate_tokens',
+           'extractive_summary'] 
\ No newline at end of file
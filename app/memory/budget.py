@@ -0,0 +1,225 @@
+"""
+토큰 예산이 있는 대화 메모리
+
+세션의 대화 줄을 그대로 모두 붙이면 턴마다 프롬프트가 길어지므로, 최근 줄은 원문으로 두고
+오래된 줄은 요약으로 접습니다(compaction). 접기는 턴이 끝난 뒤 백그라운드에서 실행하고,
+에이전트마다 MemoryView(토큰 예산)로 필요한 만큼만 컨텍스트에 넣습니다.
+의도 분류에는 최근 몇 줄이면 충분하고, 캘린더 에이전트는 더 긴 맥락이 필요합니다.
+"""
+
+import asyncio
+import re
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from autogen_core import CancellationToken
+from autogen_core.memory import (
+    ListMemory, Memory, MemoryContent, MemoryMimeType, MemoryQueryResult, UpdateContextResult
+)
+from autogen_core.model_context import ChatCompletionContext
+from autogen_core.models import ChatCompletionClient, SystemMessage, UserMessage
+
+
+# 저장된 세션에서 요약 줄을 구분하는 접두어
+SUMMARY_PREFIX = "[이전 대화 요약] "
+
+# 요약 한 줄로 남길 원문 길이 (추출 요약)
+SUMMARY_LINE_CHARS = 60
+
+_TIMESTAMP = re.compile(r"^\[\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\] ")
+
+# (이전 요약, 접을 줄들, 최대 토큰) → 새 요약
+Summarizer = Callable[[str, List[str], int], Awaitable[str]]
+
+
+@lru_cache(maxsize=4096)
+def estimate_tokens(text: str) -> int:
+    """토큰 수 추정 (ASCII 4자당 1토큰, 한글 등 그 외 문자는 1자당 1토큰으로 넉넉하게 셈)
+    
+    tiktoken 인코딩은 처음 쓸 때 내려받아야 해서 오프라인에서 멈출 수 있으므로 쓰지 않습니다.
+    """
+    ascii_chars = sum(1 for char in text if ord(char) < 128)
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+
+def _trim_summary(summary: str, max_tokens: int) -> str:
+    """요약이 max_tokens를 넘으면 가장 오래된 줄부터 버립니다."""
+    lines = summary.splitlines()
+    while len(lines) > 1 and estimate_tokens("\n".join(lines)) > max_tokens:
+        lines.pop(0)
+    return "\n".join(lines)
+
+
+async def extractive_summary(previous: str, lines: List[str], max_tokens: int) -> str:
+    """모델 없이 줄마다 앞부분만 남기는 요약 (시간 표시 제거, SUMMARY_LINE_CHARS자로 자름)"""
+    shortened = []
+    for line in lines:
+        line = _TIMESTAMP.sub("", line).replace("\n", " ").strip()
+        if len(line) > SUMMARY_LINE_CHARS:
+            line = line[:SUMMARY_LINE_CHARS - 1] + "…"
+        shortened.append(line)
+    summary = "\n".join(filter(None, [previous] + shortened))
+    return _trim_summary(summary, max_tokens)
+
+
+class ModelSummarizer:
+    """모델 클라이언트로 요약하는 Summarizer (실패하면 추출 요약으로 대신함)"""
+    
+    def __init__(self, model_client: ChatCompletionClient):
+        self.model_client = model_client
+    
+    async def __call__(self, previous: str, lines: List[str], max_tokens: int) -> str:
+        prompt = (
+            f"다음 대화를 {max_tokens}토큰 이내의 한국어로 요약하세요. "
+            "언급된 일정(날짜, 시간, 제목, uid), 사용자가 요청한 작업과 결과, 사용자 선호를 우선 남기세요."
+        )
+        conversation = "\n".join(filter(None, [f"이전 요약:\n{previous}" if previous else ""] + lines))
+        try:
+            result = await self.model_client.create([
+                SystemMessage(content=prompt),
+                UserMessage(content=conversation, source="user"),
+            ])
+        except Exception as e:
+            print(f"대화 요약 중 오류: {str(e)}")
+            return await extractive_summary(previous, lines, max_tokens)
+        if not isinstance(result.content, str):
+            return await extractive_summary(previous, lines, max_tokens)
+        return _trim_summary(result.content.strip(), max_tokens)
+
+
+class ConversationMemory(ListMemory):
+    """최근 줄은 원문, 오래된 줄은 요약으로 보관하는 세션 메모리
+    
+    content는 원문으로 남은 최근 줄이고, summary는 접힌 줄들의 요약입니다. 원문 줄의 토큰 합이
+    compact_tokens를 넘으면 compact_in_background()가 최근 recent_tokens만큼만 남기고 나머지를
+    summary_tokens 이내의 요약으로 접습니다. 에이전트에는 view(예산)를 붙입니다.
+    """
+    
+    def __init__(self, name: Optional[str] = None, recent_tokens: int = 1500, summary_tokens: int = 400,
+                 compact_tokens: Optional[int] = None, summarizer: Optional[Summarizer] = None):
+        super().__init__(name=name)
+        self.recent_tokens = recent_tokens
+        self.summary_tokens = summary_tokens
+        self.compact_tokens = compact_tokens or recent_tokens * 2
+        self.summarizer = summarizer or extractive_summary
+        self.summary = ""
+        self.compactions = 0
+        self._views: Dict[int, "MemoryView"] = {}
+        self._task: Optional["asyncio.Future"] = None
+    
+    @property
+    def tokens(self) -> int:
+        """원문으로 남은 줄의 토큰 수"""
+        return sum(estimate_tokens(str(item.content)) for item in self.content)
+    
+    def view(self, budget: int) -> "MemoryView":
+        """budget 토큰만 컨텍스트에 넣는 보기 (예산마다 같은 객체를 돌려줌)"""
+        if budget not in self._views:
+            self._views[budget] = MemoryView(self, budget)
+        return self._views[budget]
+    
+    async def add(self, content: MemoryContent, cancellation_token: Optional[CancellationToken] = None) -> None:
+        # 저장된 세션을 복원할 때 요약 줄은 요약으로 되돌림
+        if isinstance(content.content, str) and content.content.startswith(SUMMARY_PREFIX):
+            self.summary = content.content[len(SUMMARY_PREFIX):]
+            return
+        await super().add(content, cancellation_token)
+    
+    async def clear(self) -> None:
+        await super().clear()
+        self.summary = ""
+    
+    def export(self) -> List[str]:
+        """세션 파일에 저장할 줄 목록 (요약이 있으면 맨 앞에 요약 줄)"""
+        lines = [str(item.content) for item in self.content]
+        return ([SUMMARY_PREFIX + self.summary] if self.summary else []) + lines
+    
+    def compact_in_background(self) -> Optional["asyncio.Future"]:
+        """원문이 compact_tokens를 넘으면 요약 작업을 백그라운드로 시작합니다. (이미 진행 중이면 그 작업)"""
+        if self._task is None and self.tokens > self.compact_tokens:
+            self._task = asyncio.ensure_future(self._compact())
+        return self._task
+    
+    async def _compact(self):
+        try:
+            await self.compact()
+        finally:
+            self._task = None
+    
+    async def compact(self) -> int:
+        """최근 recent_tokens만큼의 원문만 남기고 나머지를 요약으로 접습니다. (접은 줄 수)"""
+        items = list(self.content)
+        kept, used = 0, 0
+        for item in reversed(items):
+            used += estimate_tokens(str(item.content))
+            if used > self.recent_tokens and kept:
+                break
+            kept += 1
+        folded = items[:len(items) - kept]
+        if not folded:
+            return 0
+        
+        summary = await self.summarizer(self.summary, [str(item.content) for item in folded], self.summary_tokens)
+        if len(self._contents) < len(folded) or any(a is not b for a, b in zip(self._contents, folded)):
+            # 요약하는 동안 메모리가 비워짐
+            return 0
+        # 요약하는 동안 추가된 줄은 뒤에 붙으므로 앞의 접은 줄만 지움
+        del self._contents[:len(folded)]
+        self.summary = summary
+        self.compactions += 1
+        return len(folded)
+    
+    async def wait(self):
+        """진행 중인 요약 작업을 기다립니다."""
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+
+
+class MemoryView(Memory):
+    """ConversationMemory의 최근 줄을 토큰 예산 안에서만 컨텍스트에 넣는 메모리
+    
+    가장 최근 줄부터 예산이 찰 때까지 넣고, 남은 예산에 요약이 들어가면 요약도 앞에 넣습니다.
+    한 번의 실행에서 에이전트가 여러 번 응답해도 같은 메모리 메시지는 한 번만 넣습니다.
+    추가·삭제는 원본 ConversationMemory에 그대로 전달합니다.
+    """
+    
+    def __init__(self, memory: ConversationMemory, budget: int):
+        self.memory = memory
+        self.budget = budget
+    
+    def select(self) -> List[MemoryContent]:
+        """예산 안에 들어가는 최근 줄 (시간 순)"""
+        selected, used = [], 0
+        for item in reversed(self.memory.content):
+            used += estimate_tokens(str(item.content))
+            if used > self.budget:
+                break
+            selected.append(item)
+        selected.reverse()
+        summary = self.memory.summary
+        if summary and used <= self.budget and estimate_tokens(summary) <= self.budget - used:
+            selected.insert(0, MemoryContent(content=SUMMARY_PREFIX + summary, mime_type=MemoryMimeType.TEXT))
+        return selected
+    
+    async def update_context(self, model_context: ChatCompletionContext) -> UpdateContextResult:
+        selected = self.select()
+        if selected:
+            memory_strings = [f"{i}. {str(item.content)}" for i, item in enumerate(selected, 1)]
+            memory_context = "\nRelevant memory content (in chronological order):\n" + "\n".join(memory_strings) + "\n"
+            messages = await model_context.get_messages()
+            if not any(isinstance(m, SystemMessage) and m.content == memory_context for m in messages):
+                await model_context.add_message(SystemMessage(content=memory_context))
+        return UpdateContextResult(memories=MemoryQueryResult(results=selected))
+    
+    async def query(self, query: Any = "", cancellation_token: Optional[CancellationToken] = None,
+                    **kwargs: Any) -> MemoryQueryResult:
+        return MemoryQueryResult(results=self.select())
+    
+    async def add(self, content: MemoryContent, cancellation_token: Optional[CancellationToken] = None) -> None:
+        await self.memory.add(content, cancellation_token)
+    
+    async def clear(self) -> None:
+        await self.memory.clear()
+    
+    async def close(self) -> None:
+        pass
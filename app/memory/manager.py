@@ -2,31 +2,46 @@
 메모리 관리자
 """
 
+import asyncio
+import sys
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional, Set
 
-from autogen_core.memory import ListMemory, MemoryContent, MemoryMimeType
+from autogen_core.memory import MemoryContent, MemoryMimeType
+
+from .budget import SUMMARY_PREFIX, ConversationMemory, MemoryView, Summarizer
 
 try:
     # 전역 설치된 경우
+    from app.config import MEMORY_BUDGETS, MEMORY_RECENT_TOKENS, MEMORY_SUMMARY_TOKENS
     from app.session.storage import SessionStorage
 except ImportError:
     # 로컬 실행인 경우
+    from config import MEMORY_BUDGETS, MEMORY_RECENT_TOKENS, MEMORY_SUMMARY_TOKENS
     from session.storage import SessionStorage
 
 
 class MemoryManager:
-    """메모리 관리자"""
+    """메모리 관리자 (세션마다 토큰 예산이 있는 ConversationMemory)"""
     
-    def __init__(self, storage: SessionStorage):
+    def __init__(self, storage: SessionStorage, budgets: Optional[Dict[str, int]] = None,
+                 summarizer: Optional[Summarizer] = None, recent_tokens: int = MEMORY_RECENT_TOKENS,
+                 summary_tokens: int = MEMORY_SUMMARY_TOKENS):
         self.storage = storage
-        self.session_memories: Dict[str, ListMemory] = {}
+        self.budgets = dict(MEMORY_BUDGETS if budgets is None else budgets)
+        self.summarizer = summarizer
+        self.recent_tokens = recent_tokens
+        self.summary_tokens = summary_tokens
+        self.session_memories: Dict[str, ConversationMemory] = {}
         self._pending_memory_restore: Dict[str, List[str]] = {}
+        # 백그라운드 요약을 시작한 세션 (close 때 요약 결과를 다시 저장)
+        self._compacted: Set[str] = set()
     
-    def get_or_create_memory(self, session_id: str) -> ListMemory:
+    def get_or_create_memory(self, session_id: str) -> ConversationMemory:
         """세션의 메모리를 가져오거나 생성합니다."""
         if session_id not in self.session_memories:
-            memory = ListMemory()
+            memory = ConversationMemory(recent_tokens=self.recent_tokens, summary_tokens=self.summary_tokens,
+                                        summarizer=self.summarizer)
             self.session_memories[session_id] = memory
             
             # 저장된 메모리 내용 복원 준비
@@ -38,6 +53,32 @@ class MemoryManager:
         
         return self.session_memories[session_id]
     
+    def get_agent_memory(self, session_id: str, role: str) -> MemoryView:
+        """역할(intent, calendar, general, router)의 토큰 예산만큼만 컨텍스트에 넣는 세션 메모리
+
+        예산이 없는 역할은 원문으로 남은 줄 전체와 요약을 넣습니다.
+        """
+        budget = self.budgets.get(role, sys.maxsize)
+        return self.get_or_create_memory(session_id).view(budget)
+    
+    def compact_in_background(self, session_id: str):
+        """세션 메모리가 길어졌으면 오래된 줄을 백그라운드에서 요약으로 접습니다."""
+        memory = self.session_memories.get(session_id)
+        if memory and memory.compact_in_background() is not None:
+            self._compacted.add(session_id)
+    
+    async def close(self):
+        """진행 중인 요약 작업을 마치고, 요약한 세션의 메모리를 저장소에 다시 씁니다.
+        
+        세션은 요약 시작 전에 저장되므로 마지막 요약 결과는 여기서 저장해야 남습니다.
+        """
+        await asyncio.gather(*(memory.wait() for memory in self.session_memories.values()))
+        for session_id in sorted(self._compacted):
+            session_data = self.storage.load_session(session_id)
+            if session_data:
+                self.storage.save_session(session_data[0], self.get_memory_contents(session_id))
+        self._compacted.clear()
+    
     async def add_to_memory(self, session_id: str, content: str, role: str = "user"):
         """세션 메모리에 대화 내용을 추가합니다."""
         memory = self.get_or_create_memory(session_id)
@@ -69,9 +110,10 @@ class MemoryManager:
         
         memory = self.session_memories[session_id]
         try:
-            memory_contents = memory.content
-            recent_memories = memory_contents[-limit:] if len(memory_contents) > limit else memory_contents
-            return [mem.content for mem in recent_memories]
+            # 요약 줄은 항상 맨 앞에 두고 limit은 원문 줄에만 적용
+            lines = [str(item.content) for item in memory.content]
+            summary = [SUMMARY_PREFIX + memory.summary] if memory.summary else []
+            return summary + (lines[-limit:] if limit > 0 else [])
         except Exception as e:
             print(f"대화 내역 조회 중 오류: {str(e)}")
             return []
@@ -83,7 +125,7 @@ class MemoryManager:
         
         memory = self.session_memories[session_id]
         try:
-            return [content.content for content in memory.content]
+            return memory.export()
         except Exception:
             return []
     
@@ -0,0 +1,7 @@
+"""
+캘린더 조회 계획 모듈
+"""
+
+from .planner import RULE_MARKER, STATS_MARKER, QueryPlan, QueryStats, plan_query, split_stats
+
+__all__ = ['RULE_MARKER', 'STATS_MARKER', 'QueryPlan', 'QueryStats', 'plan_query', 'split_stats']
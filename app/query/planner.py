@@ -0,0 +1,102 @@
+"""
+캘린더 조회 계획
+
+조회 조건(캘린더, 날짜 구간, 제목 조건)을 QueryPlan으로 정리해 AppleScript의 whose 절로
+내려보내므로, 조건에 맞는 행만 osascript 프로세스 경계를 넘어옵니다. 제목 조건이 있으면
+스크립트가 구간 안에서 검사한 행 수를 통계 레코드로 함께 보내 절감 효과를 확인할 수 있습니다.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, tzinfo
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    # 전역 설치된 경우
+    from app.events import Event, records_to_events
+except ImportError:
+    # 로컬 실행인 경우
+    from events import Event, records_to_events
+
+
+# 통계 레코드의 첫 필드 (일정 레코드는 캘린더 이름으로 시작하므로 구분됨)
+STATS_MARKER = "#stats"
+# 조회와 함께 가져온 반복 일정 레코드의 첫 필드 (뒤는 rules_call 레코드와 같음)
+RULE_MARKER = "#rule"
+
+
+@dataclass(frozen=True)
+class QueryPlan:
+    """AppleScript로 내려보낼 조회 조건
+    
+    title_terms의 각 항목은 summary contains 조건이 되며 모두 만족해야 합니다.
+    AppleScript의 contains와 같이 대소문자를 구분하지 않습니다.
+    """
+    calendars: Tuple[str, ...]
+    start: datetime
+    end: datetime
+    title_terms: Tuple[str, ...] = ()
+    
+    def matches(self, event: Event) -> bool:
+        """스크립트 조건과 같은 기준으로 일정을 검사합니다. (캐시 조회 등 Python 쪽 필터용)"""
+        if self.calendars and event.calendar not in self.calendars:
+            return False
+        if not self.start <= event.start <= self.end:
+            return False
+        title = event.title.lower()
+        return all(term.lower() in title for term in self.title_terms)
+    
+    def describe(self) -> List[str]:
+        """스크립트로 내려보낸 조건 목록 (결과 보고용)"""
+        pushed = [f"calendar in ({', '.join(self.calendars)})", "start date range"]
+        pushed.extend(f"summary contains '{term}'" for term in self.title_terms)
+        return pushed
+
+
+@dataclass
+class QueryStats:
+    """조회 한 번의 검사/반환 행 수"""
+    scanned: int = 0   # 스크립트가 날짜 구간 안에서 검사한 행 수
+    returned: int = 0  # 프로세스 경계를 넘어온 행 수
+    source: str = "calendar"
+    pushed_down: List[str] = field(default_factory=list)
+    
+    def to_dict(self) -> dict:
+        return {
+            "source": self.source,
+            "scanned": self.scanned,
+            "returned": self.returned,
+            "pushed_down": self.pushed_down
+        }
+
+
+def plan_query(calendars: Sequence[str], start: datetime, end: datetime,
+               keywords: Optional[str] = None) -> QueryPlan:
+    """조회 조건을 QueryPlan으로 만듭니다.
+    
+    keywords는 기존 get_events와 같이 제목에 통째로 포함되어야 하는 문자열로 취급합니다.
+    중복 캘린더 이름은 한 번만 조회합니다.
+    """
+    terms = (keywords.strip(),) if keywords and keywords.strip() else ()
+    return QueryPlan(tuple(dict.fromkeys(calendars)), start, end, terms)
+
+
+def split_stats(records: Iterable[List[str]], tz: tzinfo, stats: QueryStats,
+                rules: Optional[List[List[str]]] = None) -> Iterator[Event]:
+    """레코드 스트림에서 통계 레코드를 떼어 stats에 반영하고 일정만 내보냅니다.
+    
+    stats.returned에는 스크립트가 돌려준 일정 행 수(중복 제거 전)를 더합니다.
+    반복 일정 레코드(RULE_MARKER)는 표시를 뗀 레코드를 rules에 모읍니다. (rules가 None이면 버림)
+    """
+    def event_records():
+        for fields in records:
+            if fields and fields[0] == STATS_MARKER:
+                if len(fields) > 1 and fields[1].isdigit():
+                    stats.scanned += int(fields[1])
+                continue
+            if fields and fields[0] == RULE_MARKER:
+                if rules is not None:
+                    rules.append(fields[1:])
+                continue
+            stats.returned += 1
+            yield fields
+    return records_to_events(event_records(), tz)
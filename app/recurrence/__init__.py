@@ -0,0 +1,7 @@
+"""
+반복 일정 모듈
+"""
+
+from .rules import RecurringEvent, parse_recurrence, expand, records_to_rules
+
+__all__ = ['RecurringEvent', 'parse_recurrence', 'expand', 'records_to_rules']
@@ -0,0 +1,174 @@
+"""
+반복 일정 규칙과 지연 전개
+
+반복 일정은 첫 회차(마스터 일정)와 RRULE(RFC 5545) 한 줄로만 보관하고, 회차는 조회 구간이
+주어졌을 때 그 구간 안의 것만 생성기로 하나씩 만들어 냅니다. 1년짜리 주간 회의도 저장은
+규칙 하나이며, 한 주를 조회하면 회차 하나만 만들어집니다.
+"""
+
+import heapq
+import re
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from typing import Iterable, Iterator, List, Optional
+
+from dateutil.rrule import rrulestr
+
+try:
+    # 전역 설치된 경우
+    from app.events import Event, localize, to_local_naive
+    from app.temporal import resolve
+except ImportError:
+    # 로컬 실행인 경우
+    from events import Event, localize, to_local_naive
+    from temporal import resolve
+
+
+WEEKDAY_CODES = dict(zip("월화수목금토일", ("MO", "TU", "WE", "TH", "FR", "SA", "SU")))
+
+# 한국어 반복 표현 → RRULE 반복 단위 (긴 표현부터 검사)
+FREQUENCY_WORDS = [
+    ("평일", "FREQ=WEEKLY;BYDAY=MO,TU,WE,TH,FR"),
+    ("주중", "FREQ=WEEKLY;BYDAY=MO,TU,WE,TH,FR"),
+    ("격주", "FREQ=WEEKLY;INTERVAL=2"),
+    ("매일", "FREQ=DAILY"),
+    ("매주", "FREQ=WEEKLY"),
+    ("매월", "FREQ=MONTHLY"),
+    ("매달", "FREQ=MONTHLY"),
+    ("매년", "FREQ=YEARLY"),
+    ("해마다", "FREQ=YEARLY")
+]
+
+_EVERY_N = re.compile(r"(?P<n>\d+)\s*(?P<unit>일|주|개월|달|년)\s*(?:마다|간격)")
+_UNIT_FREQ = {"일": "DAILY", "주": "WEEKLY", "개월": "MONTHLY", "달": "MONTHLY", "년": "YEARLY"}
+_COUNT = re.compile(r"(?P<n>\d+)\s*(?:회|번)")
+_UNTIL = re.compile(r"(?P<until>\S.*?)\s*까지")
+_WEEKDAYS = re.compile(r"(?<![가-힣\d])(?P<days>[월화수목금토일]{1,7})(?:요일)?(?![가-힣])")
+_RRULE_PART = re.compile(r"(?P<key>[A-Z]+)=(?P<value>[^;]*)")
+_RRULE_UNTIL = re.compile(r"UNTIL=(?P<value>\d{8}(?:T\d{6})?)(?P<utc>Z?)", re.IGNORECASE)
+
+
+def parse_recurrence(expression: str, reference: Optional[date] = None) -> str:
+    """"매주", "평일", "격주 화요일", "매주 월수금 10회", "매월 12월까지", "2주마다" 같은 반복 표현을
+    RRULE 본문("FREQ=WEEKLY;BYDAY=MO,WE,FR;COUNT=10")으로 바꿉니다.
+    
+    "FREQ=..." 또는 "RRULE:FREQ=..." 형식은 그대로 받아들이며, 해석할 수 없으면 ValueError를 발생시킵니다.
+    """
+    text = " ".join(expression.split())
+    if text.upper().startswith(("RRULE:", "FREQ=")):
+        return text.split(":", 1)[1] if text.upper().startswith("RRULE:") else text
+    
+    parts = []
+    match = _EVERY_N.search(text)
+    if match:
+        parts.append(f"FREQ={_UNIT_FREQ[match['unit']]};INTERVAL={int(match['n'])}")
+        text = text[:match.start()] + " " + text[match.end():]
+    else:
+        for word, rule in FREQUENCY_WORDS:
+            if word in text:
+                parts.append(rule)
+                text = text.replace(word, " ", 1)
+                break
+    if not parts:
+        raise ValueError(f"반복 규칙 해석 실패: {expression}")
+    
+    until = _UNTIL.search(text)
+    if until:
+        last_day = resolve(until["until"], reference).end
+        parts.append(f"UNTIL={last_day.strftime('%Y%m%dT%H%M%S')}")
+        text = text[:until.start()] + " " + text[until.end():]
+    count = _COUNT.search(text)
+    if count:
+        parts.append(f"COUNT={int(count['n'])}")
+        text = text[:count.start()] + " " + text[count.end():]
+    
+    days = _WEEKDAYS.search(text)
+    if days and parts[0].startswith("FREQ=WEEKLY") and "BYDAY" not in parts[0]:
+        parts.insert(1, "BYDAY=" + ",".join(WEEKDAY_CODES[day] for day in dict.fromkeys(days["days"])))
+    return ";".join(parts)
+
+
+def _local_rule(rule: str, tz: tzinfo) -> str:
+    """UTC로 적힌 UNTIL(…Z)을 tz 로컬 시각으로 바꿉니다. (naive DTSTART와 함께 쓰기 위함)"""
+    def convert(match):
+        if not match["utc"]:
+            return match.group(0)
+        value = match["value"]
+        parsed = datetime.strptime(value, "%Y%m%dT%H%M%S" if "T" in value.upper() else "%Y%m%d")
+        local = to_local_naive(parsed.replace(tzinfo=timezone.utc), tz)
+        return f"UNTIL={local.strftime('%Y%m%dT%H%M%S')}"
+    return _RRULE_UNTIL.sub(convert, rule)
+
+
+def _fast_forward(rule: str, dtstart: datetime, lower: datetime) -> datetime:
+    """회차를 바꾸지 않는 범위에서 DTSTART를 조회 구간 직전 주기로 옮깁니다.
+    
+    dateutil은 DTSTART부터 차례로 회차를 계산하므로 몇 년 된 매일/매주 일정은 구간 전까지
+    수천 번을 돕니다. 주기(INTERVAL일 또는 INTERVAL주)의 배수만큼 옮기면 요일과 격주 위상이
+    그대로이므로 같은 회차가 나옵니다. COUNT가 있으면 처음부터 세어야 하므로 옮기지 않습니다.
+    """
+    parts = {match["key"]: match["value"] for match in _RRULE_PART.finditer(rule.upper())}
+    if "COUNT" in parts or parts.get("FREQ") not in ("DAILY", "WEEKLY") or lower <= dtstart:
+        return dtstart
+    interval = int(parts.get("INTERVAL") or 1)
+    period = timedelta(days=interval * (7 if parts["FREQ"] == "WEEKLY" else 1))
+    periods = (lower - dtstart) // period - 1
+    return dtstart + period * periods if periods > 0 else dtstart
+
+
+@dataclass(frozen=True)
+class RecurringEvent:
+    """반복 일정 (첫 회차 일정 + RRULE 본문)"""
+    event: Event
+    rule: str
+    
+    @property
+    def duration(self) -> timedelta:
+        return self.event.end - self.event.start
+    
+    def occurrences(self, start: datetime, end: datetime, tz: tzinfo) -> Iterator[Event]:
+        """시작 시각이 [start, end]인 회차를 시간 순으로 하나씩 만들어 냅니다.
+        
+        회차의 시각은 tz 기준 로컬 시각으로 계산하므로 서머타임이 있어도 같은 벽시계 시각에 반복됩니다.
+        """
+        master = self.event
+        duration = to_local_naive(master.end, tz) - to_local_naive(master.start, tz)
+        lower, upper = to_local_naive(start, tz), to_local_naive(end, tz)
+        dtstart = _fast_forward(self.rule, to_local_naive(master.start, tz), lower)
+        rule = rrulestr(_local_rule(self.rule, tz), dtstart=dtstart, ignoretz=True)
+        for occurrence in rule.xafter(lower, inc=True):
+            if occurrence > upper:
+                return
+            yield Event(master.uid, master.calendar, master.title, localize(occurrence, tz),
+                        localize(occurrence + duration, tz), master.location, master.notes)
+    
+    def overlapping(self, start: datetime, end: datetime, tz: tzinfo) -> Iterator[Event]:
+        """[start, end)와 시간이 겹치는 회차 (구간 시작 전에 시작해 걸쳐 있는 회차 포함)"""
+        for event in self.occurrences(start - self.duration, end, tz):
+            if event.overlaps(start, end):
+                yield event
+
+
+def expand(rules: Iterable[RecurringEvent], start: datetime, end: datetime, tz: tzinfo) -> Iterator[Event]:
+    """여러 반복 일정의 [start, end] 회차를 시작 시각 순으로 합쳐 지연 생성합니다."""
+    return heapq.merge(*(rule.occurrences(start, end, tz) for rule in rules), key=lambda event: event.sort_key)
+
+
+def records_to_rules(records: Iterable[List[str]], tz: tzinfo) -> Iterator[RecurringEvent]:
+    """calendar, uid, title, start, end, location, notes, rrule 레코드를 RecurringEvent로 변환합니다.
+    
+    RRULE이 비었거나 형식이 맞지 않는 레코드는 건너뜁니다.
+    """
+    fromisoformat = datetime.fromisoformat
+    for fields in records:
+        if len(fields) != 8 or not fields[7].strip():
+            continue
+        try:
+            start = localize(fromisoformat(fields[3]), tz)
+            end = localize(fromisoformat(fields[4]), tz)
+        except ValueError:
+            continue
+        rule = fields[7].strip()
+        if rule.upper().startswith("RRULE:"):
+            rule = rule[6:]
+        yield RecurringEvent(Event(fields[1], fields[0], fields[2], start, end, fields[5], fields[6]), rule)
@@ -0,0 +1,8 @@
+"""
+일정 겹침 확인과 빈 시간 계산 모듈
+"""
+
+from .intervals import IntervalIndex
+from .freebusy import Interval, merge_busy, working_windows, free_slots, parse_working_hours
+
+__all__ = ['IntervalIndex', 'Interval', 'merge_busy', 'working_windows', 'free_slots', 'parse_working_hours']
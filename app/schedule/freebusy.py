@@ -0,0 +1,93 @@
+"""
+빈 시간 계산 (sweep-line)
+
+일정들을 시작 시각 순으로 한 번 훑으며 겹치거나 맞닿은 구간을 바쁜 구간으로 합치고,
+하루마다 근무 시간 창에서 바쁜 구간을 빼 남는 빈 구간을 구합니다. 모두 정렬된 목록의
+선형 순회라 수천 개의 일정도 밀리초 안에 계산됩니다.
+"""
+
+import re
+from datetime import datetime, time, timedelta, tzinfo
+from typing import Iterable, List, Optional, Tuple
+
+try:
+    # 전역 설치된 경우
+    from app.events import Event, localize, to_local_naive
+except ImportError:
+    # 로컬 실행인 경우
+    from events import Event, localize, to_local_naive
+
+
+Interval = Tuple[datetime, datetime]
+
+_WORKING_HOURS = re.compile(r"^\s*(\d{1,2})(?::(\d{2}))?\s*[-~]\s*(\d{1,2})(?::(\d{2}))?\s*$")
+
+
+def parse_working_hours(text: str) -> Tuple[time, time]:
+    """"09:00-18:00", "9-18", "10:30~19" 형식의 근무 시간을 (시작, 끝)으로 변환합니다."""
+    match = _WORKING_HOURS.match(text or "")
+    if not match:
+        raise ValueError(f"근무 시간 형식 오류: {text} (예: 09:00-18:00)")
+    start_hour, start_minute, end_hour, end_minute = match.groups()
+    start = time(int(start_hour), int(start_minute or 0))
+    end = time(23, 59, 59) if int(end_hour) == 24 else time(int(end_hour), int(end_minute or 0))
+    if end <= start:
+        raise ValueError(f"근무 시간의 끝이 시작보다 앞섭니다: {text}")
+    return start, end
+
+
+def merge_busy(events: Iterable[Event], start: datetime, end: datetime) -> List[Interval]:
+    """[start, end) 안의 일정 구간을 겹치거나 맞닿은 것끼리 합쳐 시작 시각 순으로 반환합니다."""
+    intervals = sorted(
+        (max(event.start, start), min(event.end, end))
+        for event in events
+        if event.start < end and event.end > start
+    )
+    merged: List[Interval] = []
+    for busy_start, busy_end in intervals:
+        if merged and busy_start <= merged[-1][1]:
+            if busy_end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], busy_end)
+        else:
+            merged.append((busy_start, busy_end))
+    return merged
+
+
+def working_windows(start: datetime, end: datetime, hours: Optional[Tuple[time, time]], 
+                    tz: tzinfo) -> List[Interval]:
+    """[start, end)를 하루마다 hours 창으로 자른 구간 목록 (hours가 없으면 구간 전체)"""
+    if hours is None:
+        return [(start, end)] if start < end else []
+    windows = []
+    day = to_local_naive(start, tz).date()
+    last_day = to_local_naive(end, tz).date()
+    while day <= last_day:
+        window_start = max(localize(datetime.combine(day, hours[0]), tz), start)
+        window_end = min(localize(datetime.combine(day, hours[1]), tz), end)
+        if window_start < window_end:
+            windows.append((window_start, window_end))
+        day += timedelta(days=1)
+    return windows
+
+
+def free_slots(busy: List[Interval], windows: Iterable[Interval], 
+               duration: timedelta) -> List[Interval]:
+    """각 창에서 바쁜 구간(merge_busy 결과)을 빼고 duration 이상 남는 빈 구간을 반환합니다.
+    
+    창과 바쁜 구간이 모두 시작 시각 순이므로 두 목록을 한 번씩만 훑습니다.
+    """
+    slots: List[Interval] = []
+    i = 0
+    for window_start, window_end in windows:
+        # 이 창보다 먼저 끝나는 바쁜 구간은 이후 창에도 영향이 없음
+        while i < len(busy) and busy[i][1] <= window_start:
+            i += 1
+        cursor, j = window_start, i
+        while j < len(busy) and busy[j][0] < window_end:
+            if busy[j][0] - cursor >= duration:
+                slots.append((cursor, busy[j][0]))
+            cursor = max(cursor, busy[j][1])
+            j += 1
+        if window_end - cursor >= duration:
+            slots.append((cursor, window_end))
+    return slots
@@ -0,0 +1,66 @@
+"""
+일정 구간 색인
+
+시작 시각으로 정렬한 배열을 암시적 균형 이진 트리로 보고 각 노드에 서브트리의 최대 종료
+시각을 저장하는 interval tree입니다. 만들 때 한 번 정렬(O(n log n))하고, 겹침 조회는
+겹치지 않는 서브트리를 건너뛰므로 O(log n + k)입니다.
+"""
+
+from bisect import bisect_left
+from datetime import datetime
+from typing import Iterable, List
+
+try:
+    # 전역 설치된 경우
+    from app.events import Event
+except ImportError:
+    # 로컬 실행인 경우
+    from events import Event
+
+
+class IntervalIndex:
+    """일정의 [start, end) 구간 겹침을 찾는 정적 interval tree"""
+    
+    def __init__(self, events: Iterable[Event]):
+        self._events: List[Event] = sorted(events, key=lambda event: event.sort_key)
+        self._starts = [event.start for event in self._events]
+        self._max_end: List[datetime] = [event.end for event in self._events]
+        self._build(0, len(self._events))
+    
+    def __len__(self) -> int:
+        return len(self._events)
+    
+    def __iter__(self):
+        return iter(self._events)
+    
+    def _build(self, lo: int, hi: int):
+        """[lo, hi) 서브트리의 최대 종료 시각을 중간 노드에 채우고 반환합니다."""
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        for child in (self._build(lo, mid), self._build(mid + 1, hi)):
+            if child is not None and child > self._max_end[mid]:
+                self._max_end[mid] = child
+        return self._max_end[mid]
+    
+    def overlapping(self, start: datetime, end: datetime) -> List[Event]:
+        """[start, end)와 시간이 겹치는 일정을 시작 시각 순으로 반환합니다."""
+        found: List[Event] = []
+        # 이 위치부터는 시작이 end 이후라 겹칠 수 없음 (정렬되어 있으므로 서브트리 전체를 건너뜀)
+        cutoff = bisect_left(self._starts, end)
+        stack = [(0, len(self._events))]
+        while stack:
+            lo, hi = stack.pop()
+            if lo >= hi or lo >= cutoff:
+                continue
+            mid = (lo + hi) // 2
+            if self._max_end[mid] <= start:
+                continue
+            event = self._events[mid]
+            if event.end > start and event.start < end:
+                found.append(event)
+            stack.append((mid + 1, hi))
+            stack.append((lo, mid))
+        found.sort(key=lambda event: event.sort_key)
+        return found
+
@@ -0,0 +1,15 @@
+"""
+AppleScript 템플릿 모듈
+"""
+
+from .calendar import (
+    CREATE_FIELDS, UPDATE_FIELDS, DELETE_FIELDS, script_date,
+    list_calendars_call, query_call, rules_call, changes_call, live_uids_call,
+    create_call, update_call, delete_call
+)
+
+__all__ = [
+    'CREATE_FIELDS', 'UPDATE_FIELDS', 'DELETE_FIELDS', 'script_date',
+    'list_calendars_call', 'query_call', 'rules_call', 'changes_call', 'live_uids_call',
+    'create_call', 'update_call', 'delete_call'
+]
@@ -0,0 +1,384 @@
+"""
+Calendar 앱 AppleScript 템플릿
+
+CalendarTools가 실행하는 스크립트를 모두 `on run argv` 템플릿으로 등록해 두고, 호출마다
+인자만 바꾼 ScriptCall을 만듭니다. 캘린더 목록은 US로 이은 인자 하나로, 일괄 생성·수정·삭제는
+항목마다 고정 개수(*_FIELDS)의 인자를 이어 붙여 넘기므로 항목 수와 관계없이 템플릿이 같습니다.
+날짜 인자는 캘린더 시간대의 로컬 시각 "YYYY-MM-DDTHH:MM:SS"입니다.
+"""
+
+from datetime import datetime
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+
+try:
+    # 전역 설치된 경우
+    from app.backends.templates import ScriptCall, ScriptTemplate, register_template
+    from app.events import Event
+    from app.events.wire import APPLESCRIPT_SEPARATORS, FIELD_SEPARATOR
+    from app.query import RULE_MARKER, STATS_MARKER, QueryPlan
+except ImportError:
+    # 로컬 실행인 경우
+    from backends.templates import ScriptCall, ScriptTemplate, register_template
+    from events import Event
+    from events.wire import APPLESCRIPT_SEPARATORS, FIELD_SEPARATOR
+    from query import RULE_MARKER, STATS_MARKER, QueryPlan
+
+
+# 일괄 작업 항목당 인자 수
+CREATE_FIELDS = 6   # title, start, end, location, notes, rrule
+UPDATE_FIELDS = 9   # uid, title, dayStart, dayEnd, calendars, newTitle, newStart, newTime(HH:MM), duration(초)
+DELETE_FIELDS = 5   # uid, title, dayStart, dayEnd, calendars
+
+HANDLERS = '''
+on isoStamp(d)
+    set {year:y, month:m, day:dd, hours:h, minutes:mi, seconds:s} to d
+    return (y as string) & "-" & text -2 thru -1 of ("0" & ((m as integer) as string)) & "-" & text -2 thru -1 of ("0" & (dd as string)) & "T" & text -2 thru -1 of ("0" & (h as string)) & ":" & text -2 thru -1 of ("0" & (mi as string)) & ":" & text -2 thru -1 of ("0" & (s as string))
+end isoStamp
+
+on isoDate(s)
+    set d to (current date)
+    set day of d to 1
+    set year of d to (text 1 thru 4 of s) as integer
+    set month of d to (text 6 thru 7 of s) as integer
+    set day of d to (text 9 thru 10 of s) as integer
+    set hours of d to (text 12 thru 13 of s) as integer
+    set minutes of d to (text 15 thru 16 of s) as integer
+    set seconds of d to (text 18 thru 19 of s) as integer
+    return d
+end isoDate
+
+on textOf(v)
+    if v is missing value then return ""
+    return v as string
+end textOf
+
+on splitText(s, separator)
+    if s is "" then return {}
+    set AppleScript's text item delimiters to separator
+    set parts to text items of s
+    set AppleScript's text item delimiters to ""
+    return parts
+end splitText
+
+on joinText(values, separator)
+    set AppleScript's text item delimiters to separator
+    set output to values as string
+    set AppleScript's text item delimiters to ""
+    return output
+end joinText
+'''
+
+# 일정 한 건을 calendar, uid, title, start, end, location, notes 레코드로 만드는 구문
+EVENT_RECORD = ('(calName as string) & US & (item i of eventUids) & US & (item i of eventTitles) & US & '
+                '(my isoStamp(item i of eventStarts)) & US & (my isoStamp(item i of eventEnds)) & US & '
+                '(my textOf(item i of eventLocations)) & US & (my textOf(item i of eventNotes))')
+
+EVENT_PROPERTIES = "uid, summary, start date, end date, location, description"
+
+
+def _register(template_id: str, body: str) -> ScriptTemplate:
+    return register_template(template_id, APPLESCRIPT_SEPARATORS + body, HANDLERS)
+
+
+def script_date(dt: datetime) -> str:
+    """날짜 인자 문자열 (dt의 벽시계 시각)"""
+    return dt.strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def _calendar_arg(calendar_names: Sequence[str]) -> str:
+    return FIELD_SEPARATOR.join(dict.fromkeys(calendar_names))
+
+
+LIST_CALENDARS = _register("calendar/list", '''
+    tell application "Calendar"
+        set calendarNames to name of every calendar
+    end tell
+    return my joinText(calendarNames, RS)
+''')
+
+
+def list_calendars_call() -> ScriptCall:
+    """Calendar 앱의 캘린더 이름을 한 줄에 하나씩 내보냅니다."""
+    return LIST_CALENDARS.call()
+
+
+def _rule_records(target: str, marker: str = "") -> str:
+    """calName 캘린더의 반복 일정을 target 목록에 calendar, uid, title, start, end, location, notes, rrule
+    레코드로 더하는 구문 (marker가 있으면 레코드 앞에 필드 하나로 붙임)
+    """
+    prefix = f'"{marker}" & US & ' if marker else ""
+    return f'''
+                tell calendar (calName as string)
+                    set {{eventUids, eventTitles, eventStarts, eventEnds, eventLocations, eventNotes, eventRules}} to {{{EVENT_PROPERTIES}, recurrence}} of (every event whose recurrence is not missing value)
+                end tell
+                repeat with i from 1 to count of eventTitles
+                    set end of {target} to {prefix}{EVENT_RECORD} & US & (my textOf(item i of eventRules))
+                end repeat'''
+
+
+@lru_cache(maxsize=None)
+def _query_template(term_count: int, with_rules: bool = False) -> ScriptTemplate:
+    """제목 조건 수별 조회 템플릿 (argv: calendars, start, end, term1, ...)
+    
+    with_rules이면 같은 실행에서 반복 일정도 RULE_MARKER를 붙인 레코드로 함께 내보냅니다.
+    """
+    terms = [f"titleTerm{k}" for k in range(1, term_count + 1)]
+    assign = "".join(f"\n    set {term} to item {3 + k} of argv" for k, term in enumerate(terms, 1))
+    in_range = "start date ≥ startDate and start date ≤ endDate"
+    whose = " and ".join([in_range, *(f"summary contains {term}" for term in terms)])
+    # 제목 조건으로 걸러진 행까지 포함한 구간 전체 행 수 (값은 가져오지 않고 개수만 셈)
+    scanned = f"count of (every event whose {in_range})" if terms else "count of eventTitles"
+    rules = _rule_records("eventInfo", RULE_MARKER) if with_rules else ""
+    template_id = f"calendar/query/{term_count}" + ("/rules" if with_rules else "")
+    return _register(template_id, f'''
+    set calendarNames to my splitText(item 1 of argv, US)
+    set startDate to my isoDate(item 2 of argv)
+    set endDate to my isoDate(item 3 of argv){assign}
+    
+    set eventInfo to {{}}
+    set scanned to 0
+    tell application "Calendar"
+        repeat with calName in calendarNames
+            try
+                tell calendar (calName as string)
+                    set {{eventUids, eventTitles, eventStarts, eventEnds, eventLocations, eventNotes}} to {{{EVENT_PROPERTIES}}} of (every event whose {whose})
+                    set scanned to scanned + ({scanned})
+                end tell
+                repeat with i from 1 to count of eventTitles
+                    set end of eventInfo to {EVENT_RECORD}
+                end repeat{rules}
+            end try
+        end repeat
+    end tell
+    set end of eventInfo to "{STATS_MARKER}" & US & (scanned as string)
+    return my joinText(eventInfo, RS)
+''')
+
+
+def query_call(plan: QueryPlan, with_rules: bool = False) -> ScriptCall:
+    """조회 계획에 맞는 일정을 calendar, uid, title, start, end, location, notes 레코드로 내보냅니다.
+    
+    캘린더 선택, 날짜 구간, 제목 조건은 모두 whose 절로 Calendar 안에서 평가되며,
+    마지막에 구간 안에서 검사한 행 수를 통계 레코드(STATS_MARKER, 개수)로 붙입니다.
+    with_rules이면 조회한 캘린더의 반복 일정(rules_call과 같은 레코드)도 RULE_MARKER를 앞에 붙여
+    내보내므로 일정과 규칙을 스크립트 한 번으로 가져옵니다. (split_stats로 분리)
+    """
+    template = _query_template(len(plan.title_terms), with_rules)
+    return template.call(_calendar_arg(plan.calendars), script_date(plan.start), script_date(plan.end),
+                         *plan.title_terms)
+
+
+RULES = _register("calendar/rules", f'''
+    set ruleInfo to {{}}
+    tell application "Calendar"
+        repeat with calName in my splitText(item 1 of argv, US)
+            try{_rule_records("ruleInfo")}
+            end try
+        end repeat
+    end tell
+    return my joinText(ruleInfo, RS)
+''')
+
+
+def rules_call(calendar_names: Sequence[str]) -> ScriptCall:
+    """반복 일정을 calendar, uid, title, start, end, location, notes, rrule 레코드로 내보냅니다.
+    
+    Calendar는 반복 일정을 첫 회차(시작 날짜) 한 건으로만 돌려주므로 날짜 구간 조회로는
+    이후 회차를 알 수 없습니다. 규칙은 구간과 관계없이 캘린더마다 한 번에 가져옵니다.
+    """
+    return RULES.call(_calendar_arg(calendar_names))
+
+
+CHANGES = _register("calendar/changes", f'''
+    set sinceDate to my isoDate(item 2 of argv)
+    
+    set changeInfo to {{}}
+    tell application "Calendar"
+        repeat with calName in my splitText(item 1 of argv, US)
+            try
+                tell calendar (calName as string)
+                    set {{eventUids, eventTitles, eventStarts, eventEnds, eventLocations, eventNotes, eventRules}} to {{{EVENT_PROPERTIES}, recurrence}} of (every event whose stamp date ≥ sinceDate)
+                end tell
+                repeat with i from 1 to count of eventTitles
+                    set end of changeInfo to {EVENT_RECORD} & US & (my textOf(item i of eventRules))
+                end repeat
+            end try
+        end repeat
+    end tell
+    return my joinText(changeInfo, RS)
+''')
+
+
+def changes_call(calendar_names: Sequence[str], since: datetime) -> ScriptCall:
+    """since 이후 수정된 일정을 calendar, uid, title, start, end, location, notes, rrule 레코드로 내보냅니다.
+    
+    stamp date(마지막 수정 시각) 조건은 Calendar 안에서 평가되므로 바뀐 일정만 넘어옵니다.
+    반복 일정이 아니면 rrule 필드는 비어 있습니다.
+    """
+    return CHANGES.call(_calendar_arg(calendar_names), script_date(since))
+
+
+LIVE_UIDS = _register("calendar/live-uids", '''
+    set startDate to my isoDate(item 2 of argv)
+    set endDate to my isoDate(item 3 of argv)
+    
+    set uidInfo to {}
+    tell application "Calendar"
+        repeat with calName in my splitText(item 1 of argv, US)
+            try
+                tell calendar (calName as string)
+                    set uidInfo to uidInfo & (uid of (every event whose start date ≥ startDate and start date ≤ endDate))
+                    set uidInfo to uidInfo & (uid of (every event whose recurrence is not missing value))
+                end tell
+            end try
+        end repeat
+    end tell
+    return my joinText(uidInfo, RS)
+''')
+
+
+def live_uids_call(calendar_names: Sequence[str], start: datetime, end: datetime) -> ScriptCall:
+    """구간 안의 일정과 모든 반복 일정의 UID를 한 줄에 하나씩 내보냅니다. (삭제 확인용)"""
+    return LIVE_UIDS.call(_calendar_arg(calendar_names), script_date(start), script_date(end))
+
+
+CREATE = _register("calendar/create", f'''
+    set results to {{}}
+    tell application "Calendar"
+        tell calendar (item 1 of argv)
+            repeat with base from 2 to (count of argv) by {CREATE_FIELDS}
+                try
+                    set startDate to my isoDate(item (base + 1) of argv)
+                    set endDate to my isoDate(item (base + 2) of argv)
+                    set newEvent to make new event at end with properties {{summary:(item base of argv), start date:startDate, end date:endDate}}
+                    if item (base + 3) of argv is not "" then set location of newEvent to item (base + 3) of argv
+                    if item (base + 4) of argv is not "" then set description of newEvent to item (base + 4) of argv
+                    if item (base + 5) of argv is not "" then set recurrence of newEvent to item (base + 5) of argv
+                    set end of results to "ok" & US & (uid of newEvent)
+                on error errMsg
+                    set end of results to "error" & US & errMsg
+                end try
+            end repeat
+        end tell
+    end tell
+    return my joinText(results, RS)
+''')
+
+
+def create_call(calendar_name: str, drafts: Sequence[Event],
+                rules: Sequence[Optional[str]]) -> ScriptCall:
+    """일정 초안들을 기본 캘린더에 만들고 항목마다 "ok" US uid 또는 "error" US 메시지를 내보냅니다."""
+    args: List[str] = [calendar_name]
+    for draft, rule in zip(drafts, rules):
+        args.extend([draft.title, script_date(draft.start), script_date(draft.end),
+                     draft.location or "", draft.notes or "", rule or ""])
+    return CREATE.call(*args)
+
+
+# 대상 일정을 찾아 matches/calName에 담는 구문 (base: 항목 인자의 시작 위치)
+#   UID가 있으면 calendars 인자의 캘린더들에서 uid로, 없으면 기본 캘린더에서 제목(과 날짜)으로 찾음
+FIND_TARGET = '''
+                set targetUid to item base of argv
+                set matches to {}
+                set calName to defaultCalendar
+                if targetUid is not "" then
+                    repeat with candidate in my splitText(item (base + 4) of argv, US)
+                        set calName to candidate as string
+                        try
+                            tell calendar calName to set matches to (every event whose uid is targetUid)
+                        end try
+                        if (count of matches) > 0 then exit repeat
+                    end repeat
+                else
+                    set targetTitle to item (base + 1) of argv
+                    try
+                        if item (base + 2) of argv is "" then
+                            tell calendar calName to set matches to (every event whose summary is targetTitle)
+                        else
+                            set dayStart to my isoDate(item (base + 2) of argv)
+                            set dayEnd to my isoDate(item (base + 3) of argv)
+                            tell calendar calName to set matches to (every event whose summary is targetTitle and start date ≥ dayStart and start date ≤ dayEnd)
+                        end if
+                    end try
+                end if'''
+
+
+UPDATE = _register("calendar/update", f'''
+    set defaultCalendar to item 1 of argv
+    set results to {{}}
+    tell application "Calendar"
+        repeat with base from 2 to (count of argv) by {UPDATE_FIELDS}
+            try{FIND_TARGET}
+                if (count of matches) is 0 then
+                    set end of results to "missing"
+                else
+                    set targetEvent to item 1 of matches
+                    set eventDuration to (end date of targetEvent) - (start date of targetEvent)
+                    if item (base + 5) of argv is not "" then set summary of targetEvent to item (base + 5) of argv
+                    set newStartText to item (base + 6) of argv
+                    set newTimeText to item (base + 7) of argv
+                    if newStartText is not "" or newTimeText is not "" then
+                        if newStartText is not "" then
+                            set newStart to my isoDate(newStartText)
+                        else
+                            -- 시간만 바꾸면 기존 일정의 날짜에 새 시각을 적용
+                            copy (start date of targetEvent) to newStart
+                            set hours of newStart to (text 1 thru 2 of newTimeText) as integer
+                            set minutes of newStart to (text 4 thru 5 of newTimeText) as integer
+                            set seconds of newStart to 0
+                        end if
+                        if item (base + 8) of argv is not "" then set eventDuration to (item (base + 8) of argv) as integer
+                        set newEnd to newStart + eventDuration
+                        -- 뒤로 옮길 때는 종료를 먼저 바꿔 시작이 종료보다 늦어지는 순간이 없게 함
+                        if newStart > (end date of targetEvent) then
+                            set end date of targetEvent to newEnd
+                            set start date of targetEvent to newStart
+                        else
+                            set start date of targetEvent to newStart
+                            set end date of targetEvent to newEnd
+                        end if
+                    end if
+                    set end of results to "ok" & US & (uid of targetEvent) & US & calName & US & (summary of targetEvent) & US & (my isoStamp(start date of targetEvent)) & US & (my isoStamp(end date of targetEvent))
+                end if
+            on error errMsg
+                set end of results to "error" & US & errMsg
+            end try
+        end repeat
+    end tell
+    return my joinText(results, RS)
+''')
+
+
+def update_call(calendar_name: str, items: Sequence[Tuple[str, ...]]) -> ScriptCall:
+    """항목(UPDATE_FIELDS개 인자)마다 대상 일정을 찾아 수정하고
+    "ok" US uid US calendar US title US start US end, "missing", "error" US 메시지 중 하나를 내보냅니다.
+    """
+    return UPDATE.call(calendar_name, *(arg for item in items for arg in item))
+
+
+DELETE = _register("calendar/delete", f'''
+    set defaultCalendar to item 1 of argv
+    set results to {{}}
+    tell application "Calendar"
+        repeat with base from 2 to (count of argv) by {DELETE_FIELDS}
+            try{FIND_TARGET}
+                if (count of matches) is 0 then
+                    set end of results to "missing"
+                else
+                    set targetUid to uid of (item 1 of matches)
+                    delete item 1 of matches
+                    set end of results to "ok" & US & targetUid
+                end if
+            on error errMsg
+                set end of results to "error" & US & errMsg
+            end try
+        end repeat
+    end tell
+    return my joinText(results, RS)
+''')
+
+
+def delete_call(calendar_name: str, items: Sequence[Tuple[str, ...]]) -> ScriptCall:
+    """항목(DELETE_FIELDS개 인자)마다 대상 일정을 찾아 삭제하고 "ok" US uid, "missing", "error" US 메시지 중 하나를 내보냅니다."""
+    return DELETE.call(calendar_name, *(arg for item in items for arg in item))
@@ -0,0 +1,7 @@
+"""
+일정 전문 검색 모듈
+"""
+
+from .ngram import NgramIndex, FIELD_WEIGHTS, STOPWORDS, ngrams, tokenize
+
+__all__ = ['NgramIndex', 'FIELD_WEIGHTS', 'STOPWORDS', 'ngrams', 'tokenize']
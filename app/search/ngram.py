@@ -0,0 +1,139 @@
+"""
+문자 n-gram 전문 검색 색인
+
+한국어는 띄어쓰기와 조사 때문에 단어 단위 색인이 잘 맞지 않으므로, 토큰마다 문자 2-gram
+(한 글자 토큰은 1-gram)을 만들어 역색인합니다. "회의" 검색은 "주간회의", "회의실 예약"과도
+일치하며, 문서마다 가진 n-gram 목록을 함께 보관해 추가·수정·삭제를 증분으로 반영합니다.
+"""
+
+import math
+import re
+from collections import defaultdict
+from typing import Dict, Hashable, Iterable, List, Mapping, Optional, Set, Tuple
+
+
+# 필드별 가중치 (제목 일치가 가장 중요)
+FIELD_WEIGHTS = {"title": 3.0, "location": 1.5, "notes": 1.0}
+
+# 검색어에서 무시하는 말 ("회의 관련 일정 찾아줘" → "회의")
+STOPWORDS = frozenset({"일정", "관련", "관련된", "찾아줘", "찾아", "보여줘", "알려줘", "검색", "검색해줘", "좀", "있는"})
+
+_TOKEN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """소문자로 바꾼 단어 토큰 목록"""
+    return _TOKEN.findall(text.lower())
+
+
+def ngrams(token: str, n: int = 2) -> Set[str]:
+    """토큰의 문자 n-gram 집합 (n보다 짧은 토큰은 토큰 자체)"""
+    if len(token) <= n:
+        return {token}
+    return {token[i:i + n] for i in range(len(token) - n + 1)}
+
+
+class NgramIndex:
+    """문서(일정)별 여러 필드를 색인하는 메모리 역색인
+    
+    postings[gram][doc_id]에는 그 gram이 나타난 필드 가중치의 합을 저장합니다.
+    search는 검색어 토큰별로 모든 n-gram을 가진 문서만 후보로 삼고, 일치한 토큰 수와
+    IDF 가중 점수, 원문 부분 문자열 일치 보너스로 순위를 매깁니다.
+    """
+    
+    def __init__(self, weights: Optional[Mapping[str, float]] = None):
+        self.weights = dict(weights or FIELD_WEIGHTS)
+        self._postings: Dict[str, Dict[Hashable, float]] = defaultdict(dict)
+        self._documents: Dict[Hashable, Dict[str, str]] = {}
+        self._doc_grams: Dict[Hashable, Set[str]] = {}
+    
+    def __len__(self) -> int:
+        return len(self._documents)
+    
+    def __contains__(self, doc_id: Hashable) -> bool:
+        return doc_id in self._documents
+    
+    def add(self, doc_id: Hashable, fields: Mapping[str, Optional[str]]):
+        """문서를 색인합니다. 이미 있으면 교체합니다."""
+        if doc_id in self._documents:
+            self.remove(doc_id)
+        
+        stored = {name: value.lower() for name, value in fields.items() if value and name in self.weights}
+        weights: Dict[str, float] = defaultdict(float)
+        for name, value in stored.items():
+            for token in tokenize(value):
+                for gram in ngrams(token):
+                    weights[gram] += self.weights[name]
+        
+        for gram, weight in weights.items():
+            self._postings[gram][doc_id] = weight
+        self._documents[doc_id] = stored
+        self._doc_grams[doc_id] = set(weights)
+    
+    def update(self, documents: Iterable[Tuple[Hashable, Mapping[str, Optional[str]]]]):
+        """여러 문서를 색인합니다."""
+        for doc_id, fields in documents:
+            self.add(doc_id, fields)
+    
+    def remove(self, doc_id: Hashable):
+        """문서를 색인에서 제거합니다. (없으면 무시)"""
+        if self._documents.pop(doc_id, None) is None:
+            return
+        for gram in self._doc_grams.pop(doc_id, ()):
+            posting = self._postings.get(gram)
+            if posting is None:
+                continue
+            posting.pop(doc_id, None)
+            if not posting:
+                del self._postings[gram]
+    
+    def clear(self):
+        self._postings.clear()
+        self._documents.clear()
+        self._doc_grams.clear()
+    
+    def _idf(self, gram: str) -> float:
+        return math.log(1 + len(self._documents) / (1 + len(self._postings.get(gram, ()))))
+    
+    def search(self, query: str, limit: Optional[int] = 20,
+               candidates: Optional[Set[Hashable]] = None) -> List[Tuple[Hashable, float]]:
+        """검색어와 일치하는 문서를 (doc_id, 점수) 목록으로 점수 순으로 반환합니다.
+        
+        검색어 토큰 중 하나라도 일치하면 결과에 포함되며, 더 많은 토큰이 일치한 문서가 앞섭니다.
+        candidates를 주면 그 문서들 안에서만 찾습니다.
+        """
+        terms = [token for token in tokenize(query) if token not in STOPWORDS] or tokenize(query)
+        if not terms:
+            return []
+        
+        matched_terms: Dict[Hashable, int] = defaultdict(int)
+        scores: Dict[Hashable, float] = defaultdict(float)
+        for term in dict.fromkeys(terms):
+            grams = sorted(ngrams(term), key=lambda g: len(self._postings.get(g, ())))
+            # 가장 드문 gram의 문서부터 교집합을 좁혀 나감
+            postings = [self._postings.get(gram) for gram in grams]
+            if not all(postings):
+                continue
+            docs = set(postings[0])
+            for posting in postings[1:]:
+                docs.intersection_update(posting)
+                if not docs:
+                    break
+            if candidates is not None:
+                docs &= candidates
+            
+            idfs = [self._idf(gram) for gram in grams]
+            for doc_id in docs:
+                score = sum(idf * posting[doc_id] for idf, posting in zip(idfs, postings)) / len(grams)
+                fields = self._documents[doc_id]
+                # n-gram이 모두 있어도 순서가 다를 수 있으므로 원문에 그대로 있으면 가산
+                for name, value in fields.items():
+                    if term in value:
+                        score += self.weights[name]
+                matched_terms[doc_id] += 1
+                scores[doc_id] += score
+        
+        ranked = sorted(scores, key=lambda doc_id: (-matched_terms[doc_id], -scores[doc_id]))
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [(doc_id, scores[doc_id]) for doc_id in ranked]
@@ -0,0 +1,8 @@
+"""
+로컬 일정 저장소 모듈
+"""
+
+from .cache import EventStore
+from .catalog import CalendarCatalog
+
+__all__ = ['EventStore', 'CalendarCatalog']
@@ -0,0 +1,567 @@
+"""
+SQLite 기반 로컬 일정 캐시
+"""
+
+import heapq
+import sqlite3
+import threading
+import time
+from datetime import date, datetime, timedelta, tzinfo
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    # 전역 설치된 경우
+    from app.events import Event, localize, to_local_naive
+    from app.search import NgramIndex
+    from app.recurrence import RecurringEvent, expand
+except ImportError:
+    # 로컬 실행인 경우
+    from events import Event, localize, to_local_naive
+    from search import NgramIndex
+    from recurrence import RecurringEvent, expand
+
+
+# 스키마가 바뀌면 올립니다. 캐시이므로 버전이 다르면 테이블을 새로 만듭니다.
+SCHEMA_VERSION = 6
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    uid TEXT NOT NULL DEFAULT '',
+    calendar TEXT NOT NULL,
+    title TEXT NOT NULL,
+    start_time TEXT NOT NULL,
+    end_time TEXT NOT NULL,
+    location TEXT NOT NULL DEFAULT '',
+    notes TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_events_start ON events (start_time);
+CREATE INDEX IF NOT EXISTS idx_events_title ON events (title, calendar, start_time);
+CREATE INDEX IF NOT EXISTS idx_events_uid ON events (uid);
+
+CREATE TABLE IF NOT EXISTS windows (
+    calendar TEXT NOT NULL,
+    day TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (calendar, day)
+);
+
+-- 반복 일정은 회차 대신 첫 회차 + RRULE 한 행으로 보관 (조회 시 구간 안의 회차만 전개)
+CREATE TABLE IF NOT EXISTS rules (
+    uid TEXT NOT NULL,
+    calendar TEXT NOT NULL,
+    title TEXT NOT NULL,
+    start_time TEXT NOT NULL,
+    end_time TEXT NOT NULL,
+    location TEXT NOT NULL DEFAULT '',
+    notes TEXT NOT NULL DEFAULT '',
+    rrule TEXT NOT NULL,
+    PRIMARY KEY (calendar, uid)
+);
+CREATE INDEX IF NOT EXISTS idx_rules_uid ON rules (uid);
+
+CREATE TABLE IF NOT EXISTS rule_windows (
+    calendar TEXT PRIMARY KEY,
+    fetched_at REAL NOT NULL
+);
+
+-- 변경분 동기화 기준 시각 (이 시각 이후 수정된 일정만 다시 가져옴)
+CREATE TABLE IF NOT EXISTS sync_state (
+    calendar TEXT PRIMARY KEY,
+    stamp TEXT NOT NULL,
+    synced_at REAL NOT NULL
+);
+"""
+
+INSERT_RULE = (
+    "INSERT OR REPLACE INTO rules (uid, calendar, title, start_time, end_time, location, notes, rrule) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+# 반복 일정의 첫 회차는 창 조회에도 잡히므로, 규칙이 있는 UID의 행은 규칙 전개로만 내보냄
+NOT_RULE = "uid NOT IN (SELECT uid FROM rules)"
+
+INSERT_EVENT = (
+    "INSERT INTO events (uid, calendar, title, start_time, end_time, location, notes) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+DROP_SCHEMA = """
+DROP TABLE IF EXISTS events;
+DROP TABLE IF EXISTS windows;
+DROP TABLE IF EXISTS rules;
+DROP TABLE IF EXISTS rule_windows;
+DROP TABLE IF EXISTS sync_state;
+"""
+
+
+def _days(start: date, end: date) -> Iterable[date]:
+    day = start
+    while day <= end:
+        yield day
+        day += timedelta(days=1)
+
+
+class EventStore:
+    """캘린더 일정을 일 단위 구간으로 미러링하는 로컬 저장소
+    
+    조회한 날짜 구간은 (캘린더, 날짜) 단위로 갱신 시각을 기록하며, ttl_seconds가 지난
+    구간이나 한 번도 가져오지 않은 구간만 다시 가져오도록 missing_ranges가 알려줍니다.
+    시간 값은 tz 기준 로컬 시각의 ISO 문자열("YYYY-MM-DDTHH:MM:SS")로 저장하므로
+    문자열 비교가 곧 시간 비교이며, 읽을 때 timezone-aware Event로 복원합니다.
+    
+    반복 일정은 rules 테이블에 규칙 하나로 두고, query/count/find_overlaps가 조회 구간의
+    회차만 생성기로 전개해 일반 일정과 시작 시각 순으로 합칩니다.
+    
+    구간은 시작 날짜 기준으로 채우므로 find_overlaps는 가져온 날짜에 시작한 일정만 봅니다.
+    구간 앞에서 시작해 넘어오는 일정까지 보려면 호출하는 쪽이 앞쪽 날짜도 함께 가져와야 합니다.
+    (CalendarTools는 하루를 더 가져옴)
+    
+    제목·장소·메모의 n-gram 색인은 첫 search 때 만들고, 이후 쓰기마다 증분으로 갱신합니다.
+    
+    변경분 동기화(apply_changes)는 수정된 일정만 UID 단위로 교체하고, 이미 가져온 구간의
+    갱신 시각을 새로 고쳐 구간 전체를 다시 가져오지 않아도 캐시가 최신으로 유지되게 합니다.
+    """
+    
+    def __init__(self, db_path: Optional[Path] = None, ttl_seconds: float = 300, 
+                 tz: Optional[tzinfo] = None):
+        if db_path is None:
+            db_path = Path.home() / ".mac_agent" / "events.db"
+        
+        self.db_path = Path(db_path)
+        if str(db_path) != ":memory:":
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.tz = tz or datetime.now().astimezone().tzinfo
+        
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._init_schema()
+        self._index: Optional[NgramIndex] = None
+    
+    def _init_schema(self):
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            self._conn.executescript(DROP_SCHEMA)
+        self._conn.executescript(SCHEMA)
+        self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    
+    def close(self):
+        """DB 연결을 닫습니다."""
+        with self._lock:
+            self._conn.close()
+    
+    def _iso(self, dt: datetime) -> str:
+        return to_local_naive(dt, self.tz).strftime("%Y-%m-%dT%H:%M:%S")
+    
+    # ---- 구간 관리 ----
+    
+    def missing_ranges(self, calendars: Sequence[str], start: datetime, 
+                       end: datetime) -> List[Tuple[date, date]]:
+        """갱신이 필요한 날짜 구간들을 연속 구간으로 묶어 반환합니다."""
+        first = to_local_naive(start, self.tz).date()
+        last = to_local_naive(end, self.tz).date()
+        if not calendars:
+            return []
+        threshold = time.time() - self.ttl_seconds
+        
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT calendar, day FROM windows WHERE day BETWEEN ? AND ? AND fetched_at >= ? "
+                f"AND calendar IN ({','.join('?' * len(calendars))})",
+                (first.isoformat(), last.isoformat(), threshold, *calendars)
+            ).fetchall()
+        
+        fresh: Dict[str, set] = {}
+        for row in rows:
+            fresh.setdefault(row["day"], set()).add(row["calendar"])
+        
+        ranges: List[Tuple[date, date]] = []
+        required = set(calendars)
+        for day in _days(first, last):
+            if required <= fresh.get(day.isoformat(), set()):
+                continue
+            if ranges and ranges[-1][1] == day - timedelta(days=1):
+                ranges[-1] = (ranges[-1][0], day)
+            else:
+                ranges.append((day, day))
+        return ranges
+    
+    def replace_range(self, calendars: Sequence[str], first: date, last: date, 
+                      events: Iterable[Event]):
+        """구간의 일정을 새로 가져온 결과로 교체하고 구간을 최신으로 표시합니다.
+        
+        스트리밍 파서의 출력을 그대로 받아 읽는 대로 저장합니다.
+        """
+        range_start = f"{first.isoformat()}T00:00:00"
+        range_end = f"{(last + timedelta(days=1)).isoformat()}T00:00:00"
+        now = time.time()
+        placeholders = ','.join('?' * len(calendars))
+        
+        with self._lock, self._conn:
+            range_filter = (f"start_time >= ? AND start_time < ? AND calendar IN ({placeholders})",
+                            (range_start, range_end, *calendars))
+            if self._index is not None:
+                for row in self._conn.execute(f"SELECT id FROM events WHERE {range_filter[0]}", range_filter[1]):
+                    self._index.remove(row["id"])
+                last_id = self._conn.execute("SELECT COALESCE(MAX(id), 0) FROM events").fetchone()[0]
+            
+            self._conn.execute(f"DELETE FROM events WHERE {range_filter[0]}", range_filter[1])
+            self._conn.executemany(INSERT_EVENT, (self._event_row(e) for e in events))
+            
+            if self._index is not None:
+                self._index_rows(self._conn.execute(
+                    "SELECT id, title, location, notes FROM events WHERE id > ?", (last_id,)
+                ))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO windows (calendar, day, fetched_at) VALUES (?, ?, ?)",
+                [(calendar, day.isoformat(), now) for calendar in calendars for day in _days(first, last)]
+            )
+    
+    def invalidate(self, start: Optional[datetime] = None, end: Optional[datetime] = None):
+        """구간(생략 시 전체)의 갱신 기록을 지워 다음 조회 때 다시 가져오게 합니다."""
+        with self._lock, self._conn:
+            if start is None or end is None:
+                self._conn.execute("DELETE FROM windows")
+            else:
+                self._conn.execute(
+                    "DELETE FROM windows WHERE day BETWEEN ? AND ?",
+                    (to_local_naive(start, self.tz).date().isoformat(), 
+                     to_local_naive(end, self.tz).date().isoformat())
+                )
+    
+    # ---- 조회 ----
+    
+    def iter_query(self, start: datetime, end: datetime, keywords: Optional[str] = None, 
+                   calendars: Optional[Sequence[str]] = None) -> Iterator[Event]:
+        """시작 시각이 구간 안에 있는 일정과 반복 일정 회차를 시작 시각 순으로 내보냅니다.
+        
+        일반 일정 행은 잠금 안에서 한 번에 읽고, Event 변환과 반복 일정 회차 전개만 꺼낼 때마다 합니다.
+        """
+        sql = f"SELECT * FROM events WHERE start_time >= ? AND start_time <= ? AND {NOT_RULE}"
+        params: List[Any] = [self._iso(start), self._iso(end)]
+        if keywords:
+            sql += " AND instr(lower(title), lower(?)) > 0"
+            params.append(keywords)
+        if calendars:
+            sql += f" AND calendar IN ({','.join('?' * len(calendars))})"
+            params.extend(calendars)
+        sql += " ORDER BY start_time, id"
+        
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+            rules = self.rules(calendars, keywords, before=end)
+        events = (self._row_to_event(row) for row in rows)
+        if not rules:
+            return events
+        return heapq.merge(events, expand(rules, start, end, self.tz), key=lambda event: event.start)
+    
+    def query(self, start: datetime, end: datetime, keywords: Optional[str] = None, 
+              calendars: Optional[Sequence[str]] = None) -> List[Event]:
+        """시작 시각이 구간 안에 있는 일정(반복 일정 회차 포함)을 시작 시각 순으로 반환합니다."""
+        return list(self.iter_query(start, end, keywords, calendars))
+    
+    def count(self, start: datetime, end: datetime, calendars: Optional[Sequence[str]] = None) -> int:
+        """시작 시각이 구간 안에 있는 일정 수를 반환합니다. (반복 일정 회차는 목록을 만들지 않고 셈)"""
+        sql = f"SELECT COUNT(*) FROM events WHERE start_time >= ? AND start_time <= ? AND {NOT_RULE}"
+        params: List[Any] = [self._iso(start), self._iso(end)]
+        if calendars:
+            sql += f" AND calendar IN ({','.join('?' * len(calendars))})"
+            params.extend(calendars)
+        with self._lock:
+            count = self._conn.execute(sql, params).fetchone()[0]
+            rules = self.rules(calendars, before=end)
+        return count + sum(1 for _ in expand(rules, start, end, self.tz))
+    
+    def find_overlaps(self, start: datetime, end: datetime, 
+                      calendars: Optional[Sequence[str]] = None) -> List[Event]:
+        """[start, end)와 시간이 겹치는 일정(반복 일정 회차 포함)을 반환합니다."""
+        sql = f"SELECT * FROM events WHERE start_time < ? AND end_time > ? AND {NOT_RULE}"
+        params: List[Any] = [self._iso(end), self._iso(start)]
+        if calendars:
+            sql += f" AND calendar IN ({','.join('?' * len(calendars))})"
+            params.extend(calendars)
+        sql += " ORDER BY start_time, id"
+        
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+            rules = self.rules(calendars, before=end)
+        events = [self._row_to_event(row) for row in rows]
+        for rule in rules:
+            events.extend(rule.overlapping(start, end, self.tz))
+        return sorted(events, key=lambda event: event.sort_key) if rules else events
+    
+    # ---- 반복 일정 ----
+    
+    def rules(self, calendars: Optional[Sequence[str]] = None, keywords: Optional[str] = None, 
+              before: Optional[datetime] = None) -> List[RecurringEvent]:
+        """보관된 반복 일정 규칙 (before를 주면 그 전에 시작한 규칙만)"""
+        sql = "SELECT * FROM rules WHERE 1 = 1"
+        params: List[Any] = []
+        if keywords:
+            sql += " AND instr(lower(title), lower(?)) > 0"
+            params.append(keywords)
+        if calendars:
+            sql += f" AND calendar IN ({','.join('?' * len(calendars))})"
+            params.extend(calendars)
+        if before is not None:
+            sql += " AND start_time <= ?"
+            params.append(self._iso(before))
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [RecurringEvent(self._row_to_event(row), row["rrule"]) for row in rows]
+    
+    def stale_rule_calendars(self, calendars: Sequence[str]) -> List[str]:
+        """반복 일정 규칙을 다시 가져와야 하는 캘린더 (한 번도 가져오지 않았거나 ttl_seconds가 지남)"""
+        if not calendars:
+            return []
+        threshold = time.time() - self.ttl_seconds
+        with self._lock:
+            fresh = {
+                row["calendar"] for row in self._conn.execute(
+                    f"SELECT calendar FROM rule_windows WHERE fetched_at >= ? "
+                    f"AND calendar IN ({','.join('?' * len(calendars))})",
+                    (threshold, *calendars)
+                )
+            }
+        return [calendar for calendar in dict.fromkeys(calendars) if calendar not in fresh]
+    
+    def replace_rules(self, calendars: Sequence[str], rules: Iterable[RecurringEvent]):
+        """캘린더들의 반복 일정 규칙을 새로 가져온 결과로 교체합니다."""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"DELETE FROM rules WHERE calendar IN ({','.join('?' * len(calendars))})", tuple(calendars)
+            )
+            self._conn.executemany(INSERT_RULE, (self._event_row(rule.event) + (rule.rule,) for rule in rules))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO rule_windows (calendar, fetched_at) VALUES (?, ?)",
+                [(calendar, now) for calendar in calendars]
+            )
+    
+    def add_rule(self, rule: RecurringEvent):
+        """생성된 반복 일정을 규칙 한 행으로 캐시에 반영합니다."""
+        with self._lock, self._conn:
+            self._conn.execute(INSERT_RULE, self._event_row(rule.event) + (rule.rule,))
+    
+    # ---- 변경분 동기화 ----
+    
+    def sync_stamps(self, calendars: Sequence[str]) -> Dict[str, datetime]:
+        """캘린더별 마지막 동기화 기준 시각 (한 번도 동기화하지 않은 캘린더는 없음)"""
+        if not calendars:
+            return {}
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT calendar, stamp FROM sync_state WHERE calendar IN ({','.join('?' * len(calendars))})",
+                tuple(calendars)
+            ).fetchall()
+        return {row["calendar"]: localize(datetime.fromisoformat(row["stamp"]), self.tz) for row in rows}
+    
+    def set_sync_stamp(self, calendars: Sequence[str], stamp: datetime):
+        """캘린더들의 동기화 기준 시각을 기록합니다."""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO sync_state (calendar, stamp, synced_at) VALUES (?, ?, ?)",
+                [(calendar, self._iso(stamp), now) for calendar in calendars]
+            )
+    
+    def apply_changes(self, calendars: Sequence[str], events: Iterable[Event], 
+                      rules: Iterable[RecurringEvent], first: date, last: date) -> int:
+        """수정된 일정과 반복 일정 규칙을 UID 단위로 교체하고 반영한 건수를 반환합니다.
+        
+        일정이 바뀌지 않은 구간도 최신이므로 [first, last] 안에서 이미 가져온 구간과
+        반복 일정 규칙의 갱신 시각을 지금으로 고칩니다. (가져온 적 없는 날짜는 그대로 비워 둠)
+        """
+        now = time.time()
+        placeholders = ','.join('?' * len(calendars))
+        applied = 0
+        with self._lock, self._conn:
+            for rule in rules:
+                # 반복 일정으로 바뀐 일정의 기존 행은 규칙 전개가 대신하므로 지움
+                self._delete_event_rows(rule.event.uid)
+                self._conn.execute(INSERT_RULE, self._event_row(rule.event) + (rule.rule,))
+                applied += 1
+            for event in events:
+                self._conn.execute("DELETE FROM rules WHERE uid = ?", (event.uid,))
+                self._delete_event_rows(event.uid)
+                cursor = self._conn.execute(INSERT_EVENT, self._event_row(event))
+                if self._index is not None:
+                    self._index.add(cursor.lastrowid, 
+                                    {"title": event.title, "location": event.location, "notes": event.notes})
+                applied += 1
+            self._conn.execute(
+                f"UPDATE windows SET fetched_at = ? WHERE day BETWEEN ? AND ? AND calendar IN ({placeholders})",
+                (now, first.isoformat(), last.isoformat(), *calendars)
+            )
+            self._conn.execute(
+                f"UPDATE rule_windows SET fetched_at = ? WHERE calendar IN ({placeholders})", (now, *calendars)
+            )
+        return applied
+    
+    def prune(self, calendars: Sequence[str], first: date, last: date, live_uids: Iterable[str]) -> int:
+        """[first, last] 구간의 일정과 반복 일정 규칙 중 live_uids에 없는(삭제된) 것을 지우고 건수를 반환합니다."""
+        placeholders = ','.join('?' * len(calendars))
+        range_start = f"{first.isoformat()}T00:00:00"
+        range_end = f"{(last + timedelta(days=1)).isoformat()}T00:00:00"
+        with self._lock, self._conn:
+            self._conn.execute("CREATE TEMP TABLE IF NOT EXISTS live_uids (uid TEXT PRIMARY KEY)")
+            self._conn.execute("DELETE FROM live_uids")
+            self._conn.executemany("INSERT OR IGNORE INTO live_uids (uid) VALUES (?)", ((uid,) for uid in live_uids))
+            gone = (f"calendar IN ({placeholders}) AND uid != '' AND uid NOT IN (SELECT uid FROM live_uids)")
+            event_filter = f"start_time >= ? AND start_time < ? AND {gone}"
+            event_params = (range_start, range_end, *calendars)
+            if self._index is not None:
+                for row in self._conn.execute(f"SELECT id FROM events WHERE {event_filter}", event_params):
+                    self._index.remove(row["id"])
+            removed = self._conn.execute(f"DELETE FROM events WHERE {event_filter}", event_params).rowcount
+            removed += self._conn.execute(f"DELETE FROM rules WHERE {gone}", tuple(calendars)).rowcount
+            self._conn.execute("DELETE FROM live_uids")
+        return removed
+    
+    def _delete_event_rows(self, uid: str):
+        """UID의 일정 행과 색인 항목을 지웁니다. (잠금과 트랜잭션은 호출자가 잡음)"""
+        if self._index is not None:
+            for row in self._conn.execute("SELECT id FROM events WHERE uid = ?", (uid,)):
+                self._index.remove(row["id"])
+        self._conn.execute("DELETE FROM events WHERE uid = ?", (uid,))
+    
+    def _row_to_event(self, row: sqlite3.Row) -> Event:
+        return Event(
+            row["uid"],
+            row["calendar"],
+            row["title"],
+            localize(datetime.fromisoformat(row["start_time"]), self.tz),
+            localize(datetime.fromisoformat(row["end_time"]), self.tz),
+            row["location"],
+            row["notes"]
+        )
+    
+    def _event_row(self, event: Event) -> Tuple:
+        return (event.uid, event.calendar, event.title, self._iso(event.start), self._iso(event.end),
+                event.location, event.notes)
+    
+    # ---- 전문 검색 ----
+    
+    def _index_rows(self, rows: Iterable[sqlite3.Row]):
+        self._index.update(
+            (row["id"], {"title": row["title"], "location": row["location"], "notes": row["notes"]})
+            for row in rows
+        )
+    
+    def _ensure_index(self) -> NgramIndex:
+        """n-gram 색인을 처음 필요할 때 캐시 전체로 만듭니다."""
+        if self._index is None:
+            self._index = NgramIndex()
+            self._index_rows(self._conn.execute("SELECT id, title, location, notes FROM events"))
+        return self._index
+    
+    def search(self, query: str, start: Optional[datetime] = None, end: Optional[datetime] = None, 
+               calendars: Optional[Sequence[str]] = None, limit: int = 20) -> List[Tuple[Event, float]]:
+        """제목·장소·메모에서 검색어와 일치하는 일정을 (일정, 점수) 목록으로 점수 순으로 반환합니다.
+        
+        start/end/calendars를 주면 해당 구간·캘린더의 일정 안에서만 찾습니다.
+        """
+        with self._lock:
+            index = self._ensure_index()
+            candidates = None
+            if start is not None or end is not None or calendars:
+                sql = "SELECT id FROM events WHERE 1 = 1"
+                params: List[Any] = []
+                if start is not None:
+                    sql += " AND start_time >= ?"
+                    params.append(self._iso(start))
+                if end is not None:
+                    sql += " AND start_time <= ?"
+                    params.append(self._iso(end))
+                if calendars:
+                    sql += f" AND calendar IN ({','.join('?' * len(calendars))})"
+                    params.extend(calendars)
+                candidates = {row["id"] for row in self._conn.execute(sql, params)}
+            
+            ranked = index.search(query, limit, candidates)
+            if not ranked:
+                return []
+            rows = self._conn.execute(
+                f"SELECT * FROM events WHERE id IN ({','.join('?' * len(ranked))})",
+                [doc_id for doc_id, _ in ranked]
+            ).fetchall()
+        by_id = {row["id"]: row for row in rows}
+        return [(self._row_to_event(by_id[doc_id]), score) for doc_id, score in ranked if doc_id in by_id]
+    
+    # ---- 쓰기 반영 (write-through) ----
+    
+    def add_event(self, event: Event):
+        """생성된 일정을 캐시에 반영합니다."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(INSERT_EVENT, self._event_row(event))
+            if self._index is not None:
+                self._index.add(cursor.lastrowid, 
+                                {"title": event.title, "location": event.location, "notes": event.notes})
+    
+    def find_by_title(self, title: str, start: Optional[datetime] = None, end: Optional[datetime] = None, 
+                      calendars: Optional[Sequence[str]] = None) -> List[Event]:
+        """제목이 정확히 일치하는 일정을 시작 시각 순으로 반환합니다. (start/end를 주면 그 구간 안에서)
+        
+        (calendar, title, start_time) 인덱스를 타므로 캐시 크기와 관계없이 바로 찾습니다.
+        """
+        sql = "SELECT * FROM events WHERE title = ?"
+        params: List[Any] = [title]
+        if start is not None:
+            sql += " AND start_time >= ?"
+            params.append(self._iso(start))
+        if end is not None:
+            sql += " AND start_time <= ?"
+            params.append(self._iso(end))
+        if calendars:
+            sql += f" AND calendar IN ({','.join('?' * len(calendars))})"
+            params.extend(calendars)
+        sql += " ORDER BY start_time, id"
+        
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [self._row_to_event(row) for row in rows if row["uid"]]
+    
+    def get_by_uid(self, uid: str) -> Optional[Event]:
+        """UID로 일정을 찾습니다. (반복 일정이면 첫 회차)"""
+        with self._lock:
+            row = (self._conn.execute("SELECT * FROM rules WHERE uid = ? LIMIT 1", (uid,)).fetchone()
+                   or self._conn.execute("SELECT * FROM events WHERE uid = ? LIMIT 1", (uid,)).fetchone())
+        return self._row_to_event(row) if row else None
+    
+    def update_by_uid(self, uid: str, title: Optional[str] = None, start: Optional[datetime] = None, 
+                      end: Optional[datetime] = None) -> bool:
+        """UID로 찾은 일정(반복 일정이면 규칙)에 수정 내용을 반영합니다. (캐시에 없으면 False)"""
+        with self._lock, self._conn:
+            found = False
+            for table in ("events", "rules"):
+                if self._conn.execute(f"SELECT 1 FROM {table} WHERE uid = ? LIMIT 1", (uid,)).fetchone() is None:
+                    continue
+                found = True
+                if title:
+                    self._conn.execute(f"UPDATE {table} SET title = ? WHERE uid = ?", (title, uid))
+                if start is not None and end is not None:
+                    self._conn.execute(
+                        f"UPDATE {table} SET start_time = ?, end_time = ? WHERE uid = ?",
+                        (self._iso(start), self._iso(end), uid)
+                    )
+            if self._index is not None and title:
+                self._index_rows(self._conn.execute(
+                    "SELECT id, title, location, notes FROM events WHERE uid = ?", (uid,)
+                ))
+            return found
+    
+    def delete_by_uid(self, uid: str) -> bool:
+        """UID로 찾은 일정(반복 일정이면 규칙과 모든 회차)을 캐시에서 삭제합니다. (캐시에 없으면 False)"""
+        with self._lock, self._conn:
+            ids = [row["id"] for row in self._conn.execute("SELECT id FROM events WHERE uid = ?", (uid,))]
+            deleted_rules = self._conn.execute("DELETE FROM rules WHERE uid = ?", (uid,)).rowcount
+            if not ids:
+                return deleted_rules > 0
+            self._conn.execute("DELETE FROM events WHERE uid = ?", (uid,))
+            if self._index is not None:
+                for event_id in ids:
+                    self._index.remove(event_id)
+            return True
@@ -0,0 +1,52 @@
+"""
+캘린더 목록 캐시
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import List, Optional
+
+
+class CalendarCatalog:
+    """Calendar 앱에 있는 캘린더 이름 목록을 TTL과 함께 디스크에 보관합니다.
+    
+    목록 조회에도 osascript 실행이 한 번 필요하므로, 명령마다 새로 뜨는 CLI 프로세스들이
+    ttl_seconds 동안 같은 목록을 공유합니다. 파일이 없거나 깨졌으면 없는 것으로 취급합니다.
+    """
+    
+    def __init__(self, path: Optional[Path] = None, ttl_seconds: float = 86400):
+        if path is None:
+            path = Path.home() / ".mac_agent" / "calendars.json"
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+    
+    def load(self) -> Optional[List[str]]:
+        """유효한 캘린더 목록 (없거나 만료되었으면 None)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if time.time() - float(data["fetched_at"]) > self.ttl_seconds:
+                return None
+            return [str(name) for name in data["calendars"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    def save(self, calendars: List[str]):
+        """캘린더 목록을 기록합니다. (임시 파일에 쓴 뒤 교체하므로 동시에 읽어도 깨지지 않음)"""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({"fetched_at": time.time(), "calendars": calendars}, f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            print(f"캘린더 목록 저장 중 오류: {str(e)}")
+    
+    def invalidate(self):
+        """기록된 목록을 지워 다음 조회 때 다시 가져오게 합니다."""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
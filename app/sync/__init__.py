@@ -0,0 +1,7 @@
+"""
+캘린더 변경분 동기화 모듈
+"""
+
+from .engine import SyncEngine
+
+__all__ = ['SyncEngine']
@@ -0,0 +1,53 @@
+"""
+변경분 동기화 루프
+
+마지막 동기화 이후 수정된 일정만 주기적으로 가져와 로컬 캐시(EventStore)에 반영합니다.
+캐시 구간이 계속 최신으로 유지되므로 에이전트의 조회는 AppleScript를 거의 거치지 않고
+캐시에서 바로 처리됩니다. 수정 시각으로는 삭제를 알 수 없으므로 reconcile_every번마다
+구간의 UID 목록과 비교해 삭제된 일정을 정리합니다.
+"""
+
+import asyncio
+from typing import Any, Callable, Dict, Optional
+
+try:
+    # 전역 설치된 경우
+    from app.calendar_tools import AsyncCalendarTools
+    from app.config import SYNC_INTERVAL, SYNC_PAST_DAYS, SYNC_FUTURE_DAYS, SYNC_RECONCILE_EVERY
+except ImportError:
+    # 로컬 실행인 경우
+    from calendar_tools import AsyncCalendarTools
+    from config import SYNC_INTERVAL, SYNC_PAST_DAYS, SYNC_FUTURE_DAYS, SYNC_RECONCILE_EVERY
+
+
+class SyncEngine:
+    """interval초마다 변경분 동기화를 실행하는 루프"""
+    
+    def __init__(self, tools: AsyncCalendarTools, interval: float = SYNC_INTERVAL, 
+                 reconcile_every: int = SYNC_RECONCILE_EVERY, past_days: int = SYNC_PAST_DAYS, 
+                 future_days: int = SYNC_FUTURE_DAYS):
+        self.tools = tools
+        self.interval = max(1.0, interval)
+        self.reconcile_every = max(1, reconcile_every)
+        self.past_days = past_days
+        self.future_days = future_days
+        self.runs = 0
+    
+    async def sync_once(self) -> Dict[str, Any]:
+        """변경분을 한 번 동기화합니다. (첫 실행과 reconcile_every번째마다 삭제도 확인)"""
+        reconcile = self.runs % self.reconcile_every == 0
+        self.runs += 1
+        return await self.tools.sync_changes(reconcile, self.past_days, self.future_days)
+    
+    async def run(self, stop: Optional[asyncio.Event] = None, 
+                  on_sync: Optional[Callable[[Dict[str, Any]], None]] = None):
+        """stop이 설정되거나 작업이 취소될 때까지 동기화를 반복합니다."""
+        stop = stop or asyncio.Event()
+        while not stop.is_set():
+            result = await self.sync_once()
+            if on_sync:
+                on_sync(result)
+            try:
+                await asyncio.wait_for(stop.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,12 @@
+"""
+날짜/시간 표현 해석 모듈
+"""
+
+from .expressions import (
+    TemporalRange, DAY_PARTS, resolve, parse_duration, split_day_part, normalize_expression, cache_info, cache_clear
+)
+
+__all__ = [
+    'TemporalRange', 'DAY_PARTS', 'resolve', 'parse_duration', 'split_day_part', 'normalize_expression',
+    'cache_info', 'cache_clear'
+]
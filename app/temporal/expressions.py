@@ -0,0 +1,385 @@
+"""
+한국어 날짜/시간 표현 해석기
+
+"6월 10일 오후 3시", "내일 9:30", "다음 주 화요일", "이번 달 말", "3일 후 2시부터 1시간 반" 같은
+표현과 "이번 주", "다음 달", "6월 둘째 주" 같은 기간 표현을 기준 날짜에 대한 정확한
+[start, end] 구간으로 바꿉니다. 문법은 모듈 로드 시 한 번만
+컴파일하고, 결과는 (정규화된 표현, 기준 날짜) 키로 LRU 캐시에 보관합니다.
+"30분 후", "1시간 뒤"처럼 현재 시각에 대한 표현은 기준 시각에서 바로 계산하며 캐시하지 않습니다.
+"""
+
+import calendar
+import re
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import Optional, Tuple, Union
+
+from dateutil import parser as dateutil_parser
+
+
+CACHE_SIZE = 2048
+
+WEEKDAYS = "월화수목금토일"
+
+# 이번/다음/지난 등 상대 지시어 → 단위(주·달) 오프셋
+RELATIVE_OFFSETS = {"지지난": -2, "지난": -1, "저번": -1, "이번": 0, "금": 0, "다음": 1, "담": 1, "다다음": 2}
+
+# 날짜 없이 쓰는 상대 일자
+RELATIVE_DAYS = {"그저께": -2, "그제": -2, "어제": -1, "오늘": 0, "금일": 0, "내일": 1, "명일": 1, "모레": 2, "글피": 3}
+
+# 올해/내년 등 상대 연도 → 연도 오프셋
+RELATIVE_YEARS = {"재작년": -2, "작년": -1, "지난해": -1, "올해": 0, "금년": 0, "내년": 1, "내후년": 2}
+
+_RELATIVE = "|".join(sorted(RELATIVE_OFFSETS, key=len, reverse=True))
+_RELATIVE_YEAR = "|".join(sorted(RELATIVE_YEARS, key=len, reverse=True))
+# 월 앞에 붙는 연도 ("2027년 3월", "내년 3월")
+_YEAR_PREFIX = rf"(?:(?P<y>\d{{4}})\s*년|(?P<ry>{_RELATIVE_YEAR}))\s*"
+
+_ISO_DATE = re.compile(r"(?<!\d)(?P<y>\d{4})[-./](?P<m>\d{1,2})[-./](?P<d>\d{1,2})(?!\d)")
+_KO_DATE = re.compile(rf"(?:{_YEAR_PREFIX})?(?P<m>\d{{1,2}})\s*월\s*(?P<d>\d{{1,2}})\s*일")
+_SLASH_DATE = re.compile(r"(?<![\d:/])(?P<m>\d{1,2})/(?P<d>\d{1,2})(?![\d/])")
+_MONTH_PART = re.compile(rf"(?P<which>{_RELATIVE})\s*달\s*(?P<part>말|초|마지막\s*날|첫\s*날)")
+_WEEKDAY = re.compile(rf"(?:(?P<which>{_RELATIVE})\s*주\s*)?(?P<wd>[{WEEKDAYS}])요일")
+_DAY_OFFSET = re.compile(r"(?P<n>\d+)\s*일\s*(?P<dir>후|뒤|전)")
+_RELATIVE_DAY = re.compile("|".join(sorted(RELATIVE_DAYS, key=len, reverse=True)))
+_DAY_ONLY = re.compile(
+    rf"(?:(?P<which>{_RELATIVE})\s*달\s*)?(?<![\d월])(?P<d>\d{{1,2}})\s*일(?!\s*(?:후|뒤|전|간|동안))"
+)
+
+# 기간 표현 (날짜 하나로 해석되지 않을 때만 사용)
+ORDINALS = {"첫": 1, "첫번": 1, "둘": 2, "두번": 2, "셋": 3, "세번": 3, "넷": 4, "네번": 4, "다섯": 5, "다섯번": 5}
+_ORDINAL = "|".join(sorted(ORDINALS, key=len, reverse=True))
+_WEEK_OF_MONTH = re.compile(
+    rf"(?:{_YEAR_PREFIX})?(?:(?P<m>\d{{1,2}})\s*월|(?P<which>{_RELATIVE})\s*달)\s*"
+    rf"(?:(?P<ord>{_ORDINAL})\s*째|(?P<n>\d)\s*(?:번째|째)|(?P<last>마지막))\s*주"
+)
+_WEEK = re.compile(rf"(?:(?P<which>{_RELATIVE})\s*)?주\s*(?P<weekend>말)|(?P<week>{_RELATIVE})\s*주")
+_MONTH = re.compile(rf"(?:{_YEAR_PREFIX})?(?P<m>\d{{1,2}})\s*월|(?P<which>{_RELATIVE})\s*달")
+_YEAR = re.compile(rf"{_RELATIVE_YEAR}|(?P<y>\d{{4}})\s*년")
+_NEXT_DAYS = re.compile(r"(?:앞으로|향후)\s*(?P<n>\d+)\s*일")
+
+_TIME = re.compile(
+    r"(?P<named>정오|자정)"
+    r"|(?:(?P<period>오전|오후|아침|낮|저녁|밤|새벽)\s*)?"
+    r"(?:(?P<ch>\d{1,2}):(?P<cm>\d{2})(?::\d{2})?"
+    r"|(?P<h>\d{1,2})\s*시(?!간)(?:\s*(?:(?P<m>\d{1,2})\s*분|(?P<half>반)))?)"
+)
+_DURATION = re.compile(
+    r"(?P<h>\d+(?:\.\d+)?)\s*시간(?:\s*(?P<half>반)|\s*(?P<hm>\d+)\s*분)?"
+    r"|(?P<m>\d+)\s*분"
+)
+_AFTERNOON = ("오후", "저녁", "밤")
+_TIME_OFFSET = re.compile(
+    r"(?:(?P<h>\d+)\s*시간(?:\s*(?P<half>반)|\s*(?P<hm>\d+)\s*분)?|(?P<m>\d+)\s*분)\s*(?:후|뒤)"
+)
+
+# 시각 없이 쓰는 하루 중 때 ("목요일 오후", "내일 저녁") → [시작, 끝) 시각
+DAY_PARTS = {
+    "새벽": (time(0), time(6)),
+    "아침": (time(6), time(9)),
+    "오전": (time(9), time(12)),
+    "점심": (time(12), time(13)),
+    "낮": (time(12), time(17)),
+    "오후": (time(12), time(18)),
+    "저녁": (time(18), time(22)),
+    "밤": (time(20), time(23, 59, 59))
+}
+_DAY_PART = re.compile(rf"(?P<part>{'|'.join(DAY_PARTS)})(?!\s*\d)")
+
+
+@dataclass(frozen=True)
+class TemporalRange:
+    """해석된 시간 구간 (캘린더 시간대 기준 naive datetime)
+    
+    시간이 없는 표현은 그날 00:00:00 ~ 23:59:59, 시간만 있는 표현은 start == end이며
+    "부터 ~까지"나 지속시간이 함께 있으면 end가 그만큼 뒤로 잡힙니다.
+    """
+    start: datetime
+    end: datetime
+    has_time: bool = False
+    
+    @property
+    def duration(self) -> Optional[timedelta]:
+        """시간이 지정된 구간의 길이 (지정되지 않았으면 None)"""
+        if not self.has_time or self.end == self.start:
+            return None
+        return self.end - self.start
+
+
+def _take(pattern: "re.Pattern", text: str) -> Tuple[Optional["re.Match"], str]:
+    """패턴과 처음 일치하는 부분을 찾고, 다음 단계에서 다시 쓰이지 않도록 공백으로 지운 문자열을 함께 반환합니다."""
+    match = pattern.search(text)
+    if not match:
+        return None, text
+    return match, text[:match.start()] + " " * (match.end() - match.start()) + text[match.end():]
+
+
+def _shift_months(reference: date, months: int) -> Tuple[int, int]:
+    """기준 날짜의 달에서 months만큼 이동한 (연도, 월)"""
+    index = reference.year * 12 + reference.month - 1 + months
+    return index // 12, index % 12 + 1
+
+
+def _year_of(match: "re.Match", reference: date) -> int:
+    """일치 결과의 연도 ("2027년", "내년", 없으면 기준 연도)"""
+    if match["y"]:
+        return int(match["y"])
+    if match["ry"]:
+        return reference.year + RELATIVE_YEARS[match["ry"]]
+    return reference.year
+
+
+def _match_date(text: str, reference: date) -> Tuple[Optional[date], str]:
+    """표현에서 날짜 부분을 하나 찾아 해석합니다."""
+    match, rest = _take(_ISO_DATE, text)
+    if match:
+        return date(int(match["y"]), int(match["m"]), int(match["d"])), rest
+    
+    match, rest = _take(_KO_DATE, text)
+    if match:
+        return date(_year_of(match, reference), int(match["m"]), int(match["d"])), rest
+    
+    match, rest = _take(_SLASH_DATE, text)
+    if match:
+        return date(reference.year, int(match["m"]), int(match["d"])), rest
+    
+    match, rest = _take(_MONTH_PART, text)
+    if match:
+        year, month = _shift_months(reference, RELATIVE_OFFSETS[match["which"]])
+        if match["part"] == "말" or match["part"].startswith("마지막"):
+            return date(year, month, calendar.monthrange(year, month)[1]), rest
+        return date(year, month, 1), rest
+    
+    match, rest = _take(_WEEKDAY, text)
+    if match:
+        weekday = WEEKDAYS.index(match["wd"])
+        if match["which"] is None:
+            # "금요일"처럼 주를 지정하지 않으면 오늘 이후 가장 가까운 그 요일
+            return reference + timedelta(days=(weekday - reference.weekday()) % 7), rest
+        monday = reference - timedelta(days=reference.weekday())
+        return monday + timedelta(weeks=RELATIVE_OFFSETS[match["which"]], days=weekday), rest
+    
+    match, rest = _take(_DAY_OFFSET, text)
+    if match:
+        days = int(match["n"])
+        return reference + timedelta(days=-days if match["dir"] == "전" else days), rest
+    
+    match, rest = _take(_RELATIVE_DAY, text)
+    if match:
+        return reference + timedelta(days=RELATIVE_DAYS[match.group()]), rest
+    
+    match, rest = _take(_DAY_ONLY, text)
+    if match and not _NEXT_DAYS.search(text):
+        # "다음 달 15일"처럼 달을 지정하면 그 달의 날짜
+        year, month = _shift_months(reference, RELATIVE_OFFSETS[match["which"]] if match["which"] else 0)
+        return date(year, month, int(match["d"])), rest
+    
+    return None, text
+
+
+def _month_bounds(year: int, month: int) -> Tuple[date, date]:
+    return date(year, month, 1), date(year, month, calendar.monthrange(year, month)[1])
+
+
+def _match_span(text: str, reference: date) -> Optional[Tuple[date, date]]:
+    """주·달·해 단위 기간 표현을 (첫날, 마지막 날)로 해석합니다. 주는 월요일에 시작합니다."""
+    match = _WEEK_OF_MONTH.search(text)
+    if match:
+        if match["m"]:
+            year, month = _year_of(match, reference), int(match["m"])
+        else:
+            year, month = _shift_months(reference, RELATIVE_OFFSETS[match["which"]])
+        first, last = _month_bounds(year, month)
+        if match["last"]:
+            monday = last - timedelta(days=last.weekday())
+        else:
+            # 1일이 들어 있는 주가 첫째 주
+            index = ORDINALS[match["ord"]] if match["ord"] else int(match["n"])
+            monday = first - timedelta(days=first.weekday()) + timedelta(weeks=index - 1)
+        if monday > last:
+            raise ValueError(f"{month}월에는 해당 주가 없습니다.")
+        # 달 경계를 넘는 주는 그 달 안쪽만 사용
+        return max(monday, first), min(monday + timedelta(days=6), last)
+
+    match = _WEEK.search(text)
+    if match:
+        monday = reference - timedelta(days=reference.weekday())
+        if match["weekend"]:
+            monday += timedelta(weeks=RELATIVE_OFFSETS[match["which"]] if match["which"] else 0)
+            return monday + timedelta(days=5), monday + timedelta(days=6)
+        monday += timedelta(weeks=RELATIVE_OFFSETS[match["week"]])
+        return monday, monday + timedelta(days=6)
+
+    match = _NEXT_DAYS.search(text)
+    if match:
+        return reference, reference + timedelta(days=max(int(match["n"]) - 1, 0))
+
+    match = _MONTH.search(text)
+    if match:
+        if match["m"]:
+            return _month_bounds(_year_of(match, reference), int(match["m"]))
+        return _month_bounds(*_shift_months(reference, RELATIVE_OFFSETS[match["which"]]))
+
+    match = _YEAR.search(text)
+    if match:
+        year = int(match["y"]) if match["y"] else reference.year + RELATIVE_YEARS[match.group()]
+        return date(year, 1, 1), date(year, 12, 31)
+    return None
+
+
+def _time_of(match: "re.Match") -> Tuple[time, Optional[str]]:
+    """시간 일치 결과를 (시각, 오전/오후 구분)으로 변환합니다."""
+    if match["named"]:
+        return (time(12) if match["named"] == "정오" else time(0)), match["named"]
+    
+    period = match["period"]
+    if match["ch"]:
+        hour, minute = int(match["ch"]), int(match["cm"])
+    else:
+        hour = int(match["h"])
+        minute = 30 if match["half"] else int(match["m"] or 0)
+    
+    if hour == 12 and period in ("오전", "새벽", "아침", "밤"):
+        hour = 0
+    elif hour < 12 and (period in _AFTERNOON or (period == "낮" and hour < 6)):
+        hour += 12
+    return time(hour % 24, minute), period
+
+
+def _combine(day: date, clock: Tuple[time, Optional[str]]) -> datetime:
+    """날짜와 시각을 합칩니다. "밤 12시"는 그날이 끝나는 때이므로 다음 날 00:00입니다."""
+    value, period = clock
+    moment = datetime.combine(day, value)
+    if period == "밤" and value.hour == 0:
+        moment += timedelta(days=1)
+    return moment
+
+
+def _minutes_of(match: "re.Match") -> timedelta:
+    """지속시간 일치 결과("1시간 반", "90분")를 timedelta로 변환합니다."""
+    if match["h"]:
+        minutes = float(match["h"]) * 60 + (30 if match["half"] else int(match["hm"] or 0))
+    else:
+        minutes = int(match["m"])
+    return timedelta(minutes=minutes)
+
+
+def _match_duration(text: str) -> Optional[timedelta]:
+    match = _DURATION.search(text)
+    return _minutes_of(match) if match else None
+
+
+def _resolve_offset(text: str, now: datetime) -> Optional[TemporalRange]:
+    """"30분 후", "1시간 반 뒤"를 기준 시각에서 계산합니다. (해당 표현이 없으면 None)"""
+    match, rest = _take(_TIME_OFFSET, text)
+    if not match:
+        return None
+    start = now.replace(second=0, microsecond=0) + _minutes_of(match)
+    duration = _match_duration(rest)
+    return TemporalRange(start, start + duration if duration else start, has_time=True)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _resolve(text: str, reference: date) -> TemporalRange:
+    try:
+        day, rest = _match_date(text, reference)
+        
+        times = []
+        for match in _TIME.finditer(rest):
+            times.append(_time_of(match))
+            rest = rest[:match.start()] + " " * (match.end() - match.start()) + rest[match.end():]
+            if len(times) == 2:
+                break
+        duration = _match_duration(rest)
+        span = _match_span(rest, reference) if day is None else None
+    except ValueError:
+        # 2월 30일처럼 존재하지 않는 날짜
+        raise ValueError(f"날짜 파싱 실패: {text}")
+    
+    if span and not times:
+        return TemporalRange(datetime.combine(span[0], time.min),
+                             datetime.combine(span[1], time.min).replace(hour=23, minute=59, second=59))
+    if day is None and not times:
+        return _fallback(text, reference)
+    day = day or reference
+    
+    if not times:
+        start = datetime.combine(day, time.min)
+        return TemporalRange(start, start.replace(hour=23, minute=59, second=59))
+    
+    start = _combine(day, times[0])
+    end = start
+    if len(times) == 2:
+        end_period = times[1][1]
+        end = _combine(day, times[1])
+        if end_period is None and end <= start and end + timedelta(hours=12) > start:
+            # "오후 3시부터 5시까지"처럼 뒤쪽 시각의 오전/오후가 생략된 경우
+            end += timedelta(hours=12)
+        if end <= start:
+            end += timedelta(days=1)
+    elif duration:
+        end = start + duration
+    return TemporalRange(start, end, has_time=True)
+
+
+def _fallback(text: str, reference: date) -> TemporalRange:
+    """문법에 없는 형식은 dateutil로 해석합니다. (예: "2025-06-10T14:00", "June 10")"""
+    try:
+        parsed = dateutil_parser.parse(text, default=datetime.combine(reference, time.min))
+    except (ValueError, OverflowError):
+        raise ValueError(f"날짜 파싱 실패: {text}")
+    if parsed.tzinfo is not None:
+        parsed = parsed.replace(tzinfo=None)
+    if parsed.time() == time.min:
+        return TemporalRange(parsed, parsed.replace(hour=23, minute=59, second=59))
+    return TemporalRange(parsed, parsed, has_time=True)
+
+
+def normalize_expression(expression: str) -> str:
+    """캐시 키로 쓸 수 있도록 공백을 정리합니다."""
+    return " ".join(expression.split())
+
+
+def resolve(expression: str, reference: Optional[Union[date, datetime]] = None) -> TemporalRange:
+    """한국어 날짜/시간 표현을 기준 날짜(기본: 오늘)에 대한 구간으로 해석합니다.
+    
+    기준으로 datetime을 주면 "30분 후" 같은 표현은 그 시각에서, 날짜만 주면 그날의
+    현재 시각에서 계산합니다. 해석할 수 없으면 ValueError를 발생시킵니다.
+    """
+    text = normalize_expression(expression)
+    if isinstance(reference, datetime):
+        now, reference = reference, reference.date()
+    else:
+        reference = reference or date.today()
+        now = datetime.combine(reference, datetime.now().time())
+    return _resolve_offset(text, now) or _resolve(text, reference)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_duration(expression: str) -> Optional[timedelta]:
+    """"1시간 반", "90분", "2시간 15분" 같은 지속시간 표현을 해석합니다. (없으면 None)"""
+    return _match_duration(expression)
+
+
+def split_day_part(expression: str) -> Tuple[Optional[Tuple[time, time]], str]:
+    """시각 없이 쓴 하루 중 때를 떼어 ((시작, 끝), 나머지 표현)으로 반환합니다.
+    
+    "목요일 오후" → ((12:00, 18:00), "목요일")이며, "오후 3시"처럼 시각이 붙은 경우는 떼지 않습니다.
+    """
+    match = _DAY_PART.search(expression)
+    if not match:
+        return None, expression
+    rest = expression[:match.start()] + expression[match.end():]
+    return DAY_PARTS[match["part"]], normalize_expression(rest)
+
+
+def cache_info():
+    """구간 해석 캐시 통계 (functools.lru_cache 형식)"""
+    return _resolve.cache_info()
+
+
+def cache_clear():
+    """구간 해석 캐시를 비웁니다."""
+    _resolve.cache_clear()
+    parse_duration.cache_clear()
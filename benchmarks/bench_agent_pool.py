@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+에이전트 팀 풀 턴 준비 비용 벤치마크 (가짜 모델 클라이언트)
+
+한 세션에서 요청을 여러 턴 처리하며, 팀을 매번 만드는 경우(--pool-size 0과 같음)와 세션·역할별로
+재사용하는 경우의 턴 준비 시간(에이전트·팀 생성 + 초기화), 턴 전체 시간, 할당 메모리를 비교합니다.
+재사용한 팀이 이전 턴의 메시지를 모델에 넘기지 않는지(초기화 확인)도 함께 검사합니다.
+
+    python benchmarks/bench_agent_pool.py
+    python benchmarks/bench_agent_pool.py --turns 200 --mode router --gap-ms 0
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# bench_router_mode가 환경 변수(메모리 백엔드, 캐시 끔)와 가짜 모델을 준비함
+from bench_router_mode import REQUESTS, ScriptedModelClient
+
+from autogen_core.models import SystemMessage
+
+from agent import CalendarManagerAgent
+from memory import MemoryManager
+from session import SessionManager, SessionStorage
+
+
+async def run_turns(mode: str, pool_size: int, turns: int, gap: float):
+    """턴을 처리하고 (풀 통계, 턴당 시간 ms, 턴당 할당 KiB, 초기화 위반 수)를 돌려줍니다."""
+    client = ScriptedModelClient(0)
+    agent = CalendarManagerAgent(mode=mode, model_client=client)
+    agent.agent_pool.max_entries = pool_size
+    agent.intent_rules.threshold = 2.0  # 의도 분류 팀도 매 턴 사용
+    agent.session_manager = SessionManager(SessionStorage(Path(tempfile.mkdtemp())))
+    agent.memory_manager = MemoryManager(agent.session_manager.storage)
+    session_id = agent.session_manager.create_session()
+    
+    leaks = 0
+    elapsed = 0.0
+    try:
+        tracemalloc.start()
+        for turn in range(turns):
+            text = REQUESTS[turn % len(REQUESTS)][0]
+            calls = len(client.create_calls)
+            began = time.perf_counter()
+            await agent.process_user_input(text, session_id)
+            elapsed += time.perf_counter() - began
+            await asyncio.sleep(gap)  # 사용자가 다음 요청을 입력하는 사이
+            # 턴의 첫 모델 호출에는 이번 요청 하나만 있어야 함 (세션 메모리는 SystemMessage)
+            first = [m for m in client.create_calls[calls]["messages"] if not isinstance(m, SystemMessage)]
+            if len(first) != 1:
+                leaks += 1
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return agent.agent_pool.stats, elapsed / turns * 1000, peak / 1024, leaks
+    finally:
+        await agent.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--turns", type=int, default=100)
+    parser.add_argument("--mode", choices=["pipeline", "router"], default="pipeline")
+    parser.add_argument("--pool-size", type=int, default=32, help="재사용할 팀 수")
+    parser.add_argument("--gap-ms", type=float, default=20.0, help="턴 사이 간격 (ms, 턴 시간에는 포함하지 않음)")
+    args = parser.parse_args()
+    
+    print(f"턴 {args.turns}개 | 모드 {args.mode} | 모델 지연 0 ms | 턴 간격 {args.gap_ms:g} ms")
+    failed = False
+    for name, size in (("매번 생성", 0), ("재사용", args.pool_size)):
+        stats, turn_ms, peak_kib, leaks = asyncio.run(run_turns(args.mode, size, args.turns, args.gap_ms / 1000))
+        print(f"{name:<8} | 팀 생성 {stats.created:4d}회, 재사용 {stats.reused:4d}회 | "
+              f"준비 {stats.as_dict()['setup_average_ms']:7.3f} ms/턴 | 턴 {turn_ms:7.2f} ms | "
+              f"최대 할당 {peak_kib:8.0f} KiB | 이전 턴 메시지 노출 {leaks}회")
+        failed = failed or leaks > 0
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+CalendarTools 도구 계층 벤치마크 (메모리 Calendar 백엔드)
+
+합성 일정 N개를 채운 MemoryCalendar로 조회·검색·빈 시간 찾기·일괄 생성/수정/삭제를 실행해
+macOS 없이 도구 계층(스크립트 인자 생성, 레코드 파싱, 캐시)의 비용을 잽니다.
+--budget-ms를 주면 평균이 그보다 느린 작업이 있을 때 종료 코드 1로 끝나므로 CI의 성능 회귀 확인에 쓸 수 있습니다.
+
+    python benchmarks/bench_calendar_tools.py --events 20000 --runs 20
+    python benchmarks/bench_calendar_tools.py --events 50000 --cache --budget-ms 50
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
+# 기본 캐시(~/.mac_agent)를 건드리지 않도록 끄고 임시 디렉터리의 캐시만 사용
+os.environ["MAC_AGENT_EVENT_CACHE"] = "0"
+
+from backends import MemoryCalendar, MemoryCalendarBackend  # noqa: E402
+from calendar_tools import CalendarTools  # noqa: E402
+from store import CalendarCatalog, EventStore  # noqa: E402
+
+CALENDARS = ["캘린더", "Work", "Home"]
+
+
+def timed(func, runs: int) -> float:
+    """호출당 평균 시간 (ms)"""
+    began = time.perf_counter()
+    for _ in range(runs):
+        func()
+    return (time.perf_counter() - began) / runs * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--batch", type=int, default=20, help="일괄 생성/수정/삭제 항목 수")
+    parser.add_argument("--recurring", type=float, default=0.01, help="반복 일정 비율")
+    parser.add_argument("--cache", action="store_true", help="로컬 일정 캐시(EventStore)를 켜고 측정")
+    parser.add_argument("--budget-ms", type=float, help="작업당 평균 허용 시간 (초과 시 종료 코드 1)")
+    args = parser.parse_args()
+    
+    calendar = MemoryCalendar(CALENDARS)
+    began = time.perf_counter()
+    calendar.seed(args.events, recurring_ratio=args.recurring)
+    seed_ms = (time.perf_counter() - began) * 1000
+    backend = MemoryCalendarBackend(calendar)
+    
+    directory = tempfile.mkdtemp()
+    store = EventStore(os.path.join(directory, "events.db"), tz=calendar.timezone) if args.cache else None
+    tools = CalendarTools(backend=backend, store=store, calendars=CALENDARS,
+                          catalog=CalendarCatalog(os.path.join(directory, "calendars.json")))
+    
+    titles = [f"벤치마크 일정 {i}" for i in range(args.batch)]
+    
+    def create_batch():
+        tools.create_events([{"date_str": "내일", "title": title, "time_str": "오전 7시"} for title in titles])
+    
+    def update_batch():
+        tools.update_events([{"original_title": title, "new_time_str": "오전 6시"} for title in titles])
+    
+    def delete_batch():
+        tools.delete_events([{"title": title} for title in titles])
+    
+    def write_cycle():
+        create_batch()
+        update_batch()
+        delete_batch()
+    
+    operations = [
+        ("하루 조회", lambda: tools.get_events("내일")),
+        ("한 달 조회", lambda: tools.get_events(start="다음 달")),
+        ("한 달 제목 검색", lambda: tools.get_events(start="다음 달", keywords="코드 리뷰")),
+        ("일주일 빈 시간 찾기", lambda: tools.find_free_slots("다음 주", 60)),
+        (f"생성·수정·삭제 {args.batch}건씩", write_cycle),
+    ]
+    
+    print(f"일정 {len(calendar)}개 (캘린더 {len(CALENDARS)}개) | 채우기: {seed_ms:.1f} ms | 캐시: {'켬' if store else '끔'}")
+    slow = []
+    for name, operation in operations:
+        operation()  # 캐시·템플릿 준비
+        elapsed = timed(operation, args.runs)
+        print(f"{name:<20} | {elapsed:8.2f} ms")
+        if args.budget_ms is not None and elapsed > args.budget_ms:
+            slow.append(name)
+    
+    print("템플릿 실행 횟수: " + ", ".join(f"{template_id} {count}" for template_id, count in sorted(backend.calls.items())))
+    if slow:
+        print(f"허용 시간({args.budget_ms} ms) 초과: {', '.join(slow)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+get_events 결과 파싱 비용 벤치마크
+
+기존 방식(전체 문자열을 ', '와 '|||'로 분리)과 RS/US 스트리밍 파서를 비교합니다.
+
+    python benchmarks/bench_event_parser.py --events 10000 50000
+"""
+
+import argparse
+import sys
+import time
+from datetime import timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
+
+from events.wire import FIELD_SEPARATOR, RECORD_SEPARATOR, parse_events  # noqa: E402
+
+
+KST = timezone(timedelta(hours=9))
+
+
+def build_payload(count: int) -> str:
+    """count개의 일정 레코드로 된 전송 문자열을 만듭니다."""
+    records = []
+    for i in range(count):
+        day = 1 + i % 28
+        hour = 8 + i % 10
+        records.append(FIELD_SEPARATOR.join([
+            "캘린더",
+            f"UID-{i}",
+            f"팀 회의 {i}, 주간 점검",
+            f"2025-07-{day:02d}T{hour:02d}:00:00",
+            f"2025-07-{day:02d}T{hour + 1:02d}:00:00",
+        ]))
+    return RECORD_SEPARATOR.join(records) + "\n"
+
+
+def legacy_parse(payload: str) -> list:
+    """기존 get_events의 split 기반 파싱"""
+    events = []
+    for event_str in payload.strip().split(", "):
+        parts = event_str.split("|||")
+        if len(parts) >= 3:
+            events.append({"title": parts[0].strip(), "start_time": parts[1].strip(), "end_time": parts[2].strip()})
+    return events
+
+
+def chunked(payload: str, size: int = 64 * 1024):
+    for i in range(0, len(payload), size):
+        yield payload[i:i + size]
+
+
+def bench(label: str, func, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, nargs="+", default=[10000, 50000])
+    args = parser.parse_args()
+    
+    for count in args.events:
+        payload = build_payload(count)
+        legacy_payload = ", ".join(
+            "|||".join(r.split(FIELD_SEPARATOR)[2:]) for r in payload.strip().split(RECORD_SEPARATOR)
+        )
+        
+        parsed = list(parse_events(chunked(payload), KST))
+        assert len(parsed) == count and parsed[0].title == "팀 회의 0, 주간 점검"
+        legacy_damaged = sum(1 for e in legacy_parse(legacy_payload) if not e["title"].startswith("팀 회의"))
+        
+        legacy = bench("legacy", lambda: legacy_parse(legacy_payload))
+        streaming = bench("stream", lambda: sum(1 for _ in parse_events(chunked(payload), KST)))
+        print(f"{count:>7}개 | 기존 split: {legacy * 1000:7.1f} ms (제목 손상 {legacy_damaged}개) "
+              f"| 스트리밍 파서: {streaming * 1000:7.1f} ms ({streaming / count * 1e6:.2f} µs/개, datetime 포함)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+일정 겹침 확인·빈 시간 계산 벤치마크
+
+합성 일정 N개로 IntervalIndex를 만들고, 1시간 구간 겹침 조회를 전체 선형 탐색과 비교한 뒤
+한 달 구간의 빈 시간 계산(sweep-line) 비용을 잽니다.
+
+    python benchmarks/bench_freebusy.py --events 5000 --queries 2000
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytz
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
+
+from events import Event  # noqa: E402
+from schedule import IntervalIndex, free_slots, merge_busy, parse_working_hours, working_windows  # noqa: E402
+
+
+def synthetic_events(count: int, tz) -> list:
+    """1년에 걸쳐 근무 시간 위주로 흩어진 15분~3시간 일정"""
+    rng = random.Random(42)
+    base = tz.localize(datetime(2025, 1, 1))
+    events = []
+    for i in range(count):
+        start = base + timedelta(days=rng.randrange(365), hours=rng.randrange(8, 19), minutes=rng.choice((0, 15, 30, 45)))
+        events.append(Event(f"bench-{i}", "캘린더", f"일정 {i}", start, start + timedelta(minutes=rng.choice((15, 30, 60, 90, 180)))))
+    return events
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--queries", type=int, default=2000)
+    args = parser.parse_args()
+    
+    tz = pytz.timezone("Asia/Seoul")
+    events = synthetic_events(args.events, tz)
+    rng = random.Random(7)
+    probes = [tz.localize(datetime(2025, 1, 1)) + timedelta(minutes=rng.randrange(365 * 24 * 60)) for _ in range(args.queries)]
+    
+    began = time.perf_counter()
+    index = IntervalIndex(events)
+    build_ms = (time.perf_counter() - began) * 1000
+    
+    began = time.perf_counter()
+    for probe in probes:
+        index.overlapping(probe, probe + timedelta(hours=1))
+    indexed = (time.perf_counter() - began) / args.queries * 1e6
+    
+    began = time.perf_counter()
+    for probe in probes:
+        end = probe + timedelta(hours=1)
+        [event for event in events if event.start < end and event.end > probe]
+    linear = (time.perf_counter() - began) / args.queries * 1e6
+    
+    window_start = tz.localize(datetime(2025, 5, 1))
+    window_end = window_start + timedelta(days=30)
+    began = time.perf_counter()
+    month = index.overlapping(window_start, window_end)
+    busy = merge_busy(month, window_start, window_end)
+    windows = working_windows(window_start, window_end, parse_working_hours("09:00-18:00"), tz)
+    slots = free_slots(busy, windows, timedelta(minutes=60))
+    freebusy_ms = (time.perf_counter() - began) * 1000
+    
+    print(f"일정 {args.events}개 | 색인 생성: {build_ms:.2f} ms")
+    print(f"1시간 겹침 조회 | 색인: {indexed:7.2f} µs | 선형 탐색: {linear:9.2f} µs ({linear / indexed:.0f}배)")
+    print(f"30일 빈 시간 계산 | {freebusy_ms:.2f} ms (일정 {len(month)}개, 빈 시간 {len(slots)}개)")
+
+
+if __name__ == "__main__":
+    main()
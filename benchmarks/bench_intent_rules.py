@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+규칙 기반 의도 분류 빠른 경로 벤치마크
+
+라벨을 붙인 입력 문장으로 규칙 분류기의 적중률(LLM 없이 결정한 비율), 적중한 입력의 정확도,
+한 번 분류에 걸리는 시간을 재고, LLM 분류 한 번의 시간(--llm-ms 또는 --live로 실측)을 곱해
+절약되는 시간을 추정합니다.
+
+    python benchmarks/bench_intent_rules.py
+    python benchmarks/bench_intent_rules.py --threshold 0.9 --llm-ms 1200
+    python benchmarks/bench_intent_rules.py --live 5   # OPENAI_API_KEY 필요
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
+
+from intent import RuleIntentClassifier, parse_examples  # noqa: E402
+
+# 실제 사용 예에 가까운 라벨 문장 (분류 프롬프트 예시와 겹치지 않게 구성)
+CORPUS = [
+    ("오늘 일정 알려줘", "calendar"),
+    ("내일 오후 2시에 치과 예약 추가해줘", "calendar"),
+    ("이번 주 금요일 회의 몇 시야?", "calendar"),
+    ("다음 주 월요일 10시 팀 미팅 잡아줘", "calendar"),
+    ("6월 10일 저녁 7시 가족 모임", "calendar"),
+    ("회의 일정 오후 4시로 옮겨줘", "calendar"),
+    ("내일 점심 약속 취소해줘", "calendar"),
+    ("매주 화요일 9시 스탠드업 등록", "calendar"),
+    ("목요일 오후에 1시간 빈 시간 있어?", "calendar"),
+    ("3시에 다른 일정이랑 겹치는지 확인해줘", "calendar"),
+    ("다음 달 출장 일정 보여줘", "calendar"),
+    ("강남에서 한 약속 찾아줘", "calendar"),
+    ("캘린더에 생일 파티 넣어줘", "calendar"),
+    ("모레 스케줄 어떻게 돼?", "calendar"),
+    ("주간 회의 삭제해줘", "calendar"),
+    ("7/20 오전 11시 고객 미팅", "calendar"),
+    ("이번 달 말에 뭐 있어?", "calendar"),
+    ("내일 아침 운동 일정 30분 미뤄줘", "calendar"),
+    ("금요일 저녁 회식 추가", "calendar"),
+    ("10월 3일 병원", "calendar"),
+    ("오늘 몇 개 일정 남았어", "calendar"),
+    ("내일 9시", "calendar"),
+    ("회의록 정리하는 법 알려줘", "general"),
+    ("일정 추가하는 법 알려줘", "general"),
+    ("일정 삭제 기능 있어?", "general"),
+    ("안녕", "general"),
+    ("반가워요", "general"),
+    ("고맙습니다", "general"),
+    ("감사해요 덕분에 살았어", "general"),
+    ("테스트 중이야", "general"),
+    ("너 누구야?", "general"),
+    ("무슨 기능이 있어?", "general"),
+    ("오늘 날씨 어때", "general"),
+    ("심심해", "general"),
+    ("농담 하나 해줘", "general"),
+    ("수고했어", "general"),
+    ("잘 자", "general"),
+    ("ㅋㅋㅋ 웃기다", "general"),
+    ("파이썬에서 리스트 정렬하는 법", "general"),
+    ("맛집 추천해줘", "general"),
+    ("hello", "general"),
+    ("기분이 좀 우울해", "general"),
+    # 캘린더 키워드 하나만 있는 일반 대화 (규칙 분류가 calendar로 보내면 안 됨)
+    ("캘린더가 뭐야?", "general"),
+    ("스케줄링 알고리즘 설명해줘", "general"),
+    ("일정 관리 앱 추천해줘", "general"),
+]
+
+
+def prompt_examples():
+    """분류 프롬프트의 예시 (agent 패키지를 불러오면 OpenAI 설정을 확인하므로 가능할 때만 사용)"""
+    try:
+        from agent.prompt import PromptManager
+    except Exception:
+        return []
+    return parse_examples(PromptManager.get_intent_classifier_prompt())
+
+
+async def measure_llm(samples: int) -> float:
+    """LLM 분류 에이전트로 실제 분류 시간을 잽니다. (ms)"""
+    os.environ.setdefault("MAC_AGENT_APPLESCRIPT_BACKEND", "memory")
+    os.environ.setdefault("MAC_AGENT_INTENT_CACHE", "0")  # 캐시 적중 없이 매번 LLM 분류
+    from agent import CalendarManagerAgent
+    
+    agent = CalendarManagerAgent()
+    agent.intent_rules.threshold = 2.0  # 모든 입력을 LLM으로
+    try:
+        for text, _ in CORPUS[:samples]:
+            await agent.classify_intent(text)
+        return agent.intent_rules.stats.llm_average * 1000
+    finally:
+        await agent.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threshold", type=float, default=0.95)
+    parser.add_argument("--llm-ms", type=float, default=800.0, help="LLM 분류 한 번의 시간 가정 (ms)")
+    parser.add_argument("--live", type=int, default=0, help="LLM 분류를 N번 실제로 실행해 시간을 잼")
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--verbose", action="store_true", help="문장별 결과 출력")
+    args = parser.parse_args()
+    
+    classifier = RuleIntentClassifier(prompt_examples(), threshold=args.threshold)
+    decisions = [(text, label, classifier.classify(text)) for text, label in CORPUS]
+    
+    began = time.perf_counter()
+    for _ in range(args.runs):
+        for text, _ in CORPUS:
+            classifier.decide(text)
+    rule_us = (time.perf_counter() - began) / (args.runs * len(CORPUS)) * 1e6
+    
+    hits = [(text, label, d) for text, label, d in decisions if d.intent_type]
+    correct = sum(1 for _, label, d in hits if d.intent_type == label)
+    if args.verbose:
+        for text, label, d in decisions:
+            mark = "LLM" if not d.intent_type else ("O" if d.intent_type == label else "X")
+            print(f"  [{mark:>3}] {d.confidence:.2f} {text} → {d.intent_type or '-'} ({label})")
+    
+    llm_ms = asyncio.run(measure_llm(args.live)) if args.live else args.llm_ms
+    saved_ms = len(hits) * llm_ms - rule_us * len(CORPUS) / 1000
+    print(f"문장 {len(CORPUS)}개 | 기준 신뢰도 {args.threshold}")
+    print(f"규칙 분류 적중: {len(hits)}/{len(CORPUS)} ({len(hits) / len(CORPUS):.0%}) | "
+          f"적중 정확도: {correct}/{len(hits)} ({correct / max(1, len(hits)):.0%})")
+    print(f"규칙 분류: {rule_us:.1f} µs/문장 | LLM 분류: {llm_ms:.0f} ms/문장 ({'실측' if args.live else '가정'})")
+    print(f"절약 시간: {saved_ms / 1000:.1f} s (문장당 평균 {saved_ms / len(CORPUS):.0f} ms)")
+
+
+if __name__ == "__main__":
+    main()
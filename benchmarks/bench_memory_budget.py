@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+대화 메모리 토큰 예산 벤치마크 (가짜 모델 클라이언트)
+
+한 세션에서 턴을 길게 이어 가며 모델에 넘어가는 프롬프트 크기(추정 토큰)와 턴 시간을 잽니다.
+메모리를 그대로 모두 붙이는 경우(예산·요약 없음)와 에이전트별 예산 + 백그라운드 요약을 쓰는 경우를
+비교하고, 의도 분류처럼 예산이 작은 에이전트가 실제로 적은 맥락만 받는지 확인합니다.
+
+    python benchmarks/bench_memory_budget.py
+    python benchmarks/bench_memory_budget.py --turns 400 --mode router
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+# bench_router_mode가 환경 변수(메모리 백엔드, 캐시 끔)와 가짜 모델을 준비함
+from bench_router_mode import REQUESTS, ScriptedModelClient
+
+from agent import CalendarManagerAgent
+from memory import MemoryManager, estimate_tokens
+from session import SessionManager, SessionStorage
+
+UNBOUNDED = 10 ** 9
+
+
+def prompt_tokens(call) -> int:
+    """모델 호출 한 번에 넘어간 메시지의 추정 토큰 수"""
+    return sum(estimate_tokens(message.content) for message in call["messages"] if isinstance(message.content, str))
+
+
+async def run_session(mode: str, turns: int, budgeted: bool, checkpoints):
+    """턴을 이어 가며 체크포인트마다 (턴, 의도 분류 프롬프트, 응답 에이전트 프롬프트, 턴 ms)를 돌려줍니다."""
+    client = ScriptedModelClient(0)
+    agent = CalendarManagerAgent(mode=mode, model_client=client)
+    agent.intent_rules.threshold = 2.0  # 의도 분류도 매 턴 모델로
+    agent.session_manager = SessionManager(SessionStorage(Path(tempfile.mkdtemp())))
+    if budgeted:
+        agent.memory_manager = MemoryManager(agent.session_manager.storage)
+    else:
+        # 예전 동작: 요약 없이 전체 ListMemory를 그대로 붙임
+        manager = MemoryManager(agent.session_manager.storage, recent_tokens=UNBOUNDED, summary_tokens=UNBOUNDED)
+        manager.get_agent_memory = lambda session_id, role: manager.get_or_create_memory(session_id)
+        agent.memory_manager = manager
+    session_id = agent.session_manager.create_session()
+    
+    rows = []
+    elapsed = 0.0
+    try:
+        for turn in range(1, turns + 1):
+            text = REQUESTS[turn % len(REQUESTS)][0]
+            calls = len(client.create_calls)
+            began = time.perf_counter()
+            await agent.process_user_input(text, session_id)
+            elapsed += time.perf_counter() - began
+            await asyncio.sleep(0)  # 백그라운드 요약이 돌 틈
+            if turn in checkpoints:
+                turn_calls = client.create_calls[calls:]
+                intent = [prompt_tokens(c) for c in turn_calls if c["json_output"]]
+                answer = [prompt_tokens(c) for c in turn_calls if not c["json_output"]]
+                rows.append((turn, max(intent, default=0), max(answer, default=0), elapsed / turn * 1000))
+        memory = agent.memory_manager.get_or_create_memory(session_id)
+        return rows, memory
+    finally:
+        await agent.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--turns", type=int, default=200)
+    parser.add_argument("--mode", choices=["pipeline", "router"], default="pipeline")
+    args = parser.parse_args()
+    
+    checkpoints = sorted({t for t in (10, 50, 100, 200, 400, 800, args.turns) if t <= args.turns})
+    print(f"턴 {args.turns}개 | 모드 {args.mode} | 프롬프트 크기는 추정 토큰")
+    for name, budgeted in (("예산 없음", False), ("예산+요약", True)):
+        rows, memory = asyncio.run(run_session(args.mode, args.turns, budgeted, set(checkpoints)))
+        for turn, intent, answer, turn_ms in rows:
+            intent_text = f"의도 분류 {intent:6d}" if args.mode == "pipeline" else ""
+            print(f"{name:<8} | 턴 {turn:4d} | {intent_text} 응답 에이전트 {answer:6d} | 평균 턴 {turn_ms:7.2f} ms")
+        print(f"{name:<8} | 원문 {len(memory.content)}줄 ({memory.tokens} 토큰), 요약 {estimate_tokens(memory.summary)} 토큰, "
+              f"요약 {memory.compactions}회")
+
+
+if __name__ == "__main__":
+    main()
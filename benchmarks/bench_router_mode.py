@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+pipeline / router 모드 응답 시간 벤치마크 (가짜 모델 클라이언트)
+
+라벨을 붙인 요청을 두 방식으로 처리하며 요청당 모델 호출 수와 응답 시간을 비교합니다.
+모델은 호출마다 --latency-ms만큼 기다린 뒤 정해진 규칙으로 답하는 가짜 클라이언트
+(의도 분류 → JSON, 캘린더 요청 → 도구 호출 후 요약, 일반 대화 → 바로 답변)이고,
+캘린더는 메모리 백엔드를 쓰므로 API 키나 macOS 없이 실행됩니다.
+
+    python benchmarks/bench_router_mode.py
+    python benchmarks/bench_router_mode.py --latency-ms 800 --no-rules --verbose
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
+# 가짜 모델만 쓰므로 API 키는 쓰이지 않음, ~/.mac_agent의 캐시는 건드리지 않음
+os.environ.setdefault("OPENAI_API_KEY", "replay")
+os.environ["MAC_AGENT_APPLESCRIPT_BACKEND"] = "memory"
+os.environ["MAC_AGENT_EVENT_CACHE"] = "0"
+os.environ["MAC_AGENT_INTENT_CACHE"] = "0"
+
+from autogen_core import EVENT_LOGGER_NAME, FunctionCall  # noqa: E402
+from autogen_core.models import CreateResult, ModelFamily, ModelInfo, RequestUsage, SystemMessage  # noqa: E402
+from autogen_core.models import FunctionExecutionResultMessage, UserMessage  # noqa: E402
+from autogen_ext.models.replay import ReplayChatCompletionClient  # noqa: E402
+
+from agent import CalendarManagerAgent  # noqa: E402
+from memory import MemoryManager  # noqa: E402
+from session import SessionManager, SessionStorage  # noqa: E402
+
+# (요청, 의도, 캘린더 요청이면 모델이 부를 도구와 인자)
+REQUESTS = [
+    ("내일 오후 3시에 팀 회의 추가해줘", "calendar", ("create_event", {"date_str": "내일", "title": "팀 회의", "time_str": "오후 3시"})),
+    ("안녕하세요", "general", None),
+    ("내일 일정 보여줘", "calendar", ("get_events", {"date_str": "내일"})),
+    ("고마워", "general", None),
+    ("팀 회의 좀 뒤로 미룰 수 있을까", "calendar", ("update_event", {"original_title": "팀 회의", "new_time_str": "오후 4시"})),
+    ("회의록 잘 쓰는 요령 있어?", "general", None),
+    ("다음 주에 한 시간 비는 때", "calendar", ("find_free_slots", {"range_str": "다음 주", "duration_minutes": 60})),
+    ("팀 회의 취소", "calendar", ("delete_event", {"title": "팀 회의"})),
+]
+# 가짜 모델의 토큰 수 경고(도구 호출 메시지)는 측정과 무관하므로 숨김
+logging.getLogger(EVENT_LOGGER_NAME).setLevel(logging.ERROR)
+
+LABELS = {text: (intent, tool) for text, intent, tool in REQUESTS}
+
+MODEL_INFO = ModelInfo(vision=False, function_calling=True, json_output=True,
+                       family=ModelFamily.UNKNOWN, structured_output=True)
+
+
+class ScriptedModelClient(ReplayChatCompletionClient):
+    """마지막 메시지를 보고 정해진 답을 만드는 가짜 모델
+    
+    호출마다 latency초(스트리밍이면 첫 토큰까지) 기다리고, 스트리밍할 때는 토큰마다 token_latency초를 더 기다립니다.
+    """
+    
+    def __init__(self, latency: float, token_latency: float = 0.0):
+        super().__init__([], model_info=MODEL_INFO)
+        self.latency = latency
+        self.token_latency = token_latency
+    
+    def _respond(self, messages, tools, json_output):
+        # 세션 메모리는 SystemMessage로 맨 뒤에 붙으므로 건너뜀
+        last = next(m for m in reversed(messages) if not isinstance(m, SystemMessage))
+        if isinstance(last, FunctionExecutionResultMessage):
+            return "요청하신 캘린더 작업을 완료했습니다."
+        if not isinstance(last, UserMessage):
+            return "더 도와드릴 일이 있으면 말씀해 주세요."
+        
+        intent, tool = LABELS.get(last.content, ("general", None))
+        if json_output:
+            return json.dumps({"intent_type": intent, "reasoning": "가짜 모델 분류"}, ensure_ascii=False)
+        if tools and tool:
+            name, arguments = tool
+            call = FunctionCall(id=f"call-{self._current_index}", name=name,
+                                arguments=json.dumps(arguments, ensure_ascii=False))
+            return CreateResult(finish_reason="function_calls", content=[call],
+                                usage=RequestUsage(prompt_tokens=0, completion_tokens=0), cached=False)
+        return "안녕하세요! 캘린더 관리를 도와드릴게요."
+    
+    async def create(self, messages, *, tools=[], json_output=None, **kwargs):
+        response = self._respond(messages, tools, json_output)
+        # 스트리밍하지 않아도 토큰 생성 시간은 같음
+        tokens = len(response.split()) if isinstance(response, str) else 0
+        await asyncio.sleep(self.latency + tokens * self.token_latency)
+        self.chat_completions.append(response)
+        return await super().create(messages, tools=tools, json_output=json_output, **kwargs)
+    
+    async def create_stream(self, messages, *, tools=[], json_output=None, **kwargs):
+        await asyncio.sleep(self.latency)
+        self.chat_completions.append(self._respond(messages, tools, json_output))
+        async for chunk in super().create_stream(messages, tools=tools, json_output=json_output, **kwargs):
+            if isinstance(chunk, str):
+                await asyncio.sleep(self.token_latency)
+            yield chunk
+
+
+async def run_mode(mode: str, latency: float, rules: bool, verbose: bool):
+    """한 방식으로 모든 요청을 처리하고 (요청별 모델 호출 수, 요청별 시간) 목록을 돌려줍니다."""
+    client = ScriptedModelClient(latency)
+    agent = CalendarManagerAgent(mode=mode, model_client=client)
+    if not rules:
+        agent.intent_rules.threshold = 2.0  # 모든 입력을 LLM 분류로
+    agent.session_manager = SessionManager(SessionStorage(Path(tempfile.mkdtemp())))
+    agent.memory_manager = MemoryManager(agent.session_manager.storage)
+    session_id = agent.session_manager.create_session()
+    
+    results = []
+    try:
+        for text, intent, _ in REQUESTS:
+            calls = len(client.create_calls)
+            began = time.perf_counter()
+            response = await agent.process_user_input(text, session_id)
+            elapsed = time.perf_counter() - began
+            results.append((intent, len(client.create_calls) - calls, elapsed))
+            if verbose:
+                print(f"  [{mode}] {elapsed * 1000:7.1f} ms, 모델 {results[-1][1]}회 | {text} → {response}")
+    finally:
+        await agent.close()
+    return results
+
+
+def summarize(name: str, results):
+    for intent in ("calendar", "general", None):
+        rows = [r for r in results if intent is None or r[0] == intent]
+        calls = sum(r[1] for r in rows) / len(rows)
+        elapsed = sum(r[2] for r in rows) / len(rows) * 1000
+        print(f"{name:<10} | {intent or '전체':<8} | 모델 호출 {calls:4.1f}회/요청 | {elapsed:8.1f} ms/요청")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency-ms", type=float, default=400.0, help="가짜 모델 호출 한 번의 지연 (ms)")
+    parser.add_argument("--no-rules", action="store_true", help="pipeline의 규칙 분류 빠른 경로를 끄고 측정")
+    parser.add_argument("--verbose", action="store_true", help="요청별 결과 출력")
+    args = parser.parse_args()
+    
+    latency = args.latency_ms / 1000
+    pipeline = asyncio.run(run_mode("pipeline", latency, not args.no_rules, args.verbose))
+    router = asyncio.run(run_mode("router", latency, True, args.verbose))
+    
+    print(f"요청 {len(REQUESTS)}개 | 모델 지연 {args.latency_ms:g} ms | 규칙 분류 {'끔' if args.no_rules else '켬'}")
+    summarize("pipeline", pipeline)
+    summarize("router", router)
+    speedup = sum(r[2] for r in pipeline) / max(1e-9, sum(r[2] for r in router))
+    print(f"router 모드 응답 시간: pipeline 대비 {speedup:.2f}배 빠름")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+AppleScript 템플릿 사전 컴파일 벤치마크
+
+같은 크기의 스크립트를 매번 소스로 실행(컴파일+실행)할 때와 템플릿 ID별로 한 번 컴파일해 둔
+스크립트에 argv만 넘겨 실행할 때를 비교합니다. osascript가 없는 환경(macOS 외)에서는 osascript
+시간 측정을 건너뜁니다. 제목이 인자로 손상 없이 오가는지는 tests/test_script_templates.py에서 확인합니다.
+
+    python benchmarks/bench_script_templates.py --runs 20
+"""
+
+import argparse
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
+
+from backends import PersistentWorkerBackend, ScriptCompiler, default_worker_command  # noqa: E402
+from backends.templates import register_template  # noqa: E402
+from events.wire import APPLESCRIPT_SEPARATORS  # noqa: E402
+from scripts import delete_call  # noqa: E402
+from scripts.calendar import HANDLERS  # noqa: E402
+
+# Calendar 앱을 건드리지 않고 인자를 그대로 돌려주는 템플릿 (보조 핸들러는 실제 템플릿과 같음)
+ECHO = register_template("bench/echo", APPLESCRIPT_SEPARATORS + '''
+    return my joinText(argv, US)
+''', HANDLERS)
+
+
+def timed(func, runs: int) -> float:
+    """호출당 평균 시간 (ms)"""
+    began = time.perf_counter()
+    for _ in range(runs):
+        func()
+    return (time.perf_counter() - began) / runs * 1000
+
+
+def bench(runs: int, items: int):
+    args = [f"일정 {i} \"따옴표\"" for i in range(items)]
+    call = ECHO.call(*args)
+    
+    if not shutil.which("osascript"):
+        print("osascript가 없어 실행 시간 측정을 건너뜁니다. (macOS에서 실행하세요)")
+    else:
+        compiler = ScriptCompiler(Path(tempfile.mkdtemp()))
+        began = time.perf_counter()
+        compiled = str(compiler.path(ECHO))
+        compile_ms = (time.perf_counter() - began) * 1000
+        source = timed(lambda: subprocess.run(["osascript", "-e", call.inline()], capture_output=True), runs)
+        precompiled = timed(lambda: subprocess.run(["osascript", compiled, *args], capture_output=True), runs)
+        print(f"osascript | 최초 컴파일: {compile_ms:.1f} ms")
+        print(f"osascript | 소스 실행(컴파일+실행): {source:7.2f} ms | 컴파일된 템플릿: {precompiled:7.2f} ms "
+              f"({source / precompiled:.2f}배)")
+        
+        try:
+            from backends.worker_main import NSAppleScriptEngine
+            engine = NSAppleScriptEngine()
+        except ImportError:
+            print("NSAppleScript | PyObjC가 없어 건너뜁니다.")
+        else:
+            inline = call.inline()
+            source = timed(lambda: engine.execute(inline), runs)
+            cached = timed(lambda: engine.execute_call(ECHO.template_id, ECHO.source, args), runs)
+            print(f"NSAppleScript | 소스 실행(컴파일+실행): {source:7.2f} ms | 컴파일된 템플릿: {cached:7.2f} ms "
+                  f"({source / cached:.2f}배)")
+    
+    # 상주 실행기 왕복 비용 (echo 엔진: 요청 인코딩·프레임 전달만)
+    worker = PersistentWorkerBackend(default_worker_command("echo"), max_workers=1)
+    try:
+        worker.run(call)
+        inline = call.inline()
+        source = timed(lambda: worker.run(inline), runs * 10)
+        templated = timed(lambda: worker.run(call), runs * 10)
+        print(f"상주 실행기(echo) | 인라인 소스: {source * 1000:7.1f} µs | 템플릿 요청: {templated * 1000:7.1f} µs")
+    finally:
+        worker.close()
+    
+    plan_args = [("", title, "", "", "") for title in args]
+    began = time.perf_counter()
+    for _ in range(runs * 10):
+        delete_call("캘린더", plan_args)
+    print(f"delete_call 생성 ({items}건) | {(time.perf_counter() - began) / (runs * 10) * 1e6:.1f} µs")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--items", type=int, default=20, help="스크립트 한 번에 넘길 인자 수")
+    args = parser.parse_args()
+    bench(args.runs, args.items)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+스트리밍 출력 첫 출력 시간(TTFB) 벤치마크 (가짜 모델 클라이언트)
+
+같은 요청을 완성된 응답만 출력하는 방식과 run_stream으로 토큰·도구 진행 상황을 바로 출력하는
+방식으로 처리하며, 사용자가 첫 글자를 보기까지의 시간과 응답 전체 시간을 비교합니다.
+모델은 첫 토큰까지 --first-token-ms, 이후 토큰마다 --token-ms가 걸리는 가짜 클라이언트입니다.
+
+    python benchmarks/bench_streaming.py
+    python benchmarks/bench_streaming.py --mode pipeline --first-token-ms 600 --token-ms 40
+"""
+
+import argparse
+import asyncio
+import io
+import tempfile
+import time
+from pathlib import Path
+
+# bench_router_mode가 환경 변수(메모리 백엔드, 캐시 끔)와 가짜 모델을 준비함
+from bench_router_mode import REQUESTS, ScriptedModelClient
+
+from agent import CalendarManagerAgent
+from cli import StreamPrinter
+from memory import MemoryManager
+from session import SessionManager, SessionStorage
+
+
+async def run_requests(mode: str, stream: bool, first_token: float, token: float):
+    """요청을 처리하고 (의도, 첫 출력 ms, 전체 ms) 목록을 돌려줍니다."""
+    agent = CalendarManagerAgent(mode=mode, model_client=ScriptedModelClient(first_token, token), stream=stream)
+    agent.session_manager = SessionManager(SessionStorage(Path(tempfile.mkdtemp())))
+    agent.memory_manager = MemoryManager(agent.session_manager.storage)
+    session_id = agent.session_manager.create_session()
+    
+    results = []
+    try:
+        for text, intent, _ in REQUESTS:
+            printer = StreamPrinter(out=io.StringIO())
+            response = await agent.process_user_input(text, session_id, on_event=printer if stream else None)
+            printer.finish(response)
+            elapsed = time.perf_counter() - printer.began
+            results.append((intent, printer.time_to_first_byte * 1000, elapsed * 1000))
+    finally:
+        await agent.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--mode", choices=["pipeline", "router"], default="router")
+    parser.add_argument("--first-token-ms", type=float, default=300.0, help="모델 첫 토큰까지의 지연 (ms)")
+    parser.add_argument("--token-ms", type=float, default=20.0, help="토큰 사이 지연 (ms)")
+    args = parser.parse_args()
+    
+    first_token, token = args.first_token_ms / 1000, args.token_ms / 1000
+    print(f"요청 {len(REQUESTS)}개 | 모드 {args.mode} | 첫 토큰 {args.first_token_ms:g} ms, 토큰 간격 {args.token_ms:g} ms")
+    for name, stream in (("한 번에 출력", False), ("스트리밍", True)):
+        results = asyncio.run(run_requests(args.mode, stream, first_token, token))
+        for intent in ("calendar", "general"):
+            rows = [r for r in results if r[0] == intent]
+            ttfb = sum(r[1] for r in rows) / len(rows)
+            total = sum(r[2] for r in rows) / len(rows)
+            print(f"{name:<8} | {intent:<8} | 첫 출력 {ttfb:7.1f} ms | 전체 {total:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
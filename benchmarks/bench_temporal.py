@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+한국어 날짜/시간 표현 해석 비용 벤치마크
+
+기존 _parse_korean_date(호출마다 re.search + dateutil 대체)와 temporal 모듈의
+캐시 미적중(컴파일된 문법만 사용)·캐시 적중 비용을 호출당 µs로 비교합니다.
+
+    python benchmarks/bench_temporal.py --calls 20000
+"""
+
+import argparse
+import sys
+import time
+from datetime import date, datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
+
+from temporal import expressions  # noqa: E402
+from temporal.expressions import _resolve, normalize_expression, resolve  # noqa: E402
+
+
+# 기존 구현이 이해하는 표현 (비교용)
+LEGACY_EXPRESSIONS = ["6월 10일", "6월 10일 오후 3시", "7월 1일 14:30", "12월 24일 오전 11시", "2025-08-15"]
+
+# 새 문법에서만 해석되는 상대 표현
+RELATIVE_EXPRESSIONS = ["내일 오후 3시", "모레 9:30", "다음 주 화요일", "이번 달 말", "3일 후 2시부터 1시간 반"]
+
+
+def legacy_parse(date_str: str) -> datetime:
+    """기존 CalendarTools._parse_korean_date"""
+    import re
+    from dateutil import parser
+    
+    current_year = datetime.now().year
+    month_match = re.search(r'(\d+)월', date_str)
+    day_match = re.search(r'(\d+)일', date_str)
+    
+    if month_match and day_match:
+        month = int(month_match.group(1))
+        day = int(day_match.group(1))
+        time_match = re.search(r'(\d{1,2}):(\d{2})', date_str)
+        if time_match:
+            hour = int(time_match.group(1))
+            minute = int(time_match.group(2))
+        else:
+            afternoon_match = re.search(r'오후\s*(\d{1,2})시', date_str)
+            morning_match = re.search(r'오전\s*(\d{1,2})시', date_str)
+            hour_match = re.search(r'(\d{1,2})시', date_str)
+            if afternoon_match:
+                hour = int(afternoon_match.group(1))
+                if hour != 12:
+                    hour += 12
+                minute = 0
+            elif morning_match:
+                hour = int(morning_match.group(1))
+                if hour == 12:
+                    hour = 0
+                minute = 0
+            elif hour_match:
+                hour = int(hour_match.group(1))
+                minute = 0
+            else:
+                hour, minute = 9, 0
+        return datetime(current_year, month, day, hour, minute)
+    
+    parsed_date = parser.parse(date_str)
+    if parsed_date.year != current_year:
+        parsed_date = parsed_date.replace(year=current_year)
+    return parsed_date
+
+
+def per_call(func, expressions, calls: int) -> float:
+    """표현 목록을 돌아가며 calls번 호출했을 때 호출당 µs"""
+    count = len(expressions)
+    start = time.perf_counter()
+    for i in range(calls):
+        func(expressions[i % count])
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=20000)
+    args = parser.parse_args()
+    
+    today = date.today()
+    
+    def uncached(expression):
+        return _resolve.__wrapped__(normalize_expression(expression), today)
+    
+    def cached(expression):
+        return resolve(expression, today)
+    
+    for label, expressions_ in (("기존 형식", LEGACY_EXPRESSIONS), ("상대 표현", RELATIVE_EXPRESSIONS)):
+        legacy = per_call(legacy_parse, expressions_, args.calls) if expressions_ is LEGACY_EXPRESSIONS else None
+        miss = per_call(uncached, expressions_, args.calls)
+        expressions.cache_clear()
+        hit = per_call(cached, expressions_, args.calls)
+        legacy_text = f"기존: {legacy:6.2f} µs | " if legacy is not None else "기존: 해석 불가 | "
+        print(f"{label} | {legacy_text}캐시 미적중: {miss:6.2f} µs | 캐시 적중: {hit:5.2f} µs "
+              f"({expressions.cache_info().hits}회 적중)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+테스트 공통 설정
+
+mac_agent 실행 스크립트처럼 프로젝트 루트와 app 디렉토리를 모두 경로에 넣어 `app.*` 패키지로
+불러오고, API 키·Calendar 앱·~/.mac_agent 캐시 없이 실행되도록 환경 변수를 맞춥니다.
+Calendar는 메모리 백엔드(MemoryCalendar)로 대신합니다.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+import pytz
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "app"))
+sys.path.insert(0, str(project_root))
+os.environ.setdefault("OPENAI_API_KEY", "test")
+os.environ["MAC_AGENT_APPLESCRIPT_BACKEND"] = "memory"
+os.environ["MAC_AGENT_EVENT_CACHE"] = "0"
+os.environ["MAC_AGENT_INTENT_CACHE"] = "0"
+
+from app.backends import MemoryCalendar, MemoryCalendarBackend  # noqa: E402
+from app.calendar_tools import CalendarTools  # noqa: E402
+from app.store import EventStore  # noqa: E402
+
+SEOUL = pytz.timezone('Asia/Seoul')
+
+
+@pytest.fixture
+def calendar():
+    """캘린더 두 개가 있는 빈 MemoryCalendar"""
+    return MemoryCalendar(["캘린더", "Work"], tz=SEOUL)
+
+
+@pytest.fixture
+def tools(calendar):
+    """로컬 캐시 없이 MemoryCalendar를 직접 조회하는 CalendarTools"""
+    tools = CalendarTools(backend=MemoryCalendarBackend(calendar))
+    yield tools
+    tools.close()
+
+
+@pytest.fixture
+def cached_tools(calendar):
+    """메모리 SQLite 캐시를 쓰는 CalendarTools"""
+    tools = CalendarTools(backend=MemoryCalendarBackend(calendar), store=EventStore(":memory:", tz=SEOUL))
+    yield tools
+    tools.close()
@@ -0,0 +1,112 @@
+"""
+AppleScript 실행 백엔드 (app/backends/base.py, worker.py, aio.py)
+
+상주 실행기는 echo 엔진(worker_main.EchoEngine)으로 띄워 프레임 프로토콜과 재시작 처리를
+macOS 없이 확인합니다.
+"""
+
+import asyncio
+import sys
+
+import pytest
+
+from app.backends import (
+    AppleScriptError, AsyncOsascriptBackend, AsyncWorkerBackend, CallableBackend, PersistentWorkerBackend,
+    WorkerCrashed, WorkerTimeout, default_worker_command, register_template
+)
+from app.events import FIELD_SEPARATOR, RECORD_SEPARATOR, iter_records
+
+ECHO = register_template("test/echo-args", "return item 1 of argv")
+ARGS = ['"따옴표"', "역슬래시 \\", "줄\n바꿈", "한글 제목", ""]
+
+# 요청을 읽자마자 종료하는 실행기 / 응답하지 않는 실행기
+CRASHING = [sys.executable, "-c", "import sys; sys.stdin.buffer.readline()"]
+HANGING = [sys.executable, "-c", "import sys, time; sys.stdin.buffer.readline(); time.sleep(30)"]
+
+
+@pytest.fixture
+def worker():
+    backend = PersistentWorkerBackend(default_worker_command("echo"), max_workers=1, timeout=10)
+    yield backend
+    backend.close()
+
+
+def test_callable_backend_keeps_trailing_empty_fields():
+    backend = CallableBackend(lambda script: f"a{FIELD_SEPARATOR}{FIELD_SEPARATOR}\n")
+    output = backend.run("return 1")
+    assert list(iter_records([output])) == [["a", "", ""]]
+    assert backend.call_count == 1
+
+
+def test_callable_backend_inlines_template_calls():
+    sources = []
+    backend = CallableBackend(lambda script: sources.append(script) or "")
+    backend.run(ECHO.call('"; quit'))
+    assert sources == [ECHO.call('"; quit').inline()]
+
+
+def test_worker_passes_argv_unchanged(worker):
+    assert worker.run(ECHO.call(*ARGS)).split(FIELD_SEPARATOR) == ARGS
+    assert worker.run("  소스 그대로  ") == "소스 그대로"
+    # 두 번째 요청도 같은 실행기를 재사용
+    assert len(worker._workers) == 1
+    assert worker.restart_count == 0
+
+
+def test_worker_stream_yields_output(worker):
+    records = [f"제목 {n}{FIELD_SEPARATOR}{n}" for n in range(2000)]
+    chunks = list(worker.stream(RECORD_SEPARATOR.join(records)))
+    assert "".join(chunks) == RECORD_SEPARATOR.join(records)
+    assert len(list(iter_records(chunks))) == 2000
+
+
+def test_worker_restarts_once_after_crash():
+    backend = PersistentWorkerBackend(CRASHING, max_workers=1, timeout=10)
+    with pytest.raises(WorkerCrashed):
+        backend.run("return 1")
+    assert backend.restart_count == 2
+    assert backend._workers == []
+    backend.close()
+
+
+def test_worker_timeout_replaces_worker():
+    backend = PersistentWorkerBackend(HANGING, max_workers=1, timeout=0.3)
+    with pytest.raises(WorkerTimeout):
+        backend.run("return 1")
+    assert backend.restart_count == 1
+    assert backend._workers == []
+    backend.close()
+
+
+def test_async_worker_runs_calls_concurrently():
+    async def run():
+        backend = AsyncWorkerBackend(default_worker_command("echo"), max_concurrency=2, timeout=10)
+        try:
+            outputs = await asyncio.gather(*(backend.run(ECHO.call(f"요청 {n}", *ARGS)) for n in range(6)))
+            return outputs, len(backend._workers)
+        finally:
+            await backend.close()
+    
+    outputs, workers = asyncio.run(run())
+    assert [output.split(FIELD_SEPARATOR)[0] for output in outputs] == [f"요청 {n}" for n in range(6)]
+    assert workers <= 2
+
+
+def test_async_worker_timeout():
+    async def run():
+        backend = AsyncWorkerBackend(HANGING, max_concurrency=1, timeout=0.3)
+        try:
+            await backend.run("return 1")
+        finally:
+            await backend.close()
+    
+    with pytest.raises(WorkerTimeout):
+        asyncio.run(run())
+
+
+def test_async_osascript_backend_with_stand_in_command():
+    printer = (sys.executable, "-c", "import sys; print(sys.argv[1] + '\\x1f')")
+    failing = (sys.executable, "-c", "import sys; sys.exit('컴파일 오류')")
+    assert asyncio.run(AsyncOsascriptBackend(printer).run("return 1")) == f"return 1{FIELD_SEPARATOR}"
+    with pytest.raises(AppleScriptError):
+        asyncio.run(AsyncOsascriptBackend(failing).run("return 1"))
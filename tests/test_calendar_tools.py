@@ -0,0 +1,168 @@
+"""
+CalendarTools 단계 생성기와 동기·비동기 실행 (app/calendar_tools.py)
+
+스크립트 실행 횟수는 MemoryCalendar가 템플릿 ID별로 센 calls로 확인합니다.
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from app.backends import AsyncMemoryCalendarBackend, MemoryCalendar, MemoryCalendarBackend
+from app.calendar_tools import AsyncCalendarTools, CalendarTools
+
+from conftest import SEOUL
+
+# 지난 시간을 빼는 빈 시간 찾기에도 쓰도록 미래의 화요일
+DAY = "2027-03-02"
+
+
+def _add(calendar, name: str, title: str, hour: int, minutes: int = 60):
+    start = datetime(2027, 3, 2, hour)
+    calendar.add_event(name, title, start, start.replace(hour=hour + minutes // 60, minute=minutes % 60))
+
+
+def test_steps_can_be_driven_by_hand(tools):
+    steps = tools._get_events_steps(DAY)
+    assert next(steps).template_id == "calendar/list"
+    assert steps.send(iter([["캘린더"], ["Work"]])).template_id == "calendar/query/0/rules"
+    with pytest.raises(StopIteration) as stop:
+        steps.send(iter([
+            ["캘린더", "u1", "팀 회의", "2027-03-02T10:00:00", "2027-03-02T11:00:00", "", ""],
+            ["#stats", "3"]
+        ]))
+    result = stop.value.value
+    assert [event.title for event in result["events"]] == ["팀 회의"]
+    assert result["query"]["scanned"] == 3
+
+
+def test_get_events_queries_all_calendars_in_one_run(calendar):
+    _add(calendar, "캘린더", "팀 회의", 10)
+    _add(calendar, "Work", "코드 리뷰", 9)
+    # 없는 캘린더("집")는 스크립트로 보내지 않음
+    tools = CalendarTools(backend=MemoryCalendarBackend(calendar), calendars=["캘린더", "Work", "집"])
+    result = tools.get_events(DAY)
+    assert [(event.calendar, event.title) for event in result["events"]] == [("Work", "코드 리뷰"), ("캘린더", "팀 회의")]
+    assert tools.backend.calls == {"calendar/list": 1, "calendar/query/0/rules": 1}
+    
+    assert not tools.get_events(DAY, calendars=["집"])["success"]
+    tools.close()
+
+
+def test_get_events_pushes_title_terms_down(tools, calendar):
+    _add(calendar, "캘린더", "팀 회의", 10)
+    _add(calendar, "캘린더", "점심 약속", 12)
+    result = tools.get_events(DAY, keywords="회의")
+    assert [event.title for event in result["events"]] == ["팀 회의"]
+    assert result["query"]["scanned"] == 2
+    assert "calendar/query/1/rules" in tools.backend.calls
+
+
+def test_cached_get_events_fetches_range_once(cached_tools, calendar):
+    _add(calendar, "캘린더", "팀 회의", 10)
+    assert [event.title for event in cached_tools.get_events(DAY)["events"]] == ["팀 회의"]
+    assert [event.title for event in cached_tools.get_events(DAY, keywords="팀")["events"]] == ["팀 회의"]
+    assert cached_tools.backend.calls == {"calendar/list": 1, "calendar/query/0/rules": 1}
+
+
+def test_batch_create_runs_one_script(tools, calendar):
+    result = tools.create_events([
+        {"date_str": DAY, "title": "팀 회의", "time_str": "오전 10시"},
+        {"date_str": "2월 30일", "title": "없는 날짜"},
+        {"date_str": DAY, "title": "주간 회의", "time_str": "오후 2시", "recurrence": "매주"},
+    ])
+    assert [item["success"] for item in result["results"]] == [True, False, True]
+    assert result["results"][2]["recurrence"] == "FREQ=WEEKLY"
+    assert [(event.summary, event.recurrence) for event in calendar.events("캘린더")] == [
+        ("팀 회의", ""), ("주간 회의", "FREQ=WEEKLY")
+    ]
+    assert tools.backend.calls["calendar/create"] == 1
+
+
+def test_create_failure_is_reported_per_item():
+    tools = CalendarTools(backend=MemoryCalendarBackend(MemoryCalendar(["Work"], tz=SEOUL)))
+    result = tools.create_event(DAY, "팀 회의", "오전 10시")
+    assert not result["success"]
+    assert "캘린더를 찾을 수 없습니다" in result["error"]
+    tools.close()
+
+
+def test_batch_update_and_delete_run_one_script_each(cached_tools, calendar):
+    cached_tools.create_events([
+        {"date_str": DAY, "title": "팀 회의", "time_str": "오전 10시"},
+        {"date_str": DAY, "title": "코드 리뷰", "time_str": "오후 3시"},
+    ])
+    updated = cached_tools.update_events([
+        {"original_title": "팀 회의", "new_time_str": "오전 11시", "original_date_str": DAY},
+        {"original_title": "코드 리뷰", "new_title": "디자인 리뷰", "original_date_str": DAY},
+        {"original_title": "없는 일정", "new_title": "무엇", "original_date_str": DAY},
+    ])
+    assert [item["success"] for item in updated["results"]] == [True, True, False]
+    assert [(event.summary, event.start.hour) for event in calendar.events("캘린더")] == [
+        ("팀 회의", 11), ("디자인 리뷰", 15)
+    ]
+    # 캐시에도 바로 반영
+    assert [event.title for event in cached_tools.get_events(DAY)["events"]] == ["팀 회의", "디자인 리뷰"]
+    
+    deleted = cached_tools.delete_events([{"title": "팀 회의", "date_str": DAY}, {"title": "디자인 리뷰"}])
+    assert deleted["success"]
+    assert len(calendar) == 0
+    assert cached_tools.get_events(DAY)["events"] == []
+    assert cached_tools.backend.calls["calendar/update"] == 1
+    assert cached_tools.backend.calls["calendar/delete"] == 1
+
+
+def test_check_conflicts_and_free_slots(tools, calendar):
+    _add(calendar, "캘린더", "팀 회의", 10)
+    _add(calendar, "Work", "외부 미팅", 13, minutes=120)
+    conflicts = tools.check_conflicts(f"{DAY} 오전 10시 30분", f"{DAY} 오후 1시 30분")
+    assert [event.title for event in conflicts["conflicts"]] == ["팀 회의", "외부 미팅"]
+    
+    result = tools.find_free_slots(DAY, duration_minutes=60, working_hours="09:00-18:00")
+    assert [(slot["start"].hour, slot["minutes"]) for slot in result["slots"]] == [(9, 60), (11, 120), (15, 180)]
+    assert tools.find_free_slots(DAY, duration_minutes=150, working_hours="09:00-18:00")["slots"][0]["start"].hour == 15
+
+
+def test_conflicts_include_event_from_previous_day(tools, cached_tools, calendar):
+    calendar.add_event("캘린더", "야간 작업", datetime(2027, 3, 1, 22), datetime(2027, 3, 2, 10))
+    for each in (tools, cached_tools):
+        conflicts = each.check_conflicts(f"{DAY} 오전 9시", f"{DAY} 오전 9시 30분")
+        assert [event.title for event in conflicts["conflicts"]] == ["야간 작업"]
+
+
+def test_search_events_needs_store(tools, cached_tools, calendar):
+    assert not tools.search_events("회의")["success"]
+    _add(calendar, "캘린더", "디자인 리뷰", 10)
+    _add(calendar, "캘린더", "점심 약속", 12)
+    result = cached_tools.search_events("디자인", start=DAY, end=DAY)
+    assert [event.title for event in result["events"]] == ["디자인 리뷰"]
+
+
+def test_async_tools_share_steps(cached_tools, calendar):
+    async_tools = AsyncCalendarTools(cached_tools, AsyncMemoryCalendarBackend(calendar))
+    
+    async def run():
+        created = await async_tools.create_event(DAY, "팀 회의", "오전 10시")
+        listed = await async_tools.get_events(DAY)
+        missing = await async_tools.update_event("없는 일정", new_title="무엇", original_date_str=DAY)
+        await async_tools.close()
+        return created, listed, missing
+    
+    created, listed, missing = asyncio.run(run())
+    assert created["success"]
+    assert [event.title for event in listed["events"]] == ["팀 회의"]
+    assert not missing["success"]
+    assert async_tools.backend.calls["calendar/create"] == 1
+    # 동기 백엔드로는 스크립트를 실행하지 않음
+    assert cached_tools.backend.calls == {}
+
+
+def test_async_drive_passes_errors_into_steps():
+    async_tools = AsyncCalendarTools(
+        CalendarTools(backend=MemoryCalendarBackend(MemoryCalendar(["Work"], tz=SEOUL))),
+        AsyncMemoryCalendarBackend(MemoryCalendar(["Work"], tz=SEOUL))
+    )
+    result = asyncio.run(async_tools.create_event(DAY, "팀 회의", "오전 10시"))
+    assert not result["success"]
+    assert "캘린더를 찾을 수 없습니다" in result["error"]
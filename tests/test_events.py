@@ -0,0 +1,100 @@
+"""
+일정 모델, 스크립트 출력 형식, iCalendar 읽기/쓰기 (app/events, app/query/planner.py)
+"""
+
+from datetime import datetime, timedelta
+
+from app.events import Event, iter_records, records_to_events
+from app.events.ics import iter_ics_events, iter_ics_lines
+from app.query import QueryStats, plan_query, split_stats
+
+from conftest import SEOUL
+
+RECORD = "캘린더\x1fu1\x1f회의, 점심\n포함\x1f2026-10-20T10:00:00\x1f2026-10-20T11:00:00\x1f3층\x1f"
+
+
+def test_iter_records_across_chunk_boundaries():
+    output = f"{RECORD}\x1e{RECORD}\x1e마지막\x1f\x1f\n"
+    # 어느 위치에서 잘려 들어와도 같은 레코드
+    for size in (1, 3, 7, len(output)):
+        chunks = [output[i:i + size] for i in range(0, len(output), size)]
+        records = list(iter_records(chunks))
+        assert records[-1] == ["마지막", "", ""]
+        assert records[0][2] == "회의, 점심\n포함"
+        assert len(records) == 3
+
+
+def test_records_to_events_skips_malformed():
+    records = [
+        RECORD.split("\x1f"),
+        ["캘린더", "u2", "짧은 레코드", "2026-10-20T10:00:00", "2026-10-20T11:00:00"],
+        ["캘린더", "u3", "시간 오류", "어제", "2026-10-20T11:00:00", "", ""],
+        ["필드", "수", "불일치"],
+    ]
+    events = list(records_to_events(records, SEOUL))
+    assert [(event.uid, event.location) for event in events] == [("u1", "3층"), ("u2", "")]
+    assert events[0].start == SEOUL.localize(datetime(2026, 10, 20, 10))
+
+
+def test_split_stats_collects_rules():
+    stats, rules = QueryStats(), []
+    records = [
+        RECORD.split("\x1f"),
+        ["#rule", "캘린더", "r1", "주간 회의", "2026-10-05T10:00:00", "2026-10-05T11:00:00", "", "", "FREQ=WEEKLY"],
+        ["#stats", "12"],
+    ]
+    events = list(split_stats(records, SEOUL, stats, rules))
+    assert [event.uid for event in events] == ["u1"]
+    assert (stats.scanned, stats.returned) == (12, 1)
+    assert rules == [["캘린더", "r1", "주간 회의", "2026-10-05T10:00:00", "2026-10-05T11:00:00", "", "", "FREQ=WEEKLY"]]
+
+
+def test_plan_matches_like_applescript():
+    start, end = SEOUL.localize(datetime(2026, 10, 20)), SEOUL.localize(datetime(2026, 10, 20, 23, 59))
+    plan = plan_query(["캘린더", "Work", "캘린더"], start, end, "design 리뷰")
+    assert plan.calendars == ("캘린더", "Work")
+    event = Event("u1", "Work", "Design 리뷰", start.replace(hour=10), start.replace(hour=11))
+    assert plan.matches(event)
+    assert not plan.matches(Event("u2", "집", "Design 리뷰", start, start))
+    assert not plan.matches(Event("u3", "Work", "Design", start, start))
+
+
+def test_ics_round_trip():
+    events = [
+        Event("u1@test", "캘린더", "회의; 점심, 저녁", SEOUL.localize(datetime(2026, 10, 20, 10)),
+              SEOUL.localize(datetime(2026, 10, 20, 11)), "3층\\회의실", "첫 줄\n둘째 줄 " + "긴 메모 " * 20),
+        Event("", "Work", "코드 리뷰", SEOUL.localize(datetime(2026, 10, 21, 15)), SEOUL.localize(datetime(2026, 10, 21, 16))),
+    ]
+    lines = list(iter_ics_lines(events))
+    assert all(len(line.rstrip("\r\n").encode("utf-8")) <= 75 for text in lines for line in text.split("\r\n "))
+    
+    parsed = list(iter_ics_events("".join(lines).splitlines(), SEOUL, calendar="가져오기"))
+    assert [(event.title, event.location, event.notes) for event in parsed] == [
+        (events[0].title, events[0].location, events[0].notes.strip()), ("코드 리뷰", "", "")
+    ]
+    assert [event.start for event in parsed] == [event.start for event in events]
+    assert parsed[0].uid == "u1@test" and parsed[1].uid.endswith("@mac_agent")
+
+
+def test_ics_defaults_and_skips():
+    text = """BEGIN:VCALENDAR
+BEGIN:VEVENT
+SUMMARY:종일 일정
+DTSTART;VALUE=DATE:20261020
+END:VEVENT
+BEGIN:VEVENT
+SUMMARY:길이로 끝
+DTSTART;TZID=Asia/Seoul:20261020T090000
+DURATION:PT1H30M
+BEGIN:VALARM
+SUMMARY:알림
+END:VALARM
+END:VEVENT
+BEGIN:VEVENT
+SUMMARY:시작 없음
+END:VEVENT
+END:VCALENDAR"""
+    events = list(iter_ics_events(text.splitlines(), SEOUL))
+    assert [event.title for event in events] == ["종일 일정", "길이로 끝"]
+    assert events[0].end - events[0].start == timedelta(days=1)
+    assert (events[1].start.hour, events[1].end.hour, events[1].end.minute) == (9, 10, 30)
@@ -0,0 +1,62 @@
+"""
+규칙 기반 의도 분류 (app/intent/rules.py)
+"""
+
+import pytest
+
+from app.agent.prompt import PromptManager
+from app.intent import RuleIntentClassifier, parse_examples
+
+
+@pytest.fixture
+def classifier():
+    return RuleIntentClassifier(parse_examples(PromptManager.get_intent_classifier_prompt()))
+
+
+def test_prompt_examples_are_parsed():
+    examples = parse_examples(PromptManager.get_intent_classifier_prompt())
+    assert ("내일 일정 보여줘", "calendar") in examples
+    assert ("고마워", "general") in examples
+
+
+@pytest.mark.parametrize("text, intent", [
+    ("내일 일정 보여줘", "calendar"),
+    ("내일 오후 2시에 치과 예약 추가해줘", "calendar"),
+    ("주간 회의 삭제해줘", "calendar"),
+    ("캘린더에 생일 파티 넣어줘", "calendar"),
+    ("10월 3일 병원", "calendar"),
+    ("안녕", "general"),
+    ("고맙습니다", "general"),
+])
+def test_obvious_inputs_are_decided(classifier, text, intent):
+    assert classifier.decide(text).intent_type == intent
+
+
+@pytest.mark.parametrize("text", [
+    "캘린더가 뭐야?",
+    "스케줄링 알고리즘 설명해줘",
+    "일정 관리 앱 추천해줘",
+    "회의록 정리하는 법 알려줘",
+    "맛집 추천해줘",
+    "일정 추가하는 법 알려줘",
+    "일정 삭제 기능 있어?",
+    "회의 일정 변경은 어떻게 해?",
+])
+def test_single_clue_inputs_go_to_llm(classifier, text):
+    decision = classifier.decide(text)
+    assert decision.intent_type is None
+    assert classifier.calendar_clues(decision.evidence) < 2
+
+
+def test_threshold_above_one_always_defers(classifier):
+    classifier.threshold = 2.0
+    assert classifier.decide("내일 오후 3시 팀 회의 추가해줘").intent_type is None
+
+
+def test_classify_counts_hits_and_fallbacks(classifier):
+    classifier.classify("내일 일정 보여줘")
+    classifier.classify("캘린더가 뭐야?")
+    classifier.record_llm(0.5)
+    stats = classifier.stats.as_dict()
+    assert (stats["hits"], stats["fallbacks"], stats["llm_calls"]) == (1, 1, 1)
+    assert stats["by_intent"] == {"calendar": 1}
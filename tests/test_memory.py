@@ -0,0 +1,100 @@
+"""
+세션 메모리와 토큰 예산 (app/memory/manager.py, app/memory/budget.py)
+"""
+
+import asyncio
+from datetime import datetime
+
+from autogen_core.memory import MemoryContent, MemoryMimeType
+
+from app.memory import ConversationMemory, MemoryManager, estimate_tokens, extractive_summary
+from app.memory.budget import SUMMARY_PREFIX
+from app.session.models import SessionInfo
+from app.session.storage import SessionStorage
+
+
+def _text(content: str) -> MemoryContent:
+    return MemoryContent(content=content, mime_type=MemoryMimeType.TEXT)
+
+
+def test_history_keeps_summary_line_within_limit(tmp_path):
+    manager = MemoryManager(SessionStorage(tmp_path))
+    memory = manager.get_or_create_memory("s1")
+    
+    async def fill():
+        await memory.add(_text(f"{SUMMARY_PREFIX}회의 일정을 잡음"))
+        for turn in range(5):
+            await memory.add(_text(f"user: 질문 {turn}"))
+        return await manager.get_conversation_history("s1", limit=2)
+    
+    history = asyncio.run(fill())
+    assert history == [f"{SUMMARY_PREFIX}회의 일정을 잡음", "user: 질문 3", "user: 질문 4"]
+
+
+def test_history_without_summary(tmp_path):
+    manager = MemoryManager(SessionStorage(tmp_path))
+    
+    async def fill():
+        for turn in range(3):
+            await manager.add_to_memory("s1", f"질문 {turn}")
+        return await manager.get_conversation_history("s1", limit=2)
+    
+    history = asyncio.run(fill())
+    assert [line.split("] ", 1)[1] for line in history] == ["user: 질문 1", "user: 질문 2"]
+    assert asyncio.run(manager.get_conversation_history("없는 세션")) == []
+
+
+def test_estimate_tokens():
+    assert estimate_tokens("abcd" * 10) == 10
+    assert estimate_tokens("회의") == 2
+    assert estimate_tokens("") == 0
+
+
+def test_extractive_summary_trims_to_budget():
+    lines = [f"[2026-10-18 09:00:0{n}] user: {'긴 문장 ' * 20}{n}" for n in range(5)]
+    summary = asyncio.run(extractive_summary("", lines, max_tokens=120))
+    assert not summary.startswith("[")
+    assert estimate_tokens(summary) <= 120
+    # 오래된 줄부터 버림
+    assert summary.splitlines()[-1].startswith("user: 긴 문장")
+
+
+def test_compact_keeps_recent_lines_and_view_budget():
+    memory = ConversationMemory(recent_tokens=12, summary_tokens=100)
+    
+    async def fill():
+        for turn in range(6):
+            await memory.add(_text(f"user: 질문 {turn}"))
+        return await memory.compact()
+    
+    folded = asyncio.run(fill())
+    assert folded == 3
+    assert [str(item.content) for item in memory.content] == ["user: 질문 3", "user: 질문 4", "user: 질문 5"]
+    assert memory.summary.splitlines() == ["user: 질문 0", "user: 질문 1", "user: 질문 2"]
+    assert memory.export()[0].startswith(SUMMARY_PREFIX)
+    
+    # 예산이 작으면 최근 줄만, 넉넉하면 요약까지 넣음
+    assert [str(item.content) for item in memory.view(4).select()] == ["user: 질문 5"]
+    selected = [str(item.content) for item in memory.view(1000).select()]
+    assert selected[0].startswith(SUMMARY_PREFIX) and selected[1:] == ["user: 질문 3", "user: 질문 4", "user: 질문 5"]
+    assert memory.view(4) is memory.view(4)
+
+
+def test_close_saves_compacted_memory(tmp_path):
+    storage = SessionStorage(tmp_path)
+    manager = MemoryManager(storage, recent_tokens=12)
+    now = datetime.now()
+    storage.save_session(SessionInfo(session_id="s1", created_at=now, last_active=now, message_count=3))
+    memory = manager.get_or_create_memory("s1")
+    
+    async def run():
+        for turn in range(8):
+            await memory.add(_text(f"user: 질문 {turn}"))
+        manager.compact_in_background("s1")
+        await manager.close()
+    
+    asyncio.run(run())
+    session_info, contents = storage.load_session("s1")
+    assert session_info.message_count == 3
+    assert contents[0].startswith(SUMMARY_PREFIX)
+    assert contents[1:] == ["user: 질문 5", "user: 질문 6", "user: 질문 7"]
@@ -0,0 +1,76 @@
+"""
+메모리 Calendar 백엔드 (app/backends/memory.py)
+"""
+
+import asyncio
+from datetime import datetime
+
+from app.backends import (
+    AsyncMemoryCalendarBackend, MemoryCalendar, MemoryCalendarBackend, create_async_backend,
+    create_backend, shared_calendar
+)
+from app.events import iter_records
+from app.scripts import changes_call, list_calendars_call, rules_call
+
+
+def test_backend_keeps_empty_calendar(calendar):
+    assert len(calendar) == 0
+    assert MemoryCalendarBackend(calendar).calendar is calendar
+    assert AsyncMemoryCalendarBackend(calendar).calendar is calendar
+
+
+def test_configured_backends_share_one_calendar():
+    backend = create_backend("memory")
+    async_backend = create_async_backend("memory")
+    assert backend.calendar is shared_calendar()
+    assert async_backend.calendar is backend.calendar
+
+
+def test_list_calendars(calendar):
+    backend = MemoryCalendarBackend(calendar)
+    records = list(iter_records([backend.run(list_calendars_call())]))
+    assert records == [["캘린더"], ["Work"]]
+    assert backend.calls == {"calendar/list": 1}
+
+
+def test_changes_since_stamp():
+    now = [datetime(2026, 10, 18, 9, 0)]
+    calendar = MemoryCalendar(["캘린더"], clock=lambda: now[0])
+    calendar.add_event("캘린더", "이전 일정", datetime(2026, 10, 20, 10), datetime(2026, 10, 20, 11))
+    now[0] = datetime(2026, 10, 18, 10, 0)
+    calendar.add_event("캘린더", "새 일정", datetime(2026, 10, 21, 10), datetime(2026, 10, 21, 11),
+                       recurrence="FREQ=WEEKLY;INTERVAL=1")
+    backend = MemoryCalendarBackend(calendar)
+    
+    records = list(iter_records([backend.run(changes_call(["캘린더"], datetime(2026, 10, 18, 9, 30)))]))
+    assert [fields[2] for fields in records] == ["새 일정"]
+    assert records[0][7] == "FREQ=WEEKLY;INTERVAL=1"
+    
+    rules = list(iter_records([backend.run(rules_call(["캘린더", "없는 캘린더"]))]))
+    assert [fields[2] for fields in rules] == ["새 일정"]
+
+
+def test_tools_round_trip(tools, calendar):
+    created = tools.create_event("2026-10-20", "팀 회의", "오후 3시", location="3층")
+    assert created["success"]
+    assert [event.summary for event in calendar.events("캘린더")] == ["팀 회의"]
+    
+    events = tools.get_events("2026-10-20")["events"]
+    assert [(event.title, event.location) for event in events] == [("팀 회의", "3층")]
+    assert events[0].start.hour == 15
+    
+    updated = tools.update_event("팀 회의", new_time_str="오후 4시", original_date_str="2026-10-20")
+    assert updated["success"]
+    assert calendar.events("캘린더")[0].start == datetime(2026, 10, 20, 16, 0)
+    
+    deleted = tools.delete_event("팀 회의", "2026-10-20")
+    assert deleted["success"]
+    assert len(calendar) == 0
+
+
+def test_async_backend_runs_templates(calendar):
+    calendar.add_event("Work", "코드 리뷰", datetime(2026, 10, 20, 10), datetime(2026, 10, 20, 11))
+    backend = AsyncMemoryCalendarBackend(calendar)
+    output = asyncio.run(backend.run(rules_call(["Work"])))
+    assert output == ""
+    assert backend.calls == {"calendar/rules": 1}
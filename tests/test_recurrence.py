@@ -0,0 +1,97 @@
+"""
+반복 일정 규칙과 지연 전개 (app/recurrence/rules.py), 조회와 함께 가져오는 규칙 레코드
+"""
+
+from datetime import date, datetime
+
+import pytest
+
+from app.events import Event
+from app.recurrence import RecurringEvent, expand, parse_recurrence, records_to_rules
+
+from conftest import SEOUL
+
+
+@pytest.mark.parametrize("expression, rule", [
+    ("매주", "FREQ=WEEKLY"),
+    ("평일", "FREQ=WEEKLY;BYDAY=MO,TU,WE,TH,FR"),
+    ("격주 화요일", "FREQ=WEEKLY;INTERVAL=2;BYDAY=TU"),
+    ("매주 월수금 10회", "FREQ=WEEKLY;BYDAY=MO,WE,FR;COUNT=10"),
+    ("2주마다", "FREQ=WEEKLY;INTERVAL=2"),
+    ("매월 12월까지", "FREQ=MONTHLY;UNTIL=20261231T235959"),
+    ("RRULE:FREQ=DAILY", "FREQ=DAILY"),
+])
+def test_parse_recurrence(expression, rule):
+    assert parse_recurrence(expression, date(2026, 10, 18)) == rule
+
+
+def test_parse_recurrence_rejects_unknown():
+    with pytest.raises(ValueError):
+        parse_recurrence("가끔")
+
+
+def _weekly(title: str, start: datetime, rule: str = "FREQ=WEEKLY") -> RecurringEvent:
+    first = SEOUL.localize(start)
+    return RecurringEvent(Event(f"uid-{title}", "캘린더", title, first, first.replace(hour=first.hour + 1)), rule)
+
+
+def test_occurrences_only_in_window():
+    rule = _weekly("스탠드업", datetime(2024, 1, 1, 9))
+    window = (SEOUL.localize(datetime(2026, 10, 19)), SEOUL.localize(datetime(2026, 10, 25, 23, 59)))
+    occurrences = list(rule.occurrences(*window, SEOUL))
+    assert [event.start.replace(tzinfo=None) for event in occurrences] == [datetime(2026, 10, 19, 9)]
+    assert occurrences[0].uid == "uid-스탠드업"
+
+
+def test_expand_merges_in_start_order():
+    rules = [_weekly("B", datetime(2026, 10, 1, 14)), _weekly("A", datetime(2026, 10, 2, 9))]
+    window = (SEOUL.localize(datetime(2026, 10, 19)), SEOUL.localize(datetime(2026, 10, 31)))
+    titles = [event.title for event in expand(rules, *window, SEOUL)]
+    assert titles == ["B", "A", "B", "A"]
+
+
+def test_records_to_rules_skips_plain_events():
+    records = [
+        ["캘린더", "u1", "주간 회의", "2026-10-05T10:00:00", "2026-10-05T11:00:00", "", "", "RRULE:FREQ=WEEKLY"],
+        ["캘린더", "u2", "단발 일정", "2026-10-05T10:00:00", "2026-10-05T11:00:00", "", "", ""],
+    ]
+    rules = list(records_to_rules(records, SEOUL))
+    assert [(rule.event.title, rule.rule) for rule in rules] == [("주간 회의", "FREQ=WEEKLY")]
+
+
+def _seed_weekly(calendar):
+    calendar.add_event("캘린더", "주간 회의", datetime(2026, 10, 5, 10), datetime(2026, 10, 5, 11),
+                       recurrence="FREQ=WEEKLY")
+    calendar.add_event("Work", "코드 리뷰", datetime(2026, 10, 27, 15), datetime(2026, 10, 27, 16))
+
+
+def test_get_events_fetches_rules_in_the_query_script(tools, calendar):
+    _seed_weekly(calendar)
+    result = tools.get_events("2026-10-26")
+    assert [event.title for event in result["events"]] == ["주간 회의"]
+    assert result["events"][0].start == SEOUL.localize(datetime(2026, 10, 26, 10))
+    
+    result = tools.get_events(start="2026-10-26", end="2026-10-27")
+    assert [event.title for event in result["events"]] == ["주간 회의", "코드 리뷰"]
+    assert result["query"]["returned"] == 1
+    # 조회마다 스크립트 실행은 한 번 (반복 일정 규칙을 따로 가져오지 않음)
+    assert tools.backend.calls == {"calendar/list": 1, "calendar/query/0/rules": 2}
+
+
+def test_busy_lookup_fetches_rules_in_the_query_script(tools, calendar):
+    _seed_weekly(calendar)
+    result = tools.check_conflicts("2026-10-26 오전 10시 30분", "2026-10-26 오전 11시 30분")
+    assert [event.title for event in result["conflicts"]] == ["주간 회의"]
+    assert "calendar/rules" not in tools.backend.calls
+
+
+def test_cached_sync_fetches_rules_with_the_first_range(cached_tools, calendar):
+    _seed_weekly(calendar)
+    result = cached_tools.get_events("2026-10-26")
+    assert [event.title for event in result["events"]] == ["주간 회의"]
+    assert result["query"]["source"] == "cache"
+    assert cached_tools.backend.calls == {"calendar/list": 1, "calendar/query/0/rules": 1}
+    
+    # 규칙과 구간이 모두 새로우면 다시 조회하지 않음
+    cached_tools.get_events("2026-10-26")
+    assert cached_tools.backend.calls == {"calendar/list": 1, "calendar/query/0/rules": 1}
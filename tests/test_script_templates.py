@@ -0,0 +1,103 @@
+"""
+AppleScript 템플릿과 인자 전달 (app/backends/templates.py, app/scripts/calendar.py)
+
+제목은 스크립트 소스에 끼워 넣지 않고 argv로 넘기므로 따옴표·역슬래시·줄바꿈이 그대로
+왕복해야 하고, RS/US는 출력 레코드를 깨지 않도록 공백으로 바뀌어야 합니다.
+"""
+
+import re
+
+import pytest
+
+from app.backends import CallableBackend, MemoryCalendarBackend
+from app.backends.templates import _TEMPLATES, ScriptCall, quote_applescript, register_template
+from app.calendar_tools import CalendarTools
+from app.events import field_text
+
+# 인라인 스크립트: 보조 핸들러, argv 리터럴 목록, 본문 (ScriptTemplate.inline 참고)
+_INLINE = re.compile(r'(?s)(?P<handlers>.*?)\nset argv to \{(?P<literal>(?:"(?:[^"\\]|\\.)*"(?:, )?)*)\}\n(?P<body>.*)\n')
+_STRING = re.compile(r'"((?:[^"\\]|\\.)*)"')
+
+HOSTILE_TITLES = [
+    'Say "hi"',
+    'C:\\temp\\ 정리',
+    '1부\n2부',
+    '"; do shell script "touch /tmp/pwned" --',
+    '끝 역슬래시 \\',
+    '구분자\x1e레코드\x1f필드',
+]
+
+
+def _unquote(literal: str) -> str:
+    return re.sub(r'\\(.)', r'\1', literal, flags=re.S)
+
+
+def _interpret_inline(calendar):
+    """인라인 스크립트를 다시 템플릿과 argv로 풀어 MemoryCalendar에 실행하는 함수
+    
+    CallableBackend가 받는 소스 문자열만으로 인자가 손상 없이 전달되는지 확인합니다.
+    """
+    def run(source: str) -> str:
+        match = _INLINE.fullmatch(source)
+        assert match, source
+        template = next(template for template in _TEMPLATES.values()
+                        if template.body == match["body"] and template.handlers == match["handlers"])
+        args = tuple(_unquote(literal) for literal in _STRING.findall(match["literal"]))
+        return calendar.execute(ScriptCall(template, args))
+    return run
+
+
+@pytest.fixture(params=["memory", "callable"])
+def hostile_tools(request, calendar):
+    if request.param == "memory":
+        backend = MemoryCalendarBackend(calendar)
+    else:
+        backend = CallableBackend(_interpret_inline(calendar))
+    tools = CalendarTools(backend=backend)
+    yield tools
+    tools.close()
+
+
+def test_quote_applescript():
+    assert quote_applescript('a "b" \\c') == '"a \\"b\\" \\\\c"'
+    assert quote_applescript("") == '""'
+
+
+def test_register_template_rejects_different_source():
+    template = register_template("test/echo", "return item 1 of argv")
+    assert register_template("test/echo", "return item 1 of argv") is template
+    with pytest.raises(ValueError):
+        register_template("test/echo", "return item 2 of argv")
+
+
+def test_inline_keeps_source_fixed_per_template():
+    template = register_template("test/join", "return (item 1 of argv) & (item 2 of argv)")
+    inline = template.call('"; quit', "\\").inline()
+    assert inline.endswith(f"\n{template.body}\n")
+    assert 'set argv to {"\\"; quit", "\\\\"}' in inline
+
+
+def test_field_text_replaces_separators():
+    assert field_text("a\x1eb\x1fc") == "a b c"
+    assert field_text(None) == ""
+
+
+@pytest.mark.parametrize("title", HOSTILE_TITLES)
+def test_hostile_title_round_trip(hostile_tools, calendar, title):
+    expected = field_text(title)
+    created = hostile_tools.create_event("2026-10-20", title, "오후 3시", location='3"층\\', notes="메모\n둘째 줄")
+    assert created["success"], created
+    assert [event.summary for event in calendar.events("캘린더")] == [expected]
+    
+    events = hostile_tools.get_events("2026-10-20")["events"]
+    assert [(event.title, event.location, event.notes) for event in events] == [(expected, '3"층\\', "메모\n둘째 줄")]
+    
+    renamed = f"{title} (변경)"
+    updated = hostile_tools.update_event(title, new_title=renamed, new_time_str="오후 4시",
+                                         original_date_str="2026-10-20")
+    assert updated["success"], updated
+    events = hostile_tools.get_events("2026-10-20")["events"]
+    assert [(event.title, event.start.hour) for event in events] == [(field_text(renamed), 16)]
+    
+    assert hostile_tools.delete_event(renamed, "2026-10-20")["success"]
+    assert len(calendar) == 0
@@ -0,0 +1,170 @@
+"""
+로컬 일정 캐시와 캘린더 목록 캐시 (app/store/cache.py, app/store/catalog.py)
+"""
+
+import json
+import time
+from datetime import date, datetime
+
+import pytest
+
+from app.events import Event
+from app.recurrence import RecurringEvent
+from app.store import CalendarCatalog, EventStore
+
+from conftest import SEOUL
+
+
+def _at(day: int, hour: int) -> datetime:
+    return SEOUL.localize(datetime(2026, 10, day, hour))
+
+
+def _event(uid: str, title: str, day: int, hour: int, calendar: str = "캘린더", **fields) -> Event:
+    return Event(uid, calendar, title, _at(day, hour), _at(day, hour + 1), **fields)
+
+
+@pytest.fixture
+def store():
+    store = EventStore(":memory:", tz=SEOUL)
+    yield store
+    store.close()
+
+
+def test_missing_ranges_until_fetched(store):
+    calendars = ["캘린더", "Work"]
+    assert store.missing_ranges(calendars, _at(19, 0), _at(25, 0)) == [(date(2026, 10, 19), date(2026, 10, 25))]
+    
+    store.replace_range(calendars, date(2026, 10, 21), date(2026, 10, 22), [])
+    assert store.missing_ranges(calendars, _at(19, 0), _at(25, 0)) == [
+        (date(2026, 10, 19), date(2026, 10, 20)), (date(2026, 10, 23), date(2026, 10, 25))
+    ]
+    # 한 캘린더만 가져온 날짜는 여전히 필요
+    assert store.missing_ranges(["캘린더", "집"], _at(21, 0), _at(21, 23)) == [(date(2026, 10, 21), date(2026, 10, 21))]
+    
+    store.invalidate()
+    assert store.missing_ranges(calendars, _at(21, 0), _at(22, 0)) == [(date(2026, 10, 21), date(2026, 10, 22))]
+
+
+def test_missing_ranges_after_ttl():
+    store = EventStore(":memory:", ttl_seconds=0, tz=SEOUL)
+    store.replace_range(["캘린더"], date(2026, 10, 20), date(2026, 10, 20), [])
+    time.sleep(0.01)
+    assert store.missing_ranges(["캘린더"], _at(20, 0), _at(20, 23)) == [(date(2026, 10, 20), date(2026, 10, 20))]
+    store.close()
+
+
+def test_replace_range_replaces_only_that_range(store):
+    store.replace_range(["캘린더"], date(2026, 10, 20), date(2026, 10, 21), [
+        _event("a", "취소될 회의", 20, 9), _event("b", "유지될 회의", 21, 9)
+    ])
+    store.replace_range(["캘린더"], date(2026, 10, 20), date(2026, 10, 20), [_event("c", "새 회의", 20, 14)])
+    assert [event.title for event in store.query(_at(20, 0), _at(21, 23))] == ["새 회의", "유지될 회의"]
+    assert store.count(_at(20, 0), _at(21, 23)) == 2
+
+
+def test_query_filters_and_merges_rules(store):
+    store.replace_range(["캘린더", "Work"], date(2026, 10, 19), date(2026, 10, 25), [
+        _event("a", "팀 회의", 20, 9), _event("b", "코드 리뷰", 21, 15, calendar="Work")
+    ])
+    store.replace_rules(["캘린더"], [RecurringEvent(_event("r", "주간 회의", 5, 10), "FREQ=WEEKLY")])
+    
+    events = store.query(_at(19, 0), _at(26, 23))
+    assert [(event.title, event.start.day) for event in events] == [
+        ("주간 회의", 19), ("팀 회의", 20), ("코드 리뷰", 21), ("주간 회의", 26)
+    ]
+    assert [event.title for event in store.query(_at(20, 0), _at(25, 23), keywords="회의")] == ["팀 회의"]
+    assert [event.title for event in store.query(_at(19, 0), _at(26, 23), calendars=["Work"])] == ["코드 리뷰"]
+    assert store.count(_at(1, 0), _at(31, 23)) == 6
+
+
+def test_find_overlaps_includes_occurrences(store):
+    store.add_event(_event("a", "점심 약속", 26, 12))
+    store.add_rule(RecurringEvent(_event("r", "주간 회의", 5, 10), "FREQ=WEEKLY"))
+    overlaps = store.find_overlaps(_at(26, 10).replace(minute=30), _at(26, 12).replace(minute=30))
+    assert [event.title for event in overlaps] == ["주간 회의", "점심 약속"]
+    assert store.find_overlaps(_at(26, 11), _at(26, 12)) == []
+
+
+def test_stale_rule_calendars(store):
+    assert store.stale_rule_calendars(["캘린더", "Work", "캘린더"]) == ["캘린더", "Work"]
+    store.replace_rules(["캘린더"], [])
+    assert store.stale_rule_calendars(["캘린더", "Work"]) == ["Work"]
+
+
+def test_write_through_by_uid(store):
+    store.add_event(_event("a", "팀 회의", 20, 9))
+    store.add_rule(RecurringEvent(_event("r", "스탠드업", 5, 9), "FREQ=DAILY"))
+    assert [event.uid for event in store.find_by_title("팀 회의")] == ["a"]
+    assert store.find_by_title("팀 회의", _at(21, 0), _at(21, 23)) == []
+    
+    assert store.update_by_uid("a", "팀 회의 (변경)", _at(20, 15), _at(20, 16))
+    updated = store.get_by_uid("a")
+    assert (updated.title, updated.start) == ("팀 회의 (변경)", _at(20, 15))
+    assert store.get_by_uid("r").title == "스탠드업"
+    assert not store.update_by_uid("없음", "제목")
+    
+    assert store.delete_by_uid("a")
+    assert store.delete_by_uid("r")
+    assert not store.delete_by_uid("a")
+    assert store.query(_at(1, 0), _at(31, 23)) == []
+
+
+def test_apply_changes_and_prune(store):
+    calendars = ["캘린더"]
+    store.replace_range(calendars, date(2026, 10, 20), date(2026, 10, 21), [
+        _event("a", "팀 회의", 20, 9), _event("b", "코드 리뷰", 21, 9)
+    ])
+    applied = store.apply_changes(calendars, [_event("a", "팀 회의 (이동)", 21, 14)],
+                                  [RecurringEvent(_event("b", "코드 리뷰", 21, 9), "FREQ=WEEKLY")],
+                                  date(2026, 10, 20), date(2026, 10, 21))
+    assert applied == 2
+    assert [event.title for event in store.query(_at(20, 0), _at(21, 23))] == ["코드 리뷰", "팀 회의 (이동)"]
+    assert [rule.event.uid for rule in store.rules()] == ["b"]
+    
+    assert store.prune(calendars, date(2026, 10, 20), date(2026, 10, 21), ["a"]) == 1
+    assert store.rules() == []
+    assert [event.uid for event in store.query(_at(20, 0), _at(21, 23))] == ["a"]
+
+
+def test_sync_stamps(store):
+    assert store.sync_stamps(["캘린더"]) == {}
+    store.set_sync_stamp(["캘린더", "Work"], _at(18, 9))
+    assert store.sync_stamps(["캘린더", "Work"]) == {"캘린더": _at(18, 9), "Work": _at(18, 9)}
+
+
+def test_search_ranks_and_follows_writes(store):
+    store.replace_range(["캘린더"], date(2026, 10, 20), date(2026, 10, 22), [
+        _event("a", "디자인 리뷰", 20, 9, location="3층 회의실"),
+        _event("b", "점심 약속", 21, 12, notes="디자인팀과"),
+        _event("c", "운동", 22, 7)
+    ])
+    assert [event.uid for event, _ in store.search("디자인")] == ["a", "b"]
+    assert [event.uid for event, _ in store.search("디자인", start=_at(21, 0))] == ["b"]
+    
+    # 색인을 만든 뒤의 쓰기도 바로 반영됨
+    store.add_event(_event("d", "디자인 워크숍", 23, 10))
+    store.delete_by_uid("a")
+    assert [event.uid for event, _ in store.search("디자인 워크숍")][0] == "d"
+    assert "a" not in [event.uid for event, _ in store.search("디자인")]
+
+
+def test_catalog_round_trip_and_expiry(tmp_path):
+    catalog = CalendarCatalog(tmp_path / "calendars.json")
+    assert catalog.load() is None
+    catalog.save(["캘린더", "Work"])
+    assert catalog.load() == ["캘린더", "Work"]
+    
+    expired = CalendarCatalog(tmp_path / "calendars.json", ttl_seconds=-1)
+    assert expired.load() is None
+    
+    catalog.invalidate()
+    assert catalog.load() is None
+    catalog.invalidate()
+
+
+def test_catalog_ignores_broken_file(tmp_path):
+    path = tmp_path / "calendars.json"
+    path.write_text(json.dumps({"calendars": ["캘린더"]}), encoding="utf-8")
+    assert CalendarCatalog(path).load() is None
+    path.write_text("{", encoding="utf-8")
+    assert CalendarCatalog(path).load() is None
@@ -0,0 +1,80 @@
+"""
+변경분 동기화 (CalendarTools.sync_changes, app/sync/engine.py)
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.backends import AsyncMemoryCalendarBackend
+from app.calendar_tools import AsyncCalendarTools
+from app.sync import SyncEngine
+
+from conftest import SEOUL
+
+
+def _day(offset: int, hour: int) -> datetime:
+    today = datetime.now(SEOUL).replace(tzinfo=None, hour=0, minute=0, second=0, microsecond=0)
+    return today + timedelta(days=offset, hours=hour)
+
+
+@pytest.fixture
+def async_tools(cached_tools, calendar):
+    tools = AsyncCalendarTools(cached_tools, AsyncMemoryCalendarBackend(calendar))
+    yield tools
+    asyncio.run(tools.close())
+
+
+def _cached_titles(tools):
+    return [event.title for event in tools.store.query(tools._localize(_day(-1, 0)), tools._localize(_day(30, 0)))]
+
+
+def test_sync_applies_last_change_with_empty_fields(async_tools, calendar):
+    # 마지막 레코드의 빈 장소·메모·규칙 필드(끝의 US들)가 출력 정리에서 사라지면 안 됨
+    assert asyncio.run(async_tools.sync_changes())["success"]
+    calendar.add_event("캘린더", "A with location", _day(1, 10), _day(1, 11), location="3층")
+    calendar.add_event("캘린더", "B empty fields", _day(2, 10), _day(2, 11))
+    
+    result = asyncio.run(async_tools.sync_changes())
+    assert result["changed"] == 2
+    assert _cached_titles(async_tools.tools) == ["A with location", "B empty fields"]
+
+
+def test_sync_changes_sync_tools(cached_tools, calendar):
+    assert cached_tools.sync_changes()["success"]
+    calendar.add_event("Work", "코드 리뷰", _day(3, 14), _day(3, 15))
+    
+    result = cached_tools.sync_changes()
+    assert result["changed"] == 1
+    assert _cached_titles(cached_tools) == ["코드 리뷰"]
+
+
+def test_sync_reconcile_removes_deleted_events(cached_tools, calendar):
+    event = calendar.add_event("캘린더", "취소될 회의", _day(1, 9), _day(1, 10))
+    calendar.add_event("캘린더", "남는 회의", _day(1, 13), _day(1, 14))
+    cached_tools.sync_changes()
+    assert _cached_titles(cached_tools) == ["취소될 회의", "남는 회의"]
+    
+    calendar.calendars["캘린더"].remove(event)
+    result = cached_tools.sync_changes(reconcile=True)
+    assert result["removed"] == 1
+    assert _cached_titles(cached_tools) == ["남는 회의"]
+
+
+def test_sync_without_store_fails(tools):
+    assert not tools.sync_changes()["success"]
+
+
+def test_engine_reconciles_on_first_run_and_every_n(async_tools):
+    engine = SyncEngine(async_tools, reconcile_every=2)
+    calls = []
+    
+    async def record(reconcile, past_days, future_days):
+        calls.append(reconcile)
+        return {"success": True}
+    
+    async_tools.sync_changes = record
+    for _ in range(4):
+        asyncio.run(engine.sync_once())
+    assert calls == [True, False, True, False]
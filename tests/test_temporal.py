@@ -0,0 +1,130 @@
+"""
+한국어 날짜/시간 표현 해석 (app/temporal/expressions.py)
+"""
+
+from datetime import date, datetime, time, timedelta
+
+import pytest
+
+from app.temporal import parse_duration, resolve, split_day_part
+
+# 2026-10-18은 일요일
+REFERENCE = date(2026, 10, 18)
+
+
+def _day(expression: str) -> date:
+    span = resolve(expression, REFERENCE)
+    assert not span.has_time
+    assert span.start.date() == span.end.date()
+    return span.start.date()
+
+
+@pytest.mark.parametrize("expression, expected", [
+    ("2026-06-10", date(2026, 6, 10)),
+    ("6월 10일", date(2026, 6, 10)),
+    ("2027년 3월 1일", date(2027, 3, 1)),
+    ("6/10", date(2026, 6, 10)),
+    ("내일", date(2026, 10, 19)),
+    ("모레", date(2026, 10, 20)),
+    ("3일 후", date(2026, 10, 21)),
+    ("2일 전", date(2026, 10, 16)),
+    ("화요일", date(2026, 10, 20)),
+    ("다음 주 화요일", date(2026, 10, 20)),
+    ("이번 주 금요일", date(2026, 10, 16)),
+    ("이번 달 말", date(2026, 10, 31)),
+    ("다음 달 첫날", date(2026, 11, 1)),
+    ("15일", date(2026, 10, 15)),
+])
+def test_dates(expression, expected):
+    assert _day(expression) == expected
+
+
+@pytest.mark.parametrize("expression, expected", [
+    ("다음 달 15일", date(2026, 11, 15)),
+    ("이번 달 20일", date(2026, 10, 20)),
+    ("지난 달 3일", date(2026, 9, 3)),
+    ("다다음 달 1일", date(2026, 12, 1)),
+    ("내년 3월 1일", date(2027, 3, 1)),
+    ("작년 12월 25일", date(2025, 12, 25)),
+    ("올해 1월 2일", date(2026, 1, 2)),
+])
+def test_relative_month_and_year_apply_to_day(expression, expected):
+    assert _day(expression) == expected
+
+
+def test_relative_month_day_that_does_not_exist():
+    # 11월에는 31일이 없으므로 10월 31일로 해석하지 않음
+    with pytest.raises(ValueError):
+        resolve("다음 달 31일", REFERENCE)
+
+
+@pytest.mark.parametrize("expression, first, last", [
+    ("이번 주", date(2026, 10, 12), date(2026, 10, 18)),
+    ("다음 주", date(2026, 10, 19), date(2026, 10, 25)),
+    ("이번 주말", date(2026, 10, 17), date(2026, 10, 18)),
+    ("다음 달", date(2026, 11, 1), date(2026, 11, 30)),
+    ("2월", date(2026, 2, 1), date(2026, 2, 28)),
+    ("2028년 2월", date(2028, 2, 1), date(2028, 2, 29)),
+    ("6월 둘째 주", date(2026, 6, 8), date(2026, 6, 14)),
+    ("앞으로 3일", date(2026, 10, 18), date(2026, 10, 20)),
+    ("내년", date(2027, 1, 1), date(2027, 12, 31)),
+    ("내년 1월", date(2027, 1, 1), date(2027, 1, 31)),
+    ("작년 12월", date(2025, 12, 1), date(2025, 12, 31)),
+    ("내년 1월 둘째 주", date(2027, 1, 4), date(2027, 1, 10)),
+])
+def test_spans(expression, first, last):
+    span = resolve(expression, REFERENCE)
+    assert (span.start, span.end) == (datetime.combine(first, time.min), datetime.combine(last, time(23, 59, 59)))
+
+
+@pytest.mark.parametrize("expression, start, end", [
+    ("내일 오후 3시", datetime(2026, 10, 19, 15), datetime(2026, 10, 19, 15)),
+    ("내일 9:30", datetime(2026, 10, 19, 9, 30), datetime(2026, 10, 19, 9, 30)),
+    ("오늘 오후 3시부터 5시까지", datetime(2026, 10, 18, 15), datetime(2026, 10, 18, 17)),
+    ("3일 후 2시부터 1시간 반", datetime(2026, 10, 21, 2), datetime(2026, 10, 21, 3, 30)),
+    ("내일 밤 11시부터 1시까지", datetime(2026, 10, 19, 23), datetime(2026, 10, 20, 1)),
+    ("정오", datetime(2026, 10, 18, 12), datetime(2026, 10, 18, 12)),
+    # 도구 설명의 예시 (오전·오후 없는 시각은 오전으로 읽으므로 예시에 오후를 붙임)
+    ("금요일 오후 2시부터 4시", datetime(2026, 10, 23, 14), datetime(2026, 10, 23, 16)),
+    ("금요일 오후 1시부터 6시", datetime(2026, 10, 23, 13), datetime(2026, 10, 23, 18)),
+    ("금요일 2시부터 4시", datetime(2026, 10, 23, 2), datetime(2026, 10, 23, 4)),
+    # 밤 12시는 그날이 끝나는 시각
+    ("오늘 밤 12시", datetime(2026, 10, 19), datetime(2026, 10, 19)),
+    ("오늘 오후 10시부터 밤 12시 30분", datetime(2026, 10, 18, 22), datetime(2026, 10, 19, 0, 30)),
+    ("오늘 오전 12시", datetime(2026, 10, 18), datetime(2026, 10, 18)),
+])
+def test_times(expression, start, end):
+    span = resolve(expression, REFERENCE)
+    assert span.has_time
+    assert (span.start, span.end) == (start, end)
+
+
+@pytest.mark.parametrize("expression, start, end", [
+    ("30분 후", datetime(2026, 10, 18, 23, 10), datetime(2026, 10, 18, 23, 10)),
+    ("1시간 후", datetime(2026, 10, 18, 23, 40), datetime(2026, 10, 18, 23, 40)),
+    ("3시간 뒤", datetime(2026, 10, 19, 1, 40), datetime(2026, 10, 19, 1, 40)),
+    ("1시간 반 뒤 30분", datetime(2026, 10, 19, 0, 10), datetime(2026, 10, 19, 0, 40)),
+])
+def test_offsets_from_reference_time(expression, start, end):
+    span = resolve(expression, datetime(2026, 10, 18, 22, 40, 15))
+    assert span.has_time
+    assert (span.start, span.end) == (start, end)
+
+
+def test_invalid_date_raises():
+    with pytest.raises(ValueError):
+        resolve("2월 30일", REFERENCE)
+    with pytest.raises(ValueError):
+        resolve("언젠가", REFERENCE)
+
+
+def test_parse_duration():
+    assert parse_duration("1시간 반") == timedelta(minutes=90)
+    assert parse_duration("2시간 15분") == timedelta(minutes=135)
+    assert parse_duration("45분") == timedelta(minutes=45)
+    assert parse_duration("오늘") is None
+
+
+def test_split_day_part():
+    assert split_day_part("목요일 오후") == ((time(12), time(18)), "목요일")
+    assert split_day_part("오후 3시") == (None, "오후 3시")